@@ -0,0 +1,6 @@
+"""Micro-benchmarks for chora-github hot paths.
+
+Run a benchmark as a module, e.g. ``python -m benchmarks.bench_conversion``.
+``bench_tools`` measures the eight tools end to end (service, MCP and REST)
+against the local fake GitHub API in ``fake_github``.
+"""
@@ -0,0 +1,95 @@
+"""Benchmark: converting 10k REST issues to IssueData.
+
+Compares the attribute-walking conversion (PyGithub wrapper objects per
+label/user plus full pydantic validation) with the raw-payload fast path.
+
+Usage:
+    python -m benchmarks.bench_conversion [--count 10000] [--repeat 5]
+"""
+
+import argparse
+import time
+from unittest.mock import Mock
+
+from github.Issue import Issue
+
+from chora_github.core.models import IssueData
+from chora_github.core.payloads import issue_from_rest
+
+
+def make_payload(number: int) -> dict:
+    """A realistic REST issue payload (labels, assignees, user)."""
+    return {
+        "url": f"https://api.github.com/repos/octocat/Hello-World/issues/{number}",
+        "html_url": f"https://github.com/octocat/Hello-World/issues/{number}",
+        "number": number,
+        "title": f"Issue {number}",
+        "state": "open",
+        "body": "Steps to reproduce:\n1. ...\n" * 5,
+        "created_at": "2025-11-01T10:00:00Z",
+        "updated_at": "2025-11-02T10:00:00Z",
+        "user": {"login": "octocat", "id": 1, "type": "User"},
+        "labels": [
+            {"id": 1, "name": "bug", "color": "d73a4a"},
+            {"id": 2, "name": "triage", "color": "ededed"},
+        ],
+        "assignees": [
+            {"login": "alice", "id": 2, "type": "User"},
+            {"login": "bob", "id": 3, "type": "User"},
+        ],
+    }
+
+
+def convert_attributes(issue: Issue) -> IssueData:
+    """The previous conversion: walk PyGithub attributes, validate."""
+    return IssueData(
+        number=issue.number,
+        title=issue.title,
+        state=issue.state,
+        url=issue.html_url,
+        created_at=issue.created_at.isoformat() if issue.created_at else None,
+        updated_at=issue.updated_at.isoformat() if issue.updated_at else None,
+        body=issue.body,
+        labels=[label.name for label in issue.labels],
+        assignees=[assignee.login for assignee in issue.assignees],
+        author=issue.user.login if issue.user else None,
+    )
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = [make_payload(n) for n in range(1, args.count + 1)]
+    requester = Mock(is_not_lazy=False)
+
+    def attribute_path():
+        # Includes wrapping, as PyGithub does for every listed issue
+        for data in payloads:
+            convert_attributes(Issue(requester, {}, data, completed=True))
+
+    def raw_path():
+        for data in payloads:
+            issue_from_rest(data)
+
+    slow = best_of(attribute_path, args.repeat)
+    fast = best_of(raw_path, args.repeat)
+    print(f"issues:            {args.count}")
+    print(f"attribute path:    {slow * 1000:8.1f} ms")
+    print(f"raw payload path:  {fast * 1000:8.1f} ms")
+    print(f"speedup:           {slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
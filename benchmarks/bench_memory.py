@@ -0,0 +1,67 @@
+"""Benchmark: memory held by 100k cached issues.
+
+Compares IssueData models (validated and ``model_construct``-built, as the
+fast conversion path produces) with the slotted IssueRecord the issue cache
+stores. Payloads are parsed from JSON, as received from GitHub, so every
+label and login starts out as its own string object.
+
+Usage:
+    python -m benchmarks.bench_memory [--count 100000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.bench_conversion import make_payload
+from chora_github.core.models import IssueData
+from chora_github.core.payloads import issue_from_rest
+from chora_github.core.records import IssueRecord
+
+
+def retained(build, raw: str) -> int:
+    """Bytes still allocated after building items from ``raw`` and
+    discarding the parsed payloads."""
+    gc.collect()
+    tracemalloc.start()
+    payloads = json.loads(raw)
+    items = build(payloads)
+    del payloads
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    raw = json.dumps([make_payload(n) for n in range(1, args.count + 1)])
+
+    variants = {
+        "IssueData (validated)": lambda payloads: [
+            IssueData(**issue_from_rest(data).model_dump()) for data in payloads
+        ],
+        "IssueData (constructed)": lambda payloads: [
+            issue_from_rest(data) for data in payloads
+        ],
+        "IssueRecord": lambda payloads: [
+            IssueRecord.from_model(issue_from_rest(data)) for data in payloads
+        ],
+    }
+    sizes = {name: retained(build, raw) for name, build in variants.items()}
+
+    baseline = sizes["IssueData (constructed)"]
+    print(f"issues: {args.count}")
+    for name, size in sizes.items():
+        print(f"{name:<26} {size / 2**20:8.1f} MiB  ({size / args.count:6.0f} B/issue)")
+    saved = baseline - sizes["IssueRecord"]
+    print(f"saved by IssueRecord:      {saved / 2**20:8.1f} MiB  ({saved / baseline:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark: service settings on a recorded workload (traffic cassette).
+
+Replays the tool calls of a cassette (``chora_github.core.cassettes``)
+against services with different settings, answering every upstream
+request from the cassette, and reports per configuration: wall time,
+upstream requests, errors and p50/p99 call latency.
+
+Record a cassette from production with ``GITHUB_CASSETTE_RECORD=PATH`` on
+the REST or MCP server, or a synthetic one from the tool scenarios of
+``bench_tools`` run against the local fake GitHub API:
+
+    python -m benchmarks.bench_replay record PATH [--calls 20] [--latency 0.005]
+        [--concurrency 4]
+
+Then compare settings (every combination of the listed values is run):
+
+    python -m benchmarks.bench_replay run PATH [--speed 1] [--cache-ttl 0,60]
+        [--concurrency 1,8] [--graphql] [--output PATH]
+
+Upstream requests a configuration makes that were never recorded (e.g.
+GraphQL queries on a REST recording) fail the call and count as errors,
+so compare configurations against a cassette recorded with the same API.
+"""
+
+import argparse
+import itertools
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from benchmarks.bench_tools import SCENARIOS, make_service, percentile
+from benchmarks.fake_github import FakeGithub
+from chora_github.core import upstream
+from chora_github.core.cassettes import Cassette, Player, Recorder, replay_calls
+from chora_github.core.services import GithubToolService
+
+
+@dataclass
+class ReplayResult:
+    """Summary of one configuration."""
+
+    cache_ttl: int
+    concurrency: int
+    graphql: bool
+    calls: int
+    errors: int
+    upstream: int
+    wall_s: float
+    p50_ms: float
+    p99_ms: float
+
+
+# ============================================================================
+# Recording
+# ============================================================================
+
+
+def record(args) -> None:
+    args.cache_ttl, args.pacing = 0, False
+    with FakeGithub(latency=args.latency) as server:
+        service = make_service(server, args)
+        work = [scenario for scenario in SCENARIOS for _ in range(args.calls)]
+        with (
+            Recorder(args.cassette) as recorder,
+            ThreadPoolExecutor(max_workers=args.concurrency) as pool,
+        ):
+            list(
+                pool.map(
+                    lambda item: getattr(service, item[1].tool)(item[1].request(item[0])),
+                    enumerate(work),
+                )
+            )
+    cassette = recorder.cassette
+    print(
+        f"Recorded {len(cassette.calls)} calls and {len(cassette.interactions)} "
+        f"upstream requests ({cassette.duration:.2f}s) to {args.cassette}"
+    )
+
+
+# ============================================================================
+# Replay
+# ============================================================================
+
+
+def replay(cassette: Cassette, cache_ttl: int, concurrency: int, args) -> ReplayResult:
+    service = GithubToolService(
+        token="replay", use_graphql=args.graphql, cache_ttl=cache_ttl, client_pacing=args.pacing
+    )
+    requests: list[upstream.UpstreamCall] = []
+    upstream.add_observer(requests.append)
+    try:
+        with Player(cassette, speed=args.speed):
+            start = time.perf_counter()
+            replayed = replay_calls(service, cassette, speed=args.speed, max_workers=concurrency)
+            wall = time.perf_counter() - start
+    finally:
+        upstream.remove_observer(requests.append)
+
+    latencies = sorted(item.seconds for item in replayed) or [0.0]
+    return ReplayResult(
+        cache_ttl=cache_ttl,
+        concurrency=concurrency,
+        graphql=args.graphql,
+        calls=len(replayed),
+        errors=sum(1 for item in replayed if not item.response.success),
+        upstream=len(requests),
+        wall_s=round(wall, 3),
+        p50_ms=round(percentile(latencies, 50) * 1000, 3),
+        p99_ms=round(percentile(latencies, 99) * 1000, 3),
+    )
+
+
+def run(args) -> None:
+    cassette = Cassette.load(args.cassette)
+    print(
+        f"{args.cassette}: {len(cassette.calls)} calls, {len(cassette.interactions)} "
+        f"upstream requests, recorded {cassette.recorded_at or 'n/a'}"
+    )
+    header = (
+        "cache_ttl",
+        "concurrency",
+        "calls",
+        "errors",
+        "upstream",
+        "wall_s",
+        "p50_ms",
+        "p99_ms",
+    )
+    print(" ".join(f"{name:>11}" for name in header))
+    results = []
+    for cache_ttl, concurrency in itertools.product(args.cache_ttl, args.concurrency):
+        result = replay(cassette, cache_ttl, concurrency, args)
+        results.append(result)
+        print(" ".join(f"{getattr(result, name):>11}" for name in header))
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps([asdict(result) for result in results], indent=2) + "\n"
+        )
+
+
+def integers(value: str) -> list[int]:
+    return [int(item) for item in value.split(",")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recording = commands.add_parser("record", help="Record the tool scenarios against a fake API")
+    recording.add_argument("cassette", help="Cassette file (.json or .json.gz)")
+    recording.add_argument("--calls", type=int, default=20, help="Calls per tool")
+    recording.add_argument("--latency", type=float, default=0.005, help="Fake API latency (s)")
+    recording.add_argument("--concurrency", type=int, default=4, help="Calls in flight")
+    recording.set_defaults(handler=record)
+
+    replaying = commands.add_parser("run", help="Replay a cassette with each configuration")
+    replaying.add_argument("cassette", help="Cassette file (.json or .json.gz)")
+    replaying.add_argument("--speed", type=float, default=1.0, help="Playback speed (0: no delays)")
+    replaying.add_argument("--cache-ttl", type=integers, default=[0, 60], help="e.g. 0,60")
+    replaying.add_argument("--concurrency", type=integers, default=[1, 8], help="e.g. 1,8")
+    replaying.add_argument("--graphql", action="store_true", help="Use the GraphQL API")
+    replaying.add_argument("--pacing", action="store_true", help="Keep PyGithub's client pacing")
+    replaying.add_argument("--output", help="Write results as JSON")
+    replaying.set_defaults(handler=run)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark: serializing a 100-issue MCP tool result.
+
+Compares the previous formatting (``json.dumps(model_dump(), indent=2)``)
+with the compact native serialization used by the MCP interface.
+
+Usage:
+    python -m benchmarks.bench_serialization [--count 100] [--repeat 200]
+"""
+
+import argparse
+import json
+import time
+
+from chora_github.core.models import IssueData, ListIssuesResponse
+from chora_github.core.serialization import dumps
+
+
+def make_response(count: int) -> ListIssuesResponse:
+    issues = [
+        IssueData(
+            number=n,
+            title=f"Issue {n}: something is broken",
+            state="open",
+            url=f"https://github.com/octocat/Hello-World/issues/{n}",
+            created_at="2025-11-01T10:00:00Z",
+            updated_at="2025-11-02T10:00:00Z",
+            body="Steps to reproduce:\n1. ...\n" * 10,
+            labels=["bug", "triage"],
+            assignees=["alice", "bob"],
+            author="octocat",
+        )
+        for n in range(1, count + 1)
+    ]
+    return ListIssuesResponse(issues=issues, total_count=count)
+
+
+def per_call(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    response = make_response(args.count)
+
+    def previous():
+        return json.dumps(response.model_dump(), indent=2)
+
+    def compact():
+        return dumps(response, pretty=False)
+
+    old_bytes = len(previous().encode())
+    new_bytes = len(compact().encode())
+    old_time = per_call(previous, args.repeat)
+    new_time = per_call(compact, args.repeat)
+
+    print(f"issues:               {args.count}")
+    print(f"indent=2 dict path:   {old_bytes:8d} bytes  {old_time * 1e6:8.0f} us")
+    print(f"compact native path:  {new_bytes:8d} bytes  {new_time * 1e6:8.0f} us")
+    print(f"saved:                {1 - new_bytes / old_bytes:8.1%} bytes  {1 - new_time / old_time:8.1%} CPU")
+
+
+if __name__ == "__main__":
+    main()
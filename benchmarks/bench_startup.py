@@ -0,0 +1,131 @@
+"""Benchmark: cold start of the CLI and MCP entry points.
+
+Runs each entry point's startup in a fresh interpreter and reports the best
+wall time over several runs, less the startup of a bare interpreter, and
+the heavy packages it loaded:
+
+- ``cli``: ``github --help``
+- ``mcp``: ``github-mcp`` up to serving (server created, tools registered)
+
+Exits with status 1 when an entry point takes longer than its budget or
+loads a package it should not need at startup (e.g. PyGithub before the
+first tool call), so CI can run it as a check:
+
+    python -m benchmarks.bench_startup [--runs 5] [--cli-budget-ms 250]
+        [--mcp-budget-ms 3000] [--output PATH]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+HEAVY_PACKAGES = ("pydantic", "github", "fastapi", "fastmcp", "rich", "yaml")
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    """Startup code of one entry point and the packages it must not load."""
+
+    name: str
+    code: str
+    forbidden: tuple[str, ...]
+
+
+ENTRY_POINTS = (
+    EntryPoint(
+        name="cli",
+        code=(
+            "from chora_github.interfaces.cli import cli\ncli(['--help'], standalone_mode=False)"
+        ),
+        forbidden=("pydantic", "github", "fastapi", "fastmcp"),
+    ),
+    EntryPoint(
+        name="mcp",
+        code="from chora_github.interfaces.mcp import get_server\nget_server()",
+        forbidden=("github", "fastapi"),
+    ),
+)
+
+REPORT = "\nimport json, sys\nprint(json.dumps(sorted(set(sys.modules) & set({packages!r}))))"
+
+
+@dataclass
+class StartupResult:
+    """Cold start of one entry point."""
+
+    name: str
+    best_ms: float
+    budget_ms: float
+    loaded: list[str]
+    forbidden: list[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.best_ms <= self.budget_ms and not self.forbidden
+
+
+def run_once(code: str) -> tuple[float, str]:
+    """Wall time (s) and stdout of ``code`` in a fresh interpreter."""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return time.perf_counter() - start, completed.stdout
+
+
+def best_of(code: str, runs: int) -> float:
+    return min(run_once(code)[0] for _ in range(runs))
+
+
+def measure(entry: EntryPoint, runs: int, baseline: float, budget_ms: float) -> StartupResult:
+    seconds = best_of(entry.code, runs)
+    _, stdout = run_once(entry.code + REPORT.format(packages=HEAVY_PACKAGES))
+    loaded = json.loads(stdout.strip().splitlines()[-1])
+    return StartupResult(
+        name=entry.name,
+        best_ms=round((seconds - baseline) * 1000, 1),
+        budget_ms=budget_ms,
+        loaded=loaded,
+        forbidden=[package for package in entry.forbidden if package in loaded],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per entry point (best is kept)")
+    parser.add_argument("--cli-budget-ms", type=float, default=250.0)
+    parser.add_argument("--mcp-budget-ms", type=float, default=3000.0)
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args()
+
+    baseline = best_of("pass", args.runs)
+    budgets = {"cli": args.cli_budget_ms, "mcp": args.mcp_budget_ms}
+    print(f"bare interpreter: {baseline * 1000:.1f}ms (subtracted)")
+    print(f"{'entry':>6} {'best_ms':>9} {'budget_ms':>10}  loaded")
+    results = []
+    for entry in ENTRY_POINTS:
+        result = measure(entry, args.runs, baseline, budgets[entry.name])
+        results.append(result)
+        status = "" if result.ok else "  FAIL"
+        print(
+            f"{result.name:>6} {result.best_ms:>9} {result.budget_ms:>10}  "
+            f"{', '.join(result.loaded) or '-'}{status}"
+        )
+        if result.forbidden:
+            print(f"       loaded at startup: {', '.join(result.forbidden)}")
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps([asdict(result) for result in results], indent=2) + "\n"
+        )
+    if not all(result.ok for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
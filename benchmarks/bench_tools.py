@@ -0,0 +1,409 @@
+"""Benchmark: the eight GitHub tools through the service, MCP and REST paths.
+
+Runs every tool against a local fake GitHub API (``benchmarks.fake_github``)
+and reports calls/sec, p50 and p99 latency and upstream requests per call
+for each interface:
+
+- ``core``: GithubToolService methods called directly
+- ``mcp``: the registered MCP tools, called through an in-memory FastMCP client
+- ``rest``: the FastAPI app (full middleware stack) through a TestClient
+
+Results are written as JSON (by default ``benchmarks/results/<commit>.json``)
+so runs on different commits can be compared with ``--compare``.
+
+Usage:
+    python -m benchmarks.bench_tools [--interfaces core,mcp,rest] [--calls 50]
+        [--concurrency 1] [--latency 0.005] [--per-page 30] [--cache-ttl 0]
+        [--pacing] [--output PATH] [--compare BASELINE.json]
+
+PyGithub paces requests on the client (0.25 s apart, writes 1 s apart),
+which would dominate every figure; it is disabled unless ``--pacing`` is
+given, so the numbers show this project's own overhead plus the fake
+API's configured latency.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import subprocess
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from benchmarks.fake_github import NAME, OWNER, REPO, FakeGithub
+from chora_github.core.models import (
+    CreateIssueRequest,
+    GetFileContentsRequest,
+    GetIssueRequest,
+    GetPRRequest,
+    ListIssuesRequest,
+    ListPRsRequest,
+    ListRepoFilesRequest,
+    UpdateIssueRequest,
+)
+from chora_github.core.services import GithubToolService
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+FILE_PATH = "pkg1/module2.py"
+
+
+# ============================================================================
+# Scenarios
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One tool, expressed for each interface.
+
+    Each builder receives the call index, so writes can vary per call.
+    """
+
+    tool: str
+    request: Callable[[int], BaseModel]
+    mcp: Callable[[int], dict[str, Any]]
+    rest: Callable[[int], tuple[str, str, dict[str, Any] | None]]
+
+
+SCENARIOS = [
+    Scenario(
+        "list_issues",
+        lambda i: ListIssuesRequest(repo=REPO, state="all"),
+        lambda i: {"state": "all"},
+        lambda i: ("GET", "/issues?state=all", None),
+    ),
+    Scenario(
+        "create_issue",
+        lambda i: CreateIssueRequest(repo=REPO, title=f"Benchmark {i}", body="Created"),
+        lambda i: {"title": f"Benchmark {i}", "body": "Created"},
+        lambda i: ("POST", "/issues", {"title": f"Benchmark {i}", "body": "Created"}),
+    ),
+    Scenario(
+        "get_issue",
+        lambda i: GetIssueRequest(repo=REPO, issue_number=5),
+        lambda i: {"issue_number": 5},
+        lambda i: ("GET", "/issues/5", None),
+    ),
+    Scenario(
+        # Alternate titles so no update is skipped as a no-op
+        "update_issue",
+        lambda i: UpdateIssueRequest(repo=REPO, issue_number=6, title=f"Title {i % 2}"),
+        lambda i: {"issue_number": 6, "title": f"Title {i % 2}"},
+        lambda i: ("PATCH", "/issues/6", {"title": f"Title {i % 2}"}),
+    ),
+    Scenario(
+        "list_prs",
+        lambda i: ListPRsRequest(repo=REPO, state="all"),
+        lambda i: {"state": "all"},
+        lambda i: ("GET", "/pulls?state=all", None),
+    ),
+    Scenario(
+        "get_pr",
+        lambda i: GetPRRequest(repo=REPO, pr_number=3),
+        lambda i: {"pr_number": 3},
+        lambda i: ("GET", "/pulls/3", None),
+    ),
+    Scenario(
+        "get_file_contents",
+        lambda i: GetFileContentsRequest(repo=REPO, path=FILE_PATH),
+        lambda i: {"path": FILE_PATH},
+        lambda i: ("GET", f"/contents/{FILE_PATH}", None),
+    ),
+    Scenario(
+        "list_repo_files",
+        lambda i: ListRepoFilesRequest(repo=REPO),
+        lambda i: {},
+        lambda i: ("GET", "/files", None),
+    ),
+]
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+
+@dataclass
+class Result:
+    """Measurements for one tool on one interface."""
+
+    interface: str
+    tool: str
+    calls: int
+    errors: int
+    calls_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    upstream_requests_per_call: float
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(math.ceil(p / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class Run:
+    """Raw outcome of the measured calls of one tool."""
+
+    latencies: list[float]
+    errors: int
+    wall: float
+    upstream: int
+
+
+def summarize(interface: str, tool: str, run: Run) -> Result:
+    ordered = sorted(run.latencies)
+    return Result(
+        interface=interface,
+        tool=tool,
+        calls=len(ordered),
+        errors=run.errors,
+        calls_per_sec=round(len(ordered) / run.wall, 2),
+        p50_ms=round(percentile(ordered, 50) * 1000, 3),
+        p99_ms=round(percentile(ordered, 99) * 1000, 3),
+        mean_ms=round(sum(ordered) / len(ordered) * 1000, 3),
+        upstream_requests_per_call=round(run.upstream / len(ordered), 2),
+    )
+
+
+def timed(call: Callable[[int], bool], index: int) -> tuple[float, bool]:
+    start = time.perf_counter()
+    ok = call(index)
+    return time.perf_counter() - start, ok
+
+
+def collect(outcomes: list[tuple[float, bool]], wall: float, upstream: int) -> Run:
+    return Run(
+        latencies=[latency for latency, _ in outcomes],
+        errors=sum(not ok for _, ok in outcomes),
+        wall=wall,
+        upstream=upstream,
+    )
+
+
+def measure_sync(call: Callable[[int], bool], server: FakeGithub, args) -> Run:
+    """Warm up, then time ``args.calls`` calls of ``call`` (True on success)."""
+    for index in range(args.warmup):
+        call(index)
+    before = server.requests_served
+    start = time.perf_counter()
+    if args.concurrency == 1:
+        outcomes = [timed(call, index) for index in range(args.calls)]
+    else:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            outcomes = list(executor.map(lambda index: timed(call, index), range(args.calls)))
+    wall = time.perf_counter() - start
+    return collect(outcomes, wall, server.requests_served - before)
+
+
+async def measure_async(call: Callable[[int], Any], server: FakeGithub, args) -> Run:
+    """Async variant of measure_sync (``call`` is a coroutine function)."""
+    for index in range(args.warmup):
+        await call(index)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(index: int) -> tuple[float, bool]:
+        async with semaphore:
+            begin = time.perf_counter()
+            ok = await call(index)
+            return time.perf_counter() - begin, ok
+
+    before = server.requests_served
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(one(index) for index in range(args.calls)))
+    wall = time.perf_counter() - start
+    return collect(outcomes, wall, server.requests_served - before)
+
+
+# ============================================================================
+# Interfaces
+# ============================================================================
+
+
+def make_service(server: FakeGithub, args) -> GithubToolService:
+    return GithubToolService(
+        token="fake",
+        base_url=server.base_url,
+        cache_ttl=args.cache_ttl,
+        client_pacing=args.pacing,
+    )
+
+
+def bench_core(server: FakeGithub, scenarios: list[Scenario], args) -> list[Result]:
+    service = make_service(server, args)
+    results = []
+    for scenario in scenarios:
+        method = getattr(service, scenario.tool)
+
+        def call(index: int, method=method, scenario=scenario) -> bool:
+            method(scenario.request(index))
+            return True
+
+        results.append(summarize("core", scenario.tool, measure_sync(call, server, args)))
+    return results
+
+
+def bench_rest(server: FakeGithub, scenarios: list[Scenario], args) -> list[Result]:
+    from fastapi.testclient import TestClient
+
+    from chora_github.interfaces.rest import create_app
+
+    results = []
+    with TestClient(create_app(service=make_service(server, args))) as client:
+        for scenario in scenarios:
+
+            def call(index: int, scenario=scenario) -> bool:
+                method, path, body = scenario.rest(index)
+                url = f"/api/v1/github/repos/{REPO}{path}"
+                return client.request(method, url, json=body).status_code < 400
+
+            results.append(summarize("rest", scenario.tool, measure_sync(call, server, args)))
+    return results
+
+
+def bench_mcp(server: FakeGithub, scenarios: list[Scenario], args) -> list[Result]:
+    from fastmcp import Client, FastMCP
+
+    from chora_github.interfaces.mcp import tools
+
+    # The tools build a service per call; point each one at the fake API
+    tools._get_service = lambda token=None: make_service(server, args)
+    mcp = FastMCP("github-benchmark")
+    tools.register_tools(mcp)
+
+    async def run() -> list[Result]:
+        results = []
+        async with Client(mcp) as client:
+            for scenario in scenarios:
+                name = tools.make_tool_name(scenario.tool)
+
+                async def call(index: int, scenario=scenario, name=name) -> bool:
+                    arguments = {"owner": OWNER, "repo": NAME, **scenario.mcp(index)}
+                    result = await client.call_tool(name, arguments, raise_on_error=False)
+                    text = result.content[0].text if result.content else ""
+                    return not result.is_error and '"success":false' not in text
+
+                run = await measure_async(call, server, args)
+                results.append(summarize("mcp", scenario.tool, run))
+        return results
+
+    return asyncio.run(run())
+
+
+INTERFACES = {"core": bench_core, "mcp": bench_mcp, "rest": bench_rest}
+
+
+# ============================================================================
+# Reporting
+# ============================================================================
+
+
+def git_commit() -> str:
+    """Short HEAD commit, with ``-dirty`` for uncommitted changes."""
+    root = Path(__file__).parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def print_results(results: list[dict[str, Any]], baseline: list[dict[str, Any]] | None) -> None:
+    previous = {(r["interface"], r["tool"]): r for r in baseline or []}
+
+    def delta(new: float, key: tuple[str, str], field: str) -> str:
+        old = previous.get(key, {}).get(field)
+        if not old:
+            return ""
+        return f" ({(new - old) / old * 100:+.0f}%)"
+
+    header = f"{'interface':<9} {'tool':<18} {'calls/s':>16} {'p50 ms':>16} {'p99 ms':>16} {'up/call':>7}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        key = (r["interface"], r["tool"])
+        cps = f"{r['calls_per_sec']:.1f}" + delta(r["calls_per_sec"], key, "calls_per_sec")
+        p50 = f"{r['p50_ms']:.2f}" + delta(r["p50_ms"], key, "p50_ms")
+        p99 = f"{r['p99_ms']:.2f}" + delta(r["p99_ms"], key, "p99_ms")
+        errors = f"  {r['errors']} errors" if r["errors"] else ""
+        print(
+            f"{r['interface']:<9} {r['tool']:<18} {cps:>16} {p50:>16} {p99:>16} "
+            f"{r['upstream_requests_per_call']:>7.1f}{errors}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interfaces", default="core,mcp,rest")
+    parser.add_argument("--tools", default=",".join(s.tool for s in SCENARIOS))
+    parser.add_argument("--calls", type=int, default=50, help="Measured calls per tool")
+    parser.add_argument("--warmup", type=int, default=3, help="Unmeasured calls per tool")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.005, help="Fake API seconds/request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra random seconds")
+    parser.add_argument("--per-page", type=int, default=30, help="Fake API page size")
+    parser.add_argument(
+        "--cache-ttl", type=float, default=0.0, help="Service cache TTL (0: uncached)"
+    )
+    parser.add_argument(
+        "--pacing",
+        action="store_true",
+        help="Keep PyGithub's client-side pacing (0.25 s between requests, 1 s between writes)",
+    )
+    parser.add_argument("--output", type=Path, help="Results JSON path")
+    parser.add_argument("--compare", type=Path, help="Earlier results JSON to compare with")
+    args = parser.parse_args()
+
+    tools = args.tools.split(",")
+    scenarios = [s for s in SCENARIOS if s.tool in tools]
+    interfaces = args.interfaces.split(",")
+    unknown = set(interfaces) - INTERFACES.keys()
+    if unknown:
+        parser.error(f"unknown interfaces: {', '.join(sorted(unknown))}")
+
+    results: list[Result] = []
+    with FakeGithub(latency=args.latency, jitter=args.jitter, per_page=args.per_page) as server:
+        for interface in interfaces:
+            results.extend(INTERFACES[interface](server, scenarios, args))
+
+    config = {key: value for key, value in vars(args).items() if key not in ("output", "compare")}
+    commit = git_commit()
+    report = {
+        "benchmark": "bench_tools",
+        "commit": commit,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "results": [asdict(result) for result in results],
+    }
+    baseline = json.loads(args.compare.read_text())["results"] if args.compare else None
+    print_results(report["results"], baseline)
+
+    output = args.output or RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
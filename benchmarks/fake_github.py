@@ -0,0 +1,441 @@
+"""A local stand-in for the GitHub REST API.
+
+Serves the endpoints GithubToolService uses from an in-memory repository
+(``octocat/Hello-World``), so the service, MCP and REST paths can be
+benchmarked without network access or rate limits:
+
+- ``GET /repos/{owner}/{repo}``
+- ``GET|POST /repos/{owner}/{repo}/issues`` and ``GET|PATCH .../issues/{number}``
+- ``GET /repos/{owner}/{repo}/pulls`` and ``.../pulls/{number}``
+- ``GET /repos/{owner}/{repo}/contents/{path}`` (files and directories)
+- ``GET /repos/{owner}/{repo}/git/trees/{sha}`` (``?recursive=1``)
+- ``GET /rate_limit``
+
+Listings are paginated with ``per_page``/``page`` and ``Link`` headers,
+every response carries ``X-RateLimit-*`` headers, and each request can be
+delayed by a fixed latency plus random jitter. GraphQL is not emulated.
+
+Usage::
+
+    with FakeGithub(latency=0.02) as server:
+        service = GithubToolService(token="fake", base_url=server.base_url)
+
+or standalone: ``python -m benchmarks.fake_github --port 8765 --latency 0.02``.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+
+OWNER, NAME = "octocat", "Hello-World"
+REPO = f"{OWNER}/{NAME}"
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+RATE_LIMIT = 5000
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _user(login: str) -> dict[str, Any]:
+    return {"login": login, "id": abs(hash(login)) % 10_000, "type": "User"}
+
+
+class FakeRepository:
+    """In-memory issues, pull requests and files of one repository."""
+
+    def __init__(self, base_url: str, issues: int, pulls: int, dirs: int, files_per_dir: int):
+        self.base_url = base_url
+        self.url = f"{base_url}/repos/{REPO}"
+        self.lock = threading.Lock()
+        self.issues: dict[int, dict[str, Any]] = {}
+        for number in range(1, issues + 1):
+            self.issues[number] = self.new_issue(
+                number,
+                title=f"Issue {number}",
+                body="Steps to reproduce:\n1. ...\n" * 5,
+                labels=["bug", "triage"] if number % 3 else ["enhancement"],
+                assignees=["alice"] if number % 2 else [],
+                state="open" if number % 4 else "closed",
+            )
+        self.pulls = {number: self.new_pull(number) for number in range(1, pulls + 1)}
+        self.files: dict[str, str] = {"README.md": "# Hello World\n\nA fake repository.\n"}
+        for d in range(dirs):
+            for f in range(files_per_dir):
+                self.files[f"pkg{d}/module{f}.py"] = f'"""Module {d}.{f}."""\n\nVALUE = {f}\n' * 20
+
+    def new_issue(
+        self,
+        number: int,
+        title: str,
+        body: str = "",
+        labels: list[str] | None = None,
+        assignees: list[str] | None = None,
+        state: str = "open",
+    ) -> dict[str, Any]:
+        return {
+            "url": f"{self.url}/issues/{number}",
+            "html_url": f"https://github.com/{REPO}/issues/{number}",
+            "number": number,
+            "title": title,
+            "state": state,
+            "body": body,
+            "created_at": "2025-11-01T10:00:00Z",
+            "updated_at": "2025-11-02T10:00:00Z",
+            "user": _user("octocat"),
+            "labels": [{"name": name, "color": "ededed"} for name in labels or []],
+            "assignees": [_user(login) for login in assignees or []],
+        }
+
+    def new_pull(self, number: int) -> dict[str, Any]:
+        return {
+            "url": f"{self.url}/pulls/{number}",
+            "html_url": f"https://github.com/{REPO}/pull/{number}",
+            "number": number,
+            "title": f"Pull request {number}",
+            "state": "open" if number % 5 else "closed",
+            "body": "Fixes a bug.\n" * 5,
+            "created_at": "2025-11-01T10:00:00Z",
+            "updated_at": "2025-11-02T10:00:00Z",
+            "merged_at": None,
+            "user": _user("octocat"),
+            "head": {"ref": f"feature-{number}", "sha": _sha(f"head{number}")},
+            "base": {"ref": "main", "sha": _sha("main")},
+        }
+
+    def repository(self) -> dict[str, Any]:
+        return {
+            "id": 1296269,
+            "name": NAME,
+            "full_name": REPO,
+            "owner": _user(OWNER),
+            "private": False,
+            "url": self.url,
+            "html_url": f"https://github.com/{REPO}",
+            "default_branch": "main",
+        }
+
+    def content(self, path: str, with_content: bool) -> dict[str, Any]:
+        if path in self.files:
+            text = self.files[path]
+            entry = {"type": "file", "size": len(text.encode()), "sha": _sha(text)}
+            if with_content:
+                entry["encoding"] = "base64"
+                entry["content"] = base64.b64encode(text.encode()).decode()
+        else:
+            entry = {"type": "dir", "size": 0, "sha": _sha(path)}
+        return {
+            **entry,
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "url": f"{self.url}/contents/{path}",
+            "html_url": f"https://github.com/{REPO}/blob/main/{path}",
+        }
+
+    def children(self, directory: str) -> list[str]:
+        """Direct children (files and directories) of ``directory``."""
+        prefix = f"{directory}/" if directory else ""
+        names = {
+            prefix + path[len(prefix) :].split("/", 1)[0]
+            for path in self.files
+            if path.startswith(prefix)
+        }
+        return sorted(names)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment, without Nagle delays
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PATCH(self) -> None:
+        self._handle("PATCH")
+
+    def _handle(self, method: str) -> None:
+        fake = self.server.fake
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else {}
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        fake.delay()
+        status, data, headers = fake.route(method, unquote(url.path), query, body)
+
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in {**fake.rate_limit_headers(), **headers}.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeGithub"
+
+
+class FakeGithub:
+    """Local GitHub API server running in a background thread.
+
+    Args:
+        latency: Seconds each request is delayed before it is answered
+        jitter: Extra random delay per request, uniform in [0, jitter]
+        issues: Issues in the repository
+        pulls: Pull requests in the repository
+        dirs: Top-level directories (each with ``files_per_dir`` files)
+        files_per_dir: Files per directory
+        per_page: Page size when the client does not send ``per_page``
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        issues: int = 250,
+        pulls: int = 120,
+        dirs: int = 5,
+        files_per_dir: int = 10,
+        per_page: int = DEFAULT_PER_PAGE,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.per_page = per_page
+        self._server = _Server((host, port), _Handler)
+        self._server.fake = self
+        self.base_url = f"http://{host}:{self._server.server_address[1]}"
+        self.repo = FakeRepository(self.base_url, issues, pulls, dirs, files_per_dir)
+        self.requests_served = 0
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "FakeGithub":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Serve in a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def delay(self) -> None:
+        with self._lock:
+            self.requests_served += 1
+        pause = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if pause:
+            time.sleep(pause)
+
+    def rate_limit_headers(self) -> dict[str, str]:
+        used = min(self.requests_served, RATE_LIMIT)
+        return {
+            "X-RateLimit-Limit": str(RATE_LIMIT),
+            "X-RateLimit-Remaining": str(RATE_LIMIT - used),
+            "X-RateLimit-Used": str(used),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            "X-RateLimit-Resource": "core",
+        }
+
+    # ------------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------------
+
+    _ROUTES = (
+        ("GET", re.compile(r"/repos/([^/]+/[^/]+)"), "get_repository"),
+        ("GET", re.compile(r"/repos/([^/]+/[^/]+)/issues"), "list_issues"),
+        ("POST", re.compile(r"/repos/([^/]+/[^/]+)/issues"), "create_issue"),
+        ("GET", re.compile(r"/repos/([^/]+/[^/]+)/issues/(\d+)"), "get_issue"),
+        ("PATCH", re.compile(r"/repos/([^/]+/[^/]+)/issues/(\d+)"), "update_issue"),
+        ("GET", re.compile(r"/repos/([^/]+/[^/]+)/pulls"), "list_pulls"),
+        ("GET", re.compile(r"/repos/([^/]+/[^/]+)/pulls/(\d+)"), "get_pull"),
+        ("GET", re.compile(r"/repos/([^/]+/[^/]+)/contents/?(.*)"), "get_contents"),
+        ("GET", re.compile(r"/repos/([^/]+/[^/]+)/git/trees/([^/]+)"), "get_tree"),
+    )
+
+    def route(
+        self, method: str, path: str, query: dict[str, str], body: dict[str, Any]
+    ) -> tuple[int, Any, dict[str, str]]:
+        """Answer one request: (status, JSON body, extra headers)."""
+        if method == "GET" and path == "/rate_limit":
+            return 200, self.rate_limit(), {}
+        for route_method, pattern, handler in self._ROUTES:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                repo, *args = match.groups()
+                if repo != REPO:
+                    break
+                with self.repo.lock:
+                    return getattr(self, handler)(*args, query=query, body=body)
+        return 404, {"message": "Not Found"}, {}
+
+    def _page(self, path: str, items: list[Any], query: dict[str, str]):
+        per_page = min(int(query.get("per_page", self.per_page)), MAX_PER_PAGE)
+        page = max(int(query.get("page", 1)), 1)
+        last = max((len(items) + per_page - 1) // per_page, 1)
+        links = []
+        for rel, number in (("next", page + 1), ("last", last)):
+            if page < last:
+                params = urlencode({**query, "page": number})
+                links.append(f'<{self.base_url}{path}?{params}>; rel="{rel}"')
+        headers = {"Link": ", ".join(links)} if links else {}
+        return 200, items[(page - 1) * per_page : page * per_page], headers
+
+    def get_repository(self, query, body):
+        return 200, self.repo.repository(), {}
+
+    def list_issues(self, query, body):
+        state = query.get("state", "open")
+        labels = set(filter(None, query.get("labels", "").split(",")))
+        assignee = query.get("assignee")
+        issues = [
+            issue
+            for issue in self.repo.issues.values()
+            if state in ("all", issue["state"])
+            and labels <= {label["name"] for label in issue["labels"]}
+            and (assignee is None or assignee in {a["login"] for a in issue["assignees"]})
+        ]
+        return self._page(f"/repos/{REPO}/issues", issues, query)
+
+    def create_issue(self, query, body):
+        if not body.get("title"):
+            return 422, {"message": "Validation Failed"}, {}
+        number = max(self.repo.issues, default=0) + 1
+        self.repo.issues[number] = issue = self.repo.new_issue(
+            number,
+            title=body["title"],
+            body=body.get("body") or "",
+            labels=body.get("labels"),
+            assignees=body.get("assignees"),
+        )
+        return 201, issue, {}
+
+    def get_issue(self, number, query, body):
+        issue = self.repo.issues.get(int(number))
+        return (200, issue, {}) if issue else (404, {"message": "Not Found"}, {})
+
+    def update_issue(self, number, query, body):
+        issue = self.repo.issues.get(int(number))
+        if issue is None:
+            return 404, {"message": "Not Found"}, {}
+        for key in ("title", "body", "state"):
+            if key in body:
+                issue[key] = body[key]
+        if "labels" in body:
+            issue["labels"] = [{"name": name, "color": "ededed"} for name in body["labels"]]
+        if "assignees" in body:
+            issue["assignees"] = [_user(login) for login in body["assignees"]]
+        return 200, issue, {}
+
+    def list_pulls(self, query, body):
+        state = query.get("state", "open")
+        pulls = [pr for pr in self.repo.pulls.values() if state in ("all", pr["state"])]
+        return self._page(f"/repos/{REPO}/pulls", pulls, query)
+
+    def get_pull(self, number, query, body):
+        pr = self.repo.pulls.get(int(number))
+        if pr is None:
+            return 404, {"message": "Not Found"}, {}
+        return 200, {**pr, "mergeable": True, "merged": False}, {}
+
+    def get_contents(self, path, query, body):
+        path = path.strip("/")
+        if path in self.repo.files:
+            return 200, self.repo.content(path, with_content=True), {}
+        children = self.repo.children(path)
+        if not children:
+            return 404, {"message": "Not Found"}, {}
+        return 200, [self.repo.content(child, with_content=False) for child in children], {}
+
+    def get_tree(self, sha, query, body):
+        if query.get("recursive"):
+            dirs = {path.rsplit("/", 1)[0] for path in self.repo.files if "/" in path}
+            paths = sorted({*self.repo.files, *dirs})
+        else:
+            paths = self.repo.children("")
+        tree = [
+            {
+                "path": path,
+                "type": "blob" if path in self.repo.files else "tree",
+                "sha": _sha(self.repo.files.get(path, path)),
+                "size": len(self.repo.files[path].encode()) if path in self.repo.files else None,
+            }
+            for path in paths
+        ]
+        return 200, {"sha": sha, "tree": tree, "truncated": False}, {}
+
+    def rate_limit(self) -> dict[str, Any]:
+        core = {
+            "limit": RATE_LIMIT,
+            "remaining": RATE_LIMIT - min(self.requests_served, RATE_LIMIT),
+            "reset": int(time.time()) + 3600,
+            "used": min(self.requests_served, RATE_LIMIT),
+        }
+        return {"resources": {"core": core}, "rate": core}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a fake GitHub REST API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra random seconds")
+    parser.add_argument("--issues", type=int, default=250)
+    parser.add_argument("--pulls", type=int, default=120)
+    parser.add_argument("--per-page", type=int, default=DEFAULT_PER_PAGE)
+    args = parser.parse_args()
+
+    server = FakeGithub(
+        latency=args.latency,
+        jitter=args.jitter,
+        issues=args.issues,
+        pulls=args.pulls,
+        per_page=args.per_page,
+        port=args.port,
+    )
+    print(f"Fake GitHub API for {REPO} at {server.base_url} (GITHUB_API_URL)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
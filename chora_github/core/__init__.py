@@ -19,16 +19,28 @@ from .exceptions import (
     GithubValidationError,
 )
 from .models import (  # Enums; Common data models; Request models (8 tools); Response models (8 tools); Tool metadata; Tool call envelope
+    BatchIssuesResponse,
+    BatchItemResult,
+    BudgetReport,
+    ColumnarTable,
     CreateIssueRequest,
     CreateIssueResponse,
+    CreateIssuesRequest,
+    EnqueueIssueWriteResponse,
     FileData,
     FileType,
     GetFileContentsRequest,
     GetFileContentsResponse,
     GetIssueRequest,
     GetIssueResponse,
+    GetIssuesRequest,
+    GetIssuesResponse,
     GetPRRequest,
     GetPRResponse,
+    GetPRsRequest,
+    GetPRsResponse,
+    GetWriteJobRequest,
+    GetWriteJobResponse,
     IssueData,
     IssueState,
     ListIssuesRequest,
@@ -37,14 +49,26 @@ from .models import (  # Enums; Common data models; Request models (8 tools); Re
     ListPRsResponse,
     ListRepoFilesRequest,
     ListRepoFilesResponse,
+    PartialResult,
     PRData,
     PRState,
+    ResponseFormat,
+    StreamIssuesRequest,
+    StreamPRsRequest,
+    ToolBatchRequest,
+    ToolBatchResponse,
     ToolCallRequest,
     ToolCallResponse,
     ToolDefinition,
     ToolParameter,
+    TruncatedField,
     UpdateIssueRequest,
     UpdateIssueResponse,
+    UpdateIssuesRequest,
+    UpstreamReport,
+    WriteJob,
+    WriteJobStatus,
+    WriteOperation,
 )
 
 
@@ -56,16 +80,28 @@ from .models import (  # Enums; Common data models; Request models (8 tools); Re
 # )
 
 __all__ = [
+    "BatchIssuesResponse",
+    "BatchItemResult",
+    "BudgetReport",
+    "ColumnarTable",
     "CreateIssueRequest",
     "CreateIssueResponse",
+    "CreateIssuesRequest",
+    "EnqueueIssueWriteResponse",
     "FileData",
     "FileType",
     "GetFileContentsRequest",
     "GetFileContentsResponse",
     "GetIssueRequest",
     "GetIssueResponse",
+    "GetIssuesRequest",
+    "GetIssuesResponse",
     "GetPRRequest",
     "GetPRResponse",
+    "GetPRsRequest",
+    "GetPRsResponse",
+    "GetWriteJobRequest",
+    "GetWriteJobResponse",
     "GithubConfigError",
     "GithubConflictError",
     # Services (not yet implemented - Phase 2.2.4)
@@ -94,12 +130,24 @@ __all__ = [
     "ListRepoFilesResponse",
     "PRData",
     "PRState",
+    "PartialResult",
+    "ResponseFormat",
+    "StreamIssuesRequest",
+    "StreamPRsRequest",
     # Tool call envelope
+    "ToolBatchRequest",
+    "ToolBatchResponse",
     "ToolCallRequest",
     "ToolCallResponse",
     # Tool metadata
     "ToolDefinition",
     "ToolParameter",
+    "TruncatedField",
     "UpdateIssueRequest",
     "UpdateIssueResponse",
+    "UpdateIssuesRequest",
+    "UpstreamReport",
+    "WriteJob",
+    "WriteJobStatus",
+    "WriteOperation",
 ]
@@ -0,0 +1,187 @@
+"""GitHub - Upstream Request Accounting (SAP-042)
+
+Counts the HTTP requests each service call makes to GitHub, so hidden
+lazy-loading (N+1 request patterns) shows up in responses, logs and tests.
+
+``track_usage()`` opens an accounting scope bound to the current context
+(contextvars, so it follows ``run_in_threadpool`` and ``copy_context``):
+every upstream request observed while it is active (see ``core.upstream``)
+is added to it, as is every service cache hit. Scopes nest: when a scope
+closes, its totals are added to the enclosing one, so a REST request, a
+dispatched tool call and each service call all see their own totals.
+
+``request_budget()`` turns a scope into an assertion for tests.
+"""
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from . import upstream
+from .models import UpstreamReport
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class UpstreamUsage:
+    """Upstream requests made within one accounting scope.
+
+    Attributes:
+        requests: HTTP requests sent to GitHub
+        not_modified: Requests GitHub answered with 304 Not Modified
+        cache_hits: Lookups served from the service cache (no request)
+        upstream_seconds: Total time spent waiting for GitHub
+        endpoints: Requests per ``METHOD endpoint-template``
+    """
+
+    requests: int = 0
+    not_modified: int = 0
+    cache_hits: int = 0
+    upstream_seconds: float = 0.0
+    endpoints: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, call: upstream.UpstreamCall) -> None:
+        """Add one upstream request."""
+        key = f"{call.method} {call.endpoint}"
+        with self._lock:
+            self.requests += 1
+            self.not_modified += call.not_modified
+            self.upstream_seconds += call.duration
+            self.endpoints[key] = self.endpoints.get(key, 0) + 1
+
+    def record_cache_hit(self) -> None:
+        """Add one service cache hit."""
+        with self._lock:
+            self.cache_hits += 1
+
+    def merge(self, other: "UpstreamUsage") -> None:
+        """Add the totals of a nested scope."""
+        with self._lock:
+            self.requests += other.requests
+            self.not_modified += other.not_modified
+            self.cache_hits += other.cache_hits
+            self.upstream_seconds += other.upstream_seconds
+            for key, count in other.endpoints.items():
+                self.endpoints[key] = self.endpoints.get(key, 0) + count
+
+    def report(self) -> UpstreamReport:
+        """Totals as a response model."""
+        return UpstreamReport(
+            requests=self.requests,
+            not_modified=self.not_modified,
+            cache_hits=self.cache_hits,
+            upstream_ms=round(self.upstream_seconds * 1000, 3),
+            endpoints=dict(self.endpoints),
+        )
+
+    def headers(self) -> dict[str, str]:
+        """Totals as HTTP response headers."""
+        return {
+            "X-Upstream-Requests": str(self.requests),
+            "X-Upstream-Not-Modified": str(self.not_modified),
+            "X-Upstream-Cache-Hits": str(self.cache_hits),
+            "X-Upstream-Duration": f"{self.upstream_seconds:.3f}s",
+        }
+
+    def summary(self) -> str:
+        """One-line description for logs and assertion messages."""
+        endpoints = ", ".join(f"{key} x{count}" for key, count in self.endpoints.items())
+        return (
+            f"{self.requests} upstream requests ({self.not_modified} not modified, "
+            f"{self.cache_hits} cache hits, {self.upstream_seconds * 1000:.1f} ms)"
+            + (f": {endpoints}" if endpoints else "")
+        )
+
+
+_current: ContextVar[UpstreamUsage | None] = ContextVar("github_upstream_usage", default=None)
+
+
+def current_usage() -> UpstreamUsage | None:
+    """Return the innermost active accounting scope, if any."""
+    return _current.get()
+
+
+@contextmanager
+def track_usage(label: str | None = None) -> Iterator[UpstreamUsage]:
+    """Account upstream requests made inside the ``with`` block.
+
+    Args:
+        label: Name logged (at DEBUG) with the totals when the scope closes,
+            e.g. the tool name
+
+    Yields:
+        UpstreamUsage, complete once the block exits
+    """
+    parent = _current.get()
+    usage = UpstreamUsage()
+    token = _current.set(usage)
+    try:
+        yield usage
+    finally:
+        _current.reset(token)
+        if parent is not None:
+            parent.merge(usage)
+        if label is not None:
+            logger.debug("%s: %s", label, usage.summary())
+
+
+def record_cache_hit() -> None:
+    """Count a service cache hit in the active scope (if any)."""
+    usage = _current.get()
+    if usage is not None:
+        usage.record_cache_hit()
+
+
+def _record_upstream(call: upstream.UpstreamCall) -> None:
+    usage = _current.get()
+    if usage is not None:
+        usage.record(call)
+
+
+upstream.add_observer(_record_upstream)
+
+
+# ============================================================================
+# Test Helper
+# ============================================================================
+
+
+@contextmanager
+def request_budget(
+    max_requests: int, label: str = "block", max_seconds: float | None = None
+) -> Iterator[UpstreamUsage]:
+    """Assert that a block stays within an upstream request budget.
+
+    Example::
+
+        with request_budget(2, label="get_pr"):
+            service.get_pr(GetPRRequest(repo="octocat/Hello-World", pr_number=1))
+
+    Args:
+        max_requests: Maximum HTTP requests the block may send to GitHub
+        label: Name used in the failure message (e.g. the tool)
+        max_seconds: Optional maximum total upstream time
+
+    Yields:
+        UpstreamUsage of the block
+
+    Raises:
+        AssertionError: If the block exceeded the budget
+    """
+    with track_usage() as usage:
+        yield usage
+    if usage.requests > max_requests:
+        raise AssertionError(
+            f"{label} exceeded its budget of {max_requests} upstream requests: "
+            f"{usage.summary()}"
+        )
+    if max_seconds is not None and usage.upstream_seconds > max_seconds:
+        raise AssertionError(
+            f"{label} exceeded its budget of {max_seconds}s upstream time: {usage.summary()}"
+        )
@@ -0,0 +1,152 @@
+"""GitHub - Batch Execution Helpers (SAP-042)
+
+This module runs many independent write operations with bounded
+concurrency while respecting GitHub's secondary rate limits for
+content-creating requests.
+
+GitHub asks integrations to avoid bursts of content-creating requests
+(issues, comments, edits): writes should be spaced out and, when a
+secondary rate limit is hit, no further writes should be sent until the
+``Retry-After`` period has passed. WriteThrottle enforces both rules for all
+workers of a batch, and run_batch collects a result per item so one failure
+never aborts the rest of the batch.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TypeVar
+
+from . import deadlines
+from .exceptions import GithubError, GithubRateLimitError, get_error_code
+from .models import BatchItemResult, IssueData
+
+
+T = TypeVar("T")
+
+DEFAULT_WRITE_INTERVAL = 1.0
+"""Minimum seconds between content-creating requests (GitHub guidance)."""
+
+DEFAULT_RATE_LIMIT_PAUSE = 60.0
+"""Pause applied on a secondary rate limit without a Retry-After header."""
+
+
+# ============================================================================
+# Write Throttle
+# ============================================================================
+
+
+class WriteThrottle:
+    """Paces write requests shared by concurrent workers.
+
+    Each call to acquire() reserves the next start slot, so writes start at
+    least ``min_interval`` seconds apart regardless of how many workers are
+    running. pause() blocks all further writes until the given time passes.
+    A caller whose deadline would expire first fails instead of waiting.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_WRITE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize throttle.
+
+        Args:
+            min_interval: Minimum seconds between write starts
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.min_interval = min_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller may start its write request.
+
+        Raises:
+            GithubTimeoutError: If the current deadline expires first
+        """
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_slot, self._paused_until)
+            delay = start - now
+            deadlines.check("throttled write", wait=delay)
+            self._next_slot = start + self.min_interval
+        if delay > 0:
+            self._sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stop all writes for ``seconds`` (e.g. after a secondary rate limit).
+
+        Args:
+            seconds: Pause duration in seconds
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+# ============================================================================
+# Batch Runner
+# ============================================================================
+
+
+def run_batch(
+    items: Sequence[T],
+    worker: Callable[[T], IssueData],
+    max_concurrency: int,
+    throttle: WriteThrottle | None = None,
+    max_attempts: int = 2,
+) -> list[BatchItemResult]:
+    """Run ``worker`` for every item with bounded concurrency.
+
+    Errors are captured per item, including unexpected exceptions. An item
+    failing with GithubRateLimitError pauses the throttle for the advertised
+    retry period and is retried (up to ``max_attempts`` attempts in total).
+
+    Args:
+        items: Items to process
+        worker: Function performing one write and returning the issue
+        max_concurrency: Maximum number of writes in flight
+        throttle: Shared write throttle (a default one is created if omitted)
+        max_attempts: Attempts per item when rate limited
+
+    Returns:
+        One BatchItemResult per item, in input order
+    """
+    throttle = throttle or WriteThrottle()
+
+    def run_one(index: int, item: T) -> BatchItemResult:
+        attempt = 1
+        while True:
+            try:
+                throttle.acquire()
+                issue = worker(item)
+                return BatchItemResult(index=index, success=True, issue=issue)
+            except GithubRateLimitError as e:
+                retry_after = e.details.get("retry_after_seconds", DEFAULT_RATE_LIMIT_PAUSE)
+                throttle.pause(retry_after)
+                if attempt >= max_attempts:
+                    return BatchItemResult(
+                        index=index, success=False, error=e.message, error_code=e.code
+                    )
+                attempt += 1
+            except Exception as e:
+                message = e.message if isinstance(e, GithubError) else str(e)
+                return BatchItemResult(
+                    index=index, success=False, error=message, error_code=get_error_code(e)
+                )
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        # Each item runs in a copy of the caller's context (upstream accounting)
+        futures = [
+            pool.submit(copy_context().run, run_one, index, item)
+            for index, item in enumerate(items)
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,213 @@
+"""GitHub - Response Budget (SAP-042)
+
+Fit issue and pull request responses into a caller-chosen size budget.
+
+Issue and PR bodies can be tens of kilobytes each, so a listing returned
+verbatim can exceed what an agent can usefully read. ``fit_to_budget``
+shrinks a response until its compact JSON fits ``max_bytes``, cutting in
+this order:
+
+1. Bodies are truncated to a common length, with a marker that records the
+   original length. Short bodies are left intact.
+2. Whole fields are dropped from every item, lowest priority first
+   (``DROP_ORDER``). ``number``, ``title`` and ``state`` are always kept.
+3. Trailing items are omitted from lists.
+
+The response gains a ``budget`` object (BudgetReport) listing everything
+that was cut, so callers know which items to fetch in full with
+``get_issue`` / ``get_pr``.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+from .models import BudgetReport, TruncatedField
+from .serialization import dumps
+from .tracing import traced
+
+
+CHARS_PER_TOKEN = 4
+"""Approximate characters per model token, used to convert token budgets."""
+
+MIN_BUDGET_BYTES = 256
+"""Smallest accepted budget; below this not even one item summary fits."""
+
+TRUNCATION_MARKER = "… [truncated, {length} chars]"
+"""Appended to truncated text; ``length`` is the original length."""
+
+TRUNCATABLE_FIELDS = ("body",)
+
+DROP_ORDER = (
+    "body",
+    "updated_at",
+    "assignees",
+    "url",
+    "created_at",
+    "mergeable",
+    "merged",
+    "head_ref",
+    "base_ref",
+    "labels",
+    "author",
+)
+"""Fields dropped to fit a budget, lowest priority first."""
+
+ITEM_FIELDS = ("issues", "pull_requests", "issue", "pull_request")
+"""Response fields holding the items a budget applies to."""
+
+
+def budget_bytes(max_bytes: int | None = None, max_tokens: int | None = None) -> int | None:
+    """Resolve byte and token limits into a single byte budget.
+
+    Args:
+        max_bytes: Byte limit (optional)
+        max_tokens: Token limit, converted at CHARS_PER_TOKEN (optional)
+
+    Returns:
+        The tighter of the two limits in bytes, or None if neither is set
+
+    Raises:
+        ValueError: If the budget is below MIN_BUDGET_BYTES
+    """
+    limits = [max_bytes] if max_bytes is not None else []
+    if max_tokens is not None:
+        limits.append(max_tokens * CHARS_PER_TOKEN)
+    if not limits:
+        return None
+    limit = min(limits)
+    if limit < MIN_BUDGET_BYTES:
+        raise ValueError(
+            f"Response budget too small: {limit} bytes (minimum {MIN_BUDGET_BYTES})"
+        )
+    return limit
+
+
+def json_size(data: Any) -> int:
+    """Return the size of ``data`` as compact UTF-8 JSON, in bytes."""
+    return len(dumps(data, pretty=False).encode())
+
+
+def truncate_text(text: str, length: int) -> str:
+    """Cut ``text`` to ``length`` characters and append the truncation marker."""
+    return text[:length] + TRUNCATION_MARKER.format(length=len(text))
+
+
+def _shape(
+    rows: list[dict[str, Any]],
+    cap: int | None,
+    dropped: list[str],
+    count: int,
+) -> tuple[list[dict[str, Any]], list[TruncatedField]]:
+    shaped: list[dict[str, Any]] = []
+    truncated: list[TruncatedField] = []
+    for row in rows[:count]:
+        row = {name: value for name, value in row.items() if name not in dropped}
+        for name in TRUNCATABLE_FIELDS:
+            text = row.get(name)
+            if cap is None or not isinstance(text, str) or len(text) <= cap:
+                continue
+            short = truncate_text(text, cap)
+            if len(short) < len(text):
+                row[name] = short
+                truncated.append(
+                    TruncatedField(
+                        number=row["number"],
+                        field=name,
+                        original_length=len(text),
+                        returned_length=cap,
+                    )
+                )
+        shaped.append(row)
+    return shaped, truncated
+
+
+def _measured(result: dict[str, Any]) -> dict[str, Any]:
+    # Twice: writing the size can itself change the size by a digit
+    for _ in range(2):
+        result["budget"]["returned_bytes"] = json_size(result)
+    return result
+
+
+@traced("serialize.budget")
+def fit_to_budget(response: BaseModel | dict[str, Any], max_bytes: int) -> dict[str, Any]:
+    """Shrink a response until its compact JSON fits ``max_bytes``.
+
+    Args:
+        response: Issue/PR response model (or its JSON dict form)
+        max_bytes: Budget in bytes of compact JSON
+
+    Returns:
+        Response dict with a ``budget`` BudgetReport. If nothing more can be
+        cut (a single item with only required fields), the result may still
+        exceed the budget.
+    """
+    data = (
+        response.model_dump(mode="json")
+        if isinstance(response, BaseModel)
+        else dict(response)
+    )
+    original = json_size(data)
+    report = BudgetReport(max_bytes=max_bytes, original_bytes=original, returned_bytes=original)
+    items_field = next((name for name in ITEM_FIELDS if data.get(name) is not None), None)
+    if original <= max_bytes or items_field is None:
+        return _measured({**data, "budget": report.model_dump()})
+
+    single = isinstance(data[items_field], dict)
+    rows: list[dict[str, Any]] = [data[items_field]] if single else data[items_field]
+
+    def build(cap: int | None, dropped: list[str], count: int) -> dict[str, Any]:
+        shaped, report.truncated = _shape(rows, cap, dropped, count)
+        report.dropped_fields = list(dropped)
+        report.omitted_items = len(rows) - count
+        # Measured with returned_bytes at its upper bound, so filling in the
+        # real size afterwards never pushes the result over the budget
+        report.returned_bytes = max_bytes
+        return {
+            **data,
+            items_field: shaped[0] if single else shaped,
+            "budget": report.model_dump(),
+        }
+
+    def fits(cap: int | None, dropped: list[str], count: int) -> bool:
+        return json_size(build(cap, dropped, count)) <= max_bytes
+
+    def finish(cap: int | None, dropped: list[str], count: int) -> dict[str, Any]:
+        return _measured(build(cap, dropped, count))
+
+    # 1. Truncate text fields to the longest common length that fits
+    longest = max(
+        (len(row.get(name) or "") for row in rows for name in TRUNCATABLE_FIELDS),
+        default=0,
+    )
+    if fits(0, [], len(rows)):
+        low, high = 0, longest
+        while low < high:
+            middle = (low + high + 1) // 2
+            if fits(middle, [], len(rows)):
+                low = middle
+            else:
+                high = middle - 1
+        return finish(low, [], len(rows))
+
+    # 2. Drop whole fields, lowest priority first
+    present = {name for row in rows for name in row}
+    dropped: list[str] = []
+    for name in DROP_ORDER:
+        if name not in present:
+            continue
+        dropped.append(name)
+        if fits(0, dropped, len(rows)):
+            return finish(0, dropped, len(rows))
+
+    # 3. Omit trailing items
+    if single:
+        return finish(0, dropped, 1)
+    low, high = 0, len(rows)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(0, dropped, middle):
+            low = middle
+        else:
+            high = middle - 1
+    return finish(0, dropped, low)
@@ -0,0 +1,114 @@
+"""GitHub - In-Process Cache (SAP-042)
+
+A small thread-safe TTL + LRU cache used by the service layer to remember
+recently seen GitHub objects (for example the last known state of an
+issue), so that redundant upstream requests can be skipped.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached value with the time it was stored."""
+
+    value: Any
+    stored_at: float
+    etag: str | None = None
+
+    def age(self, now: float) -> float:
+        """Seconds since the entry was stored."""
+        return max(0.0, now - self.stored_at)
+
+
+class TTLCache:
+    """Thread-safe cache with per-entry expiry and LRU eviction.
+
+    Attributes:
+        ttl: Seconds an entry stays fresh
+        max_entries: Maximum number of entries kept (least recently used
+            entries are evicted first)
+        hits: Number of lookups that returned a fresh entry
+        misses: Number of lookups that found nothing fresh
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh (0 disables caching)
+            max_entries: Maximum number of entries kept
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        """Return the fresh entry for ``key``, or None.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry if present and not expired, otherwise None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.age(self._clock()) < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, etag: str | None = None) -> None:
+        """Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            etag: Optional upstream ETag for the value
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = CacheEntry(value=value, stored_at=self._clock(), etag=etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
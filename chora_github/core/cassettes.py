@@ -0,0 +1,519 @@
+"""GitHub - Upstream Traffic Cassettes (SAP-042)
+
+Records the GitHub traffic produced by GithubToolService into sanitized
+cassettes, and replays it offline.
+
+A cassette holds two recordings of the same period, with start offsets:
+
+- interactions: every upstream HTTP exchange (method, path, request body,
+  status, selected response headers, response body, duration)
+- calls: every service operation (tool name and request parameters)
+
+``Recorder`` captures both through the upstream interceptor and the tool
+observers (see ``core.upstream`` and ``core.metrics``), so it works under
+any interface. A server process records when ``GITHUB_CASSETTE_RECORD`` is
+set to a file path (see ``recorder_from_env``).
+
+``Player`` answers upstream requests from a cassette instead of the network,
+taking the recorded duration divided by ``speed``; ``replay_calls`` re-issues
+the recorded tool calls at their (scaled) offsets. Together they run a
+real workload against any service configuration (caching, GraphQL,
+concurrency) without network access, see ``benchmarks/bench_replay.py``.
+
+Absolute URLs of the recorded API (pagination links, ``url`` fields) are
+stored relative to ``{origin}`` and restored with the replaying client's API
+root, so a cassette can be replayed against any ``base_url``.
+
+Sanitizing: request headers (and so the token) are never stored, response
+headers are reduced to an allowlist, and token-like strings and secret query
+parameters are redacted everywhere; ``redact`` adds project-specific rules.
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from . import upstream
+from .dispatch import DEFAULT_MAX_CONCURRENCY, ToolDispatcher
+from .metrics import add_tool_observer, remove_tool_observer
+from .models import ToolCallRequest, ToolCallResponse
+
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+RECORD_ENV = "GITHUB_CASSETTE_RECORD"
+"""Environment variable: record the process's traffic to this file."""
+
+REDACTED = "REDACTED"
+
+ORIGIN = "{origin}"
+"""Stands in for the recorded API's scheme, host and port."""
+
+KEPT_HEADERS = frozenset(
+    {
+        "cache-control",
+        "content-type",
+        "etag",
+        "last-modified",
+        "link",
+        "location",
+        "retry-after",
+    }
+)
+KEPT_HEADER_PREFIXES = ("x-ratelimit-",)
+
+_SECRETS = (
+    # Personal access, OAuth, user-to-server, server-to-server and refresh tokens
+    (re.compile(r"\b(?:gh[pousr]_[A-Za-z0-9]{20,}|github_pat_[A-Za-z0-9_]{20,})"), REDACTED),
+    (re.compile(r"\b((?:access_token|client_secret|code|token)=)[^&#\s\"]+"), rf"\1{REDACTED}"),
+)
+
+
+def sanitize(text: str) -> str:
+    """Redact GitHub tokens and secret query parameters from ``text``."""
+    for pattern, replacement in _SECRETS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _origin(connection: Any) -> str:
+    """Scheme, host and (non-default) port a PyGithub connection talks to."""
+    protocol, port = connection.protocol, connection.port
+    default = 443 if protocol == "https" else 80
+    suffix = f":{port}" if port and int(port) != default else ""
+    return f"{protocol}://{connection.host}{suffix}"
+
+
+# ============================================================================
+# Cassette
+# ============================================================================
+
+
+@dataclass(slots=True)
+class Interaction:
+    """One recorded upstream HTTP exchange.
+
+    Attributes:
+        offset: Seconds from the start of the recording to the request
+        duration: Seconds until the response was received
+        method: HTTP method
+        url: Path and query string, as sent by PyGithub
+        request_body: JSON request body (None for bodiless requests)
+        status: HTTP status code
+        headers: Allowlisted response headers (lowercase names)
+        body: Response body
+    """
+
+    offset: float
+    duration: float
+    method: str
+    url: str
+    request_body: str | None
+    status: int
+    headers: dict[str, str]
+    body: str
+
+
+@dataclass(slots=True)
+class RecordedCall:
+    """One recorded service operation.
+
+    Attributes:
+        offset: Seconds from the start of the recording to the call
+        tool: Tool (service method) name
+        parameters: Request parameters the caller set
+    """
+
+    offset: float
+    tool: str
+    parameters: dict[str, Any]
+
+
+@dataclass
+class Cassette:
+    """Recorded upstream traffic and the tool calls that produced it."""
+
+    interactions: list[Interaction] = field(default_factory=list)
+    calls: list[RecordedCall] = field(default_factory=list)
+    recorded_at: str = ""
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the start of the recording to the last response."""
+        ends = [i.offset + i.duration for i in self.interactions]
+        ends += [call.offset for call in self.calls]
+        return max(ends, default=0.0)
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette as JSON (gzip-compressed if ``path`` ends in .gz)."""
+        data = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": self.recorded_at,
+            "calls": [asdict(call) for call in self.calls],
+            "interactions": [asdict(interaction) for interaction in self.interactions],
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """Read a cassette written by ``save``.
+
+        Raises:
+            ValueError: If the file is not a cassette of a supported version
+        """
+        path = Path(path)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"{path} is not a version {CASSETTE_VERSION} cassette")
+        return cls(
+            interactions=[Interaction(**item) for item in data["interactions"]],
+            calls=[RecordedCall(**item) for item in data["calls"]],
+            recorded_at=data.get("recorded_at", ""),
+        )
+
+
+# ============================================================================
+# Recording
+# ============================================================================
+
+
+class Recorder:
+    """Records upstream traffic and tool calls into a cassette.
+
+    Use as a context manager, or ``start()``/``stop()``. Only one recorder
+    or player should be active at a time (the interceptor is process-wide).
+
+    Attributes:
+        cassette: The recording so far
+        path: Where ``close()`` saves the cassette (optional)
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        redact: Callable[[str], str] | None = None,
+    ):
+        """Initialize recorder.
+
+        Args:
+            path: Where ``close()`` saves the cassette
+            redact: Applied after ``sanitize`` to every stored URL, body,
+                header value and call parameter (e.g. to mask private text)
+        """
+        self.cassette = Cassette()
+        self.path = Path(path) if path else None
+        self._redact = redact
+        self._lock = threading.Lock()
+        self._start = 0.0
+        self._previous: upstream.Interceptor | None = None
+        self._active = False
+
+    def start(self) -> "Recorder":
+        """Start recording."""
+        if self._active:
+            return self
+        upstream.install()
+        self._start = time.perf_counter()
+        self.cassette.recorded_at = datetime.now(UTC).isoformat(timespec="seconds")
+        self._previous = upstream.set_interceptor(self._intercept)
+        add_tool_observer(self._observe_tool)
+        self._active = True
+        return self
+
+    def stop(self) -> None:
+        """Stop recording (the cassette keeps what was recorded)."""
+        if not self._active:
+            return
+        upstream.set_interceptor(self._previous)
+        remove_tool_observer(self._observe_tool)
+        self._active = False
+
+    def close(self) -> None:
+        """Stop recording and save the cassette to ``path``, if set."""
+        atexit.unregister(self.close)
+        self.stop()
+        if self.path is not None:
+            with self._lock:
+                self.cassette.save(self.path)
+            logger.info(
+                "Saved %d upstream interactions and %d tool calls to %s",
+                len(self.cassette.interactions),
+                len(self.cassette.calls),
+                self.path,
+            )
+
+    def __enter__(self) -> "Recorder":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _clean(self, text: str) -> str:
+        text = sanitize(text)
+        return self._redact(text) if self._redact else text
+
+    def _observe_tool(self, tool: str, request: Any) -> None:
+        parameters = (
+            request.model_dump(mode="json", exclude_unset=True)
+            if isinstance(request, BaseModel)
+            else {}
+        )
+        call = RecordedCall(
+            offset=time.perf_counter() - self._start,
+            tool=tool,
+            parameters=json.loads(self._clean(json.dumps(parameters))),
+        )
+        with self._lock:
+            self.cassette.calls.append(call)
+
+    def _intercept(self, connection: Any, send: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        previous = self._previous
+        response = send() if previous is None else previous(connection, send)
+        duration = time.perf_counter() - start
+        if getattr(connection, "stream", False):
+            return response  # downloads are not recorded (body not read here)
+
+        origin = _origin(connection)
+
+        def clean(text: str) -> str:
+            return self._clean(text.replace(origin, ORIGIN))
+
+        request_body = connection.input if isinstance(connection.input, str) else None
+        headers = {}
+        for name, value in response.getheaders():
+            name = name.lower()
+            if name in KEPT_HEADERS or name.startswith(KEPT_HEADER_PREFIXES):
+                headers[name] = clean(value)
+        interaction = Interaction(
+            offset=start - self._start,
+            duration=duration,
+            method=connection.verb,
+            url=clean(connection.url),
+            request_body=clean(request_body) if request_body is not None else None,
+            status=response.status,
+            headers=headers,
+            body=clean(response.read()),
+        )
+        with self._lock:
+            self.cassette.interactions.append(interaction)
+        return response
+
+
+def recorder_from_env() -> Recorder | None:
+    """Start recording if ``GITHUB_CASSETTE_RECORD`` names a file.
+
+    The cassette is saved when the returned recorder is closed, or at
+    process exit.
+
+    Returns:
+        The running Recorder, or None if recording is not configured
+    """
+    path = os.getenv(RECORD_ENV)
+    if not path:
+        return None
+    recorder = Recorder(path).start()
+    atexit.register(recorder.close)
+    logger.info("Recording upstream traffic to %s", path)
+    return recorder
+
+
+# ============================================================================
+# Replay
+# ============================================================================
+
+
+class CassetteMissError(LookupError):
+    """An upstream request has no recorded response in the cassette."""
+
+
+class _ReplayResponse:
+    """Recorded response, in the shape of PyGithub's RequestsResponse."""
+
+    def __init__(self, interaction: Interaction, origin: str):
+        self.status = interaction.status
+        self._origin = origin
+        self._headers = interaction.headers
+        self._body = interaction.body
+
+    def getheaders(self) -> list[tuple[str, str]]:
+        return [
+            (name, value.replace(ORIGIN, self._origin)) for name, value in self._headers.items()
+        ]
+
+    def read(self) -> str:
+        return self._body.replace(ORIGIN, self._origin)
+
+
+class Player:
+    """Answers upstream requests from a cassette instead of the network.
+
+    A request is matched by method, URL and request body, then by method
+    and URL alone. Repeated requests get the recorded responses in order;
+    once those run out, the last one is repeated.
+
+    Attributes:
+        cassette: The recording being replayed
+        speed: Playback speed; recorded durations are divided by it
+            (0: answer immediately)
+    """
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0):
+        """Initialize player.
+
+        Args:
+            cassette: Recording to replay
+            speed: Playback speed (1: as recorded, 10: ten times faster,
+                0: no delays)
+
+        Raises:
+            ValueError: If speed is negative
+        """
+        if speed < 0:
+            raise ValueError(f"speed must not be negative, got {speed}")
+        self.cassette = cassette
+        self.speed = speed
+        self._entries: dict[tuple[Any, ...], list[Interaction]] = {}
+        for interaction in cassette.interactions:
+            method, url = interaction.method, interaction.url
+            self._entries.setdefault((method, url, interaction.request_body), []).append(
+                interaction
+            )
+            self._entries.setdefault((method, url), []).append(interaction)
+        self._positions: dict[tuple[Any, ...], int] = {}
+        self._lock = threading.Lock()
+        self._previous: upstream.Interceptor | None = None
+        self._active = False
+
+    def match(self, method: str, url: str, body: str | None = None) -> Interaction:
+        """Return the recorded exchange for a request.
+
+        Raises:
+            CassetteMissError: If nothing was recorded for method and URL
+        """
+        with self._lock:
+            for key in ((method, url, body), (method, url)):
+                entries = self._entries.get(key)
+                if entries:
+                    position = self._positions.get(key, 0)
+                    self._positions[key] = min(position + 1, len(entries) - 1)
+                    return entries[position]
+        raise CassetteMissError(f"No recorded response for {method} {url}")
+
+    def scaled(self, seconds: float) -> float:
+        """Recorded seconds at the playback speed."""
+        return seconds / self.speed if self.speed else 0.0
+
+    def start(self) -> "Player":
+        """Start answering upstream requests from the cassette."""
+        if not self._active:
+            upstream.install()
+            self._previous = upstream.set_interceptor(self._intercept)
+            self._active = True
+        return self
+
+    def stop(self) -> None:
+        """Send upstream requests to the network again."""
+        if self._active:
+            upstream.set_interceptor(self._previous)
+            self._active = False
+
+    def __enter__(self) -> "Player":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _intercept(self, connection: Any, send: Callable[[], Any]) -> Any:
+        origin = _origin(connection)
+
+        def clean(text: str) -> str:
+            return sanitize(text.replace(origin, ORIGIN))
+
+        body = clean(connection.input) if isinstance(connection.input, str) else None
+        interaction = self.match(connection.verb, clean(connection.url), body)
+        delay = self.scaled(interaction.duration)
+        if delay:
+            time.sleep(delay)
+        return _ReplayResponse(interaction, origin)
+
+
+@dataclass(slots=True)
+class ReplayedCall:
+    """Outcome of one re-issued tool call.
+
+    Attributes:
+        call: The recorded call
+        response: Its response in this replay
+        seconds: Time it took in this replay
+    """
+
+    call: RecordedCall
+    response: ToolCallResponse
+    seconds: float
+
+
+def replay_calls(
+    service: Any,
+    cassette: Cassette,
+    speed: float = 1.0,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[ReplayedCall]:
+    """Re-issue a cassette's tool calls against ``service``.
+
+    Calls start at their recorded offsets divided by ``speed`` (0: all at
+    once) and run concurrently, as they did when recorded. Upstream
+    requests go wherever they would go: wrap this in a ``Player`` to answer
+    them from the cassette.
+
+    Args:
+        service: Service to run the calls against
+        cassette: Recording with the calls
+        speed: Playback speed (0: no gaps between calls)
+        max_workers: Calls in flight at most
+
+    Returns:
+        One ReplayedCall per recorded call, in recorded order
+    """
+    calls = sorted(cassette.calls, key=lambda call: call.offset)
+    scale = 1 / speed if speed else 0.0
+
+    with (
+        ToolDispatcher(service, max_concurrency=max_workers) as dispatcher,
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="replay") as pool,
+    ):
+
+        def run(call: RecordedCall) -> ReplayedCall:
+            start = time.perf_counter()
+            response = dispatcher.call(ToolCallRequest(tool=call.tool, parameters=call.parameters))
+            return ReplayedCall(call, response, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        futures = []
+        for call in calls:
+            wait = start + call.offset * scale - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            futures.append(pool.submit(run, call))
+        return [future.result() for future in futures]
@@ -0,0 +1,162 @@
+"""GitHub - Columnar Encoding (SAP-042)
+
+Optional compact encoding for large list responses.
+
+A row-oriented ``ListIssuesResponse`` repeats every key for every item, and
+the same labels and logins for most of them. The columnar encoding stores
+one array per field (struct-of-arrays) and replaces repeated strings with
+indexes into shared dictionaries: ``labels`` index the "labels" dictionary,
+``author`` and ``assignees`` share a "logins" dictionary, and file ``type``
+indexes a "types" dictionary.
+
+``encode_list_response`` produces the columnar form of a list response and
+``decode_list_response`` / ``decode_columnar`` restore the row form, so
+clients can round-trip without knowing the dictionary layout.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+from .models import (
+    ColumnarTable,
+    ListIssuesResponse,
+    ListPRsResponse,
+    ListRepoFilesResponse,
+    ResponseFormat,
+)
+from .tracing import traced
+
+
+DICTIONARY_COLUMNS = {
+    "labels": "labels",
+    "assignees": "logins",
+    "author": "logins",
+    "type": "types",
+}
+"""Columns encoded as dictionary indexes, mapped to their dictionary name."""
+
+LIST_ITEM_FIELDS: dict[type[BaseModel], str] = {
+    ListIssuesResponse: "issues",
+    ListPRsResponse: "pull_requests",
+    ListRepoFilesResponse: "files",
+}
+"""Field holding the items of each list response model."""
+
+
+def encode_columnar(
+    rows: list[dict[str, Any]],
+    dictionary_columns: dict[str, str] = DICTIONARY_COLUMNS,
+) -> ColumnarTable:
+    """Encode rows as a columnar table.
+
+    Args:
+        rows: Items as dicts (keys of the first row define the columns)
+        dictionary_columns: Columns to dictionary-encode, mapped to the
+            dictionary they share
+
+    Returns:
+        ColumnarTable
+    """
+    names = list(rows[0]) if rows else []
+    columns: dict[str, list[Any]] = {name: [] for name in names}
+    lookups: dict[str, dict[str, int]] = {}
+    encoded = {name: dictionary_columns[name] for name in names if name in dictionary_columns}
+
+    for row in rows:
+        for name in names:
+            value = row.get(name)
+            dictionary = encoded.get(name)
+            if dictionary is not None and value is not None:
+                lookup = lookups.setdefault(dictionary, {})
+                if isinstance(value, list):
+                    value = [lookup.setdefault(item, len(lookup)) for item in value]
+                else:
+                    value = lookup.setdefault(value, len(lookup))
+            columns[name].append(value)
+
+    return ColumnarTable(
+        count=len(rows),
+        columns=columns,
+        dictionaries={name: list(lookup) for name, lookup in lookups.items()},
+        encoded=encoded,
+    )
+
+
+def decode_columnar(table: ColumnarTable | dict[str, Any]) -> list[dict[str, Any]]:
+    """Decode a columnar table back into rows.
+
+    Args:
+        table: ColumnarTable or its dict/JSON form
+
+    Returns:
+        Items as dicts, in their original order
+    """
+    if not isinstance(table, ColumnarTable):
+        table = ColumnarTable.model_validate(table)
+
+    columns: dict[str, list[Any]] = {}
+    for name, values in table.columns.items():
+        dictionary_name = table.encoded.get(name)
+        if dictionary_name is None:
+            columns[name] = values
+            continue
+        dictionary = table.dictionaries.get(dictionary_name, [])
+        columns[name] = [
+            None
+            if value is None
+            else [dictionary[index] for index in value]
+            if isinstance(value, list)
+            else dictionary[value]
+            for value in values
+        ]
+    return [
+        {name: values[index] for name, values in columns.items()}
+        for index in range(table.count)
+    ]
+
+
+@traced("serialize.columnar")
+def encode_list_response(response: BaseModel | dict[str, Any]) -> dict[str, Any]:
+    """Encode a list response (issues, PRs or files) in columnar format.
+
+    The envelope is kept (e.g. ``total_count``), the item list is replaced by
+    a ColumnarTable and ``"format": "columnar"`` is added.
+
+    Args:
+        response: ListIssuesResponse, ListPRsResponse or ListRepoFilesResponse,
+            or the JSON dict form of one
+
+    Returns:
+        JSON-compatible dict
+    """
+    if isinstance(response, BaseModel):
+        items_field = LIST_ITEM_FIELDS[type(response)]
+        data = response.model_dump(mode="json")
+    else:
+        items_field = next(name for name in LIST_ITEM_FIELDS.values() if name in response)
+        data = dict(response)
+    table = encode_columnar(data.pop(items_field))
+    return {
+        "format": ResponseFormat.COLUMNAR.value,
+        **data,
+        items_field: table.model_dump(),
+    }
+
+
+def decode_list_response(payload: dict[str, Any]) -> dict[str, Any]:
+    """Restore the row form of a list response (no-op for row responses).
+
+    Args:
+        payload: Response dict produced by encode_list_response
+
+    Returns:
+        Response dict with items as a list of objects
+    """
+    if payload.get("format") != ResponseFormat.COLUMNAR.value:
+        return payload
+    data = {key: value for key, value in payload.items() if key != "format"}
+    for items_field in LIST_ITEM_FIELDS.values():
+        if items_field in data:
+            data[items_field] = decode_columnar(data[items_field])
+    return data
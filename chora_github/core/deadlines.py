@@ -0,0 +1,161 @@
+"""GitHub - Call Deadlines (SAP-042)
+
+A deadline is the time budget of one interface-level call: an MCP tool
+call, a REST request or a CLI command. ``deadline()`` opens it in the
+current context (contextvars, so it follows ``run_in_threadpool`` and
+``copy_context`` into worker threads), and every upstream request made
+while it is active is bounded by it (see ``core.upstream``):
+
+- each request's socket timeout is shortened to the time left;
+- no request is sent once the budget is spent, so pagination loops and
+  batches stop at the next page or item instead of running on;
+- PyGithub's retries do not wait past the deadline.
+
+When the budget runs out, GithubTimeoutError reports the operation, the
+time spent, the upstream requests completed and the request that was about
+to be sent (endpoint and page), so callers can tell how far it got.
+
+Deadlines nest: an inner deadline can only shorten the enclosing one.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from .exceptions import GithubTimeoutError
+
+
+DEFAULT_TOOL_TIMEOUT = 60.0
+"""Seconds an MCP tool call may take (``GITHUB_TOOL_TIMEOUT``)."""
+
+
+@dataclass(slots=True)
+class Deadline:
+    """Time budget of one call.
+
+    Attributes:
+        seconds: Budget in seconds
+        operation: What the budget is for, e.g. a tool name or
+            ``GET /api/v1/...`` (used in error messages)
+        started_at: Monotonic start time
+        requests: Upstream requests completed within the budget
+    """
+
+    seconds: float
+    operation: str | None = None
+    started_at: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def expires_at(self) -> float:
+        """Monotonic time at which the budget is spent."""
+        return self.started_at + self.seconds
+
+    def elapsed(self) -> float:
+        """Seconds since the deadline was opened."""
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the budget is spent."""
+        return time.monotonic() >= self.expires_at
+
+    def record_request(self) -> None:
+        """Count one completed upstream request."""
+        with self._lock:
+            self.requests += 1
+
+    def error(self, pending: str | None = None) -> GithubTimeoutError:
+        """Build the error reporting how far the call got.
+
+        Args:
+            pending: Upstream request that could not be made or completed
+                (e.g. ``GET /repos/{owner}/{repo}/issues page 3``)
+
+        Returns:
+            GithubTimeoutError with ``elapsed_seconds``, ``upstream_requests``
+            and ``pending_request`` details
+        """
+        subject = f"'{self.operation}'" if self.operation else "Call"
+        message = (
+            f"{subject} exceeded its {self.seconds:g}s deadline after "
+            f"{self.requests} GitHub request{'' if self.requests == 1 else 's'}"
+        )
+        details: dict[str, Any] = {
+            "elapsed_seconds": round(self.elapsed(), 3),
+            "upstream_requests": self.requests,
+        }
+        if pending:
+            details["pending_request"] = pending
+        return GithubTimeoutError(
+            message, timeout_seconds=self.seconds, operation=self.operation, details=details
+        )
+
+
+_current: ContextVar[Deadline | None] = ContextVar("github_deadline", default=None)
+
+
+# ============================================================================
+# Scopes
+# ============================================================================
+
+
+def current() -> Deadline | None:
+    """The deadline of the current context (None: unbounded)."""
+    return _current.get()
+
+
+@contextmanager
+def deadline(seconds: float | None, operation: str | None = None) -> Iterator[Deadline | None]:
+    """Bound the upstream requests made in this block to ``seconds``.
+
+    Args:
+        seconds: Budget in seconds (None: keep the enclosing deadline, if any)
+        operation: What the budget is for (used in error messages)
+
+    Yields:
+        The deadline in effect: the enclosing one if it expires first
+    """
+    enclosing = _current.get()
+    if seconds is None:
+        yield enclosing
+        return
+    scope = Deadline(seconds=seconds, operation=operation)
+    if enclosing is not None and enclosing.expires_at <= scope.expires_at:
+        yield enclosing
+        return
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+
+
+def check(pending: str | None = None, wait: float = 0.0) -> None:
+    """Raise if the current deadline is spent, or would be after ``wait``.
+
+    Args:
+        pending: Work that was about to start (for the error details)
+        wait: Seconds the caller is about to wait before starting it
+
+    Raises:
+        GithubTimeoutError: If the deadline expires within ``wait`` seconds
+    """
+    scope = _current.get()
+    if scope is not None and scope.remaining() <= wait:
+        raise scope.error(pending)
+
+
+def tool_timeout() -> float | None:
+    """MCP tool call budget from ``GITHUB_TOOL_TIMEOUT`` (0: unbounded)."""
+    seconds = float(os.getenv("GITHUB_TOOL_TIMEOUT", DEFAULT_TOOL_TIMEOUT))
+    return seconds if seconds > 0 else None
@@ -0,0 +1,275 @@
+"""GitHub - Tool Call Dispatcher (SAP-042)
+
+Executes ToolCallRequest envelopes against GithubToolService.
+
+Every tool name maps to a ToolAdapter, built once at import time, that
+turns the envelope's ``parameters`` into the tool's request model and calls
+the matching service method. ``call_batch`` runs many envelopes
+concurrently so a client can perform several lookups in one round trip:
+calls share the dispatcher's worker pool (its size is the concurrency
+limit), each call has its own timeout, and every call gets its own
+ToolCallResponse, so one failure never affects the rest of the batch.
+
+The service is synchronous (PyGithub), so calls run in worker threads. A
+call's timeout is also its deadline (see ``core.deadlines``): a call that
+times out is reported as failed immediately, and its thread stops at its
+next GitHub request instead of finishing in the background. A listing or
+batch cut short by its deadline succeeds with what it completed, and
+``warning`` says what is missing and how to continue (see ``core.partial``).
+"""
+
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+from . import deadlines, tracing
+from .accounting import track_usage
+from .exceptions import GithubError, get_error_code
+from .models import (
+    CreateIssueRequest,
+    CreateIssuesRequest,
+    GetFileContentsRequest,
+    GetIssueRequest,
+    GetIssuesRequest,
+    GetPRRequest,
+    GetPRsRequest,
+    ListIssuesRequest,
+    ListPRsRequest,
+    ListRepoFilesRequest,
+    ToolBatchResponse,
+    ToolCallRequest,
+    ToolCallResponse,
+    UpdateIssueRequest,
+    UpdateIssuesRequest,
+)
+from .partial import partial_warning
+
+
+DEFAULT_MAX_CONCURRENCY = 8
+"""Calls in flight per dispatcher."""
+
+DEFAULT_CALL_TIMEOUT = 30.0
+"""Seconds before a batched call is reported as timed out."""
+
+DEADLINE_GRACE = 0.1
+"""Seconds a call may run past its deadline to return a partial result."""
+
+NAMESPACE_PREFIX = "github:"
+
+
+# ============================================================================
+# Tool Adapters
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class ToolAdapter:
+    """Binds a tool name to its request model and service method."""
+
+    request_model: type[BaseModel]
+    method: str
+    writes: bool = False
+
+    def build_request(self, parameters: dict[str, Any]) -> BaseModel:
+        """Validate tool parameters into the request model.
+
+        ``owner`` and ``repo`` may be given separately (as in the MCP tools)
+        instead of ``repo="owner/repo"``.
+
+        Args:
+            parameters: Tool parameters from the envelope
+
+        Returns:
+            Request model instance
+
+        Raises:
+            ValueError: If the parameters are invalid (pydantic ValidationError)
+        """
+        if "owner" in parameters and "repo" in parameters:
+            parameters = dict(parameters)
+            parameters["repo"] = f"{parameters.pop('owner')}/{parameters['repo']}"
+        return self.request_model.model_validate(parameters)
+
+
+TOOL_ADAPTERS: dict[str, ToolAdapter] = {
+    "list_issues": ToolAdapter(ListIssuesRequest, "list_issues"),
+    "get_issue": ToolAdapter(GetIssueRequest, "get_issue"),
+    "get_issues": ToolAdapter(GetIssuesRequest, "get_issues"),
+    "create_issue": ToolAdapter(CreateIssueRequest, "create_issue", writes=True),
+    "create_issues": ToolAdapter(CreateIssuesRequest, "create_issues", writes=True),
+    "update_issue": ToolAdapter(UpdateIssueRequest, "update_issue", writes=True),
+    "update_issues": ToolAdapter(UpdateIssuesRequest, "update_issues", writes=True),
+    "list_prs": ToolAdapter(ListPRsRequest, "list_prs"),
+    "get_pr": ToolAdapter(GetPRRequest, "get_pr"),
+    "get_prs": ToolAdapter(GetPRsRequest, "get_prs"),
+    "get_file_contents": ToolAdapter(GetFileContentsRequest, "get_file_contents"),
+    "list_repo_files": ToolAdapter(ListRepoFilesRequest, "list_repo_files"),
+}
+"""Dispatchable tools (names without namespace)."""
+
+
+def written_repos(call: ToolCallRequest) -> set[str]:
+    """Repositories a tool call writes to (none for reads and unknown tools).
+
+    Args:
+        call: Tool call envelope (valid, e.g. one that succeeded)
+
+    Returns:
+        ``owner/repo`` names; one per item for batch writes
+
+    Raises:
+        ValueError: If the parameters of a write are invalid
+    """
+    adapter = TOOL_ADAPTERS.get(call.tool.removeprefix(NAMESPACE_PREFIX))
+    if adapter is None or not adapter.writes:
+        return set()
+    request = adapter.build_request(call.parameters)
+    items = getattr(request, "items", None) or [request]
+    return {item.repo for item in items}
+
+
+def _failure(error: str, error_code: str) -> ToolCallResponse:
+    return ToolCallResponse(success=False, error=error, error_code=error_code)
+
+
+# ============================================================================
+# Dispatcher
+# ============================================================================
+
+
+class ToolDispatcher:
+    """Executes tool call envelopes against a GithubToolService.
+
+    Attributes:
+        service: Service the tools run against
+        max_concurrency: Calls in flight (shared by all batches)
+        timeout: Default per-call timeout for batched calls, in seconds
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_CALL_TIMEOUT,
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            service: GithubToolService (or a compatible object)
+            max_concurrency: Calls in flight (shared by all batches)
+            timeout: Default per-call timeout for batched calls, in seconds
+        """
+        self.service = service
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="github-tool"
+        )
+
+    def call(self, call: ToolCallRequest) -> ToolCallResponse:
+        """Execute one tool call synchronously.
+
+        Errors never propagate: they are reported in the response with the
+        error code of the domain exception (VALIDATION_ERROR for invalid
+        parameters, UNKNOWN_TOOL for unknown tool names).
+
+        The envelope's timeout, if any, is the call's deadline: once spent,
+        the call fails with error code TIMEOUT (see ``core.deadlines``).
+
+        Args:
+            call: Tool call envelope
+
+        Returns:
+            ToolCallResponse with the tool's response as ``result`` (and the
+            upstream requests it made as ``debug``, if ``call.debug``)
+        """
+        with deadlines.deadline(call.timeout, call.tool), track_usage() as usage:
+            response = self._execute(call)
+        if call.debug:
+            response.debug = usage.report()
+        return response
+
+    def _execute(self, call: ToolCallRequest) -> ToolCallResponse:
+        name = call.tool.removeprefix(NAMESPACE_PREFIX)
+        adapter = TOOL_ADAPTERS.get(name)
+        if adapter is None:
+            return _failure(
+                f"Unknown tool '{call.tool}'. Available: {', '.join(TOOL_ADAPTERS)}",
+                "UNKNOWN_TOOL",
+            )
+        try:
+            request = adapter.build_request(call.parameters)
+            response = getattr(self.service, adapter.method)(request)
+        except ValueError as e:  # includes pydantic ValidationError
+            return _failure(str(e), "VALIDATION_ERROR")
+        except GithubError as e:
+            return _failure(str(e), e.code)
+        except Exception as e:
+            return _failure(f"{type(e).__name__}: {e}", get_error_code(e))
+        with tracing.span("serialize.model_dump"):
+            result = response.model_dump(mode="json")
+        partial = getattr(response, "partial", None)
+        warning = partial_warning(partial) if partial is not None else None
+        return ToolCallResponse(success=True, result=result, warning=warning)
+
+    async def call_async(
+        self, call: ToolCallRequest, timeout: float | None = None
+    ) -> ToolCallResponse:
+        """Execute one tool call in the worker pool, with a timeout.
+
+        Args:
+            call: Tool call envelope
+            timeout: Seconds before the call is reported as timed out
+                (default: the envelope's timeout, then the dispatcher's)
+
+        Returns:
+            ToolCallResponse (error code TIMEOUT on timeout)
+        """
+        limit = call.timeout or timeout or self.timeout
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the caller's context, so upstream requests are
+        # also accounted to the caller's scope (e.g. the REST request), with
+        # a deadline that starts now, like the timeout
+        with deadlines.deadline(limit, call.tool):
+            context = copy_context()
+        future = loop.run_in_executor(self._executor, context.run, self.call, call)
+        try:
+            # The call's own deadline fires first; the grace lets it return
+            # what it completed before it is reported as timed out
+            return await asyncio.wait_for(future, limit + DEADLINE_GRACE)
+        except TimeoutError:
+            return _failure(f"Tool '{call.tool}' timed out after {limit:g}s", "TIMEOUT")
+
+    async def call_batch(
+        self, calls: Sequence[ToolCallRequest], timeout: float | None = None
+    ) -> ToolBatchResponse:
+        """Execute tool calls concurrently.
+
+        Args:
+            calls: Tool call envelopes
+            timeout: Default per-call timeout (an envelope's own timeout
+                takes precedence)
+
+        Returns:
+            ToolBatchResponse with one result per call, in input order
+        """
+        results = await asyncio.gather(*(self.call_async(call, timeout) for call in calls))
+        succeeded = sum(1 for result in results if result.success)
+        return ToolBatchResponse(
+            results=list(results), succeeded=succeeded, failed=len(results) - succeeded
+        )
+
+    def close(self) -> None:
+        """Release the worker pool without waiting for abandoned calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "ToolDispatcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,696 @@
+"""GitHub - GraphQL Execution Path (SAP-042)
+
+This module implements a GraphQL-backed read path for issues and pull
+requests. A single query per page returns every field needed to build
+IssueData/PRData (including PR mergeability, labels and assignees), so no
+follow-up REST requests are triggered by lazy PyGithub attributes.
+
+Every query also selects the GraphQL ``rateLimit`` object, and the cost
+reported by GitHub is recorded per query so the GraphQL and REST paths can
+be compared on the same workload.
+"""
+
+import functools
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from github import GithubException
+
+from .exceptions import GithubNotFoundError, GithubTimeoutError, GithubValidationError
+from .models import (
+    GetIssueRequest,
+    GetIssuesRequest,
+    GetPRRequest,
+    GetPRsRequest,
+    IssueData,
+    ListIssuesRequest,
+    ListPRsRequest,
+    PRData,
+    StreamIssuesRequest,
+    StreamPRsRequest,
+)
+from .partial import after_cursor, parse_after
+from .payloads import select_fields, sparse_model
+from .tracing import traced
+
+
+# ============================================================================
+# Query Fragments
+# ============================================================================
+
+
+PAGE_SIZE = 100
+"""Maximum page size accepted by GitHub GraphQL connections."""
+
+RATE_LIMIT_FIELDS = "rateLimit { cost remaining limit resetAt }"
+
+ISSUE_SELECTIONS = {
+    "number": "number",
+    "title": "title",
+    "state": "state",
+    "url": "url",
+    "created_at": "createdAt",
+    "updated_at": "updatedAt",
+    "body": "body",
+    "author": "author { login }",
+    "labels": "labels(first: 100) { nodes { name } }",
+    "assignees": "assignees(first: 100) { nodes { login } }",
+}
+"""GraphQL selection for each IssueData field."""
+
+PR_SELECTIONS = {
+    "number": "number",
+    "title": "title",
+    "state": "state",
+    "url": "url",
+    "created_at": "createdAt",
+    "updated_at": "updatedAt",
+    "body": "body",
+    "head_ref": "headRefName",
+    "base_ref": "baseRefName",
+    "author": "author { login }",
+    "mergeable": "mergeable",
+    "merged": "merged",
+}
+"""GraphQL selection for each PRData field."""
+
+
+def build_fragment(
+    name: str, type_name: str, selections: dict[str, str], fields: list[str] | None = None
+) -> str:
+    """Build a fragment selecting the given model fields.
+
+    Args:
+        name: Fragment name (e.g. "IssueFields")
+        type_name: GraphQL type the fragment applies to
+        selections: GraphQL selection per model field
+        fields: Sparse fieldset (default: every field)
+
+    Returns:
+        Fragment definition
+    """
+    selected = "\n".join(
+        f"  {selection}"
+        for field_name, selection in selections.items()
+        if fields is None or field_name in fields
+    )
+    return f"\nfragment {name} on {type_name} {{\n{selected}\n}}\n"
+
+
+def issue_fragment(fields: list[str] | None = None) -> str:
+    """IssueFields fragment for a sparse fieldset (default: all fields)."""
+    return build_fragment("IssueFields", "Issue", ISSUE_SELECTIONS, fields)
+
+
+def pr_fragment(fields: list[str] | None = None) -> str:
+    """PRFields fragment for a sparse fieldset (default: all fields)."""
+    return build_fragment("PRFields", "PullRequest", PR_SELECTIONS, fields)
+
+
+ISSUE_FIELDS = issue_fragment()
+PR_FIELDS = pr_fragment()
+
+LIST_ISSUES_OPERATION = f"""
+query ListIssues(
+  $owner: String!, $name: String!, $first: Int!, $after: String,
+  $states: [IssueState!], $labels: [String!], $assignee: String
+) {{
+  repository(owner: $owner, name: $name) {{
+    issues(
+      first: $first, after: $after, states: $states, labels: $labels,
+      filterBy: {{assignee: $assignee}},
+      orderBy: {{field: CREATED_AT, direction: DESC}}
+    ) {{
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{ ...IssueFields }}
+    }}
+  }}
+  {RATE_LIMIT_FIELDS}
+}}
+"""
+LIST_ISSUES_QUERY = LIST_ISSUES_OPERATION + ISSUE_FIELDS
+
+GET_ISSUE_OPERATION = f"""
+query GetIssue($owner: String!, $name: String!, $number: Int!) {{
+  repository(owner: $owner, name: $name) {{
+    issue(number: $number) {{ ...IssueFields }}
+  }}
+  {RATE_LIMIT_FIELDS}
+}}
+"""
+GET_ISSUE_QUERY = GET_ISSUE_OPERATION + ISSUE_FIELDS
+
+LIST_PRS_OPERATION = f"""
+query ListPRs(
+  $owner: String!, $name: String!, $first: Int!, $after: String,
+  $states: [PullRequestState!], $head: String, $base: String
+) {{
+  repository(owner: $owner, name: $name) {{
+    pullRequests(
+      first: $first, after: $after, states: $states,
+      headRefName: $head, baseRefName: $base,
+      orderBy: {{field: CREATED_AT, direction: DESC}}
+    ) {{
+      pageInfo {{ hasNextPage endCursor }}
+      nodes {{ ...PRFields }}
+    }}
+  }}
+  {RATE_LIMIT_FIELDS}
+}}
+"""
+LIST_PRS_QUERY = LIST_PRS_OPERATION + PR_FIELDS
+
+GET_PR_OPERATION = f"""
+query GetPR($owner: String!, $name: String!, $number: Int!) {{
+  repository(owner: $owner, name: $name) {{
+    pullRequest(number: $number) {{ ...PRFields }}
+  }}
+  {RATE_LIMIT_FIELDS}
+}}
+"""
+GET_PR_QUERY = GET_PR_OPERATION + PR_FIELDS
+
+
+def build_bulk_query(operation: str, field_name: str, fragment: str, numbers: list[int]) -> str:
+    """Build a query resolving many numbers with one aliased field each.
+
+    Args:
+        operation: GraphQL operation name
+        field_name: Repository field to alias ("issue" or "pullRequest")
+        fragment: Fragment definition selected for every alias
+        numbers: Issue/PR numbers (validated integers, inlined as literals)
+
+    Returns:
+        GraphQL query document
+    """
+    fragment_name = "IssueFields" if field_name == "issue" else "PRFields"
+    aliases = "\n".join(
+        f"    n{number}: {field_name}(number: {int(number)}) {{ ...{fragment_name} }}"
+        for number in numbers
+    )
+    return (
+        f"query {operation}($owner: String!, $name: String!) {{\n"
+        f"  repository(owner: $owner, name: $name) {{\n{aliases}\n  }}\n"
+        f"  {RATE_LIMIT_FIELDS}\n}}\n{fragment}"
+    )
+
+
+ISSUE_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": None}
+
+# REST "closed" includes merged pull requests
+PR_STATES = {"open": ["OPEN"], "closed": ["CLOSED", "MERGED"], "all": None}
+
+MERGEABLE_VALUES = {"MERGEABLE": True, "CONFLICTING": False, "UNKNOWN": None}
+
+
+# ============================================================================
+# Rate Limit Cost Tracking
+# ============================================================================
+
+
+@dataclass
+class GraphQLCost:
+    """Rate-limit cost reported by GitHub for a single GraphQL query."""
+
+    operation: str
+    cost: int
+    remaining: int | None = None
+    limit: int | None = None
+    reset_at: str | None = None
+
+
+@dataclass
+class GraphQLCostTracker:
+    """Accumulates GraphQL rate-limit costs across queries.
+
+    Attributes:
+        queries: Cost record for every query executed, in order
+    """
+
+    queries: list[GraphQLCost] = field(default_factory=list)
+
+    @property
+    def total_cost(self) -> int:
+        """Total rate-limit points spent by all recorded queries."""
+        return sum(query.cost for query in self.queries)
+
+    @property
+    def last(self) -> GraphQLCost | None:
+        """Most recent cost record, if any."""
+        return self.queries[-1] if self.queries else None
+
+    def record(self, operation: str, rate_limit: dict[str, Any] | None) -> GraphQLCost:
+        """Record the ``rateLimit`` object returned with a query.
+
+        Args:
+            operation: Name of the executed operation (e.g. "list_issues")
+            rate_limit: ``rateLimit`` selection from the response (may be None)
+
+        Returns:
+            The recorded cost entry
+        """
+        rate_limit = rate_limit or {}
+        entry = GraphQLCost(
+            operation=operation,
+            cost=rate_limit.get("cost", 1),
+            remaining=rate_limit.get("remaining"),
+            limit=rate_limit.get("limit"),
+            reset_at=rate_limit.get("resetAt"),
+        )
+        self.queries.append(entry)
+        return entry
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize recorded costs per operation.
+
+        Returns:
+            Dictionary with total cost, query count and per-operation totals
+        """
+        per_operation: dict[str, dict[str, int]] = {}
+        for query in self.queries:
+            stats = per_operation.setdefault(query.operation, {"queries": 0, "cost": 0})
+            stats["queries"] += 1
+            stats["cost"] += query.cost
+        return {
+            "queries": len(self.queries),
+            "total_cost": self.total_cost,
+            "remaining": self.last.remaining if self.last else None,
+            "operations": per_operation,
+        }
+
+
+# ============================================================================
+# Node Conversion
+# ============================================================================
+
+
+def split_repo(repo: str) -> tuple[str, str]:
+    """Split an ``owner/repo`` string into owner and name.
+
+    Args:
+        repo: Repository in owner/repo format
+
+    Returns:
+        Tuple of (owner, name)
+
+    Raises:
+        GithubValidationError: If repo is not in owner/repo format
+    """
+    owner, _, name = repo.partition("/")
+    if not owner or not name or "/" in name:
+        raise GithubValidationError(
+            f"Repository must be in owner/repo format, got '{repo}'",
+            field="repo",
+            value=repo,
+        )
+    return owner, name
+
+
+def _login(actor: dict[str, Any] | None) -> str | None:
+    return actor.get("login") if actor else None
+
+
+def _pr_state(node: dict[str, Any]) -> str:
+    state = node["state"].lower()
+    return "closed" if state == "merged" else state
+
+
+ISSUE_NODE_VALUES: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "number": lambda node: node["number"],
+    "title": lambda node: node["title"],
+    "state": lambda node: node["state"].lower(),
+    "url": lambda node: node["url"],
+    "created_at": lambda node: node["createdAt"],
+    "updated_at": lambda node: node.get("updatedAt"),
+    "body": lambda node: node.get("body"),
+    "labels": lambda node: [label["name"] for label in node["labels"]["nodes"]],
+    "assignees": lambda node: [user["login"] for user in node["assignees"]["nodes"]],
+    "author": lambda node: _login(node.get("author")),
+}
+
+PR_NODE_VALUES: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "number": lambda node: node["number"],
+    "title": lambda node: node["title"],
+    "state": _pr_state,
+    "url": lambda node: node["url"],
+    "created_at": lambda node: node["createdAt"],
+    "updated_at": lambda node: node.get("updatedAt"),
+    "head_ref": lambda node: node["headRefName"],
+    "base_ref": lambda node: node["baseRefName"],
+    "body": lambda node: node.get("body"),
+    "author": lambda node: _login(node.get("author")),
+    "mergeable": lambda node: MERGEABLE_VALUES.get(node.get("mergeable") or "UNKNOWN"),
+    "merged": lambda node: node.get("merged"),
+}
+
+
+def _has_labels(required: set[str], node: dict[str, Any]) -> bool:
+    """Whether an Issue node carries every label in ``required``."""
+    return required <= {label["name"] for label in node["labels"]["nodes"]}
+
+
+@traced("convert.issue")
+def issue_from_node(node: dict[str, Any], fields: list[str] | None = None) -> IssueData:
+    """Convert a GraphQL Issue node to IssueData (trusted, not re-validated).
+
+    Args:
+        node: Issue node selected with the IssueFields fragment
+        fields: Sparse fieldset the fragment was built for (default: all)
+
+    Returns:
+        IssueData model instance
+    """
+    if fields is not None:
+        return sparse_model(IssueData, select_fields(ISSUE_NODE_VALUES, node, fields))
+    return IssueData.model_construct(
+        **{name: value(node) for name, value in ISSUE_NODE_VALUES.items()}
+    )
+
+
+@traced("convert.pr")
+def pr_from_node(node: dict[str, Any], fields: list[str] | None = None) -> PRData:
+    """Convert a GraphQL PullRequest node to PRData (trusted, not re-validated).
+
+    Merged pull requests are reported as "closed" to match the REST path.
+
+    Args:
+        node: PullRequest node selected with the PRFields fragment
+        fields: Sparse fieldset the fragment was built for (default: all)
+
+    Returns:
+        PRData model instance
+    """
+    if fields is not None:
+        return sparse_model(PRData, select_fields(PR_NODE_VALUES, node, fields))
+    return PRData.model_construct(
+        **{name: value(node) for name, value in PR_NODE_VALUES.items()}
+    )
+
+
+# ============================================================================
+# Executor
+# ============================================================================
+
+
+class GraphQLExecutor:
+    """Executes issue/PR queries against the GitHub GraphQL API.
+
+    The executor reuses the PyGithub requester (and therefore its
+    authentication, connection pool and error handling). GitHub errors
+    surface as PyGithub exceptions, so callers can translate them exactly
+    like REST errors.
+    """
+
+    def __init__(self, requester: Any, tracker: GraphQLCostTracker | None = None):
+        """Initialize executor.
+
+        Args:
+            requester: PyGithub Requester (``Github.requester``)
+            tracker: Optional cost tracker (a new one is created if omitted)
+        """
+        self.requester = requester
+        self.tracker = tracker or GraphQLCostTracker()
+
+    def execute(
+        self, operation: str, query: str, variables: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Execute a query and record its rate-limit cost.
+
+        Args:
+            operation: Operation name used for cost accounting
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The ``data`` object of the GraphQL response
+        """
+        _, response = self.requester.graphql_query(query, variables)
+        data = response.get("data") or {}
+        self.tracker.record(operation, data.get("rateLimit"))
+        return data
+
+    def execute_partial(
+        self, operation: str, query: str, variables: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Execute a query that may legitimately miss some aliased nodes.
+
+        ``NOT_FOUND`` errors are tolerated (the node is returned as null);
+        any other GraphQL error raises a GithubException.
+
+        Args:
+            operation: Operation name used for cost accounting
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The ``data`` object of the GraphQL response
+        """
+        headers, response = self.requester.requestJsonAndCheck(
+            "POST",
+            self.requester.graphql_url,
+            input={"query": query, "variables": variables},
+        )
+        errors = [
+            error
+            for error in response.get("errors") or []
+            if error.get("type") != "NOT_FOUND"
+        ]
+        if errors:
+            raise GithubException(400, response, headers)
+        data = response.get("data") or {}
+        self.tracker.record(operation, data.get("rateLimit"))
+        return data
+
+    def _resolve_numbers(
+        self,
+        operation: str,
+        field_name: str,
+        fragment: str,
+        repo: str,
+        numbers: list[int],
+    ) -> tuple[list[dict[str, Any]], list[int]]:
+        owner, name = split_repo(repo)
+        unique = list(dict.fromkeys(numbers))
+        query_name = "".join(part.title() for part in operation.split("_"))
+        query = build_bulk_query(query_name, field_name, fragment, unique)
+        data = self.execute_partial(operation, query, {"owner": owner, "name": name})
+        repository = data.get("repository")
+        if repository is None:
+            raise GithubNotFoundError(f"Repository '{repo}' not found")
+
+        found: list[dict[str, Any]] = []
+        not_found: list[int] = []
+        for number in unique:
+            node = repository.get(f"n{number}")
+            if node is None:
+                not_found.append(number)
+            else:
+                found.append(node)
+        return found, not_found
+
+    def get_issues(self, request: GetIssuesRequest) -> tuple[list[IssueData], list[int]]:
+        """Resolve many issues by number in a single query.
+
+        Args:
+            request: GetIssuesRequest with repo and numbers
+
+        Returns:
+            Tuple of (issues found in request order, numbers not found)
+        """
+        nodes, not_found = self._resolve_numbers(
+            "get_issues",
+            "issue",
+            issue_fragment(request.fields),
+            request.repo,
+            request.numbers,
+        )
+        return [issue_from_node(node, request.fields) for node in nodes], not_found
+
+    def get_prs(self, request: GetPRsRequest) -> tuple[list[PRData], list[int]]:
+        """Resolve many pull requests by number in a single query.
+
+        Args:
+            request: GetPRsRequest with repo and numbers
+
+        Returns:
+            Tuple of (pull requests found in request order, numbers not found)
+        """
+        nodes, not_found = self._resolve_numbers(
+            "get_prs",
+            "pullRequest",
+            pr_fragment(request.fields),
+            request.repo,
+            request.numbers,
+        )
+        return [pr_from_node(node, request.fields) for node in nodes], not_found
+
+    def _iter_nodes(
+        self,
+        operation: str,
+        query: str,
+        variables: dict[str, Any],
+        connection: str,
+        limit: int | None,
+        after: str | None = None,
+        keep: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield connection nodes, requesting the next page only when needed.
+
+        Starts after the ``after`` end cursor; a timeout carries the cursor
+        to continue from as ``details["next_cursor"]``. Nodes failing
+        ``keep`` are dropped and do not count towards ``limit``.
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_vars = {
+                **variables,
+                "first": PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining),
+                "after": after,
+            }
+            try:
+                data = self.execute(operation, query, page_vars)
+            except GithubTimeoutError as e:
+                e.details.setdefault("next_cursor", after_cursor(after))
+                raise
+            page = data["repository"][connection]
+            nodes = page["nodes"] if keep is None else list(filter(keep, page["nodes"]))
+            if remaining is not None:
+                nodes = nodes[:remaining]
+            yield from nodes
+            if remaining is not None:
+                remaining -= len(nodes)
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+
+    def list_issues(self, request: ListIssuesRequest) -> list[IssueData]:
+        """Fetch issues matching a ListIssuesRequest.
+
+        Unlike the REST issues endpoint, pull requests are never included.
+
+        Args:
+            request: ListIssuesRequest with repo, state, labels, assignee, limit
+
+        Returns:
+            List of IssueData (newest first)
+        """
+        return list(self.iter_issues(request))
+
+    def iter_issues(
+        self, request: ListIssuesRequest | StreamIssuesRequest
+    ) -> Iterator[IssueData]:
+        """Yield issues matching a request, one page per query as consumed.
+
+        Args:
+            request: ListIssuesRequest or StreamIssuesRequest (``limit=None``
+                yields every matching issue)
+
+        Yields:
+            IssueData (newest first)
+        """
+        owner, name = split_repo(request.repo)
+        variables = {
+            "owner": owner,
+            "name": name,
+            "states": ISSUE_STATES[request.state],
+            "labels": request.labels or None,
+            "assignee": request.assignee,
+        }
+        selected = request.fields
+        keep: Callable[[dict[str, Any]], bool] | None = None
+        if request.labels:
+            # GraphQL's labels filter matches issues with ANY of the labels;
+            # keep REST semantics (ALL labels) by checking each node
+            required = set(request.labels)
+            keep = functools.partial(_has_labels, required)
+            if selected is not None and "labels" not in selected:
+                selected = [*selected, "labels"]
+        query = LIST_ISSUES_OPERATION + issue_fragment(selected)
+        after = parse_after(request.cursor)
+        for node in self._iter_nodes(
+            "list_issues", query, variables, "issues", request.limit, after, keep
+        ):
+            yield issue_from_node(node, request.fields)
+
+    def get_issue(self, request: GetIssueRequest) -> IssueData:
+        """Fetch a single issue by number.
+
+        Args:
+            request: GetIssueRequest with repo and issue_number
+
+        Returns:
+            IssueData model instance
+        """
+        owner, name = split_repo(request.repo)
+        data = self.execute(
+            "get_issue",
+            GET_ISSUE_OPERATION + issue_fragment(request.fields),
+            {"owner": owner, "name": name, "number": request.issue_number},
+        )
+        node = data["repository"]["issue"]
+        if node is None:
+            raise GithubNotFoundError(
+                f"Issue #{request.issue_number} not found in '{request.repo}'"
+            )
+        return issue_from_node(node, request.fields)
+
+    def list_prs(self, request: ListPRsRequest) -> list[PRData]:
+        """Fetch pull requests matching a ListPRsRequest.
+
+        Args:
+            request: ListPRsRequest with repo, state, head, base, limit
+
+        Returns:
+            List of PRData (newest first)
+        """
+        return list(self.iter_prs(request))
+
+    def iter_prs(self, request: ListPRsRequest | StreamPRsRequest) -> Iterator[PRData]:
+        """Yield pull requests matching a request, one page per query as consumed.
+
+        Args:
+            request: ListPRsRequest or StreamPRsRequest (``limit=None``
+                yields every matching pull request)
+
+        Yields:
+            PRData (newest first)
+        """
+        owner, name = split_repo(request.repo)
+        # REST accepts "user:branch" for head; GraphQL only takes the branch name
+        head = request.head.split(":", 1)[-1] if request.head else None
+        variables = {
+            "owner": owner,
+            "name": name,
+            "states": PR_STATES[request.state],
+            "head": head,
+            "base": request.base,
+        }
+        query = LIST_PRS_OPERATION + pr_fragment(request.fields)
+        after = parse_after(request.cursor)
+        for node in self._iter_nodes(
+            "list_prs", query, variables, "pullRequests", request.limit, after
+        ):
+            yield pr_from_node(node, request.fields)
+
+    def get_pr(self, request: GetPRRequest) -> PRData:
+        """Fetch a single pull request by number.
+
+        Args:
+            request: GetPRRequest with repo and pr_number
+
+        Returns:
+            PRData model instance
+        """
+        owner, name = split_repo(request.repo)
+        data = self.execute(
+            "get_pr",
+            GET_PR_OPERATION + pr_fragment(request.fields),
+            {"owner": owner, "name": name, "number": request.pr_number},
+        )
+        node = data["repository"]["pullRequest"]
+        if node is None:
+            raise GithubNotFoundError(
+                f"PR #{request.pr_number} not found in '{request.repo}'"
+            )
+        return pr_from_node(node, request.fields)
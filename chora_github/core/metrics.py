@@ -0,0 +1,408 @@
+"""GitHub - Metrics (SAP-042)
+
+A small in-process metrics registry rendered in the Prometheus text
+exposition format (no client library required).
+
+Metrics recorded here:
+- ``github_tool_call_duration_seconds{tool, outcome}``: service operations
+  (``@observe_tool``), whatever interface called them
+- ``github_upstream_requests_total{method, endpoint, status}`` and
+  ``github_upstream_request_duration_seconds{method, endpoint}``: every
+  HTTP request sent to GitHub (see ``core.upstream``)
+- ``github_upstream_retries_total{method, endpoint, reason}`` and
+  ``github_upstream_retries_denied_total{method, endpoint}``: requests
+  resent after a transient failure, and retries refused by the process
+  retry budget, whose ``github_upstream_retry_budget_tokens`` are left
+- ``github_rate_limit_remaining{token, resource}``: last
+  ``X-RateLimit-Remaining`` seen per token fingerprint and API resource
+- ``github_cache_{hits,misses}_total{cache}`` and
+  ``github_cache_hit_ratio{cache}``: caches registered with
+  ``track_cache``, read at scrape time
+
+Interfaces add their own (e.g. REST route latency and in-flight requests).
+All timings use ``time.perf_counter`` (monotonic).
+"""
+
+import functools
+import math
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, TypeVar
+
+from . import profiling, tracing, upstream
+from .accounting import track_usage
+from .cache import TTLCache
+from .exceptions import get_error_code
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""Histogram bucket upper bounds in seconds (``+Inf`` is implicit)."""
+
+F = TypeVar("F", bound=Callable[..., Any])
+M = TypeVar("M", bound="_Metric")
+
+
+# ============================================================================
+# Metric Types
+# ============================================================================
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_string(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base class: a named family of labelled series."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames) or not all(
+            name in labels for name in self.labelnames
+        ):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[str]:
+        """Exposition lines for every series (without HELP/TYPE)."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Exposition text for this metric family."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class _ValueMetric(_Metric):
+    """A single value per label set."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def _add(self, amount: float, labels: dict[str, Any]) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _set(self, value: float, labels: dict[str, Any]) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: Any) -> float:
+        """Current value of the series for ``labels`` (0 if never set)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_label_string(self.labelnames, key)} {_format_value(value)}"
+
+
+class Counter(_ValueMetric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add ``amount`` (>= 0) to the series for ``labels``."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._add(amount, labels)
+
+
+class Gauge(_ValueMetric):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the series for ``labels`` to ``value``."""
+        self._set(value, labels)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add ``amount`` to the series for ``labels``."""
+        self._add(amount, labels)
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Subtract ``amount`` from the series for ``labels``."""
+        self._add(-amount, labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: [count per bucket..., +Inf count, sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            # First bucket with bound >= value (len(buckets) is +Inf)
+            series[bisect_left(self.buckets, value)] += 1
+            series[-1] += value
+
+    def count(self, **labels: Any) -> int:
+        """Number of observations for ``labels``."""
+        series = self._series.get(self._key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), series[:-1], strict=True):
+                cumulative += count
+                labels = _label_string(self.labelnames, key, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {_format_value(cumulative)}"
+            labels = _label_string(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(series[-1])}"
+            yield f"{self.name}_count{labels} {_format_value(cumulative)}"
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+
+class MetricsRegistry:
+    """Named metrics plus caches sampled at scrape time."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._caches: weakref.WeakValueDictionary[str, TTLCache] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        # Mirrors of each cache's own counters, copied at scrape time
+        self.cache_hits = self.counter(
+            "github_cache_hits_total", "Cache lookups that found a fresh entry", ("cache",)
+        )
+        self.cache_misses = self.counter(
+            "github_cache_misses_total", "Cache lookups that found nothing fresh", ("cache",)
+        )
+        self.cache_hit_ratio = self.gauge(
+            "github_cache_hit_ratio", "Fraction of cache lookups that were hits", ("cache",)
+        )
+
+    def _register(self, metric: M) -> M:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def track_cache(self, name: str, cache: TTLCache) -> None:
+        """Report ``cache``'s hit/miss counts under ``cache=name``.
+
+        The cache is held weakly and replaces any cache tracked under the
+        same name.
+        """
+        self._caches[name] = cache
+
+    def _sample_caches(self) -> None:
+        for name, cache in list(self._caches.items()):
+            hits, misses = cache.hits, cache.misses
+            self.cache_hits._set(hits, {"cache": name})
+            self.cache_misses._set(misses, {"cache": name})
+            lookups = hits + misses
+            self.cache_hit_ratio.set(hits / lookups if lookups else 0.0, cache=name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        self._sample_caches()
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+"""Process-wide registry exposed by the interfaces."""
+
+
+# ============================================================================
+# Core Metrics
+# ============================================================================
+
+
+TOOL_DURATION = REGISTRY.histogram(
+    "github_tool_call_duration_seconds",
+    "Service operation latency by tool and outcome (ok or error code)",
+    ("tool", "outcome"),
+)
+
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "github_upstream_requests_total",
+    "HTTP requests sent to GitHub by endpoint and response status (0: no response)",
+    ("method", "endpoint", "status"),
+)
+
+UPSTREAM_DURATION = REGISTRY.histogram(
+    "github_upstream_request_duration_seconds",
+    "Latency of HTTP requests sent to GitHub",
+    ("method", "endpoint"),
+)
+
+UPSTREAM_RETRIES = REGISTRY.counter(
+    "github_upstream_retries_total",
+    "Requests resent to GitHub after a transient failure, by reason (status code, "
+    "connection or timeout)",
+    ("method", "endpoint", "reason"),
+)
+
+UPSTREAM_RETRIES_DENIED = REGISTRY.counter(
+    "github_upstream_retries_denied_total",
+    "Retries not made because the process retry budget was spent",
+    ("method", "endpoint"),
+)
+
+RETRY_BUDGET_TOKENS = REGISTRY.gauge(
+    "github_upstream_retry_budget_tokens",
+    "Retries the process retry budget allows right now",
+)
+
+RATE_LIMIT_REMAINING = REGISTRY.gauge(
+    "github_rate_limit_remaining",
+    "Requests left in the current GitHub rate-limit window, per token fingerprint",
+    ("token", "resource"),
+)
+
+
+ToolObserver = Callable[[str, Any], None]
+"""Called as ``observer(tool, request)`` when a service operation starts."""
+
+_tool_observers: list[ToolObserver] = []
+
+
+def add_tool_observer(observer: ToolObserver) -> None:
+    """Report every service operation to ``observer`` (once per observer)."""
+    if observer not in _tool_observers:
+        _tool_observers.append(observer)
+
+
+def remove_tool_observer(observer: ToolObserver) -> None:
+    """Stop reporting service operations to ``observer``."""
+    if observer in _tool_observers:
+        _tool_observers.remove(observer)
+
+
+def observe_tool(method: F) -> F:
+    """Record a service method's latency in ``TOOL_DURATION``.
+
+    The tool label is the method name; the outcome is ``ok`` or the
+    error code of the exception raised. Each call also runs in its own
+    upstream accounting scope (see ``core.accounting``), logged at DEBUG,
+    in a ``service.<tool>`` span when tracing is enabled, and on the
+    profiler of the enclosing call when it is profiled (see
+    ``core.profiling``); it is reported with its request model to the tool
+    observers.
+    """
+    tool = method.__name__
+    span_name = f"service.{tool}"
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        request = args[1] if len(args) > 1 else kwargs.get("request")
+        if _tool_observers:
+            for observer in tuple(_tool_observers):
+                observer(tool, request)
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            with profiling.profile_thread():
+                if not tracing.enabled():
+                    with track_usage(label=tool):
+                        return method(*args, **kwargs)
+                attributes = {"github.tool": tool, "github.repo": getattr(request, "repo", None)}
+                with tracing.span(span_name, attributes), track_usage(label=tool):
+                    return method(*args, **kwargs)
+        except Exception as e:
+            outcome = get_error_code(e)
+            raise
+        finally:
+            TOOL_DURATION.observe(time.perf_counter() - start, tool=tool, outcome=outcome)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def record_upstream(call: upstream.UpstreamCall) -> None:
+    """Upstream observer: count and time the request and its retries, track rate limits."""
+    UPSTREAM_REQUESTS.inc(method=call.method, endpoint=call.endpoint, status=call.status)
+    UPSTREAM_DURATION.observe(call.duration, method=call.method, endpoint=call.endpoint)
+    for reason in call.retries:
+        UPSTREAM_RETRIES.inc(method=call.method, endpoint=call.endpoint, reason=reason)
+    if call.retry_denied:
+        UPSTREAM_RETRIES_DENIED.inc(method=call.method, endpoint=call.endpoint)
+    RETRY_BUDGET_TOKENS.set(upstream.RETRY_BUDGET.tokens)
+    remaining = call.headers.get("x-ratelimit-remaining")
+    if remaining is not None and call.token:
+        resource = call.headers.get("x-ratelimit-resource", "core")
+        RATE_LIMIT_REMAINING.set(float(remaining), token=call.token, resource=resource)
+
+
+upstream.add_observer(record_upstream)
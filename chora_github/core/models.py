@@ -18,7 +18,7 @@ Adapted for: GitHub Integration (8 tools)
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveInt, field_validator
 
 
 # ============================================================================
@@ -36,6 +36,8 @@ class GithubBaseModel(BaseModel):
         "json_schema_extra": {"examples": []},
         "populate_by_name": True,
         "use_enum_values": True,
+        # Enum defaults become plain values too (e.g. state="open" in URLs)
+        "validate_default": True,
     }
 
 
@@ -68,6 +70,13 @@ class FileType(str, Enum):
     SYMLINK = "symlink"
 
 
+class ResponseFormat(str, Enum):
+    """Encoding of list responses."""
+
+    ROWS = "rows"
+    COLUMNAR = "columnar"
+
+
 # ============================================================================
 # Common Data Models
 # ============================================================================
@@ -119,12 +128,161 @@ class FileData(GithubBaseModel):
     sha: str | None = Field(None, description="Git blob/tree SHA")
 
 
+# ============================================================================
+# Sparse Fieldsets
+# ============================================================================
+
+
+ISSUE_FIELD_NAMES = tuple(IssueData.model_fields)
+PR_FIELD_NAMES = tuple(PRData.model_fields)
+
+
+def parse_field_selection(
+    value: Any, allowed: tuple[str, ...], kind: str
+) -> list[str] | None:
+    """Normalize a sparse fieldset selection.
+
+    Accepts a list of names or a comma-separated string (``"number,title"``).
+    ``number`` is always included, and names are returned in model order.
+
+    Args:
+        value: Raw selection (None selects every field)
+        allowed: Field names of the data model
+        kind: Model name used in error messages
+
+    Returns:
+        Normalized list of field names, or None for all fields
+
+    Raises:
+        ValueError: If a name is not a field of the data model
+    """
+    if value is None:
+        return None
+    raw = value.split(",") if isinstance(value, str) else list(value)
+    names = {name.strip() for name in raw if name.strip()}
+    unknown = sorted(names.difference(allowed))
+    if unknown:
+        raise ValueError(
+            f"Unknown {kind} fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    names.add("number")
+    return [name for name in allowed if name in names]
+
+
+class IssueFieldSelection(GithubBaseModel):
+    """Request mixin selecting which IssueData fields are returned."""
+
+    fields: list[str] | None = Field(
+        None,
+        description="IssueData fields to return, e.g. 'number,title,labels' "
+        "(number is always included; default: all fields)",
+    )
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def _parse_fields(cls, value: Any) -> list[str] | None:
+        return parse_field_selection(value, ISSUE_FIELD_NAMES, "issue")
+
+
+class PRFieldSelection(GithubBaseModel):
+    """Request mixin selecting which PRData fields are returned."""
+
+    fields: list[str] | None = Field(
+        None,
+        description="PRData fields to return, e.g. 'number,title,state' "
+        "(number is always included; default: all fields)",
+    )
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def _parse_fields(cls, value: Any) -> list[str] | None:
+        return parse_field_selection(value, PR_FIELD_NAMES, "pull request")
+
+
+# ============================================================================
+# Columnar Encoding
+# ============================================================================
+
+
+class ColumnarTable(GithubBaseModel):
+    """Struct-of-arrays encoding of a list of items.
+
+    ``columns[name][i]`` is the value of field ``name`` for item ``i``.
+    Columns listed in ``encoded`` hold indexes (or lists of indexes) into
+    the named entry of ``dictionaries`` instead of repeated strings.
+    """
+
+    count: int = Field(..., ge=0, description="Number of items")
+    columns: dict[str, list[Any]] = Field(
+        default_factory=dict, description="One value array per field"
+    )
+    dictionaries: dict[str, list[str]] = Field(
+        default_factory=dict, description="Distinct values of dictionary-encoded columns"
+    )
+    encoded: dict[str, str] = Field(
+        default_factory=dict,
+        description="Dictionary-encoded columns, mapped to their dictionary name",
+    )
+
+
+# ============================================================================
+# Response Budget
+# ============================================================================
+
+
+class TruncatedField(GithubBaseModel):
+    """A text field shortened to fit a response budget."""
+
+    number: int = Field(..., description="Issue or PR number")
+    field: str = Field(..., description="Truncated field name")
+    original_length: int = Field(..., ge=0, description="Length before truncation (characters)")
+    returned_length: int = Field(..., ge=0, description="Characters kept (excluding marker)")
+
+
+class BudgetReport(GithubBaseModel):
+    """What was cut from a response to fit its byte budget."""
+
+    max_bytes: int = Field(..., description="Requested budget (bytes of compact JSON)")
+    original_bytes: int = Field(..., description="Size of the full response")
+    returned_bytes: int = Field(..., description="Size of the returned response")
+    truncated: list[TruncatedField] = Field(
+        default_factory=list, description="Text fields shortened (with a marker)"
+    )
+    dropped_fields: list[str] = Field(
+        default_factory=list, description="Fields removed from every item"
+    )
+    omitted_items: int = Field(
+        default=0, ge=0, description="Trailing items removed from the response"
+    )
+
+
+# ============================================================================
+# Partial Results
+# ============================================================================
+
+
+CURSOR_PATTERN = r"^(offset:\d+|after:.*)$"
+"""Listing cursors: ``offset:<n>`` (REST) or ``after:<end cursor>`` (GraphQL)."""
+
+
+class PartialResult(GithubBaseModel):
+    """Marks a response cut short by the call's deadline; completed work is kept."""
+
+    reason: str = Field(..., description="Why the response is incomplete (the timeout)")
+    next_cursor: str | None = Field(
+        None, description="Pass as 'cursor' to continue the listing where it stopped"
+    )
+    pending: list[int] = Field(
+        default_factory=list, description="Batch items (indices) that did not complete"
+    )
+
+
 # ============================================================================
 # Tool 1: list_issues
 # ============================================================================
 
 
-class ListIssuesRequest(GithubBaseModel):
+class ListIssuesRequest(IssueFieldSelection):
     """Request model for list_issues tool."""
 
     repo: str = Field(
@@ -133,11 +291,22 @@ class ListIssuesRequest(GithubBaseModel):
         examples=["anthropics/anthropic-sdk-python"],
     )
     state: IssueState = Field(default=IssueState.OPEN, description="Filter by state")
-    labels: list[str] | None = Field(None, description="Filter by labels")
+    labels: list[str] | None = Field(
+        None, description="Filter by labels (issues must have all of them)"
+    )
     assignee: str | None = Field(None, description="Filter by assignee")
     limit: int = Field(
         default=30, ge=1, le=100, description="Maximum results to return"
     )
+    cursor: str | None = Field(
+        None,
+        pattern=CURSOR_PATTERN,
+        description="Continue a listing cut short by a timeout (its partial.next_cursor)",
+    )
+    format: ResponseFormat = Field(
+        default=ResponseFormat.ROWS,
+        description="Response encoding: 'rows' (list of objects) or 'columnar'",
+    )
 
 
 class ListIssuesResponse(GithubBaseModel):
@@ -145,6 +314,9 @@ class ListIssuesResponse(GithubBaseModel):
 
     issues: list[IssueData] = Field(default_factory=list, description="List of issues")
     total_count: int = Field(..., ge=0, description="Total number of matching issues")
+    partial: PartialResult | None = Field(
+        None, description="Set when the call's deadline cut the response short"
+    )
 
 
 # ============================================================================
@@ -173,7 +345,7 @@ class CreateIssueResponse(GithubBaseModel):
 # ============================================================================
 
 
-class GetIssueRequest(GithubBaseModel):
+class GetIssueRequest(IssueFieldSelection):
     """Request model for get_issue tool."""
 
     repo: str = Field(..., description="Repository in owner/repo format")
@@ -213,6 +385,10 @@ class UpdateIssueResponse(GithubBaseModel):
     """Response model for update_issue tool."""
 
     issue: IssueData = Field(..., description="Updated issue")
+    changed: bool = Field(
+        default=True,
+        description="False when every provided field already matched and no edit was sent",
+    )
 
 
 # ============================================================================
@@ -220,7 +396,7 @@ class UpdateIssueResponse(GithubBaseModel):
 # ============================================================================
 
 
-class ListPRsRequest(GithubBaseModel):
+class ListPRsRequest(PRFieldSelection):
     """Request model for list_prs tool."""
 
     repo: str = Field(..., description="Repository in owner/repo format")
@@ -230,6 +406,15 @@ class ListPRsRequest(GithubBaseModel):
     limit: int = Field(
         default=30, ge=1, le=100, description="Maximum results to return"
     )
+    cursor: str | None = Field(
+        None,
+        pattern=CURSOR_PATTERN,
+        description="Continue a listing cut short by a timeout (its partial.next_cursor)",
+    )
+    format: ResponseFormat = Field(
+        default=ResponseFormat.ROWS,
+        description="Response encoding: 'rows' (list of objects) or 'columnar'",
+    )
 
 
 class ListPRsResponse(GithubBaseModel):
@@ -239,6 +424,9 @@ class ListPRsResponse(GithubBaseModel):
         default_factory=list, description="List of pull requests"
     )
     total_count: int = Field(..., ge=0, description="Total number of matching PRs")
+    partial: PartialResult | None = Field(
+        None, description="Set when the call's deadline cut the response short"
+    )
 
 
 # ============================================================================
@@ -246,7 +434,7 @@ class ListPRsResponse(GithubBaseModel):
 # ============================================================================
 
 
-class GetPRRequest(GithubBaseModel):
+class GetPRRequest(PRFieldSelection):
     """Request model for get_pr tool."""
 
     repo: str = Field(..., description="Repository in owner/repo format")
@@ -294,6 +482,10 @@ class ListRepoFilesRequest(GithubBaseModel):
     path: str = Field(default="", description="Directory path (empty for root)")
     ref: str = Field(default="main", description="Branch, tag, or commit SHA")
     recursive: bool = Field(default=False, description="List recursively")
+    format: ResponseFormat = Field(
+        default=ResponseFormat.ROWS,
+        description="Response encoding: 'rows' (list of objects) or 'columnar'",
+    )
 
 
 class ListRepoFilesResponse(GithubBaseModel):
@@ -303,6 +495,223 @@ class ListRepoFilesResponse(GithubBaseModel):
         default_factory=list, description="List of files/directories"
     )
     total_count: int = Field(..., ge=0, description="Total number of items")
+    partial: PartialResult | None = Field(
+        None, description="Set when the call's deadline cut the response short"
+    )
+
+
+# ============================================================================
+# Bulk reads: get_issues / get_prs
+# ============================================================================
+
+
+MAX_BULK_NUMBERS = 100
+"""Maximum number of issue/PR numbers resolved in a single bulk request."""
+
+
+class GetIssuesRequest(IssueFieldSelection):
+    """Request model for get_issues tool (bulk get_issue)."""
+
+    repo: str = Field(..., description="Repository in owner/repo format")
+    numbers: list[PositiveInt] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_NUMBERS,
+        description="Issue numbers to resolve",
+    )
+
+
+class GetIssuesResponse(GithubBaseModel):
+    """Response model for get_issues tool."""
+
+    issues: list[IssueData] = Field(
+        default_factory=list, description="Issues found, in request order"
+    )
+    not_found: list[int] = Field(
+        default_factory=list, description="Requested numbers that do not exist"
+    )
+
+
+class GetPRsRequest(PRFieldSelection):
+    """Request model for get_prs tool (bulk get_pr)."""
+
+    repo: str = Field(..., description="Repository in owner/repo format")
+    numbers: list[PositiveInt] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_NUMBERS,
+        description="Pull request numbers to resolve",
+    )
+
+
+class GetPRsResponse(GithubBaseModel):
+    """Response model for get_prs tool."""
+
+    pull_requests: list[PRData] = Field(
+        default_factory=list, description="Pull requests found, in request order"
+    )
+    not_found: list[int] = Field(
+        default_factory=list, description="Requested numbers that do not exist"
+    )
+
+
+# ============================================================================
+# Streaming reads: stream_issues / stream_prs
+# ============================================================================
+
+
+class StreamIssuesRequest(IssueFieldSelection):
+    """Request model for streaming issue listings (no page-size cap)."""
+
+    repo: str = Field(..., description="Repository in owner/repo format")
+    state: IssueState = Field(default=IssueState.OPEN, description="Filter by state")
+    labels: list[str] | None = Field(
+        None, description="Filter by labels (issues must have all of them)"
+    )
+    assignee: str | None = Field(None, description="Filter by assignee")
+    limit: int | None = Field(
+        None, ge=1, description="Maximum results to return (default: all)"
+    )
+    cursor: str | None = Field(
+        None,
+        pattern=CURSOR_PATTERN,
+        description="Continue a listing cut short by a timeout (its partial.next_cursor)",
+    )
+
+
+class StreamPRsRequest(PRFieldSelection):
+    """Request model for streaming pull request listings (no page-size cap)."""
+
+    repo: str = Field(..., description="Repository in owner/repo format")
+    state: PRState = Field(default=PRState.OPEN, description="Filter by state")
+    head: str | None = Field(None, description="Filter by head branch")
+    base: str | None = Field(None, description="Filter by base branch")
+    limit: int | None = Field(
+        None, ge=1, description="Maximum results to return (default: all)"
+    )
+    cursor: str | None = Field(
+        None,
+        pattern=CURSOR_PATTERN,
+        description="Continue a listing cut short by a timeout (its partial.next_cursor)",
+    )
+
+
+# ============================================================================
+# Bulk writes: create_issues / update_issues
+# ============================================================================
+
+
+MAX_BATCH_ITEMS = 100
+"""Maximum number of write operations accepted in a single batch."""
+
+
+class CreateIssuesRequest(GithubBaseModel):
+    """Request model for create_issues tool (batch create_issue)."""
+
+    items: list[CreateIssueRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_ITEMS, description="Issues to create"
+    )
+    max_concurrency: int = Field(
+        default=3, ge=1, le=10, description="Maximum writes in flight"
+    )
+
+
+class UpdateIssuesRequest(GithubBaseModel):
+    """Request model for update_issues tool (batch update_issue)."""
+
+    items: list[UpdateIssueRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_ITEMS, description="Updates to apply"
+    )
+    max_concurrency: int = Field(
+        default=3, ge=1, le=10, description="Maximum writes in flight"
+    )
+
+
+class BatchItemResult(GithubBaseModel):
+    """Outcome of one item of a batch write."""
+
+    index: int = Field(..., ge=0, description="Position of the item in the request")
+    success: bool = Field(..., description="Whether the write succeeded")
+    issue: IssueData | None = Field(None, description="Resulting issue (if successful)")
+    error: str | None = Field(None, description="Error message (if failed)")
+    error_code: str | None = Field(None, description="Error code (if failed)")
+
+
+class BatchIssuesResponse(GithubBaseModel):
+    """Response model for create_issues and update_issues tools."""
+
+    results: list[BatchItemResult] = Field(
+        default_factory=list, description="Per-item results, in request order"
+    )
+    succeeded: int = Field(..., ge=0, description="Number of successful items")
+    failed: int = Field(..., ge=0, description="Number of failed items")
+    partial: PartialResult | None = Field(
+        None, description="Set when the call's deadline cut the response short"
+    )
+
+
+# ============================================================================
+# Write Queue: enqueue_issue_write / get_write_job
+# ============================================================================
+
+
+class WriteOperation(str, Enum):
+    """Issue mutations accepted by the write queue."""
+
+    CREATE_ISSUE = "create_issue"
+    UPDATE_ISSUE = "update_issue"
+
+
+class WriteJobStatus(str, Enum):
+    """Lifecycle states of a queued write."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class WriteJob(GithubBaseModel):
+    """A queued issue mutation and its outcome."""
+
+    job_id: str = Field(..., description="Queue-assigned job identifier")
+    idempotency_key: str | None = Field(
+        None, description="Client-supplied key; repeated enqueues return the same job"
+    )
+    operation: WriteOperation = Field(..., description="Mutation to perform")
+    repo: str = Field(..., description="Repository in owner/repo format")
+    status: WriteJobStatus = Field(..., description="Current job status")
+    attempts: int = Field(default=0, ge=0, description="Attempts made so far")
+    issue: IssueData | None = Field(None, description="Resulting issue (if succeeded)")
+    error: str | None = Field(None, description="Last error message (if any)")
+    error_code: str | None = Field(None, description="Last error code (if any)")
+    created_at: str = Field(..., description="When the job was enqueued (ISO 8601)")
+    updated_at: str = Field(..., description="When the job last changed (ISO 8601)")
+    next_attempt_at: str | None = Field(
+        None, description="Earliest time of the next attempt (ISO 8601, pending jobs)"
+    )
+
+
+class EnqueueIssueWriteResponse(GithubBaseModel):
+    """Response model for enqueue_issue_write tool."""
+
+    job: WriteJob = Field(..., description="Queued (or previously queued) job")
+    duplicate: bool = Field(
+        default=False,
+        description="True when the idempotency key matched an existing job",
+    )
+
+
+class GetWriteJobRequest(GithubBaseModel):
+    """Request model for get_write_job tool."""
+
+    job_id: str = Field(..., min_length=1, description="Job identifier")
+
+
+class GetWriteJobResponse(GithubBaseModel):
+    """Response model for get_write_job tool."""
+
+    job: WriteJob = Field(..., description="Job details")
 
 
 # ============================================================================
@@ -346,6 +755,18 @@ class ToolDefinition(GithubBaseModel):
 # ============================================================================
 
 
+class UpstreamReport(GithubBaseModel):
+    """Upstream GitHub requests made while serving a call."""
+
+    requests: int = Field(..., ge=0, description="HTTP requests sent to GitHub")
+    not_modified: int = Field(0, ge=0, description="Requests answered 304 Not Modified")
+    cache_hits: int = Field(0, ge=0, description="Lookups served from the service cache")
+    upstream_ms: float = Field(0.0, ge=0, description="Total time waiting for GitHub (ms)")
+    endpoints: dict[str, int] = Field(
+        default_factory=dict, description="Requests per 'METHOD endpoint-template'"
+    )
+
+
 class ToolCallRequest(GithubBaseModel):
     """Envelope for tool execution requests."""
 
@@ -355,6 +776,12 @@ class ToolCallRequest(GithubBaseModel):
     parameters: dict[str, Any] = Field(
         default_factory=dict, description="Tool parameters"
     )
+    timeout: float | None = Field(
+        None, gt=0, description="Seconds before the call is abandoned (batch calls)"
+    )
+    debug: bool = Field(
+        False, description="Include upstream request accounting in the response"
+    )
 
 
 class ToolCallResponse(GithubBaseModel):
@@ -367,6 +794,34 @@ class ToolCallResponse(GithubBaseModel):
     error: str | None = Field(None, description="Error message (if failed)")
     error_code: str | None = Field(None, description="Error code (if failed)")
     warning: str | None = Field(None, description="Warning message (if applicable)")
+    debug: UpstreamReport | None = Field(
+        None, description="Upstream requests made by the call (if requested)"
+    )
+
+
+MAX_BATCH_CALLS = 50
+"""Maximum number of tool calls in one batch."""
+
+
+class ToolBatchRequest(GithubBaseModel):
+    """Several tool calls executed concurrently in one round trip."""
+
+    calls: list[ToolCallRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_CALLS, description="Tool calls to run"
+    )
+    timeout: float | None = Field(
+        None, gt=0, description="Default per-call timeout in seconds"
+    )
+
+
+class ToolBatchResponse(GithubBaseModel):
+    """Results of a tool call batch."""
+
+    results: list[ToolCallResponse] = Field(
+        default_factory=list, description="Per-call results, in request order"
+    )
+    succeeded: int = Field(..., ge=0, description="Number of successful calls")
+    failed: int = Field(..., ge=0, description="Number of failed calls")
 
 
 # ============================================================================
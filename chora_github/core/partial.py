@@ -0,0 +1,149 @@
+"""GitHub - Partial Results (SAP-042)
+
+When a call's deadline runs out (see ``core.deadlines``) part-way through a
+listing or a batch, the work already done is returned instead of discarded:
+the response carries a PartialResult with the reason and, for listings, a
+cursor to continue from, and the dispatcher turns it into
+``ToolCallResponse.warning``.
+
+Listings stop at page boundaries (the deadline is checked before each
+request), so a cursor always points at the first item not returned:
+
+- ``offset:<n>``: REST listings, resumed at page ``n // per_page``;
+- ``after:<end cursor>``: GraphQL listings, resumed after the last page.
+
+Service iterators add the cursor to the GithubTimeoutError they raise
+(``details["next_cursor"]``), so streamed listings report it as well.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, TypeVar
+
+from .exceptions import GithubTimeoutError, GithubValidationError
+from .models import BatchItemResult, PartialResult
+
+
+T = TypeVar("T")
+
+OFFSET_PREFIX = "offset:"
+AFTER_PREFIX = "after:"
+
+
+# ============================================================================
+# Cursors
+# ============================================================================
+
+
+def offset_cursor(offset: int) -> str:
+    """Cursor of a REST listing that returned ``offset`` items."""
+    return f"{OFFSET_PREFIX}{offset}"
+
+
+def after_cursor(end_cursor: str | None) -> str:
+    """Cursor of a GraphQL listing whose last page ended at ``end_cursor``."""
+    return f"{AFTER_PREFIX}{end_cursor or ''}"
+
+
+def parse_offset(cursor: str | None) -> int:
+    """Items to skip for a REST listing cursor (0 without one).
+
+    Raises:
+        GithubValidationError: If the cursor is from a GraphQL listing
+    """
+    if cursor is None:
+        return 0
+    if not cursor.startswith(OFFSET_PREFIX):
+        raise GithubValidationError(
+            "Cursor is from a GraphQL listing; continue it with GITHUB_USE_GRAPHQL enabled",
+            field="cursor",
+            value=cursor,
+        )
+    return int(cursor.removeprefix(OFFSET_PREFIX))
+
+
+def parse_after(cursor: str | None) -> str | None:
+    """GraphQL end cursor to continue after (None: from the start).
+
+    Raises:
+        GithubValidationError: If the cursor is from a REST listing
+    """
+    if cursor is None:
+        return None
+    if not cursor.startswith(AFTER_PREFIX):
+        raise GithubValidationError(
+            "Cursor is from a REST listing; continue it with GITHUB_USE_GRAPHQL disabled",
+            field="cursor",
+            value=cursor,
+        )
+    return cursor.removeprefix(AFTER_PREFIX) or None
+
+
+def paginate_from(paginated: Any, offset: int, per_page: int) -> Iterator[Any]:
+    """Iterate a PyGithub PaginatedList starting at item ``offset``.
+
+    Pages before the offset are not requested.
+
+    Args:
+        paginated: PaginatedList
+        offset: Items to skip
+        per_page: Page size of the client that created the list
+    """
+    if offset == 0:
+        yield from paginated
+        return
+    page, skip = divmod(offset, per_page)
+    while True:
+        items = paginated.get_page(page)
+        yield from items[skip:]
+        if len(items) < per_page:
+            return
+        page, skip = page + 1, 0
+
+
+# ============================================================================
+# Collecting
+# ============================================================================
+
+
+def collect(items: Iterable[T]) -> tuple[list[T], PartialResult | None]:
+    """Consume a listing, keeping what was fetched if it times out.
+
+    Args:
+        items: Service iterator (e.g. ``iter_issues``)
+
+    Returns:
+        The items, and a PartialResult if the listing was cut short
+
+    Raises:
+        GithubTimeoutError: If it timed out before the first item
+    """
+    collected: list[T] = []
+    try:
+        for item in items:
+            collected.append(item)
+    except GithubTimeoutError as e:
+        if not collected:
+            raise
+        return collected, PartialResult(reason=e.message, next_cursor=e.details.get("next_cursor"))
+    return collected, None
+
+
+def batch_partial(results: Sequence[BatchItemResult]) -> PartialResult | None:
+    """PartialResult for batch items that timed out (None if none did)."""
+    timed_out = [result for result in results if result.error_code == "TIMEOUT"]
+    if not timed_out:
+        return None
+    return PartialResult(
+        reason=timed_out[0].error or "Timed out",
+        pending=[result.index for result in timed_out],
+    )
+
+
+def partial_warning(partial: PartialResult) -> str:
+    """Describe a partial result for ``ToolCallResponse.warning``."""
+    warning = f"Partial result: {partial.reason}."
+    if partial.next_cursor is not None:
+        warning += f" Continue with cursor '{partial.next_cursor}'."
+    if partial.pending:
+        warning += f" Items not completed: {', '.join(map(str, partial.pending))}."
+    return warning
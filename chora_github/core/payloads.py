@@ -0,0 +1,179 @@
+"""GitHub - Raw Payload Conversion (SAP-042)
+
+Fast conversion of GitHub REST JSON payloads into IssueData/PRData.
+
+PyGithub wraps every label and user of an issue in its own object, and
+reading an attribute that a list response did not include (for example a
+pull request's ``mergeable``) triggers a follow-up request to complete the
+object. The converters here read the payload dict PyGithub already
+received and build the models with ``model_construct``: upstream data is
+trusted and not re-validated, which is several times faster than the
+attribute-walking path for large listings.
+
+When a request selects a sparse fieldset, only the selected values are
+extracted, and the resulting models carry only those fields: pydantic
+serialization skips fields that were never set, so unselected fields are
+absent from the output rather than null.
+"""
+
+from collections.abc import Callable, Collection
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from .models import IssueData, PRData
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def sparse_model(model_cls: type[ModelT], values: dict[str, Any]) -> ModelT:
+    """Build a model holding only ``values`` (no defaults, no validation).
+
+    Fields not in ``values`` are left unset and are omitted when the model is
+    serialized; reading them raises AttributeError, so sparse models are
+    only meant to be returned to callers, not inspected internally.
+
+    Args:
+        model_cls: Pydantic model class
+        values: Field values to set
+
+    Returns:
+        Model instance with exactly the given fields
+    """
+    model = model_cls.model_construct(**values)
+    for name in model.__dict__.keys() - values.keys():
+        del model.__dict__[name]
+    return model
+
+
+def select_fields(
+    values: dict[str, Callable[[dict[str, Any]], Any]],
+    data: dict[str, Any],
+    fields: Collection[str],
+) -> dict[str, Any]:
+    """Extract the selected fields from a payload with per-field extractors.
+
+    Args:
+        values: Extractor per model field
+        data: Upstream payload (REST JSON object or GraphQL node)
+        fields: Selected model field names
+
+    Returns:
+        Mapping of field name to extracted value
+    """
+    return {name: values[name](data) for name in fields}
+
+
+def raw_payload(obj: Any) -> dict[str, Any] | None:
+    """Return the JSON payload a PyGithub object was built from.
+
+    Reads the stored payload directly: PyGithub's public ``raw_data``
+    property completes lazy objects first, which costs a request per item.
+
+    Args:
+        obj: PyGithub object (Issue, PullRequest, ...)
+
+    Returns:
+        Payload dict, or None if the object carries no raw payload
+    """
+    data = getattr(obj, "_rawData", None)
+    return data if isinstance(data, dict) else None
+
+
+def _login(user: dict[str, Any] | None) -> str | None:
+    return user.get("login") if user else None
+
+
+def _pr_merged(data: dict[str, Any]) -> bool:
+    merged = data.get("merged")
+    return data.get("merged_at") is not None if merged is None else merged
+
+
+ISSUE_REST_VALUES: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "number": lambda data: data["number"],
+    "title": lambda data: data["title"],
+    "state": lambda data: data["state"],
+    "url": lambda data: data["html_url"],
+    "created_at": lambda data: data["created_at"],
+    "updated_at": lambda data: data.get("updated_at"),
+    "body": lambda data: data.get("body"),
+    "labels": lambda data: [label["name"] for label in data.get("labels") or ()],
+    "assignees": lambda data: [user["login"] for user in data.get("assignees") or ()],
+    "author": lambda data: _login(data.get("user")),
+}
+
+PR_REST_VALUES: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "number": lambda data: data["number"],
+    "title": lambda data: data["title"],
+    "state": lambda data: data["state"],
+    "url": lambda data: data["html_url"],
+    "created_at": lambda data: data["created_at"],
+    "updated_at": lambda data: data.get("updated_at"),
+    "head_ref": lambda data: data["head"]["ref"],
+    "base_ref": lambda data: data["base"]["ref"],
+    "body": lambda data: data.get("body"),
+    "author": lambda data: _login(data.get("user")),
+    "mergeable": lambda data: data.get("mergeable"),
+    "merged": _pr_merged,
+}
+
+
+def issue_from_rest(
+    data: dict[str, Any], fields: Collection[str] | None = None
+) -> IssueData:
+    """Build IssueData from a REST issue payload without re-validation.
+
+    Args:
+        data: Issue JSON object as returned by the GitHub REST API
+        fields: Optional sparse fieldset (default: all fields)
+
+    Returns:
+        IssueData model instance
+    """
+    if fields is not None:
+        return sparse_model(IssueData, select_fields(ISSUE_REST_VALUES, data, fields))
+    return IssueData.model_construct(
+        number=data["number"],
+        title=data["title"],
+        state=data["state"],
+        url=data["html_url"],
+        created_at=data["created_at"],
+        updated_at=data.get("updated_at"),
+        body=data.get("body"),
+        labels=[label["name"] for label in data.get("labels") or ()],
+        assignees=[assignee["login"] for assignee in data.get("assignees") or ()],
+        author=_login(data.get("user")),
+    )
+
+
+def pr_from_rest(data: dict[str, Any], fields: Collection[str] | None = None) -> PRData:
+    """Build PRData from a REST pull request payload without re-validation.
+
+    List responses omit ``mergeable`` and ``merged``; merged is derived from
+    ``merged_at`` and mergeable is reported as unknown (None) rather than
+    fetched per pull request.
+
+    Args:
+        data: Pull request JSON object as returned by the GitHub REST API
+        fields: Optional sparse fieldset (default: all fields)
+
+    Returns:
+        PRData model instance
+    """
+    if fields is not None:
+        return sparse_model(PRData, select_fields(PR_REST_VALUES, data, fields))
+    return PRData.model_construct(
+        number=data["number"],
+        title=data["title"],
+        state=data["state"],
+        url=data["html_url"],
+        created_at=data["created_at"],
+        updated_at=data.get("updated_at"),
+        head_ref=data["head"]["ref"],
+        base_ref=data["base"]["ref"],
+        body=data.get("body"),
+        author=_login(data.get("user")),
+        mergeable=data.get("mergeable"),
+        merged=_pr_merged(data),
+    )
@@ -0,0 +1,245 @@
+"""GitHub - Slow Call Profiling (SAP-042)
+
+Opt-in deterministic profiling (cProfile) of REST requests and MCP tool
+calls, keeping only the calls slower than a threshold. Each kept profile is
+written to a directory as ``<time>-<tool>-<ms>ms-<id>.prof`` (pstats format:
+``python -m pstats``, snakeviz) with a ``.json`` sidecar holding the tool
+name, request parameters, duration and profiled threads.
+
+Enable it with ``GITHUB_PROFILE_DIR`` (plus ``GITHUB_PROFILE_THRESHOLD_MS``,
+default 1000, and ``GITHUB_PROFILE_SAMPLE_RATE``, default 1), with
+``configure()``, or at runtime through the REST admin endpoint
+``/api/v1/admin/profiling``.
+
+A call is profiled on the thread that handles it (``profiled()``, opened by
+the REST error handler middleware and the MCP tool wrappers) and on every
+worker thread its service operations run on (``profile_thread()``, from
+``metrics.observe_tool``); the per-thread profiles are merged. A thread runs
+one profiler at a time, so a call that starts while its thread is already
+being profiled (concurrent requests on the event loop) is only profiled on
+its worker threads. While profiling is off, both return at once.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+import uuid
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIRECTORY = "profiles"
+DEFAULT_THRESHOLD_MS = 1000.0
+DEFAULT_MAX_PROFILES = 100
+SECRET_PARAMETERS = frozenset({"token", "authorization"})
+"""Parameters never written to profile sidecars."""
+
+
+@dataclass
+class ProfilingConfig:
+    """Where and when slow calls are profiled.
+
+    Attributes:
+        directory: Directory profiles are written to (created on demand)
+        threshold_ms: Calls at least this slow are kept
+        sample_rate: Fraction of calls profiled (0 to 1)
+        max_profiles: Profiles written at most (protects the disk)
+        written: Profiles written so far
+    """
+
+    directory: str
+    threshold_ms: float = DEFAULT_THRESHOLD_MS
+    sample_rate: float = 1.0
+    max_profiles: int = DEFAULT_MAX_PROFILES
+    written: int = field(default=0, compare=False)
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.sample_rate <= 1:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {self.sample_rate}")
+        if self.threshold_ms < 0:
+            raise ValueError(f"threshold_ms must not be negative, got {self.threshold_ms}")
+
+
+_config: ProfilingConfig | None = None
+_config_lock = threading.Lock()
+_session: ContextVar["ProfileSession | None"] = ContextVar("profile_session", default=None)
+_thread = threading.local()  # .busy: the thread's profiler is running
+_NOOP = nullcontext()
+
+
+def configure(config: ProfilingConfig | None) -> ProfilingConfig | None:
+    """Enable profiling with ``config`` (None: disable).
+
+    Returns:
+        The previous configuration
+    """
+    global _config
+    with _config_lock:
+        previous, _config = _config, config
+    if config is not None:
+        logger.info(
+            "Profiling calls slower than %gms (sample rate %g) to %s",
+            config.threshold_ms,
+            config.sample_rate,
+            config.directory,
+        )
+    return previous
+
+
+def current_config() -> ProfilingConfig | None:
+    """The active configuration (None while profiling is off)."""
+    return _config
+
+
+def config_from_env() -> ProfilingConfig | None:
+    """Configuration from ``GITHUB_PROFILE_*`` (None if no directory is set)."""
+    directory = os.getenv("GITHUB_PROFILE_DIR")
+    if not directory:
+        return None
+    return ProfilingConfig(
+        directory=directory,
+        threshold_ms=float(os.getenv("GITHUB_PROFILE_THRESHOLD_MS", DEFAULT_THRESHOLD_MS)),
+        sample_rate=float(os.getenv("GITHUB_PROFILE_SAMPLE_RATE", "1")),
+    )
+
+
+# ============================================================================
+# Sessions
+# ============================================================================
+
+
+class ProfileSession:
+    """Profiles of one call, across the threads it ran on."""
+
+    def __init__(self, config: ProfilingConfig, tool: str):
+        self.config = config
+        self.tool = tool
+        self.parameters: dict[str, Any] = {}
+        self._profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def tag(self, tool: str | None = None, parameters: Mapping[str, Any] | None = None) -> None:
+        """Name the call's tool and request parameters (secrets are dropped)."""
+        if tool:
+            self.tool = tool
+        if parameters is not None:
+            self.parameters = {
+                key: value
+                for key, value in parameters.items()
+                if key.lower() not in SECRET_PARAMETERS and value is not None
+            }
+
+    @contextmanager
+    def thread(self) -> Iterator[None]:
+        """Profile the current thread for the duration of the block."""
+        if getattr(_thread, "busy", False):
+            yield
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler (e.g. a debugger) owns the thread
+            yield
+            return
+        _thread.busy = True
+        try:
+            yield
+        finally:
+            profile.disable()
+            _thread.busy = False
+            with self._lock:
+                self._profiles.append(profile)
+
+    def write(self, duration: float) -> Path | None:
+        """Write the merged profile and its sidecar; returns the profile path."""
+        with self._lock:
+            profiles = list(self._profiles)
+        config = self.config
+        with _config_lock:
+            if not profiles or config.written >= config.max_profiles:
+                return None
+            config.written += 1
+
+        directory = Path(config.directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        now = datetime.now(UTC)
+        milliseconds = round(duration * 1000)
+        stem = f"{now:%Y%m%dT%H%M%S}-{self.tool}-{milliseconds}ms-{uuid.uuid4().hex[:8]}"
+        path = directory / f"{stem}.prof"
+
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(path)
+        sidecar = {
+            "tool": self.tool,
+            "parameters": self.parameters,
+            "duration_ms": milliseconds,
+            "threads": len(profiles),
+            "recorded_at": now.isoformat(timespec="seconds"),
+            "threshold_ms": config.threshold_ms,
+        }
+        path.with_suffix(".json").write_text(json.dumps(sidecar, default=str, indent=2) + "\n")
+        logger.info("Profiled slow call %s (%dms): %s", self.tool, milliseconds, path)
+        return path
+
+
+@contextmanager
+def profiled(tool: str = "unknown") -> Iterator[ProfileSession | None]:
+    """Profile a call if profiling is on and the call is sampled.
+
+    The profile is written when the block exits (also on error) if the call
+    took at least the threshold. Entering gives the session, to ``tag`` the
+    call, or None when the call is not profiled.
+    """
+    config = _config
+    if config is None or _session.get() is not None or random.random() >= config.sample_rate:
+        yield None
+        return
+    session = ProfileSession(config, tool)
+    token = _session.set(session)
+    start = time.perf_counter()
+    try:
+        with session.thread():
+            yield session
+    finally:
+        _session.reset(token)
+        duration = time.perf_counter() - start
+        if duration * 1000 >= config.threshold_ms:
+            try:
+                session.write(duration)
+            except OSError as e:
+                logger.warning("Could not write profile for %s: %s", session.tool, e)
+
+
+def profile_thread() -> Any:
+    """Context manager profiling the current thread for the current call.
+
+    Used around service operations, which may run on a worker thread; does
+    nothing unless the enclosing call is being profiled.
+    """
+    session = _session.get()
+    return _NOOP if session is None else session.thread()
+
+
+def summary(config: ProfilingConfig | None = None) -> dict[str, Any]:
+    """JSON-compatible description of a configuration (default: the active one)."""
+    config = config or _config
+    if config is None:
+        return {"enabled": False}
+    return {"enabled": True, **asdict(config)}
+
+
+configure(config_from_env())
@@ -0,0 +1,81 @@
+"""GitHub - Internal Records (SAP-042)
+
+Compact in-memory representation of issues held by the service layer.
+
+A pydantic model instance carries a ``__dict__``, a fields-set and private
+attribute storage, and every label and login is its own list entry. That is
+fine for a response, but heavy for the tens of thousands of issues the
+issue cache may hold. The service stores ``IssueRecord`` instances instead
+(slotted, immutable, tuples rather than lists, repeated strings interned)
+and converts them to IssueData, without re-validation, only when they are
+returned to a caller.
+
+``python -m benchmarks.bench_memory`` measures the difference per 100k issues.
+"""
+
+import sys
+from dataclasses import dataclass
+
+from .models import IssueData
+
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class IssueRecord:
+    """Slotted, immutable counterpart of IssueData."""
+
+    number: int
+    title: str
+    state: str
+    url: str
+    created_at: str
+    updated_at: str | None
+    body: str | None
+    labels: tuple[str, ...]
+    assignees: tuple[str, ...]
+    author: str | None
+
+    @classmethod
+    def from_model(cls, issue: IssueData) -> "IssueRecord":
+        """Build a record from a (complete) IssueData model.
+
+        Args:
+            issue: IssueData with every field set
+
+        Returns:
+            IssueRecord
+        """
+        return cls(
+            number=issue.number,
+            title=issue.title,
+            state=sys.intern(issue.state),
+            url=issue.url,
+            created_at=issue.created_at,
+            updated_at=issue.updated_at,
+            body=issue.body,
+            labels=tuple(sys.intern(label) for label in issue.labels),
+            assignees=tuple(sys.intern(login) for login in issue.assignees),
+            author=_intern(issue.author),
+        )
+
+    def to_model(self) -> IssueData:
+        """Convert to the IssueData response model (no re-validation).
+
+        Returns:
+            IssueData model instance
+        """
+        return IssueData.model_construct(
+            number=self.number,
+            title=self.title,
+            state=self.state,
+            url=self.url,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            body=self.body,
+            labels=list(self.labels),
+            assignees=list(self.assignees),
+            author=self.author,
+        )
@@ -0,0 +1,86 @@
+"""GitHub - JSON Serialization (SAP-042)
+
+Serialization of responses for machine consumers (MCP tool results and
+resources).
+
+Responses are written compactly by default: pretty-printing only adds
+whitespace bytes (and tokens) for a reader that is a program. Pydantic
+models are serialized with ``model_dump_json``, which runs in pydantic-core
+and skips the intermediate ``model_dump()`` dict. Plain dicts use ``orjson``
+when it is installed and fall back to the standard library otherwise.
+
+Set ``GITHUB_JSON_PRETTY=1`` to restore indented output when debugging.
+"""
+
+import importlib
+import json
+import os
+from types import ModuleType
+from typing import Any
+
+from pydantic import BaseModel
+
+from .tracing import traced
+
+
+orjson: ModuleType | None
+try:  # Optional fast backend
+    orjson = importlib.import_module("orjson")
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+PRETTY_DEFAULT = os.getenv("GITHUB_JSON_PRETTY", "").lower() in ("1", "true", "yes")
+"""Whether output is indented when callers do not choose explicitly."""
+
+INDENT = 2
+
+
+def _pretty(pretty: bool | None) -> bool:
+    return PRETTY_DEFAULT if pretty is None else pretty
+
+
+@traced("serialize.json")
+def dumps(data: Any, pretty: bool | None = None) -> str:
+    """Serialize a pydantic model or JSON-compatible value to a string.
+
+    Args:
+        data: Pydantic model, dict, list or scalar
+        pretty: Indent output (default: GITHUB_JSON_PRETTY setting)
+
+    Returns:
+        JSON string (compact unless pretty)
+    """
+    pretty = _pretty(pretty)
+    if isinstance(data, BaseModel):
+        return data.model_dump_json(indent=INDENT if pretty else None)
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        encoded: bytes = orjson.dumps(data, option=option, default=str)
+        return encoded.decode()
+    if pretty:
+        return json.dumps(data, indent=INDENT, default=str)
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+@traced("serialize.envelope")
+def dumps_envelope(envelope: dict[str, Any], key: str, model: BaseModel) -> str:
+    """Serialize ``envelope`` with ``model`` embedded under ``key``.
+
+    The model is serialized natively and spliced into the envelope, so the
+    (usually large) model is never converted to an intermediate dict.
+    Output is always compact.
+
+    Args:
+        envelope: Small JSON-compatible dict (must not contain ``key``)
+        key: Name of the field holding the model
+        model: Pydantic model to embed
+
+    Returns:
+        JSON object string
+    """
+    if _pretty(None):
+        return dumps({**envelope, key: model.model_dump(mode="json")}, pretty=True)
+    head = dumps(envelope, pretty=False)[:-1]
+    separator = "," if envelope else ""
+    return f"{head}{separator}{json.dumps(key)}:{model.model_dump_json()}}}"
@@ -14,23 +14,46 @@ Adapted for: GitHub Integration (8 tools)
 """
 
 
-from github import Auth, Github, GithubException, UnknownObjectException
-
+import math
+from collections import deque
+from collections.abc import Iterator
+from contextlib import nullcontext
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import Any
+
+from github import Auth, Consts, Github, GithubException, UnknownObjectException
+from github.GithubObject import NotSet
+
+from .accounting import record_cache_hit
+from .batch import WriteThrottle, run_batch
+from .cache import DEFAULT_TTL_SECONDS, TTLCache
 from .exceptions import (
     GithubError,
     GithubNotFoundError,
     GithubPermissionError,
+    GithubRateLimitError,
+    GithubTimeoutError,
 )
+from .graphql import GraphQLExecutor
+from .metrics import observe_tool
 from .models import (  # Request models; Response models; Data models
+    BatchIssuesResponse,
     CreateIssueRequest,
     CreateIssueResponse,
+    CreateIssuesRequest,
     FileData,
     GetFileContentsRequest,
     GetFileContentsResponse,
     GetIssueRequest,
     GetIssueResponse,
+    GetIssuesRequest,
+    GetIssuesResponse,
     GetPRRequest,
     GetPRResponse,
+    GetPRsRequest,
+    GetPRsResponse,
     IssueData,
     ListIssuesRequest,
     ListIssuesResponse,
@@ -39,9 +62,43 @@ from .models import (  # Request models; Response models; Data models
     ListRepoFilesRequest,
     ListRepoFilesResponse,
     PRData,
+    StreamIssuesRequest,
+    StreamPRsRequest,
     UpdateIssueRequest,
     UpdateIssueResponse,
+    UpdateIssuesRequest,
 )
+from .partial import batch_partial, collect, offset_cursor, paginate_from, parse_offset
+from .payloads import issue_from_rest, pr_from_rest, raw_payload, sparse_model
+from .records import IssueRecord
+from .tracing import traced
+from .upstream import UpstreamRetry, idempotent_writes
+from .upstream import install as install_upstream_observation
+
+
+DEFAULT_REQUEST_TIMEOUT = 15
+"""Seconds to wait for each GitHub response (a call deadline shortens it)."""
+
+
+def _retry_after_seconds(value: str | None) -> int | None:
+    """Parse a ``Retry-After`` header (delay in seconds or an HTTP date).
+
+    Returns:
+        Whole seconds to wait (0 for a date already past), or None if the
+        header is missing or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:  # an HTTP date is always GMT
+        when = when.replace(tzinfo=UTC)
+    return max(0, math.ceil((when - datetime.now(UTC)).total_seconds()))
 
 
 class GithubToolService:
@@ -56,13 +113,51 @@ class GithubToolService:
     6. get_pr - Get PR details
     7. get_file_contents - Read file contents
     8. list_repo_files - List files in a directory
+
+    plus bulk reads (get_issues, get_prs) that resolve a list of numbers
+    in a single GraphQL request, and batch writes (create_issues,
+    update_issues) that run with bounded, throttled concurrency, and
+    iterators (iter_issues, iter_prs, iter_repo_files) that yield items as
+    pages arrive, for interfaces that stream listings.
+
+    Issue and PR reads can optionally use the GraphQL API (``use_graphql``),
+    which fetches every IssueData/PRData field in one query per page
+    instead of one REST request per page plus lazy follow-up requests.
+
+    A request that fails transiently (502/503, connection reset, secondary
+    rate limit) is resent on its own by the client's UpstreamRetry policy,
+    not the whole operation.
     """
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        use_graphql: bool = False,
+        cache_ttl: float = DEFAULT_TTL_SECONDS,
+        base_url: str | None = None,
+        client_pacing: bool = True,
+        timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        retry_writes: bool = False,
+    ):
         """Initialize service with GitHub token.
 
         Args:
             token: GitHub personal access token (PAT)
+            use_graphql: Serve list/get issue and PR reads via GraphQL
+            cache_ttl: Seconds a fetched issue is remembered (0 disables)
+            base_url: REST API root (default: https://api.github.com), e.g.
+                a GitHub Enterprise ``https://host/api/v3`` or a local
+                stand-in server
+            client_pacing: Keep client-side pacing (requests 0.25 s apart,
+                writes 1 s apart); disable only against servers without
+                rate limits, e.g. in benchmarks
+            timeout: Seconds (whole) to wait for each GitHub response; the deadline
+                of the current call, if shorter, takes precedence (see
+                ``core.deadlines``)
+            retry_writes: Also retry issue updates after 5xx responses and
+                connection errors (reads always are, see ``UpstreamRetry``);
+                an update sets fields, so applying it twice is harmless.
+                Issue creation is never retried this way
 
         Raises:
             ValueError: If token is None or empty
@@ -71,18 +166,48 @@ class GithubToolService:
             raise ValueError("GitHub token is required")
 
         self.token = token
-        self.client = Github(auth=Auth.Token(token))
+        # Report every request to GitHub (metrics) before the client exists
+        install_upstream_observation()
+        # Writes are paced by the WriteThrottle below, not by PyGithub, so
+        # batch writes are not paced twice
+        self.client = Github(
+            base_url=base_url or Consts.DEFAULT_BASE_URL,
+            auth=Auth.Token(token),
+            timeout=timeout,
+            retry=UpstreamRetry(),
+            seconds_between_requests=(
+                Consts.DEFAULT_SECONDS_BETWEEN_REQUESTS if client_pacing else None
+            ),
+            seconds_between_writes=None,
+        )
+        self.use_graphql = use_graphql
+        self.retry_writes = retry_writes
+        self.graphql = GraphQLExecutor(self.client.requester)
+        # Shared by all writes: secondary rate limits apply per token
+        self.write_throttle = WriteThrottle(
+            min_interval=Consts.DEFAULT_SECONDS_BETWEEN_WRITES if client_pacing else 0.0
+        )
+        # Last known state of issues, keyed by (repo, number)
+        self.issue_cache = TTLCache(ttl=cache_ttl)
 
-    def _convert_issue_to_data(self, issue) -> IssueData:
+    @traced("convert.issue")
+    def _convert_issue_to_data(self, issue, fields: list[str] | None = None) -> IssueData:
         """Convert PyGithub Issue to IssueData model.
 
+        Uses the raw payload PyGithub received when available (no wrapper
+        objects, no lazy completion, no re-validation).
+
         Args:
             issue: PyGithub Issue object
+            fields: Optional sparse fieldset (default: all fields)
 
         Returns:
             IssueData model instance
         """
-        return IssueData(
+        data = raw_payload(issue)
+        if data is not None:
+            return issue_from_rest(data, fields)
+        issue_data = IssueData(
             number=issue.number,
             title=issue.title,
             state=issue.state,
@@ -94,17 +219,206 @@ class GithubToolService:
             assignees=[assignee.login for assignee in issue.assignees],
             author=issue.user.login if issue.user else None,
         )
+        return self._select(issue_data, fields)
+
+    def _select(self, item: IssueData | PRData, fields: list[str] | None):
+        """Reduce a fully built item to a sparse fieldset (if any)."""
+        if fields is None:
+            return item
+        return sparse_model(type(item), {name: getattr(item, name) for name in fields})
+
+    @traced("convert.issue")
+    def _issue_from_payload(self, data: dict[str, Any]) -> IssueData:
+        """Convert a raw REST issue payload to IssueData model.
+
+        Args:
+            data: Issue JSON object as returned by the GitHub REST API
+
+        Returns:
+            IssueData model instance
+        """
+        return issue_from_rest(data)
+
+    def _remember_issues(
+        self, repo: str, issues: list[IssueData], fields: list[str] | None = None
+    ) -> None:
+        """Record the latest known state of issues in the issue cache.
+
+        Args:
+            repo: Repository in owner/repo format
+            issues: Issues just received from GitHub
+            fields: Sparse fieldset the issues were built with (sparse
+                issues are incomplete and are not cached)
+        """
+        if fields is not None:
+            return
+        for issue in issues:
+            self.issue_cache.put((repo.lower(), issue.number), IssueRecord.from_model(issue))
+
+    def _cached_issue(self, repo: str, number: int) -> IssueRecord | None:
+        """Return the cached record of an issue, if fresh."""
+        entry = self.issue_cache.get((repo.lower(), number))
+        if entry is None:
+            return None
+        record_cache_hit()
+        return entry.value
+
+    def _write_error(
+        self, e: GithubException, repo: str, not_found: str | None = None
+    ) -> GithubError:
+        """Translate a PyGithub exception raised by a write request.
+
+        Args:
+            e: PyGithub exception
+            repo: Repository in owner/repo format
+            not_found: Optional message used for 404 responses
+
+        Returns:
+            Matching GitHub domain exception
+        """
+        data = e.data if isinstance(e.data, dict) else {}
+        message = data.get("message", str(e))
+        if e.status in (403, 429) and "rate limit" in message.lower():
+            return GithubRateLimitError(
+                f"GitHub rate limit exceeded: {message}",
+                retry_after_seconds=_retry_after_seconds((e.headers or {}).get("retry-after")),
+            )
+        if e.status == 404:
+            return GithubNotFoundError(
+                not_found or f"Repository or issue not found in '{repo}'"
+            )
+        if e.status == 403:
+            return GithubPermissionError(f"Access denied to repository '{repo}'")
+        return GithubError(f"GitHub API error: {message}")
+
+    def _post_issue(self, request: CreateIssueRequest) -> IssueData:
+        """Create an issue with a single POST (no repository lookup).
+
+        Args:
+            request: CreateIssueRequest
+
+        Returns:
+            Created IssueData
+        """
+        payload: dict[str, Any] = {"title": request.title, "body": request.body}
+        if request.labels is not None:
+            payload["labels"] = request.labels
+        if request.assignees is not None:
+            payload["assignees"] = request.assignees
+        try:
+            _, data = self.client.requester.requestJsonAndCheck(
+                "POST", f"/repos/{request.repo}/issues", input=payload
+            )
+        except GithubException as e:
+            raise self._write_error(e, request.repo) from e
+        issue = self._issue_from_payload(data)
+        self._remember_issues(request.repo, [issue])
+        return issue
+
+    def _issue_changes(
+        self, request: UpdateIssueRequest, current: IssueRecord | None
+    ) -> dict[str, Any]:
+        """Compute the fields an update would actually change.
+
+        Args:
+            request: UpdateIssueRequest (None fields are left untouched)
+            current: Cached record of the issue, if known
+
+        Returns:
+            Fields to send in the PATCH body (all provided fields when the
+            current state is unknown)
+        """
+        fields = request.model_dump(
+            include={"title", "body", "state", "labels", "assignees"},
+            exclude_none=True,
+        )
+        if current is None:
+            return fields
+
+        changes = {}
+        for name, value in fields.items():
+            existing = getattr(current, name)
+            if name in ("labels", "assignees"):
+                # Order is not significant for labels and assignees
+                if sorted(value) != sorted(existing):
+                    changes[name] = value
+            elif value != existing:
+                changes[name] = value
+        return changes
+
+    def _patch_issue(self, request: UpdateIssueRequest) -> IssueData:
+        """Update an issue with a single PATCH by number.
+
+        Args:
+            request: UpdateIssueRequest
 
-    def _convert_pr_to_data(self, pr) -> PRData:
+        Returns:
+            Updated IssueData
+        """
+        return self._apply_issue_update(request)[0]
+
+    def _apply_issue_update(
+        self, request: UpdateIssueRequest, throttled: bool = False
+    ) -> tuple[IssueData, bool]:
+        """Apply an update, skipping it when it would change nothing.
+
+        The issue is PATCHed directly by number (no get_repo/get_issue). When
+        a fresh cached copy exists, only fields that differ are sent, and no
+        request is made at all if every provided field already matches.
+
+        Args:
+            request: UpdateIssueRequest
+            throttled: Wait for the write throttle before the PATCH (batch
+                workers have already waited for it)
+
+        Returns:
+            Tuple of (issue after the update, whether a change was sent)
+        """
+        current = self._cached_issue(request.repo, request.issue_number)
+        changes = self._issue_changes(request, current)
+        not_found = f"Issue #{request.issue_number} not found in '{request.repo}'"
+        path = f"/repos/{request.repo}/issues/{request.issue_number}"
+
+        try:
+            if not changes:
+                if current is not None:
+                    return current.to_model(), False
+                # Nothing to change and nothing cached: a single GET suffices
+                _, data = self.client.requester.requestJsonAndCheck("GET", path)
+                changed = False
+            else:
+                if throttled:
+                    self.write_throttle.acquire()
+                with idempotent_writes() if self.retry_writes else nullcontext():
+                    _, data = self.client.requester.requestJsonAndCheck(
+                        "PATCH", path, input=changes
+                    )
+                changed = True
+        except GithubException as e:
+            raise self._write_error(e, request.repo, not_found=not_found) from e
+
+        issue = self._issue_from_payload(data)
+        self._remember_issues(request.repo, [issue])
+        return issue, changed
+
+    @traced("convert.pr")
+    def _convert_pr_to_data(self, pr, fields: list[str] | None = None) -> PRData:
         """Convert PyGithub PullRequest to PRData model.
 
+        Uses the raw payload when available, so list results never trigger
+        per-PR completion requests for ``mergeable``/``merged``.
+
         Args:
             pr: PyGithub PullRequest object
+            fields: Optional sparse fieldset (default: all fields)
 
         Returns:
             PRData model instance
         """
-        return PRData(
+        data = raw_payload(pr)
+        if data is not None:
+            return pr_from_rest(data, fields)
+        pr_data = PRData(
             number=pr.number,
             title=pr.title,
             state=pr.state,
@@ -118,7 +432,9 @@ class GithubToolService:
             mergeable=pr.mergeable,
             merged=pr.merged,
         )
+        return self._select(pr_data, fields)
 
+    @traced("convert.file")
     def _convert_content_to_file_data(self, content) -> FileData:
         """Convert PyGithub ContentFile to FileData model.
 
@@ -136,6 +452,7 @@ class GithubToolService:
             sha=content.sha,
         )
 
+    @observe_tool
     def list_issues(self, request: ListIssuesRequest) -> ListIssuesResponse:
         """List issues in a repository.
 
@@ -150,7 +467,40 @@ class GithubToolService:
             GithubPermissionError: If access denied
             GithubError: For other GitHub API errors
         """
+        issue_data, partial = collect(self.iter_issues(request))
+        self._remember_issues(request.repo, issue_data, request.fields)
+
+        return ListIssuesResponse(issues=issue_data, total_count=len(issue_data), partial=partial)
+
+    def iter_issues(
+        self, request: ListIssuesRequest | StreamIssuesRequest
+    ) -> Iterator[IssueData]:
+        """Yield issues in a repository as pages arrive from GitHub.
+
+        Pages are fetched lazily: the next one is only requested once every
+        issue of the previous page has been consumed. A listing can continue
+        from ``request.cursor`` (see ``core.partial``).
+
+        Args:
+            request: ListIssuesRequest or StreamIssuesRequest (``limit=None``
+                yields every matching issue)
+
+        Yields:
+            IssueData
+
+        Raises:
+            GithubNotFoundError: If repository not found
+            GithubPermissionError: If access denied
+            GithubTimeoutError: If the deadline runs out (with the cursor to
+                continue from as ``details["next_cursor"]``)
+            GithubError: For other GitHub API errors
+        """
+        offset = 0
         try:
+            if self.use_graphql:
+                yield from self.graphql.iter_issues(request)
+                return
+
             repo = self.client.get_repo(request.repo)
 
             # Build filter parameters
@@ -161,14 +511,16 @@ class GithubToolService:
                 kwargs["assignee"] = request.assignee
 
             # Get issues (paginated)
+            offset = parse_offset(request.cursor)
             issues_paginated = repo.get_issues(**kwargs)
-            issues_list = list(issues_paginated[: request.limit])
-
-            # Convert to data models
-            issue_data = [self._convert_issue_to_data(issue) for issue in issues_list]
-
-            return ListIssuesResponse(issues=issue_data, total_count=len(issue_data))
-
+            pages = paginate_from(issues_paginated, offset, self.client.per_page)
+            for issue in islice(pages, request.limit):
+                yield self._convert_issue_to_data(issue, request.fields)
+                offset += 1
+
+        except GithubTimeoutError as e:
+            e.details.setdefault("next_cursor", offset_cursor(offset))
+            raise
         except UnknownObjectException as e:
             raise GithubNotFoundError(f"Repository '{request.repo}' not found") from e
         except GithubException as e:
@@ -180,6 +532,7 @@ class GithubToolService:
                 f"GitHub API error: {e.data.get('message', str(e))}"
             ) from e
 
+    @observe_tool
     def create_issue(self, request: CreateIssueRequest) -> CreateIssueResponse:
         """Create a new issue in a repository.
 
@@ -192,35 +545,33 @@ class GithubToolService:
         Raises:
             GithubNotFoundError: If repository not found
             GithubPermissionError: If access denied
+            GithubRateLimitError: If a rate limit rejected the request
             GithubError: For other GitHub API errors
         """
         try:
             repo = self.client.get_repo(request.repo)
 
-            # Create issue
+            # Create issue (PyGithub rejects None for omitted lists)
+            self.write_throttle.acquire()
             issue = repo.create_issue(
                 title=request.title,
                 body=request.body,
-                labels=request.labels,
-                assignees=request.assignees,
+                labels=NotSet if request.labels is None else request.labels,
+                assignees=NotSet if request.assignees is None else request.assignees,
             )
 
             # Convert to data model
             issue_data = self._convert_issue_to_data(issue)
+            self._remember_issues(request.repo, [issue_data])
 
             return CreateIssueResponse(issue=issue_data)
 
         except UnknownObjectException as e:
             raise GithubNotFoundError(f"Repository '{request.repo}' not found") from e
         except GithubException as e:
-            if e.status == 403:
-                raise GithubPermissionError(
-                    f"Access denied to repository '{request.repo}'"
-                ) from e
-            raise GithubError(
-                f"GitHub API error: {e.data.get('message', str(e))}"
-            ) from e
+            raise self._write_error(e, request.repo) from e
 
+    @observe_tool
     def get_issue(self, request: GetIssueRequest) -> GetIssueResponse:
         """Get details of a specific issue.
 
@@ -235,12 +586,16 @@ class GithubToolService:
             GithubError: For other GitHub API errors
         """
         try:
-            repo = self.client.get_repo(request.repo)
-            issue = repo.get_issue(request.issue_number)
+            if self.use_graphql:
+                issue_data = self.graphql.get_issue(request)
+            else:
+                repo = self.client.get_repo(request.repo)
+                issue = repo.get_issue(request.issue_number)
 
-            # Convert to data model
-            issue_data = self._convert_issue_to_data(issue)
+                # Convert to data model
+                issue_data = self._convert_issue_to_data(issue, request.fields)
 
+            self._remember_issues(request.repo, [issue_data], request.fields)
             return GetIssueResponse(issue=issue_data)
 
         except UnknownObjectException as e:
@@ -252,9 +607,14 @@ class GithubToolService:
                 f"GitHub API error: {e.data.get('message', str(e))}"
             ) from e
 
+    @observe_tool
     def update_issue(self, request: UpdateIssueRequest) -> UpdateIssueResponse:
         """Update an existing issue.
 
+        The issue is PATCHed directly by number. When a cached copy of the
+        issue shows every provided field already matches, no request is sent
+        and the response reports ``changed=False``.
+
         Args:
             request: UpdateIssueRequest with repo, issue_number, and fields to update
 
@@ -266,44 +626,65 @@ class GithubToolService:
             GithubPermissionError: If access denied
             GithubError: For other GitHub API errors
         """
-        try:
-            repo = self.client.get_repo(request.repo)
-            issue = repo.get_issue(request.issue_number)
-
-            # Build update parameters (only include non-None fields)
-            kwargs = {}
-            if request.title is not None:
-                kwargs["title"] = request.title
-            if request.body is not None:
-                kwargs["body"] = request.body
-            if request.state is not None:
-                kwargs["state"] = request.state
-            if request.labels is not None:
-                kwargs["labels"] = request.labels
-            if request.assignees is not None:
-                kwargs["assignees"] = request.assignees
+        issue_data, changed = self._apply_issue_update(request, throttled=True)
+        return UpdateIssueResponse(issue=issue_data, changed=changed)
 
-            # Update issue
-            issue.edit(**kwargs)
+    @observe_tool
+    def create_issues(self, request: CreateIssuesRequest) -> BatchIssuesResponse:
+        """Create many issues with bounded concurrency.
 
-            # Convert to data model (refresh to get updated data)
-            issue_data = self._convert_issue_to_data(issue)
+        Each issue is created with a single POST (no get_repo per item).
+        Writes are paced by the service's shared WriteThrottle, and a
+        failing item is reported in its result without aborting the batch.
 
-            return UpdateIssueResponse(issue=issue_data)
+        Args:
+            request: CreateIssuesRequest with items and max_concurrency
 
-        except UnknownObjectException as e:
-            raise GithubNotFoundError(
-                f"Issue #{request.issue_number} not found in '{request.repo}'"
-            ) from e
-        except GithubException as e:
-            if e.status == 403:
-                raise GithubPermissionError(
-                    f"Access denied to update issue in '{request.repo}'"
-                ) from e
-            raise GithubError(
-                f"GitHub API error: {e.data.get('message', str(e))}"
-            ) from e
+        Returns:
+            BatchIssuesResponse with per-item results
+        """
+        results = run_batch(
+            request.items,
+            self._post_issue,
+            max_concurrency=request.max_concurrency,
+            throttle=self.write_throttle,
+        )
+        succeeded = sum(1 for result in results if result.success)
+        return BatchIssuesResponse(
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            partial=batch_partial(results),
+        )
+
+    @observe_tool
+    def update_issues(self, request: UpdateIssuesRequest) -> BatchIssuesResponse:
+        """Update many issues with bounded concurrency.
+
+        Each update is a single PATCH by issue number (no get_repo or
+        get_issue per item). Failures are reported per item.
+
+        Args:
+            request: UpdateIssuesRequest with items and max_concurrency
+
+        Returns:
+            BatchIssuesResponse with per-item results
+        """
+        results = run_batch(
+            request.items,
+            self._patch_issue,
+            max_concurrency=request.max_concurrency,
+            throttle=self.write_throttle,
+        )
+        succeeded = sum(1 for result in results if result.success)
+        return BatchIssuesResponse(
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            partial=batch_partial(results),
+        )
 
+    @observe_tool
     def list_prs(self, request: ListPRsRequest) -> ListPRsResponse:
         """List pull requests in a repository.
 
@@ -317,7 +698,34 @@ class GithubToolService:
             GithubNotFoundError: If repository not found
             GithubError: For other GitHub API errors
         """
+        pr_data, partial = collect(self.iter_prs(request))
+
+        return ListPRsResponse(pull_requests=pr_data, total_count=len(pr_data), partial=partial)
+
+    def iter_prs(self, request: ListPRsRequest | StreamPRsRequest) -> Iterator[PRData]:
+        """Yield pull requests in a repository as pages arrive from GitHub.
+
+        A listing can continue from ``request.cursor`` (see ``core.partial``).
+
+        Args:
+            request: ListPRsRequest or StreamPRsRequest (``limit=None``
+                yields every matching pull request)
+
+        Yields:
+            PRData
+
+        Raises:
+            GithubNotFoundError: If repository not found
+            GithubTimeoutError: If the deadline runs out (with the cursor to
+                continue from as ``details["next_cursor"]``)
+            GithubError: For other GitHub API errors
+        """
+        offset = 0
         try:
+            if self.use_graphql:
+                yield from self.graphql.iter_prs(request)
+                return
+
             repo = self.client.get_repo(request.repo)
 
             # Build filter parameters
@@ -328,14 +736,16 @@ class GithubToolService:
                 kwargs["base"] = request.base
 
             # Get pull requests (paginated)
+            offset = parse_offset(request.cursor)
             prs_paginated = repo.get_pulls(**kwargs)
-            prs_list = list(prs_paginated[: request.limit])
-
-            # Convert to data models
-            pr_data = [self._convert_pr_to_data(pr) for pr in prs_list]
-
-            return ListPRsResponse(pull_requests=pr_data, total_count=len(pr_data))
-
+            pages = paginate_from(prs_paginated, offset, self.client.per_page)
+            for pr in islice(pages, request.limit):
+                yield self._convert_pr_to_data(pr, request.fields)
+                offset += 1
+
+        except GithubTimeoutError as e:
+            e.details.setdefault("next_cursor", offset_cursor(offset))
+            raise
         except UnknownObjectException as e:
             raise GithubNotFoundError(f"Repository '{request.repo}' not found") from e
         except GithubException as e:
@@ -343,6 +753,7 @@ class GithubToolService:
                 f"GitHub API error: {e.data.get('message', str(e))}"
             ) from e
 
+    @observe_tool
     def get_pr(self, request: GetPRRequest) -> GetPRResponse:
         """Get details of a specific pull request.
 
@@ -357,11 +768,14 @@ class GithubToolService:
             GithubError: For other GitHub API errors
         """
         try:
+            if self.use_graphql:
+                return GetPRResponse(pull_request=self.graphql.get_pr(request))
+
             repo = self.client.get_repo(request.repo)
             pr = repo.get_pull(request.pr_number)
 
             # Convert to data model
-            pr_data = self._convert_pr_to_data(pr)
+            pr_data = self._convert_pr_to_data(pr, request.fields)
 
             return GetPRResponse(pull_request=pr_data)
 
@@ -374,6 +788,68 @@ class GithubToolService:
                 f"GitHub API error: {e.data.get('message', str(e))}"
             ) from e
 
+    @observe_tool
+    def get_issues(self, request: GetIssuesRequest) -> GetIssuesResponse:
+        """Get several issues by number in a single GraphQL request.
+
+        Args:
+            request: GetIssuesRequest with repo and numbers
+
+        Returns:
+            GetIssuesResponse with found issues and numbers not found
+
+        Raises:
+            GithubNotFoundError: If repository not found
+            GithubPermissionError: If access denied
+            GithubError: For other GitHub API errors
+        """
+        try:
+            issues, not_found = self.graphql.get_issues(request)
+            self._remember_issues(request.repo, issues, request.fields)
+            return GetIssuesResponse(issues=issues, not_found=not_found)
+
+        except UnknownObjectException as e:
+            raise GithubNotFoundError(f"Repository '{request.repo}' not found") from e
+        except GithubException as e:
+            if e.status == 403:
+                raise GithubPermissionError(
+                    f"Access denied to repository '{request.repo}'"
+                ) from e
+            raise GithubError(
+                f"GitHub API error: {e.data.get('message', str(e))}"
+            ) from e
+
+    @observe_tool
+    def get_prs(self, request: GetPRsRequest) -> GetPRsResponse:
+        """Get several pull requests by number in a single GraphQL request.
+
+        Args:
+            request: GetPRsRequest with repo and numbers
+
+        Returns:
+            GetPRsResponse with found pull requests and numbers not found
+
+        Raises:
+            GithubNotFoundError: If repository not found
+            GithubPermissionError: If access denied
+            GithubError: For other GitHub API errors
+        """
+        try:
+            prs, not_found = self.graphql.get_prs(request)
+            return GetPRsResponse(pull_requests=prs, not_found=not_found)
+
+        except UnknownObjectException as e:
+            raise GithubNotFoundError(f"Repository '{request.repo}' not found") from e
+        except GithubException as e:
+            if e.status == 403:
+                raise GithubPermissionError(
+                    f"Access denied to repository '{request.repo}'"
+                ) from e
+            raise GithubError(
+                f"GitHub API error: {e.data.get('message', str(e))}"
+            ) from e
+
+    @observe_tool
     def get_file_contents(
         self, request: GetFileContentsRequest
     ) -> GetFileContentsResponse:
@@ -418,6 +894,7 @@ class GithubToolService:
                 f"GitHub API error: {e.data.get('message', str(e))}"
             ) from e
 
+    @observe_tool
     def list_repo_files(self, request: ListRepoFilesRequest) -> ListRepoFilesResponse:
         """List files in a repository directory.
 
@@ -427,26 +904,46 @@ class GithubToolService:
         Returns:
             ListRepoFilesResponse with files and total count
 
+        Raises:
+            GithubNotFoundError: If repository or path not found
+            GithubError: For other GitHub API errors
+        """
+        file_data, partial = collect(self.iter_repo_files(request))
+
+        return ListRepoFilesResponse(files=file_data, total_count=len(file_data), partial=partial)
+
+    def iter_repo_files(self, request: ListRepoFilesRequest) -> Iterator[FileData]:
+        """Yield files in a repository directory, one directory listing at a time.
+
+        With ``recursive``, subdirectories are listed breadth-first after the
+        entries of their parent have been yielded.
+
+        Args:
+            request: ListRepoFilesRequest with repo, path, ref, recursive
+
+        Yields:
+            FileData
+
         Raises:
             GithubNotFoundError: If repository or path not found
             GithubError: For other GitHub API errors
         """
         try:
             repo = self.client.get_repo(request.repo)
+            pending = deque([request.path])
 
-            # Get contents (can be a single file or list of files)
-            contents = repo.get_contents(request.path, ref=request.ref)
-
-            # Ensure we have a list
-            if not isinstance(contents, list):
-                contents = [contents]
+            while pending:
+                # Get contents (can be a single file or list of files)
+                contents = repo.get_contents(pending.popleft(), ref=request.ref)
 
-            # Convert to data models
-            file_data = [
-                self._convert_content_to_file_data(content) for content in contents
-            ]
+                # Ensure we have a list
+                if not isinstance(contents, list):
+                    contents = [contents]
 
-            return ListRepoFilesResponse(files=file_data, total_count=len(file_data))
+                for content in contents:
+                    yield self._convert_content_to_file_data(content)
+                    if request.recursive and content.type == "dir":
+                        pending.append(content.path)
 
         except UnknownObjectException as e:
             raise GithubNotFoundError(
@@ -0,0 +1,143 @@
+"""GitHub - Tracing (SAP-042)
+
+Optional OpenTelemetry spans around each layer a tool call passes through,
+so a slow call shows where its time went:
+
+- interface entry points: REST requests (``tracing_middleware``) and MCP
+  tools, named ``HTTP <method> <route>`` and ``mcp.tool <name>``
+- service operations (``service.<tool>``, see ``metrics.observe_tool``)
+- upstream HTTP requests to GitHub (``<METHOD> <endpoint template>``, one
+  per page when paginating, see ``core.upstream``)
+- conversion of GitHub objects to models (``convert.<kind>``) and
+  serialization of responses (``serialize.*``)
+
+Tracing is off unless ``GITHUB_TRACING=1`` is set (or ``enable()`` is
+called) and needs ``opentelemetry-api`` (the ``tracing`` extra); spans go
+to whatever tracer provider the process configures (SDK, exporter,
+``opentelemetry-instrument``). While off, ``span()`` returns a shared no-op
+context manager and ``traced`` functions call straight through.
+"""
+
+import contextlib
+import functools
+import importlib
+import inspect
+import logging
+import os
+from collections.abc import Callable, Mapping
+from types import ModuleType
+from typing import Any, TypeVar
+
+
+otel_trace: ModuleType | None
+propagate: ModuleType | None
+try:  # Optional dependency (tracing extra)
+    otel_trace = importlib.import_module("opentelemetry.trace")
+    propagate = importlib.import_module("opentelemetry.propagate")
+except ImportError:  # pragma: no cover - exercised when opentelemetry is absent
+    otel_trace = None
+    propagate = None
+
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACER_NAME = "chora_github"
+
+_NOOP = contextlib.nullcontext()
+_tracer: Any = None  # None: tracing disabled
+
+
+def enable(tracer: Any = None) -> bool:
+    """Start emitting spans.
+
+    Args:
+        tracer: OpenTelemetry ``Tracer`` (or a compatible object) to use
+            (default: the global tracer provider's tracer)
+
+    Returns:
+        True if tracing is now enabled (False if opentelemetry-api is
+        missing and no tracer was given)
+    """
+    global _tracer
+    if tracer is None:
+        if otel_trace is None:
+            logger.warning("Tracing requested but opentelemetry-api is not installed")
+            return False
+        tracer = otel_trace.get_tracer(TRACER_NAME)
+    _tracer = tracer
+    return True
+
+
+def disable() -> None:
+    """Stop emitting spans."""
+    global _tracer
+    _tracer = None
+
+
+def enabled() -> bool:
+    """Whether spans are being emitted."""
+    return _tracer is not None
+
+
+def span(
+    name: str, attributes: Mapping[str, Any] | None = None, context: Any = None
+) -> contextlib.AbstractContextManager[Any]:
+    """Context manager for a span that becomes the current span.
+
+    Entering it gives the span (None while tracing is disabled).
+
+    Args:
+        name: Span name
+        attributes: Span attributes (None values are skipped)
+        context: Parent context (default: the current one), e.g. from
+            ``extract_context``
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    if attributes:
+        attributes = {key: value for key, value in attributes.items() if value is not None}
+    current: contextlib.AbstractContextManager[Any] = tracer.start_as_current_span(
+        name, context=context, attributes=attributes or None
+    )
+    return current
+
+
+def extract_context(headers: Mapping[str, str]) -> Any:
+    """Parent context from W3C ``traceparent`` headers (None if disabled)."""
+    if _tracer is None or propagate is None:
+        return None
+    return propagate.extract(headers)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator running each call of a function (sync or async) in a span."""
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+if os.getenv("GITHUB_TRACING", "").lower() in ("1", "true", "yes"):
+    enable()
@@ -0,0 +1,532 @@
+"""GitHub - Upstream Request Observation (SAP-042)
+
+Every HTTP request PyGithub sends to GitHub (REST and GraphQL) goes through
+one connection object per client. ``install()`` swaps PyGithub's connection
+classes for thin subclasses that time each request with a monotonic clock
+and report it, as an UpstreamCall, to every registered observer.
+
+Observers run synchronously on the requesting thread, after the response
+has been received, so they must be cheap and must not raise.
+
+An interceptor (``set_interceptor``) can additionally wrap the sending of
+each request, e.g. to record exchanges or answer them from a recording
+instead of the network (see ``core.cassettes``). With tracing enabled, each
+request also runs in a span (see ``core.tracing``).
+
+Requests are bounded by the current deadline (see ``core.deadlines``): the
+socket timeout is shortened to the time left, nothing is sent once it is
+spent, and DeadlineRetry keeps PyGithub's retries within it. A request
+that times out raises GithubTimeoutError instead of a ``requests`` error,
+and one that cannot reach GitHub raises GithubServiceError.
+
+Transient failures (502/503, connection resets, rate-limit rejections) are
+retried in place by UpstreamRetry, so only the failed request is resent:
+reads by default, writes only inside ``idempotent_writes()``, with jittered
+exponential backoff and a process-wide RetryBudget. The retries made for a
+request are reported with it (``UpstreamCall.retries``).
+"""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import requests
+from github.GithubRetry import GithubRetry
+from github.Requester import (
+    HTTPRequestsConnectionClass,
+    HTTPSRequestsConnectionClass,
+    Requester,
+)
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
+
+from . import deadlines, tracing
+from .exceptions import GithubServiceError, GithubTimeoutError
+
+
+ERROR_STATUS = 0
+"""Status reported when no response was received (connection error)."""
+
+_ENDPOINT_PATTERNS = (
+    (re.compile(r"^/repos/[^/]+/[^/]+"), "/repos/{owner}/{repo}"),
+    (re.compile(r"/contents/.*$"), "/contents/{path}"),
+    (re.compile(r"/git/(trees|refs|commits|blobs)/[^/]+"), r"/git/\1/{ref}"),
+    (re.compile(r"/users/[^/]+"), "/users/{user}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{number}"),
+)
+_PAGE = re.compile(r"(?:^|&)page=(\d+)")
+
+
+@dataclass(frozen=True, slots=True)
+class UpstreamCall:
+    """One HTTP request made to GitHub."""
+
+    method: str
+    endpoint: str
+    status: int
+    duration: float
+    token: str = ""
+    headers: Mapping[str, str] = field(default_factory=dict)
+    retries: tuple[str, ...] = ()
+    """Why the request was resent before this outcome, one entry per retry
+    (a status code, ``connection`` or ``timeout``)."""
+    retry_denied: bool = False
+    """Whether a further retry was refused by the retry budget."""
+
+    @property
+    def not_modified(self) -> bool:
+        """Whether GitHub answered 304 (a conditional request hit)."""
+        return self.status == 304
+
+
+Observer = Callable[[UpstreamCall], None]
+
+Interceptor = Callable[["_ObservedConnection", Callable[[], Any]], Any]
+"""Called as ``interceptor(connection, send)`` for every request; returns the
+response, normally by calling ``send()`` (the real network round trip)."""
+
+_observers: list[Observer] = []
+_interceptor: Interceptor | None = None
+# Retries made by UpstreamRetry for the request in flight on this thread
+_retry_log = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+# PyGithub has no public hook on a client's session, so install() relies on
+# this private Requester flag; pyproject pins the PyGithub versions it holds for
+_PERSIST_ATTRIBUTE = "_Requester__persist"
+
+
+# ============================================================================
+# Labels
+# ============================================================================
+
+
+def endpoint_template(url: str) -> str:
+    """Reduce a request URL to a low-cardinality endpoint template.
+
+    Args:
+        url: Request path, optionally with a query string
+            (e.g. ``/repos/octocat/Hello-World/issues/12?per_page=30``)
+
+    Returns:
+        Template such as ``/repos/{owner}/{repo}/issues/{number}``
+    """
+    path = url.split("?", 1)[0].split("#", 1)[0] or "/"
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def describe_request(method: str, url: str) -> str:
+    """Describe a request for error messages, e.g. ``GET /repos/{owner}/{repo}/issues page 3``."""
+    path, _, query = url.partition("?")
+    page = _PAGE.search(query)
+    description = f"{method} {endpoint_template(path)}"
+    return f"{description} page {page.group(1)}" if page else description
+
+
+def token_fingerprint(authorization: str | None) -> str:
+    """Identify a token without exposing it.
+
+    Args:
+        authorization: Authorization header value (``token ...`` or
+            ``Bearer ...``) or a raw token
+
+    Returns:
+        First 8 hex characters of the token's SHA-256, or "" if absent
+    """
+    if not authorization:
+        return ""
+    token = authorization.split()[-1]
+    return hashlib.sha256(token.encode()).hexdigest()[:8]
+
+
+# ============================================================================
+# Observers
+# ============================================================================
+
+
+def add_observer(observer: Observer) -> None:
+    """Report every upstream request to ``observer`` (once per observer)."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    """Stop reporting upstream requests to ``observer``."""
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def notify(call: UpstreamCall) -> None:
+    """Report ``call`` to every observer."""
+    for observer in tuple(_observers):
+        observer(call)
+
+
+def set_interceptor(interceptor: Interceptor | None) -> Interceptor | None:
+    """Route every upstream request through ``interceptor`` (None: direct).
+
+    Returns:
+        The previous interceptor, so callers can restore it
+    """
+    global _interceptor
+    previous, _interceptor = _interceptor, interceptor
+    return previous
+
+
+# ============================================================================
+# Connection Classes
+# ============================================================================
+
+
+def _per_thread(name: str) -> Any:
+    """Connection attribute stored per thread (see ``_ObservedConnection``)."""
+
+    def get(self: "_ObservedConnection") -> Any:
+        return getattr(self._pending, name)
+
+    def set(self: "_ObservedConnection", value: Any) -> None:
+        setattr(self._pending, name, value)
+
+    return property(get, set)
+
+
+def _bounded_timeout() -> Any:
+    """Socket timeout of the pending request, bounded by its deadline."""
+
+    def get(self: "_ObservedConnection") -> float | None:
+        bounded: float | None = getattr(self._pending, "timeout", None)
+        return self._timeout if bounded is None else bounded
+
+    def set(self: "_ObservedConnection", value: float | None) -> None:
+        self._timeout = value
+
+    return property(get, set)
+
+
+class _ObservedConnection:
+    """Mixin timing ``getresponse`` for PyGithub's connection classes.
+
+    PyGithub shares one (persisted) connection per client and keeps the
+    pending request on it between ``request()`` and ``getresponse()``; the
+    request attributes are kept per thread, so concurrent service calls
+    cannot send each other's requests.
+    """
+
+    verb: str = _per_thread("verb")
+    url: str = _per_thread("url")
+    input: Any = _per_thread("input")
+    headers: dict[str, str] = _per_thread("headers")
+    stream: bool = _per_thread("stream")
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._pending = threading.local()
+        self._timeout: float | None = None
+        super().__init__(*args, **kwargs)
+
+    # PyGithub passes the client's timeout to every request; a deadline
+    # shortens it for the requests of its own thread only. Declared as the
+    # bases declare it: requests takes the (float) bounded value all the same
+    timeout: int | None = _bounded_timeout()
+
+    def getresponse(self) -> Any:
+        if not tracing.enabled():
+            return self._send()
+        path, _, query = self.url.partition("?")
+        page = _PAGE.search(query)
+        attributes = {
+            "http.request.method": self.verb,
+            "server.address": getattr(self, "host", None),
+            "url.path": path,
+            "github.page": int(page.group(1)) if page else None,
+        }
+        with tracing.span(f"{self.verb} {endpoint_template(path)}", attributes) as span:
+            response = self._send()
+            span.set_attribute("http.response.status_code", response.status)
+            return response
+
+    def _send(self) -> Any:
+        scope = deadlines.current()
+        bounded = False
+        if scope is not None:
+            remaining = scope.remaining()
+            if remaining <= 0:
+                raise scope.error(describe_request(self.verb, self.url))
+            bounded = self._timeout is None or remaining < self._timeout
+            if bounded:
+                self._pending.timeout = remaining
+        send = super().getresponse  # type: ignore[misc]
+        interceptor = _interceptor
+        _retry_log.retries = []
+        _retry_log.denied = False
+        RETRY_BUDGET.deposit()
+        start = time.perf_counter()
+        try:
+            response = send() if interceptor is None else interceptor(self, send)
+        except Exception as e:
+            self._report(ERROR_STATUS, {}, time.perf_counter() - start)
+            if not _is_timeout(e):
+                if isinstance(e, requests.ConnectionError):
+                    # Retries exhausted or denied, or a write not retried
+                    raise GithubServiceError(
+                        "Could not reach GitHub",
+                        operation=describe_request(self.verb, self.url),
+                        cause=e,
+                    ) from e
+                raise
+            if scope is not None and (bounded or scope.expired()):
+                raise scope.error(describe_request(self.verb, self.url)) from e
+            raise GithubTimeoutError(
+                f"GitHub did not respond within {self._timeout:g}s",
+                timeout_seconds=self._timeout,
+                operation=describe_request(self.verb, self.url),
+            ) from e
+        finally:
+            self._pending.timeout = None
+        self._report(response.status, dict(response.getheaders()), time.perf_counter() - start)
+        if scope is not None:
+            scope.record_request()
+        return response
+
+    def _report(self, status: int, headers: dict[str, str], duration: float) -> None:
+        if not _observers:
+            return
+        notify(
+            UpstreamCall(
+                method=self.verb,
+                endpoint=endpoint_template(self.url),
+                status=status,
+                duration=duration,
+                token=token_fingerprint(self.headers.get("Authorization")),
+                headers={key.lower(): value for key, value in headers.items()},
+                retries=tuple(_retry_log.retries),
+                retry_denied=_retry_log.denied,
+            )
+        )
+
+
+def _is_timeout(error: Exception) -> bool:
+    """Whether ``error`` means GitHub did not answer in time.
+
+    Once urllib3 has used up its retries, requests reports a read timeout
+    as a ConnectionError wrapping MaxRetryError.
+    """
+    if isinstance(error, requests.Timeout):
+        return True
+    reason = error.args[0] if isinstance(error, requests.ConnectionError) and error.args else None
+    return isinstance(reason, MaxRetryError) and isinstance(reason.reason, Urllib3TimeoutError)
+
+
+class ObservedHTTPSConnection(_ObservedConnection, HTTPSRequestsConnectionClass):
+    """HTTPS connection reporting each request to the observers."""
+
+
+class ObservedHTTPConnection(_ObservedConnection, HTTPRequestsConnectionClass):
+    """HTTP connection (GitHub Enterprise) reporting each request."""
+
+
+# ============================================================================
+# Retries
+# ============================================================================
+
+
+class DeadlineRetry(GithubRetry):
+    """PyGithub's retry policy (5xx and rate-limited 403), within the deadline.
+
+    urllib3 retries inside a single ``getresponse``, so without this a
+    retried request could wait out a ``Retry-After`` or back off long after
+    the caller's deadline. No retry starts once the deadline is spent, and
+    no wait is started that would outlast it.
+    """
+
+    def increment(
+        self, method: str | None = None, url: str | None = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        deadlines.check(describe_request(method or "", url or "/"))
+        return super().increment(method, url, *args, **kwargs)
+
+    def sleep(self, response: Any = None) -> None:
+        wait = None
+        if response is not None and self.respect_retry_after_header:
+            wait = self.get_retry_after(response)
+        deadlines.check(wait=self.get_backoff_time() if wait is None else wait)
+        super().sleep(response)
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+"""Transient responses retried (GithubRetry adds 403, for rate limits only)."""
+
+REJECTED_STATUSES = (403, 429)
+"""Rate-limit rejections: GitHub did not process the request, so it is safe
+to resend whatever the method."""
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+"""Seconds before the first retry at most (doubling for each further one)."""
+DEFAULT_BACKOFF_MAX = 8.0
+
+_idempotent_writes: ContextVar[bool] = ContextVar("github_idempotent_writes", default=False)
+
+
+class RetryBudget:
+    """Process-wide allowance of retries, so retries cannot amplify an outage.
+
+    Every request sent deposits ``ratio`` of a token (up to ``max_tokens``)
+    and every retry withdraws a whole one: when GitHub fails everything,
+    retries add at most ``ratio`` extra requests per request, after an
+    initial ``max_tokens`` for bursts.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        """Initialize budget (full).
+
+        Args:
+            ratio: Retries earned per request sent
+            max_tokens: Most retries that can be saved up
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit one request sent."""
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for one retry; False if the budget is spent."""
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+RETRY_BUDGET = RetryBudget()
+"""Shared by every client of the process."""
+
+
+@contextmanager
+def idempotent_writes() -> Iterator[None]:
+    """Let UpstreamRetry resend the writes made in this block, like reads.
+
+    Only for writes that have the same effect when applied twice (e.g. a
+    PATCH setting fields): after a 5xx or a connection error, GitHub may
+    already have applied the first attempt.
+    """
+    token = _idempotent_writes.set(True)
+    try:
+        yield
+    finally:
+        _idempotent_writes.reset(token)
+
+
+def _retry_reason(response: Any, error: Exception | None) -> str:
+    if response is not None:
+        return str(response.status)
+    return "timeout" if isinstance(error, Urllib3TimeoutError) else "connection"
+
+
+class UpstreamRetry(DeadlineRetry):
+    """Retry policy for transient GitHub failures (PyGithub's ``retry``).
+
+    - Reads (GET/HEAD/OPTIONS) are resent after a 429 or 5xx response, a
+      connection error (refused, reset) or a read timeout. Writes are
+      resent only inside ``idempotent_writes()``.
+    - A request rejected by a rate limit (403/429) is resent whatever its
+      method, as GitHub did not process it. ``Retry-After`` is honoured
+      (primary limits wait for the reset, see GithubRetry).
+    - Otherwise the wait before retry ``n`` is drawn uniformly from
+      ``[0, min(backoff_max, backoff_factor * 2 ** (n - 1))]`` (full jitter),
+      so clients failing together do not retry together.
+    - Each retry takes a token from RETRY_BUDGET; none is made once it is
+      spent.
+    - Waits and retries stay within the deadline (DeadlineRetry).
+
+    When no retry is left, the last response is returned as is, so PyGithub
+    raises its usual exception for it.
+    """
+
+    def __init__(
+        self,
+        total: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        **kwargs: Any,
+    ):
+        kwargs.setdefault("status_forcelist", list(RETRY_STATUSES))
+        kwargs.setdefault("allowed_methods", READ_METHODS)
+        kwargs.setdefault("raise_on_status", False)
+        super().__init__(
+            total=total, backoff_factor=backoff_factor, backoff_max=backoff_max, **kwargs
+        )
+        # Drawn once per attempt, so the deadline check and the sleep agree
+        self._jitter = random.random()
+
+    def _is_method_retryable(self, method: str) -> bool:
+        if self.allowed_methods is None:  # urllib3: retry any method
+            return True
+        return method.upper() in self.allowed_methods or _idempotent_writes.get()
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code in REJECTED_STATUSES:
+            return status_code in (self.status_forcelist or ())
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_backoff_time(self) -> float:
+        if not self.history:
+            return 0.0
+        ceiling = float(self.backoff_factor) * 2.0 ** (len(self.history) - 1)
+        return min(float(self.backoff_max), ceiling) * self._jitter
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: Any = None,
+        error: Exception | None = None,
+        _pool: Any = None,
+        _stacktrace: Any = None,
+    ) -> Any:
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if not RETRY_BUDGET.withdraw():
+            _retry_log.denied = True
+            raise MaxRetryError(_pool, url, error or ResponseError("retry budget spent"))
+        if hasattr(_retry_log, "retries"):
+            _retry_log.retries.append(_retry_reason(response, error))
+        return retry
+
+
+def install() -> None:
+    """Route PyGithub's requests through the observed connection classes.
+
+    Applies to clients created afterwards (the connection class is chosen
+    when a Requester is built). Idempotent.
+
+    Raises:
+        RuntimeError: If the installed PyGithub lacks the Requester
+            internals this relies on (an unsupported PyGithub version)
+    """
+    global _installed
+    with _install_lock:
+        if not _installed:
+            if not isinstance(getattr(Requester, _PERSIST_ATTRIBUTE, None), bool):
+                raise RuntimeError(
+                    f"Unsupported PyGithub version: Requester.{_PERSIST_ATTRIBUTE} is missing"
+                )
+            Requester.injectConnectionClasses(ObservedHTTPConnection, ObservedHTTPSConnection)
+            # injectConnectionClasses also disables connection reuse (it is
+            # meant for tests); keep the pooled session per client
+            setattr(Requester, _PERSIST_ATTRIBUTE, True)
+            _installed = True
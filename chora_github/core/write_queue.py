@@ -0,0 +1,464 @@
+"""GitHub - Durable Write Queue (SAP-042)
+
+An optional, SQLite-backed write-behind queue for issue mutations.
+
+Writers enqueue a create/update and get a job id back immediately; a
+background worker drains the queue against GitHub with exponential backoff,
+honouring ``Retry-After`` on rate limits. Jobs carry an optional idempotency
+key: enqueueing the same key again returns the existing job instead of a new
+one, so clients can safely retry after a timeout without creating duplicate
+issues.
+
+Creates are applied at most once: GitHub may have created the issue even
+when the request failed (a timeout, a 5xx, a dropped connection), so a
+create job is only retried after a rate-limit rejection, which GitHub did
+not process. Any other failure is final, and the job's error says what
+happened. Updates set fields, so applying one twice is harmless; they are
+retried after any failure that is not permanent, and delivered at least
+once.
+
+Jobs left ``running`` by a crashed process are returned to ``pending`` when
+the queue is reopened; create jobs are marked failed instead
+(``INTERRUPTED``), since their outcome is unknown. The background worker
+survives errors of its own (e.g. a locked database): it logs them, releases
+the jobs it was running the same way and tries again after a backoff.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from .exceptions import (
+    GithubConflictError,
+    GithubError,
+    GithubNotFoundError,
+    GithubPermissionError,
+    GithubRateLimitError,
+    GithubValidationError,
+    get_error_code,
+)
+from .models import (
+    CreateIssueRequest,
+    EnqueueIssueWriteResponse,
+    IssueData,
+    UpdateIssueRequest,
+    WriteJob,
+    WriteJobStatus,
+    WriteOperation,
+)
+
+
+if TYPE_CHECKING:
+    from .services import GithubToolService
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_DELAY = 2.0
+DEFAULT_MAX_DELAY = 300.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+PERMANENT_ERRORS = (
+    GithubNotFoundError,
+    GithubPermissionError,
+    GithubValidationError,
+    GithubConflictError,
+    ValueError,
+)
+"""Errors that will not succeed on retry; jobs failing with these fail at once."""
+
+RETRYABLE_CREATE_ERRORS = (GithubRateLimitError,)
+"""Create failures GitHub is known not to have processed; only these are retried."""
+
+INTERRUPTED_CREATE = "Interrupted while creating the issue; it may have been created"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS write_jobs (
+    job_id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    operation TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    result TEXT,
+    error TEXT,
+    error_code TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS write_jobs_due ON write_jobs (status, next_attempt_at);
+"""
+
+
+def _isoformat(timestamp: float) -> str:
+    """Convert an epoch timestamp to an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+class WriteQueue:
+    """Durable queue of issue writes drained in the background.
+
+    Attributes:
+        service: GithubToolService used to perform the writes
+        max_attempts: Attempts per job before it is marked failed
+        base_delay: Backoff before the second attempt (doubles per attempt)
+        max_delay: Upper bound for the backoff delay
+    """
+
+    def __init__(
+        self,
+        service: "GithubToolService",
+        path: str = ":memory:",
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open (or create) the queue database.
+
+        Args:
+            service: GithubToolService used to perform the writes
+            path: SQLite database path (":memory:" for a non-durable queue)
+            max_attempts: Attempts per job before it is marked failed
+            base_delay: Backoff in seconds before the second attempt
+            max_delay: Maximum backoff in seconds
+            poll_interval: Seconds the worker sleeps when nothing is due
+            clock: Wall clock returning epoch seconds (injectable for tests)
+        """
+        self.service = service
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+        # Jobs a previous process was running when it stopped
+        self._recover_running()
+
+    def _recover_running(self) -> None:
+        """Release jobs left ``running`` by an interrupted drain.
+
+        A create may already have reached GitHub, so it is failed
+        (``INTERRUPTED``) rather than sent again; updates return to pending.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE write_jobs SET status = ?, error = ?, error_code = ?"
+                " WHERE status = ? AND operation = ?",
+                (
+                    WriteJobStatus.FAILED.value,
+                    INTERRUPTED_CREATE,
+                    "INTERRUPTED",
+                    WriteJobStatus.RUNNING.value,
+                    WriteOperation.CREATE_ISSUE.value,
+                ),
+            )
+            self._conn.execute(
+                "UPDATE write_jobs SET status = ? WHERE status = ?",
+                (WriteJobStatus.PENDING.value, WriteJobStatus.RUNNING.value),
+            )
+
+    # ========================================================================
+    # Enqueue / Lookup
+    # ========================================================================
+
+    def enqueue_create(
+        self, request: CreateIssueRequest, idempotency_key: str | None = None
+    ) -> EnqueueIssueWriteResponse:
+        """Queue an issue creation.
+
+        Args:
+            request: CreateIssueRequest to perform
+            idempotency_key: Optional client key making retries safe
+
+        Returns:
+            EnqueueIssueWriteResponse with the job (existing job if duplicate)
+        """
+        return self._enqueue(WriteOperation.CREATE_ISSUE, request, idempotency_key)
+
+    def enqueue_update(
+        self, request: UpdateIssueRequest, idempotency_key: str | None = None
+    ) -> EnqueueIssueWriteResponse:
+        """Queue an issue update.
+
+        Args:
+            request: UpdateIssueRequest to perform
+            idempotency_key: Optional client key making retries safe
+
+        Returns:
+            EnqueueIssueWriteResponse with the job (existing job if duplicate)
+        """
+        return self._enqueue(WriteOperation.UPDATE_ISSUE, request, idempotency_key)
+
+    def get(self, job_id: str) -> WriteJob | None:
+        """Look up a job by id.
+
+        Args:
+            job_id: Job identifier returned on enqueue
+
+        Returns:
+            WriteJob, or None if no such job exists
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM write_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._job_from_row(row) if row else None
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs per status.
+
+        Returns:
+            Mapping of status value to job count
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM write_jobs GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def _enqueue(
+        self,
+        operation: WriteOperation,
+        request: CreateIssueRequest | UpdateIssueRequest,
+        idempotency_key: str | None,
+    ) -> EnqueueIssueWriteResponse:
+        now = self._clock()
+        job_id = uuid.uuid4().hex
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO write_jobs (job_id, idempotency_key, operation, repo,"
+                    " payload, status, next_attempt_at, created_at, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        job_id,
+                        idempotency_key,
+                        operation.value,
+                        request.repo,
+                        request.model_dump_json(),
+                        WriteJobStatus.PENDING.value,
+                        now,
+                        now,
+                        now,
+                    ),
+                )
+                row = self._conn.execute(
+                    "SELECT * FROM write_jobs WHERE job_id = ?", (job_id,)
+                ).fetchone()
+        except sqlite3.IntegrityError:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT * FROM write_jobs WHERE idempotency_key = ?",
+                    (idempotency_key,),
+                ).fetchone()
+            return EnqueueIssueWriteResponse(job=self._job_from_row(row), duplicate=True)
+
+        self._wake.set()
+        return EnqueueIssueWriteResponse(job=self._job_from_row(row))
+
+    def _job_from_row(self, row: sqlite3.Row) -> WriteJob:
+        status = WriteJobStatus(row["status"])
+        return WriteJob(
+            job_id=row["job_id"],
+            idempotency_key=row["idempotency_key"],
+            operation=row["operation"],
+            repo=row["repo"],
+            status=status,
+            attempts=row["attempts"],
+            issue=IssueData.model_validate_json(row["result"]) if row["result"] else None,
+            error=row["error"],
+            error_code=row["error_code"],
+            created_at=_isoformat(row["created_at"]),
+            updated_at=_isoformat(row["updated_at"]),
+            next_attempt_at=(
+                _isoformat(row["next_attempt_at"])
+                if status == WriteJobStatus.PENDING
+                else None
+            ),
+        )
+
+    # ========================================================================
+    # Draining
+    # ========================================================================
+
+    def drain_once(self, limit: int = 10) -> int:
+        """Attempt every due job once (up to ``limit`` jobs).
+
+        Args:
+            limit: Maximum number of jobs to attempt
+
+        Returns:
+            Number of jobs attempted
+        """
+        jobs = self._claim_due(limit)
+        for row in jobs:
+            self._run(row)
+        return len(jobs)
+
+    def _claim_due(self, limit: int) -> list[sqlite3.Row]:
+        now = self._clock()
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT * FROM write_jobs WHERE status = ? AND next_attempt_at <= ?"
+                " ORDER BY created_at LIMIT ?",
+                (WriteJobStatus.PENDING.value, now, limit),
+            ).fetchall()
+            for row in rows:
+                self._conn.execute(
+                    "UPDATE write_jobs SET status = ?, attempts = attempts + 1,"
+                    " updated_at = ? WHERE job_id = ?",
+                    (WriteJobStatus.RUNNING.value, now, row["job_id"]),
+                )
+        return rows
+
+    def _run(self, row: sqlite3.Row) -> None:
+        attempts = row["attempts"] + 1
+        try:
+            issue = self._perform(row["operation"], row["payload"])
+        except Exception as e:
+            message = e.message if isinstance(e, GithubError) else str(e)
+            if not self._retryable(row["operation"], e) or attempts >= self.max_attempts:
+                self._finish(row["job_id"], WriteJobStatus.FAILED, error=e, message=message)
+            else:
+                self._reschedule(row["job_id"], attempts, e, message)
+            return
+        self._finish(row["job_id"], WriteJobStatus.SUCCEEDED, issue=issue)
+
+    @staticmethod
+    def _retryable(operation: str, error: Exception) -> bool:
+        """Whether a failed job may be attempted again."""
+        if operation == WriteOperation.CREATE_ISSUE.value:
+            return isinstance(error, RETRYABLE_CREATE_ERRORS)
+        return not isinstance(error, PERMANENT_ERRORS)
+
+    def _perform(self, operation: str, payload: str) -> IssueData:
+        if operation == WriteOperation.CREATE_ISSUE.value:
+            create = CreateIssueRequest.model_validate_json(payload)
+            return self.service.create_issue(create).issue
+        update = UpdateIssueRequest.model_validate_json(payload)
+        return self.service.update_issue(update).issue
+
+    def backoff(self, attempts: int, error: Exception | None = None) -> float:
+        """Delay before the next attempt after ``attempts`` failed attempts.
+
+        Args:
+            attempts: Attempts made so far
+            error: Error of the last attempt (a rate limit's Retry-After wins
+                when it is longer than the computed backoff)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * 2.0 ** (attempts - 1))
+        if isinstance(error, GithubRateLimitError):
+            delay = max(delay, float(error.details.get("retry_after_seconds", 0)))
+        return delay
+
+    def _reschedule(self, job_id: str, attempts: int, error: Exception, message: str) -> None:
+        now = self._clock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE write_jobs SET status = ?, next_attempt_at = ?, error = ?,"
+                " error_code = ?, updated_at = ? WHERE job_id = ?",
+                (
+                    WriteJobStatus.PENDING.value,
+                    now + self.backoff(attempts, error),
+                    message,
+                    get_error_code(error),
+                    now,
+                    job_id,
+                ),
+            )
+
+    def _finish(
+        self,
+        job_id: str,
+        status: WriteJobStatus,
+        issue: IssueData | None = None,
+        error: Exception | None = None,
+        message: str | None = None,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE write_jobs SET status = ?, result = ?, error = ?, error_code = ?,"
+                " updated_at = ? WHERE job_id = ?",
+                (
+                    status.value,
+                    issue.model_dump_json() if issue else None,
+                    message,
+                    get_error_code(error) if error else None,
+                    self._clock(),
+                    job_id,
+                ),
+            )
+
+    # ========================================================================
+    # Background Worker
+    # ========================================================================
+
+    def start(self) -> None:
+        """Start the background worker thread (no-op if already running)."""
+        if self._worker and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._loop, name="chora-github-write-queue", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background worker, waiting for the current job to finish.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker to exit
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._worker:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def close(self) -> None:
+        """Stop the worker and close the database."""
+        self.stop()
+        with self._lock:
+            self._conn.close()
+
+    def _loop(self) -> None:
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                drained = self.drain_once()
+            except Exception:
+                # A database error must not end the worker: log it, release
+                # the jobs it left running and try again after a backoff
+                failures += 1
+                logger.exception("Write queue drain failed (attempt %d)", failures)
+                try:
+                    self._recover_running()
+                except Exception:
+                    logger.exception("Could not release running write jobs")
+                self._stop.wait(min(self.max_delay, self.poll_interval * 2.0**failures))
+                continue
+            failures = 0
+            if drained == 0:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
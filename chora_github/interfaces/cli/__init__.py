@@ -3,16 +3,17 @@
 Command-line interface using Click framework. Translates CLI commands
 to core service calls and formats output for terminal display.
 
+Startup imports only click and the formatters; commands import the core
+service when they run (see ``commands``).
+
 Generated by: chora-base SAP-047 (Capability Server Template)
 """
 
-import asyncio
-from typing import Optional
-
 import click
-from github.core import create_github_service
 
-from .commands import cli as cli_app
+from chora_github import __version__
+
+from .commands import call_command, tools_command
 from .formatters import OutputFormat
 
 
@@ -22,7 +23,7 @@ from .formatters import OutputFormat
 
 
 @click.group()
-@click.version_option(version="{{ version }}", prog_name="github")
+@click.version_option(version=__version__, prog_name="github")
 @click.option(
     "--format",
     type=click.Choice(["json", "table", "yaml"], case_sensitive=False),
@@ -31,37 +32,18 @@ from .formatters import OutputFormat
 )
 @click.pass_context
 def cli(ctx: click.Context, format: str):
-    """GitHub - CLI + REST only, no optional features
+    """GitHub issues, pull requests and files from the command line.
 
-    A production-ready capability server with multi-interface support.
+    Commands run the same tools as the REST and MCP interfaces, with
+    GITHUB_TOKEN from the environment.
     """
     # Store format in context for commands to access
     ctx.ensure_object(dict)
     ctx.obj["format"] = OutputFormat(format.lower())
 
-    # Create service instance (shared across commands in this invocation)
-    ctx.obj["service"] = create_github_service()
-
-
-# Import and register command groups
-from .commands import (
-    create_command,
-    delete_command,
-    get_command,
-    health_command,
-    list_command,
-    status_command,
-    update_command,
-)
-
 
-cli.add_command(create_command)
-cli.add_command(get_command)
-cli.add_command(list_command)
-cli.add_command(update_command)
-cli.add_command(delete_command)
-cli.add_command(status_command)
-cli.add_command(health_command)
+cli.add_command(tools_command)
+cli.add_command(call_command)
 
 
 # ============================================================================
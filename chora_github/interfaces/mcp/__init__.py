@@ -3,17 +3,22 @@
 Model Context Protocol interface using FastMCP. Provides tools and
 resources for AI assistants like Claude to interact with GitHub repositories.
 
+Importing this package is cheap: the server (and FastMCP) is created on
+first access to ``mcp`` or by ``main()``, and the core service (PyGithub)
+is imported by the first tool call.
+
 Generated by: chora-base SAP-047 (Capability Server Template)
-Adapted for: GitHub Integration (8 tools)
 """
 
-from fastmcp import FastMCP
+import os
+from typing import TYPE_CHECKING, Any
+
 
-from .tools import register_tools
-from .resources import register_resources
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 # Export for testing
-__all__ = ["mcp", "create_mcp_server"]
+__all__ = ["create_mcp_server", "get_server", "mcp"]
 
 
 # ============================================================================
@@ -21,17 +26,21 @@ __all__ = ["mcp", "create_mcp_server"]
 # ============================================================================
 
 
-def create_mcp_server() -> FastMCP:
+def create_mcp_server() -> "FastMCP":
     """Create and configure MCP server for GitHub operations.
 
     Returns:
         Configured FastMCP server instance with GitHub tools and resources
     """
+    from fastmcp import FastMCP
+
+    from .tools import register_tools
+
     mcp = FastMCP(
         name="mcp-server-github",
         version="1.0.0",
-        description="GitHub integration server with multi-interface support (CLI, REST, MCP). "
-                    "Provides 8 tools for managing issues, pull requests, and repository files."
+        instructions="GitHub integration server with multi-interface support (CLI, REST, MCP). "
+        "Provides tools for managing issues, pull requests, and repository files.",
     )
 
     # Register tools and resources
@@ -48,10 +57,22 @@ def create_mcp_server() -> FastMCP:
 # ============================================================================
 
 
-# Only create server instance if not in test mode
-# Tests should import tools directly and mock services
-import os
-mcp = None if os.getenv("PYTEST_CURRENT_TEST") else create_mcp_server()
+_server: "FastMCP | None" = None
+
+
+def get_server() -> "FastMCP":
+    """Get the process-wide server, creating it on first use."""
+    global _server
+    if _server is None:
+        _server = create_mcp_server()
+    return _server
+
+
+def __getattr__(name: str) -> Any:
+    # ``mcp`` is created on first access rather than at import
+    if name == "mcp":
+        return get_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
@@ -60,13 +81,16 @@ mcp = None if os.getenv("PYTEST_CURRENT_TEST") else create_mcp_server()
 
 
 def main():
-    """Main entry point for GitHub MCP server."""
-    if mcp is None:
-        # Create server if not already created (e.g., in tests)
-        server = create_mcp_server()
-        server.run()
-    else:
-        mcp.run()
+    """Main entry point for GitHub MCP server.
+
+    With GITHUB_CASSETTE_RECORD set, upstream traffic is recorded to that
+    file and saved at exit (see ``core.cassettes``).
+    """
+    if os.getenv("GITHUB_CASSETTE_RECORD"):
+        from chora_github.core.cassettes import recorder_from_env
+
+        recorder_from_env()
+    get_server().run()
 
 
 if __name__ == "__main__":
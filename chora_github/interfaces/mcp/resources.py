@@ -7,12 +7,12 @@ Generated by: chora-base SAP-047 (Capability Server Template)
 Adapted for: GitHub Integration (3 resources)
 """
 
-import json
 import os
 from typing import Optional
 
 from fastmcp import FastMCP
 
+from chora_github.core.serialization import dumps, dumps_envelope
 from chora_github.core.services import GithubToolService
 from chora_github.core.models import (
     ListIssuesRequest,
@@ -66,7 +66,7 @@ def _get_service(token: Optional[str] = None) -> GithubToolService:
         raise ValueError(
             "GitHub token required. Set GITHUB_TOKEN environment variable."
         )
-    return GithubToolService(token=github_token)
+    return GithubToolService(token=github_token, base_url=os.getenv("GITHUB_API_URL"))
 
 
 # ============================================================================
@@ -109,7 +109,7 @@ def register_resources(mcp: FastMCP) -> None:
         """
         try:
             service = _get_service()
-            request = ListIssuesRequest(owner=owner, repo=repo, state="open")
+            request = ListIssuesRequest(repo=f"{owner}/{repo}", state="open")
             response = service.list_issues(request)
 
             # Format as resource
@@ -118,17 +118,16 @@ def register_resources(mcp: FastMCP) -> None:
                 "name": f"{owner}/{repo} Issues",
                 "description": f"Open issues in {owner}/{repo}",
                 "mime_type": "application/json",
-                "data": response.model_dump(),
             }
 
-            return json.dumps(resource_data, indent=2)
+            return dumps_envelope(resource_data, "data", response)
 
         except (GithubError, ValueError) as e:
             error_data = {
                 "uri": make_resource_uri("repo", owner, repo, "issues"),
                 "error": str(e),
             }
-            return json.dumps(error_data, indent=2)
+            return dumps(error_data)
 
     # ========================================================================
     # Resource 2: Repository Pull Requests
@@ -155,7 +154,7 @@ def register_resources(mcp: FastMCP) -> None:
         """
         try:
             service = _get_service()
-            request = ListPRsRequest(owner=owner, repo=repo, state="open")
+            request = ListPRsRequest(repo=f"{owner}/{repo}", state="open")
             response = service.list_prs(request)
 
             # Format as resource
@@ -164,17 +163,16 @@ def register_resources(mcp: FastMCP) -> None:
                 "name": f"{owner}/{repo} Pull Requests",
                 "description": f"Open pull requests in {owner}/{repo}",
                 "mime_type": "application/json",
-                "data": response.model_dump(),
             }
 
-            return json.dumps(resource_data, indent=2)
+            return dumps_envelope(resource_data, "data", response)
 
         except (GithubError, ValueError) as e:
             error_data = {
                 "uri": make_resource_uri("repo", owner, repo, "prs"),
                 "error": str(e),
             }
-            return json.dumps(error_data, indent=2)
+            return dumps(error_data)
 
     # ========================================================================
     # Resource 3: Repository Files
@@ -201,7 +199,7 @@ def register_resources(mcp: FastMCP) -> None:
         """
         try:
             service = _get_service()
-            request = ListRepoFilesRequest(owner=owner, repo=repo, path="")
+            request = ListRepoFilesRequest(repo=f"{owner}/{repo}", path="")
             response = service.list_repo_files(request)
 
             # Format as resource
@@ -210,17 +208,16 @@ def register_resources(mcp: FastMCP) -> None:
                 "name": f"{owner}/{repo} Files",
                 "description": f"Root directory listing for {owner}/{repo}",
                 "mime_type": "application/json",
-                "data": response.model_dump(),
             }
 
-            return json.dumps(resource_data, indent=2)
+            return dumps_envelope(resource_data, "data", response)
 
         except (GithubError, ValueError) as e:
             error_data = {
                 "uri": make_resource_uri("repo", owner, repo, "files"),
                 "error": str(e),
             }
-            return json.dumps(error_data, indent=2)
+            return dumps(error_data)
 
 
 # ============================================================================
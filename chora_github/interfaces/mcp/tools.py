@@ -2,27 +2,51 @@
 
 MCP tool definitions for GitHub operations. Tools are functions that
 AI assistants can call to interact with GitHub repositories, issues, PRs, and files.
+Each tool runs in an ``mcp.tool <name>`` span when tracing is enabled, is
+profiled when slow-call profiling is enabled (see ``core.profiling``), and
+has ``GITHUB_TOOL_TIMEOUT`` seconds (default 60) to finish its GitHub
+requests (see ``core.deadlines``). A listing or batch cut short by that
+deadline returns what it completed, with a ``partial`` object saying what
+is missing (see ``core.partial``). Tools call the (blocking) service in a
+worker thread, with the deadline carried over, so a slow GitHub request or
+the write throttle never blocks the event loop.
 
 Generated by: chora-base SAP-047 (Capability Server Template)
 Adapted for: GitHub Integration (8 tools)
 """
 
-import json
+import asyncio
+import functools
+import inspect
 import os
-from typing import Optional
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Optional
 
-from fastmcp import FastMCP
+from pydantic import BaseModel
 
-from chora_github.core.services import GithubToolService
+from chora_github.core import deadlines, profiling
+from chora_github.core.budget import budget_bytes, fit_to_budget
+from chora_github.core.columnar import encode_list_response
+from chora_github.core.serialization import dumps
+from chora_github.core.tracing import traced
+from chora_github.core.write_queue import WriteQueue
 from chora_github.core.models import (
     ListIssuesRequest,
     CreateIssueRequest,
+    CreateIssuesRequest,
     GetIssueRequest,
+    GetIssuesRequest,
     UpdateIssueRequest,
+    UpdateIssuesRequest,
     ListPRsRequest,
     GetPRRequest,
+    GetPRsRequest,
     GetFileContentsRequest,
+    GetWriteJobRequest,
+    GetWriteJobResponse,
     ListRepoFilesRequest,
+    ResponseFormat,
+    ToolBatchRequest,
 )
 from chora_github.core.exceptions import (
     GithubError,
@@ -30,6 +54,13 @@ from chora_github.core.exceptions import (
     GithubPermissionError,
 )
 
+if TYPE_CHECKING:
+    # Imported when first used: PyGithub loads with the first tool call,
+    # not at server startup
+    from fastmcp import FastMCP
+
+    from chora_github.core.services import GithubToolService
+
 
 # ============================================================================
 # Namespace Configuration
@@ -56,8 +87,20 @@ def make_tool_name(tool: str) -> str:
 # ============================================================================
 
 
-def _get_service(token: Optional[str] = None) -> GithubToolService:
-    """Get GitHub service instance with token.
+# Services kept for the process (one per token and configuration)
+MAX_SERVICES = 8
+
+
+def _get_service(token: Optional[str] = None) -> "GithubToolService":
+    """Get the GitHub service for a token, shared across tool calls.
+
+    Issue and PR reads use the GraphQL path when GITHUB_USE_GRAPHQL is set;
+    GITHUB_API_URL overrides the API root (e.g. GitHub Enterprise), and
+    GITHUB_RETRY_WRITES lets issue updates be retried like reads.
+
+    The service is built once per token and configuration and reused for
+    the life of the process, as the REST app does, so its issue cache (no-op
+    update skips) and write throttle apply across calls.
 
     Args:
         token: GitHub PAT (optional, uses GITHUB_TOKEN env if not provided)
@@ -73,19 +116,141 @@ def _get_service(token: Optional[str] = None) -> GithubToolService:
         raise ValueError(
             "GitHub token required. Provide 'token' parameter or set GITHUB_TOKEN environment variable."
         )
-    return GithubToolService(token=github_token)
+    use_graphql = os.getenv("GITHUB_USE_GRAPHQL", "").lower() in ("1", "true", "yes")
+    retry_writes = os.getenv("GITHUB_RETRY_WRITES", "").lower() in ("1", "true", "yes")
+    return _shared_service(github_token, use_graphql, os.getenv("GITHUB_API_URL"), retry_writes)
+
+
+@functools.lru_cache(maxsize=MAX_SERVICES)
+def _shared_service(
+    token: str, use_graphql: bool, base_url: str | None, retry_writes: bool
+) -> "GithubToolService":
+    """Build the service for one token and configuration (memoized)."""
+    from chora_github.core.services import GithubToolService
+
+    return GithubToolService(
+        token=token,
+        use_graphql=use_graphql,
+        base_url=base_url,
+        retry_writes=retry_writes,
+    )
 
 
-def _format_success(data: dict) -> str:
+_write_queue: Optional[WriteQueue] = None
+
+
+def _get_write_queue() -> WriteQueue:
+    """Get the process-wide write queue, starting its worker on first use.
+
+    The queue is opt-in: set GITHUB_WRITE_QUEUE_PATH to the SQLite file that
+    should hold queued writes. Queued writes run with GITHUB_TOKEN (tokens
+    are never persisted in the queue).
+
+    Returns:
+        Running WriteQueue instance
+
+    Raises:
+        ValueError: If the queue is not configured or GITHUB_TOKEN is not set
+    """
+    global _write_queue
+    if _write_queue is None:
+        path = os.getenv("GITHUB_WRITE_QUEUE_PATH")
+        if not path:
+            raise ValueError(
+                "Write queue disabled. Set GITHUB_WRITE_QUEUE_PATH to enable queued writes."
+            )
+        # Same service as direct tool calls: one cache and write throttle
+        _write_queue = WriteQueue(_get_service(), path=path)
+        _write_queue.start()
+    return _write_queue
+
+
+def _repo_slug(owner: str, repo: str) -> str:
+    """Combine owner and repository name into owner/repo format.
+
+    Args:
+        owner: Repository owner (user or organization)
+        repo: Repository name
+
+    Returns:
+        Repository in owner/repo format (e.g., "octocat/Hello-World")
+    """
+    return f"{owner}/{repo}"
+
+
+def _format_success(data: BaseModel | dict) -> str:
     """Format successful response as JSON.
 
     Args:
-        data: Response data dictionary
+        data: Response model (serialized natively) or data dictionary
+
+    Returns:
+        JSON-formatted string (compact unless GITHUB_JSON_PRETTY is set)
+    """
+    return dumps(data)
+
+
+def _format_list(
+    response: BaseModel, response_format: str, max_bytes: Optional[int] = None
+) -> str:
+    """Format a list response in the requested encoding.
+
+    Args:
+        response: ListIssuesResponse, ListPRsResponse or ListRepoFilesResponse
+        response_format: "rows" or "columnar"
+        max_bytes: Response budget (optional, applied to the row form)
 
     Returns:
         JSON-formatted string
     """
-    return json.dumps(data, indent=2)
+    data = response if max_bytes is None else fit_to_budget(response, max_bytes)
+    if response_format == ResponseFormat.COLUMNAR:
+        return _format_success(encode_list_response(data))
+    return _format_success(data)
+
+
+def _format_budgeted(response: BaseModel, max_bytes: Optional[int] = None) -> str:
+    """Format a response, shrinking it to a byte budget if one is given.
+
+    Args:
+        response: Issue or pull request response model
+        max_bytes: Response budget (optional)
+
+    Returns:
+        JSON-formatted string (with a "budget" report when budgeted)
+    """
+    if max_bytes is None:
+        return _format_success(response)
+    return _format_success(fit_to_budget(response, max_bytes))
+
+
+def _instrumented(tool: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator for tool functions: deadline, tracing span and profiling.
+
+    The tool's GitHub requests are bounded by ``GITHUB_TOOL_TIMEOUT``.
+    Profiles are tagged with the tool name and its arguments (the token is
+    never written).
+
+    Args:
+        tool: Tool name (without namespace)
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with deadlines.deadline(deadlines.tool_timeout(), tool):
+                if profiling.current_config() is None:
+                    return await func(*args, **kwargs)
+                with profiling.profiled(tool) as profile:
+                    if profile is not None:
+                        profile.tag(parameters=signature.bind_partial(*args, **kwargs).arguments)
+                    return await func(*args, **kwargs)
+
+        return traced(f"mcp.tool {tool}")(wrapper)
+
+    return decorator
 
 
 def _format_error(error: Exception) -> str:
@@ -104,7 +269,7 @@ def _format_error(error: Exception) -> str:
             "message": str(error),
         },
     }
-    return json.dumps(error_data, indent=2)
+    return dumps(error_data)
 
 
 # ============================================================================
@@ -112,7 +277,7 @@ def _format_error(error: Exception) -> str:
 # ============================================================================
 
 
-def register_tools(mcp: FastMCP) -> None:
+def register_tools(mcp: "FastMCP") -> None:
     """Register all GitHub tools with MCP server.
 
     Args:
@@ -124,10 +289,16 @@ def register_tools(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("list_issues"))
+    @_instrumented("list_issues")
     async def list_issues(
         owner: str,
         repo: str,
         state: str = "open",
+        fields: Optional[str] = None,
+        format: str = "rows",
+        cursor: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
         token: Optional[str] = None,
     ) -> str:
         """List issues in a GitHub repository.
@@ -139,6 +310,15 @@ def register_tools(mcp: FastMCP) -> None:
             owner: Repository owner (user or organization)
             repo: Repository name
             state: Issue state filter - "open", "closed", or "all" (default: "open")
+            fields: Comma-separated issue fields to return, e.g. "number,title,labels"
+                (optional, default: all fields; use to skip large bodies)
+            format: Response encoding - "rows" (default) or "columnar" (one array
+                per field, labels/logins dictionary-encoded; compact for large lists)
+            cursor: Continue a listing that timed out (optional; the
+                "partial.next_cursor" of the previous response)
+            max_bytes: Response size budget in bytes (optional). Bodies are truncated,
+                then low-priority fields dropped, and a "budget" object reports the cuts
+            max_tokens: Response size budget in tokens (optional, ~4 bytes per token)
             token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
 
         Returns:
@@ -170,10 +350,17 @@ def register_tools(mcp: FastMCP) -> None:
             }
         """
         try:
+            budget = budget_bytes(max_bytes, max_tokens)
             service = _get_service(token)
-            request = ListIssuesRequest(owner=owner, repo=repo, state=state)
-            response = service.list_issues(request)
-            return _format_success(response.model_dump())
+            request = ListIssuesRequest(
+                repo=_repo_slug(owner, repo),
+                state=state,
+                fields=fields,
+                format=format,
+                cursor=cursor,
+            )
+            response = await asyncio.to_thread(service.list_issues, request)
+            return _format_list(response, request.format, budget)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
@@ -182,6 +369,7 @@ def register_tools(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("create_issue"))
+    @_instrumented("create_issue")
     async def create_issue(
         owner: str,
         repo: str,
@@ -236,15 +424,14 @@ def register_tools(mcp: FastMCP) -> None:
         try:
             service = _get_service(token)
             request = CreateIssueRequest(
-                owner=owner,
-                repo=repo,
+                repo=_repo_slug(owner, repo),
                 title=title,
                 body=body or "",
                 labels=labels or [],
                 assignees=assignees or [],
             )
-            response = service.create_issue(request)
-            return _format_success(response.model_dump())
+            response = await asyncio.to_thread(service.create_issue, request)
+            return _format_success(response)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
@@ -253,10 +440,14 @@ def register_tools(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("get_issue"))
+    @_instrumented("get_issue")
     async def get_issue(
         owner: str,
         repo: str,
         issue_number: int,
+        fields: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
         token: Optional[str] = None,
     ) -> str:
         """Get detailed information about a specific GitHub issue.
@@ -267,6 +458,11 @@ def register_tools(mcp: FastMCP) -> None:
             owner: Repository owner (user or organization)
             repo: Repository name
             issue_number: Issue number to retrieve
+            fields: Comma-separated issue fields to return, e.g. "number,title,labels"
+                (optional, default: all fields; use to skip large bodies)
+            max_bytes: Response size budget in bytes (optional). Bodies are truncated,
+                then low-priority fields dropped, and a "budget" object reports the cuts
+            max_tokens: Response size budget in tokens (optional, ~4 bytes per token)
             token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
 
         Returns:
@@ -296,10 +492,15 @@ def register_tools(mcp: FastMCP) -> None:
             }
         """
         try:
+            budget = budget_bytes(max_bytes, max_tokens)
             service = _get_service(token)
-            request = GetIssueRequest(owner=owner, repo=repo, issue_number=issue_number)
-            response = service.get_issue(request)
-            return _format_success(response.model_dump())
+            request = GetIssueRequest(
+                repo=_repo_slug(owner, repo),
+                issue_number=issue_number,
+                fields=fields,
+            )
+            response = await asyncio.to_thread(service.get_issue, request)
+            return _format_budgeted(response, budget)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
@@ -308,6 +509,7 @@ def register_tools(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("update_issue"))
+    @_instrumented("update_issue")
     async def update_issue(
         owner: str,
         repo: str,
@@ -358,8 +560,7 @@ def register_tools(mcp: FastMCP) -> None:
         try:
             service = _get_service(token)
             request = UpdateIssueRequest(
-                owner=owner,
-                repo=repo,
+                repo=_repo_slug(owner, repo),
                 issue_number=issue_number,
                 title=title,
                 body=body,
@@ -367,20 +568,243 @@ def register_tools(mcp: FastMCP) -> None:
                 labels=labels,
                 assignees=assignees,
             )
-            response = service.update_issue(request)
-            return _format_success(response.model_dump())
+            response = await asyncio.to_thread(service.update_issue, request)
+            return _format_success(response)
+        except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
+            return _format_error(e)
+
+    # ========================================================================
+    # Batch Writes: Create Issues / Update Issues
+    # ========================================================================
+
+    @mcp.tool(name=make_tool_name("create_issues"))
+    @_instrumented("create_issues")
+    async def create_issues(
+        owner: str,
+        repo: str,
+        issues: list[dict],
+        max_concurrency: int = 3,
+        token: Optional[str] = None,
+    ) -> str:
+        """Create many issues in a GitHub repository in one call.
+
+        Use this tool instead of calling create_issue in a loop. Writes run with
+        bounded concurrency and are paced to respect GitHub's secondary rate
+        limits. A failing issue does not abort the batch.
+
+        Args:
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            issues: Issues to create, each with "title" and optional "body",
+                "labels" and "assignees"
+            max_concurrency: Maximum writes in flight (1-10, default: 3)
+            token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
+
+        Returns:
+            JSON string with:
+            - results: One entry per issue (index, success, issue or error)
+            - succeeded: Number of issues created
+            - failed: Number of issues that failed
+
+        Example:
+            >>> await create_issues("octocat", "Hello-World", [{"title": "A"}, {"title": "B"}])
+            {
+              "results": [{"index": 0, "success": true, "issue": {...}}, ...],
+              "succeeded": 2,
+              "failed": 0
+            }
+        """
+        try:
+            service = _get_service(token)
+            slug = _repo_slug(owner, repo)
+            request = CreateIssuesRequest(
+                items=[CreateIssueRequest(**{"body": "", **item, "repo": slug}) for item in issues],
+                max_concurrency=max_concurrency,
+            )
+            response = await asyncio.to_thread(service.create_issues, request)
+            return _format_success(response)
+        except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
+            return _format_error(e)
+
+    @mcp.tool(name=make_tool_name("update_issues"))
+    @_instrumented("update_issues")
+    async def update_issues(
+        owner: str,
+        repo: str,
+        updates: list[dict],
+        max_concurrency: int = 3,
+        token: Optional[str] = None,
+    ) -> str:
+        """Update many issues in a GitHub repository in one call.
+
+        Use this tool instead of calling update_issue in a loop (e.g. to relabel
+        or close many issues). Each update only changes the fields provided.
+
+        Args:
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            updates: Updates to apply, each with "issue_number" and any of
+                "title", "body", "state", "labels", "assignees"
+            max_concurrency: Maximum writes in flight (1-10, default: 3)
+            token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
+
+        Returns:
+            JSON string with per-update results and succeeded/failed counts
+        """
+        try:
+            service = _get_service(token)
+            slug = _repo_slug(owner, repo)
+            request = UpdateIssuesRequest(
+                items=[UpdateIssueRequest(**{**item, "repo": slug}) for item in updates],
+                max_concurrency=max_concurrency,
+            )
+            response = await asyncio.to_thread(service.update_issues, request)
+            return _format_success(response)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
+    # ========================================================================
+    # Queued Writes: Queue Create / Queue Update / Get Write Job
+    # ========================================================================
+
+    @mcp.tool(name=make_tool_name("queue_create_issue"))
+    @_instrumented("queue_create_issue")
+    async def queue_create_issue(
+        owner: str,
+        repo: str,
+        title: str,
+        body: Optional[str] = None,
+        labels: Optional[list[str]] = None,
+        assignees: Optional[list[str]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> str:
+        """Queue an issue creation and return immediately with a job id.
+
+        Use this tool instead of create_issue when GitHub is slow or rate
+        limiting. The issue is created in the background with retries. Pass
+        the same idempotency_key when retrying so only one issue is created.
+        Requires GITHUB_WRITE_QUEUE_PATH to be configured.
+
+        Args:
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            title: Issue title (required)
+            body: Issue description/body (optional)
+            labels: List of label names to apply (optional)
+            assignees: List of usernames to assign (optional)
+            idempotency_key: Client-chosen key identifying this write (optional)
+
+        Returns:
+            JSON string with:
+            - job: Job id, status ("pending", "running", "succeeded", "failed")
+              and, once succeeded, the created issue
+            - duplicate: True if the idempotency key matched an earlier job
+
+        Example:
+            >>> await queue_create_issue("octocat", "Hello-World", "Found a bug",
+            ...                          idempotency_key="bug-report-17")
+            {
+              "job": {"job_id": "3f2a...", "status": "pending", ...},
+              "duplicate": false
+            }
+        """
+        try:
+            request = CreateIssueRequest(
+                repo=_repo_slug(owner, repo),
+                title=title,
+                body=body or "",
+                labels=labels or [],
+                assignees=assignees or [],
+            )
+            response = _get_write_queue().enqueue_create(request, idempotency_key)
+            return _format_success(response)
+        except (GithubError, ValueError) as e:
+            return _format_error(e)
+
+    @mcp.tool(name=make_tool_name("queue_update_issue"))
+    @_instrumented("queue_update_issue")
+    async def queue_update_issue(
+        owner: str,
+        repo: str,
+        issue_number: int,
+        title: Optional[str] = None,
+        body: Optional[str] = None,
+        state: Optional[str] = None,
+        labels: Optional[list[str]] = None,
+        assignees: Optional[list[str]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> str:
+        """Queue an issue update and return immediately with a job id.
+
+        Like update_issue, but applied in the background with retries. Only
+        provide the fields you want to update. Requires
+        GITHUB_WRITE_QUEUE_PATH to be configured.
+
+        Args:
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            issue_number: Issue number to update
+            title: New issue title (optional)
+            body: New issue body (optional)
+            state: New issue state - "open" or "closed" (optional)
+            labels: New list of labels (optional, empty list to clear)
+            assignees: New list of assignees (optional, empty list to clear)
+            idempotency_key: Client-chosen key identifying this write (optional)
+
+        Returns:
+            JSON string with the queued job and duplicate flag
+        """
+        try:
+            request = UpdateIssueRequest(
+                repo=_repo_slug(owner, repo),
+                issue_number=issue_number,
+                title=title,
+                body=body,
+                state=state,
+                labels=labels,
+                assignees=assignees,
+            )
+            response = _get_write_queue().enqueue_update(request, idempotency_key)
+            return _format_success(response)
+        except (GithubError, ValueError) as e:
+            return _format_error(e)
+
+    @mcp.tool(name=make_tool_name("get_write_job"))
+    @_instrumented("get_write_job")
+    async def get_write_job(job_id: str) -> str:
+        """Get the status of a queued write.
+
+        Args:
+            job_id: Job id returned by queue_create_issue or queue_update_issue
+
+        Returns:
+            JSON string with the job: status, attempts, last error (if any)
+            and the resulting issue once succeeded
+        """
+        try:
+            request = GetWriteJobRequest(job_id=job_id)
+            job = _get_write_queue().get(request.job_id)
+            if job is None:
+                raise GithubNotFoundError(f"Write job '{request.job_id}' not found")
+            return _format_success(GetWriteJobResponse(job=job))
+        except (GithubError, ValueError) as e:
+            return _format_error(e)
+
     # ========================================================================
     # Tool 5: List Pull Requests
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("list_prs"))
+    @_instrumented("list_prs")
     async def list_prs(
         owner: str,
         repo: str,
         state: str = "open",
+        fields: Optional[str] = None,
+        format: str = "rows",
+        cursor: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
         token: Optional[str] = None,
     ) -> str:
         """List pull requests in a GitHub repository.
@@ -392,6 +816,15 @@ def register_tools(mcp: FastMCP) -> None:
             owner: Repository owner (user or organization)
             repo: Repository name
             state: PR state filter - "open", "closed", or "all" (default: "open")
+            fields: Comma-separated pull request fields to return, e.g. "number,title,state"
+                (optional, default: all fields; use to skip large bodies)
+            format: Response encoding - "rows" (default) or "columnar" (one array
+                per field, labels/logins dictionary-encoded; compact for large lists)
+            cursor: Continue a listing that timed out (optional; the
+                "partial.next_cursor" of the previous response)
+            max_bytes: Response size budget in bytes (optional). Bodies are truncated,
+                then low-priority fields dropped, and a "budget" object reports the cuts
+            max_tokens: Response size budget in tokens (optional, ~4 bytes per token)
             token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
 
         Returns:
@@ -423,10 +856,17 @@ def register_tools(mcp: FastMCP) -> None:
             }
         """
         try:
+            budget = budget_bytes(max_bytes, max_tokens)
             service = _get_service(token)
-            request = ListPRsRequest(owner=owner, repo=repo, state=state)
-            response = service.list_prs(request)
-            return _format_success(response.model_dump())
+            request = ListPRsRequest(
+                repo=_repo_slug(owner, repo),
+                state=state,
+                fields=fields,
+                format=format,
+                cursor=cursor,
+            )
+            response = await asyncio.to_thread(service.list_prs, request)
+            return _format_list(response, request.format, budget)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
@@ -435,10 +875,14 @@ def register_tools(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("get_pr"))
+    @_instrumented("get_pr")
     async def get_pr(
         owner: str,
         repo: str,
         pr_number: int,
+        fields: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
         token: Optional[str] = None,
     ) -> str:
         """Get detailed information about a specific GitHub pull request.
@@ -449,6 +893,11 @@ def register_tools(mcp: FastMCP) -> None:
             owner: Repository owner (user or organization)
             repo: Repository name
             pr_number: Pull request number to retrieve
+            fields: Comma-separated pull request fields to return, e.g. "number,title,state"
+                (optional, default: all fields; use to skip large bodies)
+            max_bytes: Response size budget in bytes (optional). Bodies are truncated,
+                then low-priority fields dropped, and a "budget" object reports the cuts
+            max_tokens: Response size budget in tokens (optional, ~4 bytes per token)
             token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
 
         Returns:
@@ -482,10 +931,124 @@ def register_tools(mcp: FastMCP) -> None:
             }
         """
         try:
+            budget = budget_bytes(max_bytes, max_tokens)
             service = _get_service(token)
-            request = GetPRRequest(owner=owner, repo=repo, pr_number=pr_number)
-            response = service.get_pr(request)
-            return _format_success(response.model_dump())
+            request = GetPRRequest(
+                repo=_repo_slug(owner, repo),
+                pr_number=pr_number,
+                fields=fields,
+            )
+            response = await asyncio.to_thread(service.get_pr, request)
+            return _format_budgeted(response, budget)
+        except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
+            return _format_error(e)
+
+    # ========================================================================
+    # Bulk Reads: Get Issues / Get Pull Requests
+    # ========================================================================
+
+    @mcp.tool(name=make_tool_name("get_issues"))
+    @_instrumented("get_issues")
+    async def get_issues(
+        owner: str,
+        repo: str,
+        issue_numbers: list[int],
+        fields: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        token: Optional[str] = None,
+    ) -> str:
+        """Get several GitHub issues by number in a single call.
+
+        Use this tool instead of calling get_issue repeatedly when resolving a
+        list of referenced issues (e.g. "#12, #45, #87"). Up to 100 numbers are
+        resolved in one upstream request.
+
+        Args:
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            issue_numbers: Issue numbers to retrieve (max 100)
+            fields: Comma-separated issue fields to return, e.g. "number,title,labels"
+                (optional, default: all fields; use to skip large bodies)
+            max_bytes: Response size budget in bytes (optional). Bodies are truncated,
+                then low-priority fields dropped, and a "budget" object reports the cuts
+            max_tokens: Response size budget in tokens (optional, ~4 bytes per token)
+            token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
+
+        Returns:
+            JSON string with:
+            - issues: Issues found, in the requested order
+            - not_found: Requested numbers that do not exist (or are PRs)
+
+        Example:
+            >>> await get_issues("octocat", "Hello-World", [1, 2, 999])
+            {
+              "issues": [{"number": 1, ...}, {"number": 2, ...}],
+              "not_found": [999]
+            }
+        """
+        try:
+            budget = budget_bytes(max_bytes, max_tokens)
+            service = _get_service(token)
+            request = GetIssuesRequest(
+                repo=_repo_slug(owner, repo),
+                numbers=issue_numbers,
+                fields=fields,
+            )
+            response = await asyncio.to_thread(service.get_issues, request)
+            return _format_budgeted(response, budget)
+        except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
+            return _format_error(e)
+
+    @mcp.tool(name=make_tool_name("get_prs"))
+    @_instrumented("get_prs")
+    async def get_prs(
+        owner: str,
+        repo: str,
+        pr_numbers: list[int],
+        fields: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        token: Optional[str] = None,
+    ) -> str:
+        """Get several GitHub pull requests by number in a single call.
+
+        Use this tool instead of calling get_pr repeatedly. Up to 100 numbers
+        are resolved in one upstream request, including mergeability.
+
+        Args:
+            owner: Repository owner (user or organization)
+            repo: Repository name
+            pr_numbers: Pull request numbers to retrieve (max 100)
+            fields: Comma-separated pull request fields to return, e.g. "number,title,state"
+                (optional, default: all fields; use to skip large bodies)
+            max_bytes: Response size budget in bytes (optional). Bodies are truncated,
+                then low-priority fields dropped, and a "budget" object reports the cuts
+            max_tokens: Response size budget in tokens (optional, ~4 bytes per token)
+            token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
+
+        Returns:
+            JSON string with:
+            - pull_requests: Pull requests found, in the requested order
+            - not_found: Requested numbers that do not exist
+
+        Example:
+            >>> await get_prs("octocat", "Hello-World", [5, 6])
+            {
+              "pull_requests": [{"number": 5, "mergeable": true, ...}],
+              "not_found": [6]
+            }
+        """
+        try:
+            budget = budget_bytes(max_bytes, max_tokens)
+            service = _get_service(token)
+            request = GetPRsRequest(
+                repo=_repo_slug(owner, repo),
+                numbers=pr_numbers,
+                fields=fields,
+            )
+            response = await asyncio.to_thread(service.get_prs, request)
+            return _format_budgeted(response, budget)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
@@ -494,6 +1057,7 @@ def register_tools(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("get_file_contents"))
+    @_instrumented("get_file_contents")
     async def get_file_contents(
         owner: str,
         repo: str,
@@ -537,9 +1101,12 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             service = _get_service(token)
-            request = GetFileContentsRequest(owner=owner, repo=repo, path=path, ref=ref)
-            response = service.get_file_contents(request)
-            return _format_success(response.model_dump())
+            # An omitted ref keeps the model default
+            request = GetFileContentsRequest(
+                repo=_repo_slug(owner, repo), path=path, **({"ref": ref} if ref else {})
+            )
+            response = await asyncio.to_thread(service.get_file_contents, request)
+            return _format_success(response)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
@@ -548,11 +1115,13 @@ def register_tools(mcp: FastMCP) -> None:
     # ========================================================================
 
     @mcp.tool(name=make_tool_name("list_repo_files"))
+    @_instrumented("list_repo_files")
     async def list_repo_files(
         owner: str,
         repo: str,
         path: str = "",
         ref: Optional[str] = None,
+        format: str = "rows",
         token: Optional[str] = None,
     ) -> str:
         """List files and directories in a GitHub repository path.
@@ -564,6 +1133,8 @@ def register_tools(mcp: FastMCP) -> None:
             repo: Repository name
             path: Directory path within repository (empty string for root, default: "")
             ref: Git reference (branch, tag, or commit SHA). Defaults to repo's default branch
+            format: Response encoding - "rows" (default) or "columnar" (one array
+                per field, labels/logins dictionary-encoded; compact for large lists)
             token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
 
         Returns:
@@ -598,12 +1169,72 @@ def register_tools(mcp: FastMCP) -> None:
         """
         try:
             service = _get_service(token)
-            request = ListRepoFilesRequest(owner=owner, repo=repo, path=path, ref=ref)
-            response = service.list_repo_files(request)
-            return _format_success(response.model_dump())
+            request = ListRepoFilesRequest(
+                repo=_repo_slug(owner, repo),
+                path=path,
+                format=format,
+                **({"ref": ref} if ref else {}),
+            )
+            response = await asyncio.to_thread(service.list_repo_files, request)
+            return _format_list(response, request.format)
         except (GithubError, GithubNotFoundError, GithubPermissionError, ValueError) as e:
             return _format_error(e)
 
+    # ========================================================================
+    # Batch: several tool calls in one round trip
+    # ========================================================================
+
+    @mcp.tool(name=make_tool_name("batch"))
+    @_instrumented("batch")
+    async def batch(
+        calls: list[dict],
+        timeout: Optional[float] = None,
+        token: Optional[str] = None,
+    ) -> str:
+        """Run several GitHub tool calls concurrently in one round trip.
+
+        Use this tool instead of calling tools one by one when you need several
+        independent lookups (e.g. an issue, a PR and a file). Each call gets its
+        own result; one failing call does not affect the others.
+
+        Args:
+            calls: Tool calls, each {"tool": "get_issue", "parameters": {...},
+                "timeout": 10}. Parameters are the request fields of the tool
+                ("repo": "owner/repo", or "owner" and "repo" separately).
+                At most 50 calls.
+            timeout: Per-call timeout in seconds (optional, default 30; a call's
+                own "timeout" takes precedence)
+            token: GitHub Personal Access Token (optional, uses GITHUB_TOKEN env if not provided)
+
+        Returns:
+            JSON string with:
+            - results: One {success, result | error, error_code} per call, in order
+            - succeeded / failed: Counts
+
+        Example:
+            >>> await batch([
+            ...     {"tool": "get_issue", "parameters": {"repo": "octocat/Hello-World", "issue_number": 1}},
+            ...     {"tool": "get_pr", "parameters": {"repo": "octocat/Hello-World", "pr_number": 2}},
+            ... ])
+            {
+              "results": [
+                {"success": true, "result": {"issue": {...}}},
+                {"success": false, "error": "PR #2 not found", "error_code": "NOT_FOUND"}
+              ],
+              "succeeded": 1,
+              "failed": 1
+            }
+        """
+        from chora_github.core.dispatch import ToolDispatcher
+
+        try:
+            request = ToolBatchRequest(calls=calls, timeout=timeout)
+            with ToolDispatcher(_get_service(token)) as dispatcher:
+                response = await dispatcher.call_batch(request.calls, request.timeout)
+            return _format_success(response)
+        except (GithubError, ValueError) as e:
+            return _format_error(e)
+
 
 # ============================================================================
 # Tool Examples
@@ -627,6 +1258,26 @@ TOOL_EXAMPLES = [
         "tool": "github:update_issue",
         "description": "Update an existing issue",
     },
+    {
+        "tool": "github:create_issues",
+        "description": "Create many issues in one call",
+    },
+    {
+        "tool": "github:update_issues",
+        "description": "Update many issues in one call",
+    },
+    {
+        "tool": "github:queue_create_issue",
+        "description": "Queue an issue creation with an idempotency key",
+    },
+    {
+        "tool": "github:queue_update_issue",
+        "description": "Queue an issue update with an idempotency key",
+    },
+    {
+        "tool": "github:get_write_job",
+        "description": "Get the status of a queued write",
+    },
     {
         "tool": "github:list_prs",
         "description": "List pull requests in a repository",
@@ -635,6 +1286,14 @@ TOOL_EXAMPLES = [
         "tool": "github:get_pr",
         "description": "Get pull request details",
     },
+    {
+        "tool": "github:get_issues",
+        "description": "Get several issues by number in one call",
+    },
+    {
+        "tool": "github:get_prs",
+        "description": "Get several pull requests by number in one call",
+    },
     {
         "tool": "github:get_file_contents",
         "description": "Get file contents from a repository",
@@ -643,4 +1302,8 @@ TOOL_EXAMPLES = [
         "tool": "github:list_repo_files",
         "description": "List files in a repository directory",
     },
+    {
+        "tool": "github:batch",
+        "description": "Run several tool calls concurrently in one round trip",
+    },
 ]
@@ -3,15 +3,70 @@
 FastAPI-based REST API interface. Translates HTTP requests to core
 service calls and returns JSON responses.
 
+The app owns one GithubToolService (and one ToolDispatcher) for its whole
+lifetime. They are created by the lifespan handler on startup from
+``GITHUB_TOKEN`` (and ``GITHUB_USE_GRAPHQL``, ``GITHUB_API_URL``,
+``GITHUB_RETRY_WRITES``), and every request reuses them. With
+``GITHUB_CASSETTE_RECORD`` set, the upstream traffic is recorded to that
+file until shutdown (see ``core.cassettes``).
+
 Generated by: chora-base SAP-047 (Capability Server Template)
 """
 
-from fastapi import FastAPI
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from github.core import create_github_service
 
-from .middleware import error_handler_middleware
-from .routes import router
+from chora_github import __version__
+from chora_github.core.cassettes import recorder_from_env
+from chora_github.core.dispatch import ToolDispatcher
+from chora_github.core.exceptions import GithubConfigError
+from chora_github.core.metrics import CONTENT_TYPE, REGISTRY
+from chora_github.core.services import GithubToolService
+
+from .caching import ResponseCache
+from .middleware import (
+    error_handler_middleware,
+    http_cache_middleware,
+    metrics_middleware,
+    tracing_middleware,
+    upstream_usage_middleware,
+)
+from .models import HealthResponse
+from .routes import admin_router, router, tools_router
+
+
+# ============================================================================
+# Service Lifespan
+# ============================================================================
+
+
+def create_service() -> GithubToolService:
+    """Create the app-wide service from the environment.
+
+    Returns:
+        GithubToolService
+
+    Raises:
+        GithubConfigError: If GITHUB_TOKEN is not set
+    """
+    token = os.getenv("GITHUB_TOKEN")
+    if not token:
+        raise GithubConfigError(
+            "GITHUB_TOKEN environment variable is required", config_key="GITHUB_TOKEN"
+        )
+    use_graphql = os.getenv("GITHUB_USE_GRAPHQL", "").lower() in ("1", "true", "yes")
+    retry_writes = os.getenv("GITHUB_RETRY_WRITES", "").lower() in ("1", "true", "yes")
+    return GithubToolService(
+        token=token,
+        use_graphql=use_graphql,
+        base_url=os.getenv("GITHUB_API_URL"),
+        retry_writes=retry_writes,
+    )
 
 
 # ============================================================================
@@ -19,21 +74,46 @@ from .routes import router
 # ============================================================================
 
 
-def create_app() -> FastAPI:
+def create_app(service: GithubToolService | None = None) -> FastAPI:
     """Create and configure FastAPI application.
 
+    Args:
+        service: Service to use instead of creating one from the
+            environment on startup (e.g. in tests)
+
     Returns:
         Configured FastAPI app
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        recorder = recorder_from_env()
+        app.state.service = service or create_service()
+        app.state.dispatcher = ToolDispatcher(app.state.service)
+        # Responses stay fresh exactly as long as the service's own cache
+        app.state.response_cache = ResponseCache(ttl=app.state.service.issue_cache.ttl)
+        REGISTRY.track_cache("issues", app.state.service.issue_cache)
+        REGISTRY.track_cache("responses", app.state.response_cache.responses)
+        try:
+            yield
+        finally:
+            app.state.dispatcher.close()
+            if recorder is not None:
+                recorder.close()
+
     app = FastAPI(
         title="GitHub API",
-        description="CLI + REST only, no optional features",
-        version="{{ version }}",
+        description="GitHub issues, pull requests and files over REST",
+        version=__version__,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
 
+    # HTTP caching (innermost, so CORS headers are added to cached responses too)
+    app.middleware("http")(http_cache_middleware)
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -46,26 +126,46 @@ def create_app() -> FastAPI:
     # Add error handling middleware
     app.middleware("http")(error_handler_middleware)
 
+    # Upstream request accounting headers (error responses included)
+    app.middleware("http")(upstream_usage_middleware)
+
+    # Metrics (outside error handling, so error responses are counted with their status)
+    app.middleware("http")(metrics_middleware)
+
+    # Tracing (outermost, so the request span covers every other layer)
+    app.middleware("http")(tracing_middleware)
+
     # Register routes
     app.include_router(router, prefix="/api/v1")
+    app.include_router(tools_router, prefix="/api/v1")
+    app.include_router(admin_router, prefix="/api/v1")
 
     # Health check endpoint
-    @app.get("/health")
-    async def health_check():
+    @app.get("/health", response_model=HealthResponse)
+    async def health_check() -> HealthResponse:
         """Health check endpoint."""
-        service = create_github_service()
-        health = await service.health_check()
-        return health
+        return HealthResponse(
+            status="healthy",
+            version=__version__,
+            timestamp=datetime.now(UTC).isoformat(),
+        )
+
+    # Prometheus scrape endpoint
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Metrics in the Prometheus text exposition format."""
+        return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
 
     # Root endpoint
     @app.get("/")
-    async def root():
+    async def root() -> dict[str, str]:
         """Root endpoint with API information."""
         return {
             "name": "GitHub API",
-            "version": "{{ version }}",
+            "version": __version__,
             "docs": "/docs",
             "health": "/health",
+            "metrics": "/metrics",
             "api": "/api/v1",
         }
 
@@ -89,7 +189,7 @@ if __name__ == "__main__":
     import uvicorn
 
     uvicorn.run(
-        "github.interfaces.rest:app",
+        "chora_github.interfaces.rest:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
@@ -0,0 +1,160 @@
+"""GitHub - REST HTTP Caching (SAP-043)
+
+HTTP caching semantics for the REST read endpoints.
+
+Successful GET responses under ``/api/v1/github`` are kept, already
+serialized, for as long as the service's own issue cache keeps data fresh.
+Each carries a strong ETag (a hash of the exact response bytes), a
+``Cache-Control: max-age`` with the remaining freshness and an ``Age``
+header, so clients and intermediate proxies can reuse or revalidate it:
+
+- A repeated request within the freshness window is answered from the
+  stored bytes, without calling GitHub or serializing again.
+- A request whose ``If-None-Match`` matches the current ETag gets an empty
+  304 Not Modified.
+
+A successful write (POST/PATCH/...) to a repository invalidates every
+stored response for that repository, including a write tool call sent
+through ``/api/v1/call`` (whose repository is in its parameters, not its
+URL). A read's cache key is taken before it
+runs, so a read that overlaps a write is stored under the pre-write key and
+never served after the write. Partial results (a listing cut short by its
+deadline, marked with ``X-Partial-Result``) are never stored.
+"""
+
+import hashlib
+import re
+import time
+from collections.abc import Callable
+
+from fastapi import Request
+
+from chora_github.core.cache import DEFAULT_TTL_SECONDS, CacheEntry, TTLCache
+
+
+CACHED_PATH_PREFIX = "/api/v1/github/"
+PARTIAL_HEADER = "X-Partial-Result"
+DEFAULT_MAX_RESPONSES = 1_000
+
+_REPO_SCOPE = re.compile(r"/repos/([^/]+)/([^/]+)")
+
+
+def make_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body.
+
+    Args:
+        body: Exact response bytes
+
+    Returns:
+        Quoted entity tag
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    ``W/"x"`` matches ``"x"``.
+
+    Args:
+        if_none_match: Header value (may list several tags, or be ``*``)
+        etag: Current entity tag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def _repo_scope(path: str) -> str:
+    match = _REPO_SCOPE.search(path)
+    return f"{match[1]}/{match[2]}".lower() if match else ""
+
+
+class ResponseCache:
+    """Serialized GET responses with ETags, per repository.
+
+    Attributes:
+        ttl: Seconds a stored response stays fresh
+        responses: Stored bodies, keyed per request (hit/miss counts)
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_RESPONSES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize response cache.
+
+        Args:
+            ttl: Seconds a stored response stays fresh (0 stores nothing,
+                but ETags and 304s still work)
+            max_entries: Maximum number of stored responses
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self.responses = TTLCache(ttl=ttl, max_entries=max_entries, clock=clock)
+        # Generation of each recently written repository, in write order;
+        # a write gives its repository a new generation, so keys taken
+        # before it become unreachable and age out. Repositories not listed
+        # are at ``_floor``, which is at least every generation dropped.
+        self._max_generations = max_entries
+        self._generations: dict[str, int] = {}
+        self._last_generation = 0
+        self._floor = 0
+
+    def applies_to(self, request: Request) -> bool:
+        """Whether ``request`` is a cacheable read."""
+        return request.method in ("GET", "HEAD") and request.url.path.startswith(
+            CACHED_PATH_PREFIX
+        )
+
+    def key(self, request: Request) -> tuple[str, int, str, str]:
+        """Cache key of ``request`` (take it before the request runs)."""
+        scope = _repo_scope(request.url.path)
+        generation = self._generations.get(scope, self._floor)
+        return (scope, generation, request.url.path, request.url.query)
+
+    def lookup(self, key: tuple[str, int, str, str]) -> CacheEntry | None:
+        """Return the fresh stored response for ``key``, if any."""
+        return self.responses.get(key)
+
+    def store(self, key: tuple[str, int, str, str], body: bytes) -> CacheEntry:
+        """Store a response body and return its entry (with ETag)."""
+        entry = CacheEntry(value=body, stored_at=self._clock(), etag=make_etag(body))
+        self.responses.put(key, entry.value, etag=entry.etag)
+        return entry
+
+    def invalidate(self, path: str) -> None:
+        """Drop every stored response for the repository in ``path``."""
+        self.invalidate_repo(_repo_scope(path))
+
+    def invalidate_repo(self, repo: str) -> None:
+        """Drop every stored response for ``repo`` (``owner/repo``)."""
+        scope = repo.lower()
+        self._last_generation += 1
+        self._generations.pop(scope, None)
+        self._generations[scope] = self._last_generation
+        if len(self._generations) > self._max_generations:
+            # Forget the least recently written repository; raising the
+            # floor to its generation keeps its older keys unreachable
+            oldest = next(iter(self._generations))
+            self._floor = max(self._floor, self._generations.pop(oldest))
+
+    def headers(self, entry: CacheEntry) -> dict[str, str]:
+        """Caching headers describing ``entry``'s freshness."""
+        age = int(entry.age(self._clock()))
+        return {
+            "ETag": entry.etag or make_etag(entry.value),
+            "Cache-Control": f"max-age={max(0, int(self.ttl) - age)}",
+            "Age": str(age),
+        }
@@ -5,12 +5,16 @@ Middleware for error handling, logging, and other cross-cutting concerns.
 Generated by: chora-base SAP-047 (Capability Server Template)
 """
 
+import os
 import time
 from collections.abc import Callable
 
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
-from github.core import (
+
+from chora_github.core import deadlines, profiling, tracing
+from chora_github.core.accounting import track_usage
+from chora_github.core.exceptions import (
     GithubConfigError,
     GithubConflictError,
     GithubError,
@@ -21,6 +25,23 @@ from github.core import (
     GithubTimeoutError,
     GithubValidationError,
 )
+from chora_github.core.metrics import REGISTRY
+
+from .caching import PARTIAL_HEADER, etag_matches
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+TIMEOUT_HEADER = "X-Request-Timeout"
+JSON_MEDIA_TYPE = "application/json"
+
+REQUEST_DURATION = REGISTRY.histogram(
+    "github_http_request_duration_seconds",
+    "REST request latency (until the response starts) by route template",
+    ("method", "route", "status"),
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "github_http_requests_in_flight", "REST requests currently being handled"
+)
 
 
 # ============================================================================
@@ -28,10 +49,41 @@ from github.core import (
 # ============================================================================
 
 
+def request_timeout(request: Request) -> float | None:
+    """Deadline of ``request`` in seconds, if any.
+
+    Taken from the ``X-Request-Timeout`` header, else from
+    ``GITHUB_REQUEST_TIMEOUT`` (unset: no deadline, so long streamed
+    listings are not cut off).
+
+    Raises:
+        GithubValidationError: If the header is not a positive number
+    """
+    value = request.headers.get(TIMEOUT_HEADER)
+    if value is None:
+        default = os.getenv("GITHUB_REQUEST_TIMEOUT")
+        return float(default) if default else None
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = 0.0
+    if not seconds > 0:
+        raise GithubValidationError(
+            f"{TIMEOUT_HEADER} must be a positive number of seconds",
+            field=TIMEOUT_HEADER,
+            value=value,
+        )
+    return seconds
+
+
 async def error_handler_middleware(request: Request, call_next: Callable) -> Response:
     """Middleware to catch and format exceptions.
 
     Translates core domain exceptions to appropriate HTTP responses.
+    The request's GitHub requests are bounded by its deadline (see
+    ``request_timeout``); a spent deadline is answered with 504.
+    Slow requests are profiled when profiling is enabled (see
+    ``core.profiling``), tagged with the route's endpoint and parameters.
 
     Args:
         request: FastAPI request
@@ -41,14 +93,27 @@ async def error_handler_middleware(request: Request, call_next: Callable) -> Res
         Response (possibly error response)
     """
     try:
-        # Record start time for logging
-        start_time = time.time()
+        # Record start time for logging (monotonic)
+        start_time = time.perf_counter()
 
         # Call next handler
-        response = await call_next(request)
+        operation = f"{request.method} {request.url.path}"
+        with (
+            deadlines.deadline(request_timeout(request), operation),
+            profiling.profiled() as profile,
+        ):
+            try:
+                response = await call_next(request)
+            finally:
+                if profile is not None:
+                    endpoint = request.scope.get("endpoint")
+                    profile.tag(
+                        getattr(endpoint, "__name__", None),
+                        {**request.path_params, **request.query_params},
+                    )
 
         # Log request duration
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         response.headers["X-Request-Duration"] = f"{duration:.3f}s"
 
         return response
@@ -81,6 +146,13 @@ async def error_handler_middleware(request: Request, call_next: Callable) -> Res
             status_code=status.HTTP_504_GATEWAY_TIMEOUT, content=e.to_dict()
         )
 
+    except ValueError as e:
+        # Invalid parameters rejected by a core request model
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"error": "VALIDATION_ERROR", "message": str(e), "details": {}},
+        )
+
     except GithubConfigError as e:
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=e.to_dict()
@@ -107,3 +179,169 @@ async def error_handler_middleware(request: Request, call_next: Callable) -> Res
                 "details": {"type": type(e).__name__, "message": str(e)},
             },
         )
+
+
+# ============================================================================
+# Metrics Middleware
+# ============================================================================
+
+
+def route_template(request: Request) -> str:
+    """Return the full path template of the route that handled ``request``.
+
+    Routes of included routers only know their own path (e.g.
+    ``/github/repos/{owner}/{repo}/issues``), so the prefix they were
+    mounted under is recovered from the request path.
+
+    Args:
+        request: Request after routing
+
+    Returns:
+        Path template, or "unmatched" if no route matched
+    """
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    try:
+        rendered = route.path_format.format(**request.path_params)
+    except (AttributeError, KeyError, IndexError):
+        return getattr(route, "path", "unmatched")
+    path = request.url.path
+    prefix = path[: len(path) - len(rendered)] if path.endswith(rendered) else ""
+    return prefix + route.path
+
+
+async def metrics_middleware(request: Request, call_next: Callable) -> Response:
+    """Middleware recording per-route latency and in-flight requests.
+
+    Requests are labelled with the matched route template (e.g.
+    ``/api/v1/github/repos/{owner}/{repo}/issues``), so label cardinality
+    does not grow with repositories or issue numbers.
+
+    Args:
+        request: FastAPI request
+        call_next: Next middleware/handler
+
+    Returns:
+        Response
+    """
+    REQUESTS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=route_template(request),
+            status=status_code,
+        )
+
+
+# ============================================================================
+# Tracing Middleware
+# ============================================================================
+
+
+async def tracing_middleware(request: Request, call_next: Callable) -> Response:
+    """Middleware running each request in an ``HTTP <method> <route>`` span.
+
+    A W3C ``traceparent`` header continues the caller's trace. Does nothing
+    unless tracing is enabled (see ``core.tracing``).
+
+    Args:
+        request: FastAPI request
+        call_next: Next middleware/handler
+
+    Returns:
+        Response
+    """
+    if not tracing.enabled():
+        return await call_next(request)
+    attributes = {"http.request.method": request.method, "url.path": request.url.path}
+    context = tracing.extract_context(request.headers)
+    with tracing.span(f"HTTP {request.method}", attributes, context=context) as span:
+        response = await call_next(request)
+        route = route_template(request)
+        span.update_name(f"HTTP {request.method} {route}")
+        span.set_attribute("http.route", route)
+        span.set_attribute("http.response.status_code", response.status_code)
+        return response
+
+
+# ============================================================================
+# Upstream Accounting Middleware
+# ============================================================================
+
+
+async def upstream_usage_middleware(request: Request, call_next: Callable) -> Response:
+    """Middleware reporting the GitHub requests made for each request.
+
+    Adds ``X-Upstream-Requests``, ``X-Upstream-Not-Modified``,
+    ``X-Upstream-Cache-Hits`` and ``X-Upstream-Duration`` headers. For
+    streaming responses they cover the work done before the first line.
+
+    Args:
+        request: FastAPI request
+        call_next: Next middleware/handler
+
+    Returns:
+        Response with upstream accounting headers
+    """
+    with track_usage() as usage:
+        response = await call_next(request)
+    response.headers.update(usage.headers())
+    return response
+
+
+# ============================================================================
+# HTTP Cache Middleware
+# ============================================================================
+
+
+async def http_cache_middleware(request: Request, call_next: Callable) -> Response:
+    """Middleware adding ETag / 304 / Cache-Control semantics to reads.
+
+    Uses the app's ResponseCache (``app.state.response_cache``): fresh
+    responses are served from stored bytes, and a matching If-None-Match
+    gets an empty 304. Successful writes invalidate the repository's
+    stored responses; partial results are passed through unstored.
+
+    Args:
+        request: FastAPI request
+        call_next: Next middleware/handler
+
+    Returns:
+        Response (possibly 304 Not Modified)
+    """
+    cache = getattr(request.app.state, "response_cache", None)
+    if cache is None or not cache.applies_to(request):
+        response = await call_next(request)
+        if cache is not None and request.method not in SAFE_METHODS and response.status_code < 400:
+            cache.invalidate(request.url.path)
+        return response
+
+    # Taken before the handler runs: a write finishing meanwhile moves the
+    # repository to a new generation, leaving this response unreachable
+    key = cache.key(request)
+    entry = cache.lookup(key)
+    if entry is None:
+        response = await call_next(request)
+        content_type = response.headers.get("content-type", "")
+        if (
+            response.status_code != status.HTTP_200_OK
+            or content_type != JSON_MEDIA_TYPE
+            or PARTIAL_HEADER in response.headers
+        ):
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        entry = cache.store(key, body)
+
+    headers = cache.headers(entry)
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.value, media_type=JSON_MEDIA_TYPE, headers=headers)
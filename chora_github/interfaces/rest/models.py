@@ -1,96 +1,68 @@
 """GitHub - REST API Models (SAP-043)
 
 API-specific request and response models. These are separate from core
-models and may have different validation rules or fields suitable for
-HTTP API interactions.
+models: repository and issue numbers come from the URL path, so request
+bodies only carry the remaining fields of the core request models.
 
 Generated by: chora-base SAP-047 (Capability Server Template)
 """
 
 from typing import Any
 
-from github.core import GithubEntity, GithubStatus
 from pydantic import BaseModel, Field
 
+from chora_github.core.models import IssueState
+
 
 # ============================================================================
 # Request Models
 # ============================================================================
 
 
-class CreateEntityRequest(BaseModel):
-    """Request model for creating an entity via API.
-
-    This model may have different validation rules than the core
-    GithubRequest model.
-    """
+class CreateIssueBody(BaseModel):
+    """Request body for creating an issue (repository from the path)."""
 
-    name: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        description="Entity name",
-        examples=["My Entity"],
-    )
-
-    description: str | None = Field(
-        None,
-        max_length=2000,
-        description="Optional description",
-        examples=["A detailed description"],
-    )
-
-    metadata: dict[str, Any] | None = Field(
-        None,
-        description="Optional metadata as key-value pairs",
-        examples=[{"priority": "high", "tags": "important"}],
-    )
+    title: str = Field(..., min_length=1, max_length=256, description="Issue title")
+    body: str = Field("", description="Issue description (markdown)")
+    labels: list[str] | None = Field(None, description="Label names")
+    assignees: list[str] | None = Field(None, description="Usernames to assign")
 
     model_config = {
         "json_schema_extra": {
             "example": {
-                "name": "Important Task",
-                "description": "This is an important task to complete",
-                "metadata": {"priority": "high", "category": "development"},
+                "title": "Bug: login fails",
+                "body": "Steps to reproduce...",
+                "labels": ["bug"],
             }
         }
     }
 
 
-class UpdateEntityRequest(BaseModel):
-    """Request model for updating an entity via API.
+class UpdateIssueBody(BaseModel):
+    """Request body for updating an issue (only provided fields change)."""
 
-    For PATCH requests, all fields are optional. For PUT requests,
-    all fields should be provided.
-    """
+    title: str | None = Field(None, min_length=1, max_length=256, description="New title")
+    body: str | None = Field(None, description="New description")
+    state: IssueState | None = Field(None, description="New state (open/closed)")
+    labels: list[str] | None = Field(None, description="Replacement label names")
+    assignees: list[str] | None = Field(None, description="Replacement assignees")
 
-    name: str | None = Field(
-        None, min_length=1, max_length=200, description="Entity name"
-    )
+    model_config = {"json_schema_extra": {"example": {"state": "closed"}}}
 
-    description: str | None = Field(None, max_length=2000, description="Description")
 
-    metadata: dict[str, Any] | None = Field(
-        None, description="Metadata as key-value pairs"
-    )
+class ProfilingSettings(BaseModel):
+    """Request body for turning slow-call profiling on or off.
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "name": "Updated Task Name",
-                "description": "Updated description",
-                "metadata": {"priority": "low"},
-            }
-        }
-    }
-
-
-class UpdateStatusRequest(BaseModel):
-    """Request model for updating entity status."""
+    Profiles are written to ``GITHUB_PROFILE_DIR`` (default ``profiles``);
+    the directory cannot be changed over HTTP.
+    """
 
-    status: GithubStatus = Field(..., description="New status value")
+    enabled: bool = Field(..., description="Profile slow calls")
+    threshold_ms: float = Field(1000.0, ge=0, description="Keep calls at least this slow")
+    sample_rate: float = Field(1.0, ge=0, le=1, description="Fraction of calls profiled")
+    max_profiles: int = Field(100, ge=1, description="Profiles written at most")
 
-    model_config = {"json_schema_extra": {"example": {"status": "active"}}}
+    model_config = {"json_schema_extra": {"example": {"enabled": True, "threshold_ms": 500}}}
 
 
 # ============================================================================
@@ -98,68 +70,6 @@ class UpdateStatusRequest(BaseModel):
 # ============================================================================
 
 
-class EntityResponse(BaseModel):
-    """Response model for single entity operations."""
-
-    success: bool = Field(True, description="Whether the operation succeeded")
-
-    message: str | None = Field(None, description="Optional response message")
-
-    entity: GithubEntity = Field(..., description="The entity")
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "success": True,
-                "message": "Entity created successfully",
-                "entity": {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "name": "Example Entity",
-                    "description": "Description",
-                    "status": "pending",
-                    "metadata": {},
-                    "created_at": "2025-01-15T10:30:00Z",
-                    "updated_at": "2025-01-15T10:30:00Z",
-                },
-            }
-        }
-    }
-
-
-class EntityListResponse(BaseModel):
-    """Response model for entity list operations."""
-
-    entities: list[GithubEntity] = Field(
-        default_factory=list, description="List of entities"
-    )
-
-    total: int = Field(0, ge=0, description="Total number of entities matching filters")
-
-    offset: int = Field(0, ge=0, description="Pagination offset")
-
-    limit: int = Field(
-        100, ge=1, le=1000, description="Maximum number of entities returned"
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "entities": [
-                    {
-                        "id": "123e4567-e89b-12d3-a456-426614174000",
-                        "name": "Entity 1",
-                        "status": "active",
-                        "created_at": "2025-01-15T10:30:00Z",
-                    }
-                ],
-                "total": 10,
-                "offset": 0,
-                "limit": 100,
-            }
-        }
-    }
-
-
 class ErrorResponse(BaseModel):
     """Response model for error responses.
 
@@ -177,20 +87,31 @@ class ErrorResponse(BaseModel):
     model_config = {
         "json_schema_extra": {
             "example": {
-                "error": "VALIDATION_ERROR",
-                "message": "Invalid input data",
-                "details": {"field": "name", "value": ""},
+                "error": "NOT_FOUND",
+                "message": "Issue #999 not found in 'octocat/Hello-World'",
+                "details": {},
             }
         }
     }
 
 
+class ProfilingStatus(BaseModel):
+    """Response model for the slow-call profiling settings."""
+
+    enabled: bool = Field(..., description="Whether slow calls are profiled")
+    directory: str | None = Field(None, description="Directory profiles are written to")
+    threshold_ms: float | None = Field(None, description="Calls at least this slow are kept")
+    sample_rate: float | None = Field(None, description="Fraction of calls profiled")
+    max_profiles: int | None = Field(None, description="Profiles written at most")
+    written: int | None = Field(None, description="Profiles written so far")
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
 
     status: str = Field(..., description="Health status (healthy, degraded, unhealthy)")
 
-    entity_count: int = Field(0, ge=0, description="Number of entities in storage")
+    version: str = Field(..., description="Server version")
 
     timestamp: str = Field(..., description="Timestamp of health check (ISO 8601)")
 
@@ -198,7 +119,7 @@ class HealthResponse(BaseModel):
         "json_schema_extra": {
             "example": {
                 "status": "healthy",
-                "entity_count": 42,
+                "version": "0.1.0",
                 "timestamp": "2025-01-15T10:30:00Z",
             }
         }
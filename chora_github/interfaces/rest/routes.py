@@ -3,27 +3,69 @@
 API endpoint definitions. Routes translate HTTP requests to core service
 calls and format responses.
 
+All routes share the application's GithubToolService (created once by the
+app lifespan handler, see ``create_app``), so connection pools, the issue
+cache and the write throttle are reused across requests. The service is
+synchronous, so calls run in the server's thread pool.
+
 Generated by: chora-base SAP-047 (Capability Server Template)
 """
 
-from uuid import UUID
+import hmac
+import os
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from typing import Any
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi import status as http_status
-from github.core import (
-    GithubEntity,
-    GithubFilter,
-    GithubRequest,
-    GithubStatus,
-    create_github_service,
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from chora_github.core import profiling
+from chora_github.core.columnar import encode_list_response
+from chora_github.core.dispatch import ToolDispatcher, written_repos
+from chora_github.core.exceptions import GithubError, GithubPermissionError
+from chora_github.core.models import (
+    CreateIssueRequest,
+    CreateIssueResponse,
+    FileData,
+    GetFileContentsRequest,
+    GetFileContentsResponse,
+    GetIssueRequest,
+    GetIssueResponse,
+    GetPRRequest,
+    GetPRResponse,
+    IssueData,
+    IssueState,
+    ListIssuesRequest,
+    ListIssuesResponse,
+    ListPRsRequest,
+    ListPRsResponse,
+    ListRepoFilesRequest,
+    ListRepoFilesResponse,
+    PRData,
+    PRState,
+    ResponseFormat,
+    StreamIssuesRequest,
+    StreamPRsRequest,
+    ToolBatchRequest,
+    ToolBatchResponse,
+    ToolCallRequest,
+    ToolCallResponse,
+    UpdateIssueRequest,
+    UpdateIssueResponse,
 )
+from chora_github.core.serialization import dumps
+from chora_github.core.services import GithubToolService
 
+from .caching import PARTIAL_HEADER
 from .models import (
-    CreateEntityRequest,
-    EntityListResponse,
-    EntityResponse,
-    UpdateEntityRequest,
-    UpdateStatusRequest,
+    CreateIssueBody,
+    ErrorResponse,
+    ProfilingSettings,
+    ProfilingStatus,
+    UpdateIssueBody,
 )
 
 
@@ -33,351 +75,512 @@ from .models import (
 
 
 router = APIRouter(prefix="/github", tags=["GitHub"])
+tools_router = APIRouter(tags=["Tools"])
+admin_router = APIRouter(prefix="/admin", tags=["Admin"])
+
+ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
+    400: {"model": ErrorResponse, "description": "Invalid parameters"},
+    403: {"model": ErrorResponse, "description": "Access denied"},
+    404: {"model": ErrorResponse, "description": "Not found"},
+    429: {"model": ErrorResponse, "description": "GitHub rate limit exceeded"},
+}
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_END = object()
 
 
 # ============================================================================
-# Dependency: Service Instance
+# Dependencies: Shared Service Instances
 # ============================================================================
 
 
-def get_service():
-    """Get service instance.
+def get_service(request: Request) -> GithubToolService:
+    """Get the application's shared service instance.
 
     This is a dependency that can be overridden for testing.
     """
-    return create_github_service()
-
-
-# ============================================================================
-# Create Entity
-# ============================================================================
+    return request.app.state.service
 
 
-@router.post(
-    "/entities",
-    response_model=EntityResponse,
-    status_code=http_status.HTTP_201_CREATED,
-    summary="Create new entity",
-    description="Create a new github entity with the provided data.",
-)
-async def create_entity(request: CreateEntityRequest) -> EntityResponse:
-    """Create a new entity.
+def get_dispatcher(request: Request) -> ToolDispatcher:
+    """Get the application's shared tool dispatcher."""
+    return request.app.state.dispatcher
 
-    Args:
-        request: Entity creation request
 
-    Returns:
-        Created entity
+def require_admin(request: Request) -> None:
+    """Allow only requests bearing ``GITHUB_ADMIN_TOKEN``.
 
     Raises:
-        400: Validation error
-        500: Internal server error
+        GithubPermissionError: If admin endpoints are disabled (no token
+            configured) or the request's bearer token does not match
     """
-    service = get_service()
-
-    # Convert API request to core request
-    core_request = GithubRequest(
-        name=request.name,
-        description=request.description,
-        metadata=request.metadata or {},
-    )
-
-    # Call core service
-    response = await service.create(core_request)
-
-    # Convert to API response
-    return EntityResponse(
-        success=response.success, message=response.message, entity=response.entity
-    )
+    expected = os.getenv("GITHUB_ADMIN_TOKEN")
+    if not expected:
+        raise GithubPermissionError("Admin endpoints are disabled (GITHUB_ADMIN_TOKEN is not set)")
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise GithubPermissionError("Invalid admin token")
 
 
 # ============================================================================
-# Get Entity
+# Helpers
 # ============================================================================
 
 
-@router.get(
-    "/entities/{entity_id}",
-    response_model=GithubEntity,
-    summary="Get entity by ID",
-    description="Retrieve a github entity by its unique identifier.",
-)
-async def get_entity(entity_id: UUID) -> GithubEntity:
-    """Get entity by ID.
+def _split(value: str | None) -> list[str] | None:
+    """Split a comma-separated query value."""
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def json_response(data: BaseModel | dict, status_code: int = http_status.HTTP_200_OK) -> Response:
+    """Serialize a response natively (no response_model re-validation).
 
     Args:
-        entity_id: Entity unique identifier
+        data: Response model or JSON-compatible dict
+        status_code: HTTP status code
 
     Returns:
-        The entity
+        JSON response
+    """
+    return Response(content=dumps(data), status_code=status_code, media_type="application/json")
 
-    Raises:
-        404: Entity not found
-        500: Internal server error
+
+def list_response(response: BaseModel, response_format: str) -> Response:
+    """Serialize a list response in the requested encoding.
+
+    A partial result (cut short by the request's deadline) is marked with
+    ``X-Partial-Result`` so it is not cached.
     """
-    service = get_service()
-    return await service.get(entity_id)
+    if response_format == ResponseFormat.COLUMNAR:
+        http_response = json_response(encode_list_response(response))
+    else:
+        http_response = json_response(response)
+    if getattr(response, "partial", None) is not None:
+        http_response.headers[PARTIAL_HEADER] = "true"
+    return http_response
 
 
-# ============================================================================
-# List Entities
-# ============================================================================
+async def call_service(method: Callable[[Any], BaseModel], request: BaseModel) -> Any:
+    """Run a synchronous service method in the thread pool."""
+    return await run_in_threadpool(method, request)
 
 
-@router.get(
-    "/entities",
-    response_model=EntityListResponse,
-    summary="List entities",
-    description="List github entities with optional filtering and pagination.",
-)
-async def list_entities(
-    status: GithubStatus | None = Query(None, description="Filter by status"),
-    name_contains: str | None = Query(
-        None, description="Filter by name containing text (case-insensitive)"
-    ),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-) -> EntityListResponse:
-    """List entities with optional filtering.
+async def ndjson_response(items: Iterator[BaseModel]) -> StreamingResponse:
+    """Stream items from a service iterator as NDJSON (one item per line).
+
+    Each item is pulled from the iterator (in the thread pool) only after
+    the previous line has been sent, so upstream pages are fetched at the
+    pace the client reads and at most one page is held in memory.
+
+    The first item is fetched before the response starts, so errors such as
+    an unknown repository still produce a regular error response. An error
+    after that ends the stream with a final ``{"error": ...}`` line.
 
     Args:
-        status: Optional status filter
-        name_contains: Optional name search filter
-        offset: Pagination offset (default: 0)
-        limit: Maximum results (default: 100, max: 1000)
+        items: Iterator from the service (e.g. ``iter_issues``)
 
     Returns:
-        List of entities with pagination metadata
-
-    Raises:
-        400: Invalid filter parameters
-        500: Internal server error
+        Streaming NDJSON response
     """
-    service = get_service()
+    first = await run_in_threadpool(next, items, _END)
 
-    # Build filter
-    filters = GithubFilter(
-        status=status, name_contains=name_contains, offset=offset, limit=limit
-    )
+    async def lines() -> AsyncIterator[str]:
+        item = first
+        try:
+            while item is not _END:
+                yield dumps(item, pretty=False) + "\n"
+                item = await run_in_threadpool(next, items, _END)
+        except GithubError as e:
+            yield dumps(e.to_dict(), pretty=False) + "\n"
 
-    # Call core service
-    response = await service.list(filters)
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
 
-    # Convert to API response
-    return EntityListResponse(
-        entities=response.entities,
-        total=response.total,
-        offset=response.offset,
-        limit=response.limit,
-    )
+
+def stream_responses(item: type[BaseModel]) -> dict[int | str, dict[str, Any]]:
+    """OpenAPI responses for an NDJSON stream of ``item``."""
+    return {
+        http_status.HTTP_200_OK: {
+            "description": f"One {item.__name__} per line",
+            "content": {NDJSON_MEDIA_TYPE: {"schema": item.model_json_schema()}},
+        },
+        **ERROR_RESPONSES,
+    }
 
 
 # ============================================================================
-# Update Entity
+# Streaming Listings
 # ============================================================================
+# Registered before the item routes, so ".../issues/stream" is not taken
+# for an issue number.
 
 
-@router.put(
-    "/entities/{entity_id}",
-    response_model=EntityResponse,
-    summary="Update entity",
-    description="Update an existing github entity.",
+@router.get(
+    "/repos/{owner}/{repo}/issues/stream",
+    response_class=StreamingResponse,
+    responses=stream_responses(IssueData),
+    summary="Stream issues (NDJSON)",
 )
-async def update_entity(
-    entity_id: UUID, request: UpdateEntityRequest
-) -> EntityResponse:
-    """Update an existing entity.
+async def stream_issues(
+    owner: str,
+    repo: str,
+    state: IssueState = Query(IssueState.OPEN, description="open, closed or all"),
+    labels: str | None = Query(None, description="Comma-separated label names"),
+    assignee: str | None = Query(None, description="Filter by assignee"),
+    limit: int | None = Query(None, description="Maximum results (default: all)"),
+    cursor: str | None = Query(None, description="Continue a listing cut short by a timeout"),
+    fields: str | None = Query(None, description="Comma-separated issue fields to return"),
+    service: GithubToolService = Depends(get_service),
+) -> StreamingResponse:
+    """Stream every matching issue, one JSON object per line."""
+    request = StreamIssuesRequest(
+        repo=f"{owner}/{repo}",
+        state=state,
+        labels=_split(labels),
+        assignee=assignee,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+    )
+    return await ndjson_response(service.iter_issues(request))
 
-    Args:
-        entity_id: Entity to update
-        request: Update request
 
-    Returns:
-        Updated entity
-
-    Raises:
-        400: Validation error
-        404: Entity not found
-        500: Internal server error
-    """
-    service = get_service()
-
-    # Convert API request to core request
-    core_request = GithubRequest(
-        name=request.name,
-        description=request.description,
-        metadata=request.metadata or {},
+@router.get(
+    "/repos/{owner}/{repo}/pulls/stream",
+    response_class=StreamingResponse,
+    responses=stream_responses(PRData),
+    summary="Stream pull requests (NDJSON)",
+)
+async def stream_prs(
+    owner: str,
+    repo: str,
+    state: PRState = Query(PRState.OPEN, description="open, closed or all"),
+    head: str | None = Query(None, description="Filter by head branch"),
+    base: str | None = Query(None, description="Filter by base branch"),
+    limit: int | None = Query(None, description="Maximum results (default: all)"),
+    cursor: str | None = Query(None, description="Continue a listing cut short by a timeout"),
+    fields: str | None = Query(None, description="Comma-separated PR fields to return"),
+    service: GithubToolService = Depends(get_service),
+) -> StreamingResponse:
+    """Stream every matching pull request, one JSON object per line."""
+    request = StreamPRsRequest(
+        repo=f"{owner}/{repo}",
+        state=state,
+        head=head,
+        base=base,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
     )
+    return await ndjson_response(service.iter_prs(request))
 
-    # Call core service
-    response = await service.update(entity_id, core_request)
 
-    # Convert to API response
-    return EntityResponse(
-        success=response.success, message=response.message, entity=response.entity
-    )
+@router.get(
+    "/repos/{owner}/{repo}/files/stream",
+    response_class=StreamingResponse,
+    responses=stream_responses(FileData),
+    summary="Stream repository files (NDJSON)",
+)
+async def stream_repo_files(
+    owner: str,
+    repo: str,
+    path: str = Query("", description="Directory path (default: root)"),
+    ref: str = Query("main", description="Branch, tag, or commit SHA"),
+    recursive: bool = Query(False, description="List recursively"),
+    service: GithubToolService = Depends(get_service),
+) -> StreamingResponse:
+    """Stream files and directories, one JSON object per line."""
+    request = ListRepoFilesRequest(repo=f"{owner}/{repo}", path=path, ref=ref, recursive=recursive)
+    return await ndjson_response(service.iter_repo_files(request))
 
 
 # ============================================================================
-# Partial Update Entity (PATCH)
+# Issues
 # ============================================================================
 
 
-@router.patch(
-    "/entities/{entity_id}",
-    response_model=EntityResponse,
-    summary="Partially update entity",
-    description="Update specific fields of an existing github entity.",
+@router.get(
+    "/repos/{owner}/{repo}/issues",
+    response_model=ListIssuesResponse,
+    responses=ERROR_RESPONSES,
+    summary="List issues",
 )
-async def patch_entity(entity_id: UUID, request: UpdateEntityRequest) -> EntityResponse:
-    """Partially update an entity.
+async def list_issues(
+    owner: str,
+    repo: str,
+    state: IssueState = Query(IssueState.OPEN, description="open, closed or all"),
+    labels: str | None = Query(None, description="Comma-separated label names"),
+    assignee: str | None = Query(None, description="Filter by assignee"),
+    limit: int = Query(30, description="Maximum results (1-100)"),
+    cursor: str | None = Query(None, description="Continue a listing cut short by a timeout"),
+    fields: str | None = Query(None, description="Comma-separated issue fields to return"),
+    format: ResponseFormat = Query(ResponseFormat.ROWS, description="rows or columnar"),
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """List issues in a repository."""
+    request = ListIssuesRequest(
+        repo=f"{owner}/{repo}",
+        state=state,
+        labels=_split(labels),
+        assignee=assignee,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        format=format,
+    )
+    response = await call_service(service.list_issues, request)
+    return list_response(response, request.format)
 
-    Only provided fields will be updated. Omitted fields remain unchanged.
 
-    Args:
-        entity_id: Entity to update
-        request: Partial update request
+@router.post(
+    "/repos/{owner}/{repo}/issues",
+    response_model=CreateIssueResponse,
+    status_code=http_status.HTTP_201_CREATED,
+    responses=ERROR_RESPONSES,
+    summary="Create issue",
+)
+async def create_issue(
+    owner: str,
+    repo: str,
+    body: CreateIssueBody,
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """Create an issue."""
+    request = CreateIssueRequest(repo=f"{owner}/{repo}", **body.model_dump())
+    response = await call_service(service.create_issue, request)
+    return json_response(response, status_code=http_status.HTTP_201_CREATED)
 
-    Returns:
-        Updated entity
 
-    Raises:
-        400: Validation error
-        404: Entity not found
-        500: Internal server error
-    """
-    service = get_service()
-
-    # Get existing entity
-    existing = await service.get(entity_id)
-
-    # Merge with existing values
-    core_request = GithubRequest(
-        name=request.name if request.name else existing.name,
-        description=(
-            request.description
-            if request.description is not None
-            else existing.description
-        ),
-        metadata=(
-            request.metadata if request.metadata is not None else existing.metadata
-        ),
-    )
+@router.get(
+    "/repos/{owner}/{repo}/issues/{issue_number}",
+    response_model=GetIssueResponse,
+    responses=ERROR_RESPONSES,
+    summary="Get issue",
+)
+async def get_issue(
+    owner: str,
+    repo: str,
+    issue_number: int,
+    fields: str | None = Query(None, description="Comma-separated issue fields to return"),
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """Get an issue by number."""
+    request = GetIssueRequest(repo=f"{owner}/{repo}", issue_number=issue_number, fields=fields)
+    return json_response(await call_service(service.get_issue, request))
 
-    # Call core service
-    response = await service.update(entity_id, core_request)
 
-    # Convert to API response
-    return EntityResponse(
-        success=response.success, message=response.message, entity=response.entity
+@router.patch(
+    "/repos/{owner}/{repo}/issues/{issue_number}",
+    response_model=UpdateIssueResponse,
+    responses=ERROR_RESPONSES,
+    summary="Update issue",
+)
+async def update_issue(
+    owner: str,
+    repo: str,
+    issue_number: int,
+    body: UpdateIssueBody,
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """Update an issue (only provided fields change)."""
+    request = UpdateIssueRequest(
+        repo=f"{owner}/{repo}", issue_number=issue_number, **body.model_dump()
     )
+    return json_response(await call_service(service.update_issue, request))
 
 
 # ============================================================================
-# Delete Entity
+# Pull Requests
 # ============================================================================
 
 
-@router.delete(
-    "/entities/{entity_id}",
-    status_code=http_status.HTTP_204_NO_CONTENT,
-    summary="Delete entity",
-    description="Delete a github entity.",
+@router.get(
+    "/repos/{owner}/{repo}/pulls",
+    response_model=ListPRsResponse,
+    responses=ERROR_RESPONSES,
+    summary="List pull requests",
 )
-async def delete_entity(entity_id: UUID):
-    """Delete an entity.
-
-    Args:
-        entity_id: Entity to delete
+async def list_prs(
+    owner: str,
+    repo: str,
+    state: PRState = Query(PRState.OPEN, description="open, closed or all"),
+    head: str | None = Query(None, description="Filter by head branch"),
+    base: str | None = Query(None, description="Filter by base branch"),
+    limit: int = Query(30, description="Maximum results (1-100)"),
+    cursor: str | None = Query(None, description="Continue a listing cut short by a timeout"),
+    fields: str | None = Query(None, description="Comma-separated PR fields to return"),
+    format: ResponseFormat = Query(ResponseFormat.ROWS, description="rows or columnar"),
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """List pull requests in a repository."""
+    request = ListPRsRequest(
+        repo=f"{owner}/{repo}",
+        state=state,
+        head=head,
+        base=base,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        format=format,
+    )
+    response = await call_service(service.list_prs, request)
+    return list_response(response, request.format)
 
-    Returns:
-        None (204 No Content)
 
-    Raises:
-        404: Entity not found
-        500: Internal server error
-    """
-    service = get_service()
-    await service.delete(entity_id)
+@router.get(
+    "/repos/{owner}/{repo}/pulls/{pr_number}",
+    response_model=GetPRResponse,
+    responses=ERROR_RESPONSES,
+    summary="Get pull request",
+)
+async def get_pr(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    fields: str | None = Query(None, description="Comma-separated PR fields to return"),
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """Get a pull request by number."""
+    request = GetPRRequest(repo=f"{owner}/{repo}", pr_number=pr_number, fields=fields)
+    return json_response(await call_service(service.get_pr, request))
 
 
 # ============================================================================
-# Update Status
+# Files
 # ============================================================================
 
 
-@router.post(
-    "/entities/{entity_id}/status",
-    response_model=EntityResponse,
-    summary="Update entity status",
-    description="Update the status of a github entity.",
+@router.get(
+    "/repos/{owner}/{repo}/contents/{path:path}",
+    response_model=GetFileContentsResponse,
+    responses=ERROR_RESPONSES,
+    summary="Get file contents",
 )
-async def update_status(
-    entity_id: UUID, request: UpdateStatusRequest
-) -> EntityResponse:
-    """Update entity status.
+async def get_file_contents(
+    owner: str,
+    repo: str,
+    path: str,
+    ref: str = Query("main", description="Branch, tag, or commit SHA"),
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """Read a file from a repository."""
+    request = GetFileContentsRequest(repo=f"{owner}/{repo}", path=path, ref=ref)
+    return json_response(await call_service(service.get_file_contents, request))
 
-    Args:
-        entity_id: Entity to update
-        request: Status update request
 
-    Returns:
-        Updated entity
-
-    Raises:
-        400: Invalid status transition
-        404: Entity not found
-        500: Internal server error
-    """
-    service = get_service()
-
-    # Call core service
-    response = await service.update_status(entity_id, request.status)
-
-    # Convert to API response
-    return EntityResponse(
-        success=response.success, message=response.message, entity=response.entity
+@router.get(
+    "/repos/{owner}/{repo}/files",
+    response_model=ListRepoFilesResponse,
+    responses=ERROR_RESPONSES,
+    summary="List repository files",
+)
+async def list_repo_files(
+    owner: str,
+    repo: str,
+    path: str = Query("", description="Directory path (default: root)"),
+    ref: str = Query("main", description="Branch, tag, or commit SHA"),
+    recursive: bool = Query(False, description="List recursively"),
+    format: ResponseFormat = Query(ResponseFormat.ROWS, description="rows or columnar"),
+    service: GithubToolService = Depends(get_service),
+) -> Response:
+    """List files and directories in a repository path."""
+    request = ListRepoFilesRequest(
+        repo=f"{owner}/{repo}", path=path, ref=ref, recursive=recursive, format=format
     )
+    response = await call_service(service.list_repo_files, request)
+    return list_response(response, request.format)
 
 
 # ============================================================================
-# Bulk Operations (Optional)
+# Tool Calls
 # ============================================================================
 
 
-@router.post(
-    "/entities/bulk/delete",
-    status_code=http_status.HTTP_200_OK,
-    summary="Bulk delete entities",
-    description="Delete multiple entities at once.",
-)
-async def bulk_delete(entity_ids: list[UUID]) -> dict:
-    """Bulk delete entities.
-
-    Args:
-        entity_ids: List of entity IDs to delete
-
-    Returns:
-        Summary of deletion results
+def invalidate_written(
+    request: Request, calls: Sequence[ToolCallRequest], results: Sequence[ToolCallResponse]
+) -> None:
+    """Invalidate the cached reads of the repositories tool calls wrote to.
 
-    Raises:
-        500: Internal server error
+    Tool calls are all POSTed to ``/call``, so the HTTP cache cannot tell
+    the written repository from the URL; it is taken from the parameters
+    of each successful write instead.
     """
-    service = get_service()
+    cache = getattr(request.app.state, "response_cache", None)
+    if cache is None:
+        return
+    for call, result in zip(calls, results, strict=True):
+        if result.success:
+            for repo in written_repos(call):
+                cache.invalidate_repo(repo)
+
+
+@tools_router.post(
+    "/call",
+    response_model=ToolCallResponse,
+    summary="Call a tool",
+    description="Execute one tool call envelope (errors are reported in the body).",
+)
+async def call_tool(
+    call: ToolCallRequest, request: Request, dispatcher: ToolDispatcher = Depends(get_dispatcher)
+) -> Response:
+    """Execute one ToolCallRequest."""
+    response = await dispatcher.call_async(call)
+    invalidate_written(request, [call], [response])
+    return json_response(response)
+
+
+@tools_router.post(
+    "/call/batch",
+    response_model=ToolBatchResponse,
+    summary="Call several tools",
+    description="Execute tool calls concurrently; one result per call, in order.",
+)
+async def call_batch(
+    batch: ToolBatchRequest, request: Request, dispatcher: ToolDispatcher = Depends(get_dispatcher)
+) -> Response:
+    """Execute a ToolBatchRequest."""
+    response = await dispatcher.call_batch(batch.calls, batch.timeout)
+    invalidate_written(request, batch.calls, response.results)
+    return json_response(response)
 
-    deleted = []
-    failed = []
 
-    for entity_id in entity_ids:
-        try:
-            await service.delete(entity_id)
-            deleted.append(str(entity_id))
-        except Exception as e:
-            failed.append({"id": str(entity_id), "error": str(e)})
+# ============================================================================
+# Admin
+# ============================================================================
 
-    return {
-        "deleted_count": len(deleted),
-        "failed_count": len(failed),
-        "deleted": deleted,
-        "failed": failed,
-    }
+
+@admin_router.get(
+    "/profiling",
+    response_model=ProfilingStatus,
+    summary="Show slow-call profiling settings",
+    dependencies=[Depends(require_admin)],
+)
+async def get_profiling() -> ProfilingStatus:
+    """Current slow-call profiling settings."""
+    return ProfilingStatus(**profiling.summary())
+
+
+@admin_router.put(
+    "/profiling",
+    response_model=ProfilingStatus,
+    summary="Turn slow-call profiling on or off",
+    description=(
+        "Profile REST requests and tool calls slower than threshold_ms, writing "
+        "one profile per call to GITHUB_PROFILE_DIR (default: profiles)."
+    ),
+    dependencies=[Depends(require_admin)],
+)
+async def set_profiling(settings: ProfilingSettings) -> ProfilingStatus:
+    """Replace the slow-call profiling settings."""
+    config = None
+    if settings.enabled:
+        config = profiling.ProfilingConfig(
+            directory=os.getenv("GITHUB_PROFILE_DIR") or profiling.DEFAULT_DIRECTORY,
+            threshold_ms=settings.threshold_ms,
+            sample_rate=settings.sample_rate,
+            max_profiles=settings.max_profiles,
+        )
+    profiling.configure(config)
+    return ProfilingStatus(**profiling.summary())
@@ -0,0 +1,69 @@
+"""Tests for the fake GitHub API used by the benchmarks.
+
+The real service (PyGithub over HTTP) runs against the fake server, so
+these also check that the fake answers every request the tools make.
+"""
+
+import pytest
+import requests
+
+from benchmarks.bench_tools import SCENARIOS, percentile
+from benchmarks.fake_github import REPO, FakeGithub
+from chora_github.core.accounting import track_usage
+from chora_github.core.exceptions import GithubNotFoundError
+from chora_github.core.models import GetIssueRequest, ListIssuesRequest
+from chora_github.core.services import GithubToolService
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeGithub(issues=45, per_page=20) as server:
+        yield server
+
+
+@pytest.fixture
+def service(server):
+    return GithubToolService(
+        token="fake", base_url=server.base_url, cache_ttl=0, client_pacing=False
+    )
+
+
+class TestFakeGithub:
+    """Test the stand-in API."""
+
+    def test_pagination_links(self, server):
+        response = requests.get(f"{server.base_url}/repos/{REPO}/issues?state=all&page=2")
+
+        assert [issue["number"] for issue in response.json()] == list(range(21, 41))
+        assert 'page=3>; rel="next"' in response.headers["Link"]
+        assert int(response.headers["X-RateLimit-Remaining"]) < 5000
+
+    def test_unknown_repository(self, server):
+        response = requests.get(f"{server.base_url}/repos/octocat/Other")
+
+        assert response.status_code == 404
+
+    def test_service_paginates(self, service):
+        with track_usage() as usage:
+            response = service.list_issues(ListIssuesRequest(repo=REPO, state="all", limit=45))
+
+        assert response.total_count == 45
+        assert usage.endpoints["GET /repos/{owner}/{repo}/issues"] == 3
+
+    def test_not_found(self, service):
+        with pytest.raises(GithubNotFoundError):
+            service.get_issue(GetIssueRequest(repo=REPO, issue_number=999))
+
+    @pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.tool)
+    def test_every_tool_runs(self, service, scenario):
+        response = getattr(service, scenario.tool)(scenario.request(0))
+
+        assert response is not None
+
+
+def test_percentile():
+    values = [float(n) for n in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7
@@ -10,15 +10,19 @@ from unittest.mock import Mock, AsyncMock
 import pytest
 
 from chora_github.core.models import (
+    BatchIssuesResponse,
+    BatchItemResult,
     IssueData,
     PRData,
     FileData,
     ListIssuesResponse,
     CreateIssueResponse,
     GetIssueResponse,
+    GetIssuesResponse,
     UpdateIssueResponse,
     ListPRsResponse,
     GetPRResponse,
+    GetPRsResponse,
     GetFileContentsResponse,
     ListRepoFilesResponse,
 )
@@ -147,11 +151,27 @@ def mock_github_service(issue, pr, file_data):
     def get_pr_side_effect(request):
         from chora_github.core.exceptions import GithubNotFoundError
         if request.pr_number == 1:
-            return GetPRResponse(pr=pr)
+            return GetPRResponse(pull_request=pr)
         raise GithubNotFoundError(f"PR #{request.pr_number} not found")
 
     service.get_pr.side_effect = get_pr_side_effect
 
+    # Mock bulk reads
+    service.get_issues.return_value = GetIssuesResponse(issues=[issue], not_found=[999])
+    service.get_prs.return_value = GetPRsResponse(pull_requests=[pr], not_found=[])
+
+    # Mock batch writes
+    service.create_issues.return_value = BatchIssuesResponse(
+        results=[BatchItemResult(index=0, success=True, issue=issue)],
+        succeeded=1,
+        failed=0,
+    )
+
+    # Mock streaming iterators (a fresh iterator per call)
+    service.iter_issues.side_effect = lambda request: iter([issue])
+    service.iter_prs.side_effect = lambda request: iter([pr])
+    service.iter_repo_files.side_effect = lambda request: iter([file_data])
+
     # Mock get_file_contents
     service.get_file_contents.return_value = GetFileContentsResponse(
         content="# Hello World\n\nThis is a test file.",
@@ -192,6 +212,33 @@ def mcp_tool_executor(mock_github_service):
         yield tools
 
 
+class _ToolRecorder:
+    """Minimal FastMCP stand-in that records tools passed to register_tools."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, name):
+        def decorator(fn):
+            self.tools[name] = fn
+            return fn
+
+        return decorator
+
+
+@pytest.fixture
+def mcp_tools(mock_github_service):
+    """Registered MCP tool functions keyed by namespaced name, with mocked service."""
+    from unittest.mock import patch
+
+    from chora_github.interfaces.mcp.tools import register_tools
+
+    recorder = _ToolRecorder()
+    register_tools(recorder)
+    with patch('chora_github.interfaces.mcp.tools._get_service', return_value=mock_github_service):
+        yield recorder.tools
+
+
 @pytest.fixture
 def mcp_resource_executor(mock_github_service):
     """Create MCP resource executor with mocked service.
@@ -208,6 +255,82 @@ def mcp_resource_executor(mock_github_service):
         yield resources
 
 
+# ============================================================================
+# Tracing Fixtures
+# ============================================================================
+
+
+class _RecordedSpan:
+    """Span recorded by _SpanRecorder."""
+
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def update_name(self, name):
+        self.name = name
+
+
+class _SpanRecorder:
+    """Minimal OpenTelemetry tracer stand-in that records spans with their parent."""
+
+    def __init__(self):
+        from contextvars import ContextVar
+
+        self.spans = []
+        self._current = ContextVar("current_span", default=None)
+
+    def start_as_current_span(self, name, context=None, attributes=None):
+        from contextlib import contextmanager
+
+        @contextmanager
+        def current():
+            span = _RecordedSpan(name, attributes, self._current.get())
+            self.spans.append(span)
+            token = self._current.set(span)
+            try:
+                yield span
+            finally:
+                self._current.reset(token)
+
+        return current()
+
+    def names(self, parent=None):
+        """Names of the recorded spans under ``parent`` (all spans if None)."""
+        return [span.name for span in self.spans if parent is None or span.parent is parent]
+
+
+@pytest.fixture
+def tracer():
+    """Enable tracing into a span recorder for the duration of a test."""
+    from chora_github.core import tracing
+
+    recorder = _SpanRecorder()
+    tracing.enable(recorder)
+    yield recorder
+    tracing.disable()
+
+
+# ============================================================================
+# Profiling Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def profiles(tmp_path):
+    """Profile every call into a temporary directory for the duration of a test."""
+    from chora_github.core import profiling
+
+    directory = tmp_path / "profiles"
+    profiling.configure(profiling.ProfilingConfig(directory=str(directory), threshold_ms=0))
+    yield directory
+    profiling.configure(None)
+
+
 # ============================================================================
 # Helper Fixtures
 # ============================================================================
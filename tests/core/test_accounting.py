@@ -0,0 +1,192 @@
+"""Tests for upstream request accounting.
+
+The service runs against real PyGithub objects; only ``requests`` is
+patched, with canned GitHub payloads, so every upstream request PyGithub
+would make (including lazy completion) is counted.
+"""
+
+import json
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from chora_github.core import upstream
+from chora_github.core.accounting import (
+    current_usage,
+    record_cache_hit,
+    request_budget,
+    track_usage,
+)
+from chora_github.core.dispatch import ToolDispatcher
+from chora_github.core.models import (
+    GetIssueResponse,
+    GetPRRequest,
+    IssueData,
+    ListPRsRequest,
+    ToolCallRequest,
+)
+from chora_github.core.services import GithubToolService
+
+
+API = "https://api.github.com"
+
+
+def pull(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "state": "open",
+        "html_url": f"https://github.com/octocat/Hello-World/pull/{number}",
+        "url": f"{API}/repos/octocat/Hello-World/pulls/{number}",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-02T00:00:00Z",
+        "head": {"ref": "feature"},
+        "base": {"ref": "main"},
+        "body": "",
+        "user": {"login": "octocat"},
+        "mergeable": True,
+        "merged": False,
+    }
+
+
+ROUTES = {
+    "/repos/octocat/Hello-World": {
+        "full_name": "octocat/Hello-World",
+        "url": f"{API}/repos/octocat/Hello-World",
+    },
+    "/repos/octocat/Hello-World/pulls/1": pull(1),
+    "/repos/octocat/Hello-World/pulls": [pull(n) for n in range(1, 6)],
+}
+
+
+def fake_github(session, method, url, **kwargs):
+    """Answer PyGithub's requests from ROUTES."""
+    path = urlsplit(url).path
+    response = requests.Response()
+    response.url = url
+    response.headers["X-RateLimit-Remaining"] = "4999"
+    if path in ROUTES:
+        response.status_code = 200
+        response._content = json.dumps(ROUTES[path]).encode()
+    else:
+        response.status_code = 404
+        response._content = b'{"message": "Not Found"}'
+    return response
+
+
+@pytest.fixture
+def service():
+    with patch.object(requests.Session, "request", autospec=True, side_effect=fake_github):
+        yield GithubToolService(token="ghp_test_token")
+
+
+class TestUpstreamUsage:
+    """Test accounting scopes."""
+
+    def call(self, status=200, endpoint="/repos/{owner}/{repo}"):
+        return upstream.UpstreamCall(method="GET", endpoint=endpoint, status=status, duration=0.01)
+
+    def test_nested_scopes_add_up(self):
+        with track_usage() as outer:
+            upstream.notify(self.call())
+            with track_usage() as inner:
+                upstream.notify(self.call(status=304))
+                record_cache_hit()
+            assert current_usage() is outer
+
+        assert inner.requests == 1
+        assert inner.not_modified == 1
+        assert outer.requests == 2
+        assert outer.cache_hits == 1
+        assert outer.endpoints == {"GET /repos/{owner}/{repo}": 2}
+        assert current_usage() is None
+
+    def test_headers(self):
+        with track_usage() as usage:
+            upstream.notify(self.call())
+
+        assert usage.headers() == {
+            "X-Upstream-Requests": "1",
+            "X-Upstream-Not-Modified": "0",
+            "X-Upstream-Cache-Hits": "0",
+            "X-Upstream-Duration": "0.010s",
+        }
+
+    def test_request_budget_fails_when_exceeded(self):
+        with (
+            pytest.raises(AssertionError, match="budget of 1 upstream requests"),
+            request_budget(1, label="probe"),
+        ):
+            upstream.notify(self.call())
+            upstream.notify(self.call())
+
+
+class TestServiceRequestBudgets:
+    """Request budgets per tool (regression tests for N+1 patterns)."""
+
+    def test_get_pr(self, service):
+        with request_budget(2, label="get_pr") as usage:
+            response = service.get_pr(GetPRRequest(repo="octocat/Hello-World", pr_number=1))
+
+        assert response.pull_request.head_ref == "feature"
+        assert usage.endpoints == {
+            "GET /repos/{owner}/{repo}": 1,
+            "GET /repos/{owner}/{repo}/pulls/{number}": 1,
+        }
+
+    def test_list_prs_does_not_load_each_pr(self, service):
+        with request_budget(2, label="list_prs"):
+            response = service.list_prs(ListPRsRequest(repo="octocat/Hello-World"))
+
+        assert response.total_count == 5
+        assert {pr.mergeable for pr in response.pull_requests} == {True}
+
+    def test_cache_hits_are_counted(self, service):
+        issue = IssueData(
+            number=3, title="Cached", state="open", url="u", created_at="2025-01-01T00:00:00Z"
+        )
+        service._remember_issues("octocat/Hello-World", [issue], None)
+
+        with track_usage() as usage:
+            assert service._cached_issue("octocat/Hello-World", 3).title == "Cached"
+
+        assert usage.cache_hits == 1
+        assert usage.requests == 0
+
+
+class TestDispatcherDebug:
+    """Test the ToolCallResponse debug field."""
+
+    def test_debug_report_is_opt_in(self, service):
+        with ToolDispatcher(service) as dispatcher:
+            plain = dispatcher.call(
+                ToolCallRequest(
+                    tool="get_pr", parameters={"repo": "octocat/Hello-World", "pr_number": 1}
+                )
+            )
+            debug = dispatcher.call(
+                ToolCallRequest(
+                    tool="get_pr",
+                    parameters={"repo": "octocat/Hello-World", "pr_number": 1},
+                    debug=True,
+                )
+            )
+
+        assert plain.debug is None
+        assert debug.success
+        assert debug.debug.requests == 2
+        assert debug.debug.upstream_ms >= 0
+
+    def test_failed_calls_are_reported(self):
+        service = Mock()
+        service.get_issue.return_value = GetIssueResponse(
+            issue=IssueData(number=1, title="t", state="open", url="u", created_at="c")
+        )
+
+        with ToolDispatcher(service) as dispatcher:
+            response = dispatcher.call(ToolCallRequest(tool="nope", debug=True))
+
+        assert response.error_code == "UNKNOWN_TOOL"
+        assert response.debug.requests == 0
@@ -0,0 +1,296 @@
+"""Tests for batch write execution and the bulk write service methods."""
+
+import threading
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from github import GithubException
+
+from chora_github.core.batch import WriteThrottle, run_batch
+from chora_github.core.exceptions import GithubNotFoundError, GithubRateLimitError
+from chora_github.core.models import (
+    CreateIssueRequest,
+    CreateIssuesRequest,
+    IssueData,
+    UpdateIssueRequest,
+    UpdateIssuesRequest,
+)
+
+
+class FakeClock:
+    """Deterministic clock whose sleep() advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+
+
+def make_issue(number: int) -> IssueData:
+    return IssueData(
+        number=number,
+        title=f"Issue {number}",
+        state="open",
+        url=f"https://github.com/owner/repo/issues/{number}",
+        created_at="2025-11-01T10:00:00Z",
+    )
+
+
+def issue_payload(number: int, **overrides) -> dict:
+    payload = {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": "open",
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "created_at": "2025-11-01T10:00:00Z",
+        "updated_at": "2025-11-01T10:00:00Z",
+        "body": "Body",
+        "labels": [{"name": "triage"}],
+        "assignees": [{"login": "alice"}],
+        "user": {"login": "bot"},
+    }
+    payload.update(overrides)
+    return payload
+
+
+class TestWriteThrottle:
+    """Test write pacing and pausing."""
+
+    def test_spaces_consecutive_writes(self):
+        clock = FakeClock()
+        throttle = WriteThrottle(min_interval=1.0, clock=clock, sleep=clock.sleep)
+
+        throttle.acquire()
+        throttle.acquire()
+        throttle.acquire()
+
+        assert clock.sleeps == [1.0, 2.0]
+
+    def test_pause_delays_next_write(self):
+        clock = FakeClock()
+        throttle = WriteThrottle(min_interval=0.0, clock=clock, sleep=clock.sleep)
+
+        throttle.pause(30)
+        throttle.acquire()
+
+        assert clock.sleeps == [30]
+
+
+class TestRunBatch:
+    """Test bounded concurrent execution with per-item results."""
+
+    def no_wait(self):
+        return WriteThrottle(min_interval=0.0)
+
+    def test_results_in_input_order(self):
+        results = run_batch([3, 1, 2], make_issue, max_concurrency=3, throttle=self.no_wait())
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.issue.number for r in results] == [3, 1, 2]
+        assert all(r.success for r in results)
+
+    def test_failure_does_not_abort_batch(self):
+        def worker(number):
+            if number == 2:
+                raise GithubNotFoundError("missing")
+            if number == 3:
+                raise RuntimeError("boom")
+            return make_issue(number)
+
+        results = run_batch([1, 2, 3], worker, max_concurrency=2, throttle=self.no_wait())
+
+        assert results[0].success
+        assert results[1].error_code == "NOT_FOUND"
+        assert results[1].error == "missing"
+        assert results[2].error_code == "UNKNOWN_ERROR"
+
+    def test_concurrency_is_bounded(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def worker(number):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            release.wait(0.05)
+            with lock:
+                active -= 1
+            return make_issue(number)
+
+        run_batch(list(range(1, 9)), worker, max_concurrency=2, throttle=self.no_wait())
+
+        assert peak <= 2
+
+    def test_rate_limited_item_pauses_and_retries(self):
+        throttle = WriteThrottle(min_interval=0.0, sleep=lambda _: None)
+        calls = []
+
+        def worker(number):
+            calls.append(number)
+            if len(calls) == 1:
+                raise GithubRateLimitError("secondary", retry_after_seconds=5)
+            return make_issue(number)
+
+        with patch.object(throttle, "pause", wraps=throttle.pause) as pause:
+            results = run_batch([1], worker, max_concurrency=1, throttle=throttle)
+
+        pause.assert_called_once_with(5)
+        assert results[0].success
+        assert calls == [1, 1]
+
+    def test_rate_limited_item_gives_up_after_max_attempts(self):
+        throttle = WriteThrottle(min_interval=0.0, sleep=lambda _: None)
+
+        def worker(number):
+            raise GithubRateLimitError("secondary", retry_after_seconds=1)
+
+        results = run_batch([1], worker, max_concurrency=1, throttle=throttle, max_attempts=2)
+
+        assert not results[0].success
+        assert results[0].error_code == "RATE_LIMIT_EXCEEDED"
+
+
+class TestServiceBatchWrites:
+    """Test create_issues/update_issues on GithubToolService."""
+
+    @pytest.fixture
+    def mock_github(self):
+        with patch("chora_github.core.services.Github") as mock:
+            yield mock
+
+    @pytest.fixture
+    def service(self, mock_github):
+        from chora_github.core.services import GithubToolService
+
+        service = GithubToolService(token="ghp_test_token")
+        service.write_throttle = WriteThrottle(min_interval=0.0)
+        return service
+
+    def test_create_issues_posts_without_get_repo(self, service, mock_github):
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.side_effect = [
+            ({}, issue_payload(10)),
+            ({}, issue_payload(11)),
+        ]
+        request = CreateIssuesRequest(
+            items=[
+                CreateIssueRequest(repo="owner/repo", title="A", body="a", labels=["triage"]),
+                CreateIssueRequest(repo="owner/repo", title="B", body="b"),
+            ],
+            max_concurrency=1,
+        )
+
+        response = service.create_issues(request)
+
+        assert response.succeeded == 2
+        assert response.failed == 0
+        assert response.results[0].issue.labels == ["triage"]
+        assert response.results[0].issue.author == "bot"
+        mock_github.return_value.get_repo.assert_not_called()
+        verb, url = requester.requestJsonAndCheck.call_args_list[0].args
+        assert (verb, url) == ("POST", "/repos/owner/repo/issues")
+        assert requester.requestJsonAndCheck.call_args_list[0].kwargs["input"] == {
+            "title": "A",
+            "body": "a",
+            "labels": ["triage"],
+        }
+
+    def test_update_issues_reports_partial_failure(self, service, mock_github):
+        requester = mock_github.return_value.requester
+
+        def respond(verb, url, input):
+            if url.endswith("/2"):
+                raise GithubException(404, {"message": "Not Found"}, {})
+            return {}, issue_payload(int(url.rsplit("/", 1)[1]), state="closed")
+
+        requester.requestJsonAndCheck.side_effect = respond
+        request = UpdateIssuesRequest(
+            items=[
+                UpdateIssueRequest(repo="owner/repo", issue_number=1, state="closed"),
+                UpdateIssueRequest(repo="owner/repo", issue_number=2, state="closed"),
+            ],
+            max_concurrency=1,
+        )
+
+        response = service.update_issues(request)
+
+        assert response.succeeded == 1
+        assert response.failed == 1
+        assert response.results[0].issue.state == "closed"
+        assert response.results[1].error_code == "NOT_FOUND"
+        first_call = requester.requestJsonAndCheck.call_args_list[0]
+        assert first_call.args == ("PATCH", "/repos/owner/repo/issues/1")
+        assert first_call.kwargs["input"] == {"state": "closed"}
+
+    def test_secondary_rate_limit_maps_to_rate_limit_error(self, service, mock_github):
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.side_effect = GithubException(
+            403,
+            {"message": "You have exceeded a secondary rate limit"},
+            {"retry-after": "42"},
+        )
+
+        with pytest.raises(GithubRateLimitError) as exc_info:
+            service._post_issue(CreateIssueRequest(repo="owner/repo", title="A", body=""))
+
+        assert exc_info.value.details["retry_after_seconds"] == 42
+
+    def test_retry_after_http_date(self, service, mock_github):
+        retry_at = datetime.now(UTC) + timedelta(seconds=120)
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.side_effect = GithubException(
+            403,
+            {"message": "You have exceeded a secondary rate limit"},
+            {"retry-after": format_datetime(retry_at, usegmt=True)},
+        )
+
+        with pytest.raises(GithubRateLimitError) as exc_info:
+            service._post_issue(CreateIssueRequest(repo="owner/repo", title="A", body=""))
+
+        assert 115 <= exc_info.value.details["retry_after_seconds"] <= 120
+
+    def test_unparseable_retry_after_is_ignored(self, service, mock_github):
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.side_effect = GithubException(
+            403, {"message": "You have exceeded a secondary rate limit"}, {"retry-after": "soon"}
+        )
+
+        with pytest.raises(GithubRateLimitError) as exc_info:
+            service._post_issue(CreateIssueRequest(repo="owner/repo", title="A", body=""))
+
+        assert "retry_after_seconds" not in exc_info.value.details
+
+    def test_writes_are_paced_only_by_write_throttle(self, mock_github):
+        from chora_github.core.services import GithubToolService
+
+        service = GithubToolService(token="ghp_test_token")
+
+        assert mock_github.call_args.kwargs["seconds_between_writes"] is None
+        assert service.write_throttle.min_interval == 1.0
+
+    def test_single_writes_wait_for_write_throttle(self, service, mock_github):
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = ({}, issue_payload(1, state="closed"))
+        service.write_throttle = Mock(wraps=service.write_throttle)
+
+        service.update_issue(UpdateIssueRequest(repo="owner/repo", issue_number=1, state="closed"))
+        service.update_issues(
+            UpdateIssuesRequest(
+                items=[UpdateIssueRequest(repo="owner/repo", issue_number=2, state="closed")]
+            )
+        )
+
+        # Once for the single update, once for the batch item (not twice)
+        assert service.write_throttle.acquire.call_count == 2
@@ -0,0 +1,119 @@
+"""Tests for response budgets."""
+
+import pytest
+
+from chora_github.core.budget import (
+    CHARS_PER_TOKEN,
+    MIN_BUDGET_BYTES,
+    budget_bytes,
+    fit_to_budget,
+    json_size,
+    truncate_text,
+)
+from chora_github.core.models import (
+    GetIssueResponse,
+    GetPRsResponse,
+    IssueData,
+    ListIssuesResponse,
+)
+
+
+def make_issue(number: int, body_length: int) -> IssueData:
+    return IssueData(
+        number=number,
+        title=f"Issue {number}",
+        state="open",
+        url=f"https://github.com/octocat/Hello-World/issues/{number}",
+        created_at="2025-01-01T00:00:00Z",
+        body="x" * body_length,
+        labels=["bug"],
+        assignees=["octocat"],
+        author="octocat",
+    )
+
+
+@pytest.fixture
+def large_listing() -> ListIssuesResponse:
+    issues = [make_issue(n, 20_000 if n % 2 else 40) for n in range(1, 21)]
+    return ListIssuesResponse(issues=issues, total_count=len(issues))
+
+
+class TestBudgetBytes:
+    """Test resolution of byte and token limits."""
+
+    def test_unset(self):
+        assert budget_bytes() is None
+
+    def test_tighter_limit_wins(self):
+        assert budget_bytes(max_bytes=10_000, max_tokens=1_000) == 1_000 * CHARS_PER_TOKEN
+        assert budget_bytes(max_bytes=1_000, max_tokens=1_000) == 1_000
+
+    def test_too_small(self):
+        with pytest.raises(ValueError, match="too small"):
+            budget_bytes(max_bytes=MIN_BUDGET_BYTES - 1)
+
+
+class TestFitToBudget:
+    """Test shrinking responses to a byte budget."""
+
+    def test_fitting_response_is_unchanged(self, large_listing):
+        result = fit_to_budget(large_listing, 10_000_000)
+
+        assert result["issues"] == large_listing.model_dump(mode="json")["issues"]
+        assert result["budget"]["truncated"] == []
+        assert result["budget"]["returned_bytes"] == json_size(result)
+
+    def test_truncates_long_bodies_with_marker(self, large_listing):
+        result = fit_to_budget(large_listing, 50_000)
+        report = result["budget"]
+
+        assert json_size(result) <= 50_000
+        assert report["returned_bytes"] == json_size(result)
+        assert report["dropped_fields"] == []
+        assert [cut["number"] for cut in report["truncated"]] == list(range(1, 21, 2))
+        assert all(cut["original_length"] == 20_000 for cut in report["truncated"])
+        first = result["issues"][0]["body"]
+        assert first.endswith("[truncated, 20000 chars]")
+        # Short bodies are kept intact
+        assert result["issues"][1]["body"] == "x" * 40
+
+    def test_drops_lowest_priority_fields(self, large_listing):
+        result = fit_to_budget(large_listing, 2_000)
+        report = result["budget"]
+
+        assert json_size(result) <= 2_000
+        assert report["dropped_fields"][:2] == ["body", "updated_at"]
+        assert report["truncated"] == []
+        assert report["omitted_items"] == 0
+        assert {"number", "title", "state"} <= result["issues"][0].keys()
+        assert "body" not in result["issues"][0]
+
+    def test_omits_trailing_items(self, large_listing):
+        result = fit_to_budget(large_listing, 600)
+        report = result["budget"]
+
+        assert json_size(result) <= 600
+        assert report["omitted_items"] > 0
+        assert len(result["issues"]) == 20 - report["omitted_items"]
+        assert result["issues"][0]["number"] == 1
+        assert result["total_count"] == 20
+
+    def test_single_item(self):
+        response = GetIssueResponse(issue=make_issue(7, 50_000))
+
+        result = fit_to_budget(response, 1_000)
+
+        assert json_size(result) <= 1_000
+        assert result["issue"]["body"].endswith("[truncated, 50000 chars]")
+        assert result["budget"]["truncated"][0]["number"] == 7
+
+    def test_envelope_fields_are_kept(self):
+        response = GetPRsResponse(pull_requests=[], not_found=[5, 6])
+
+        result = fit_to_budget(response, 1_000)
+
+        assert result["not_found"] == [5, 6]
+
+
+def test_truncate_text():
+    assert truncate_text("abcdef", 2) == "ab… [truncated, 6 chars]"
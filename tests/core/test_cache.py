@@ -0,0 +1,66 @@
+"""Tests for the in-process TTL cache."""
+
+from chora_github.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test expiry, eviction and statistics."""
+
+    def test_get_returns_fresh_entry(self):
+        cache = TTLCache(ttl=10, clock=FakeClock())
+        cache.put("a", 1, etag='"x"')
+
+        entry = cache.get("a")
+
+        assert entry.value == 1
+        assert entry.etag == '"x"'
+        assert cache.hits == 1
+
+    def test_entry_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 10.0
+
+        assert cache.get("a") is None
+        assert cache.misses == 1
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(ttl=10, max_entries=2, clock=FakeClock())
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a").value == 1
+        assert cache.get("c").value == 3
+
+    def test_zero_ttl_disables_cache(self):
+        cache = TTLCache(ttl=0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_and_clear(self):
+        cache = TTLCache(ttl=10, clock=FakeClock())
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 0 and cache.misses == 0
@@ -0,0 +1,242 @@
+"""Tests for recording and replaying upstream traffic cassettes.
+
+Recording runs real PyGithub objects against canned GitHub payloads
+(``requests`` patched, as in test_accounting); replay runs with every
+network request failing, so anything not answered from the cassette
+shows up.
+"""
+
+import json
+from dataclasses import asdict
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from chora_github.core import upstream
+from chora_github.core.cassettes import (
+    ORIGIN,
+    Cassette,
+    CassetteMissError,
+    Interaction,
+    Player,
+    RecordedCall,
+    Recorder,
+    recorder_from_env,
+    replay_calls,
+    sanitize,
+)
+from chora_github.core.models import GetPRRequest, ListPRsRequest
+from chora_github.core.services import GithubToolService
+
+
+API = "https://api.github.com"
+TOKEN = "ghp_" + "a1B2" * 9
+
+
+def pull(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "state": "open",
+        "html_url": f"https://github.com/octocat/Hello-World/pull/{number}",
+        "url": f"{API}/repos/octocat/Hello-World/pulls/{number}",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-02T00:00:00Z",
+        "head": {"ref": "feature"},
+        "base": {"ref": "main"},
+        "body": f"Deployed with {TOKEN}",
+        "user": {"login": "octocat"},
+    }
+
+
+def fake_github(session, method, url, **kwargs):
+    """Answer PyGithub's requests; pulls are paginated two per page."""
+    parts = urlsplit(url)
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.headers.update({"X-RateLimit-Remaining": "4999", "Set-Cookie": "session=secret"})
+    if parts.path == "/repos/octocat/Hello-World":
+        payload = {"full_name": "octocat/Hello-World", "url": f"{API}/repos/octocat/Hello-World"}
+    elif parts.path == "/repos/octocat/Hello-World/pulls/1":
+        payload = pull(1)
+    elif parts.path == "/repos/octocat/Hello-World/pulls":
+        page = 2 if "page=2" in parts.query else 1
+        payload = [pull(n) for n in ((1, 2) if page == 1 else (3,))]
+        if page == 1:
+            next_url = f"{API}/repos/octocat/Hello-World/pulls?state=open&page=2"
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
+    else:
+        response.status_code = 404
+        payload = {"message": "Not Found"}
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def offline(session, method, url, **kwargs):
+    raise AssertionError(f"network access during replay: {method} {url}")
+
+
+@pytest.fixture
+def recorded():
+    """A cassette of one list_prs and one get_pr call."""
+    with patch.object(requests.Session, "request", autospec=True, side_effect=fake_github):
+        service = GithubToolService(token=TOKEN, client_pacing=False)
+        with Recorder() as recorder:
+            listed = service.list_prs(ListPRsRequest(repo="octocat/Hello-World", limit=10))
+            service.get_pr(GetPRRequest(repo="octocat/Hello-World", pr_number=1))
+    assert listed.total_count == 3
+    return recorder.cassette
+
+
+class TestSanitize:
+    """Test secret redaction."""
+
+    def test_tokens_and_query_secrets(self):
+        text = f"token {TOKEN} /login?client_secret=abc&code=xyz&page=2"
+
+        assert sanitize(text) == (
+            "token REDACTED /login?client_secret=REDACTED&code=REDACTED&page=2"
+        )
+
+    def test_fine_grained_tokens(self):
+        assert sanitize("github_pat_" + "x_Y1" * 10) == "REDACTED"
+
+
+class TestRecorder:
+    """Test recording."""
+
+    def test_records_calls_and_interactions(self, recorded):
+        assert [call.tool for call in recorded.calls] == ["list_prs", "get_pr"]
+        assert recorded.calls[1].parameters == {"repo": "octocat/Hello-World", "pr_number": 1}
+        assert [(i.method, i.url) for i in recorded.interactions] == [
+            ("GET", "/repos/octocat/Hello-World"),
+            ("GET", "/repos/octocat/Hello-World/pulls?state=open"),
+            ("GET", "/repos/octocat/Hello-World/pulls?page=2&state=open"),
+            ("GET", "/repos/octocat/Hello-World"),
+            ("GET", "/repos/octocat/Hello-World/pulls/1"),
+        ]
+        offsets = [i.offset for i in recorded.interactions]
+        assert offsets == sorted(offsets)
+
+    def test_is_sanitized(self, recorded):
+        page = recorded.interactions[1]
+
+        assert page.headers == {
+            "x-ratelimit-remaining": "4999",
+            "link": f'<{ORIGIN}/repos/octocat/Hello-World/pulls?state=open&page=2>; rel="next"',
+        }
+        assert TOKEN not in json.dumps([asdict(i) for i in recorded.interactions])
+        assert "Deployed with REDACTED" in page.body
+        assert f'"url": "{ORIGIN}/repos/' in page.body
+
+    def test_redact_hook(self):
+        with patch.object(requests.Session, "request", autospec=True, side_effect=fake_github):
+            service = GithubToolService(token=TOKEN, client_pacing=False)
+            with Recorder(redact=lambda text: text.replace("Deployed", "[private]")) as recorder:
+                service.get_pr(GetPRRequest(repo="octocat/Hello-World", pr_number=1))
+
+        assert "[private] with REDACTED" in recorder.cassette.interactions[-1].body
+
+    def test_stop_restores_interceptor(self):
+        with Recorder():
+            pass
+
+        assert upstream.set_interceptor(None) is None
+
+    @pytest.mark.parametrize("name", ["traffic.json", "traffic.json.gz"])
+    def test_save_and_load(self, recorded, tmp_path, name):
+        recorded.save(tmp_path / name)
+
+        loaded = Cassette.load(tmp_path / name)
+
+        assert loaded == recorded
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.json"
+        path.write_text('{"version": 99}')
+
+        with pytest.raises(ValueError, match="not a version 1 cassette"):
+            Cassette.load(path)
+
+    def test_recorder_from_env_saves_on_close(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GITHUB_CASSETTE_RECORD", str(tmp_path / "env.json"))
+        recorder = recorder_from_env()
+        recorder.close()
+
+        assert Cassette.load(tmp_path / "env.json").calls == []
+
+    def test_recorder_from_env_is_opt_in(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_CASSETTE_RECORD", raising=False)
+
+        assert recorder_from_env() is None
+
+
+class TestPlayer:
+    """Test replay without network access."""
+
+    def test_replays_offline_on_another_host(self, recorded):
+        with patch.object(requests.Session, "request", autospec=True, side_effect=offline):
+            service = GithubToolService(
+                token="other", base_url="https://ghe.example.com", client_pacing=False
+            )
+            with Player(recorded, speed=0):
+                listed = service.list_prs(ListPRsRequest(repo="octocat/Hello-World", limit=10))
+
+        # Page 2 was requested from the replaying host (the recorded Link
+        # header pointed to api.github.com, which PyGithub would refuse)
+        assert [pr.number for pr in listed.pull_requests] == [1, 2, 3]
+
+    def test_repeated_requests_get_recorded_responses_in_order(self):
+        first, second = (Interaction(n, 0.0, "GET", "/a", None, 200, {}, str(n)) for n in (1, 2))
+        player = Player(Cassette(interactions=[first, second]))
+
+        bodies = [player.match("GET", "/a").body for _ in range(3)]
+
+        assert bodies == ["1", "2", "2"]
+
+    def test_prefers_matching_request_body(self):
+        a = Interaction(0, 0.0, "POST", "/graphql", '{"q": 1}', 200, {}, "a")
+        b = Interaction(1, 0.0, "POST", "/graphql", '{"q": 2}', 200, {}, "b")
+        player = Player(Cassette(interactions=[a, b]))
+
+        assert player.match("POST", "/graphql", '{"q": 2}').body == "b"
+        assert player.match("POST", "/graphql", '{"q": 3}').body == "a"
+
+    def test_miss(self):
+        with pytest.raises(CassetteMissError, match="GET /missing"):
+            Player(Cassette()).match("GET", "/missing")
+
+    def test_speed(self):
+        assert Player(Cassette(), speed=4).scaled(2.0) == 0.5
+        assert Player(Cassette(), speed=0).scaled(2.0) == 0.0
+        with pytest.raises(ValueError):
+            Player(Cassette(), speed=-1)
+
+
+class TestReplayCalls:
+    """Test workload replay."""
+
+    def test_reissues_recorded_calls(self, recorded):
+        with patch.object(requests.Session, "request", autospec=True, side_effect=offline):
+            service = GithubToolService(token="other", client_pacing=False)
+            with Player(recorded, speed=0):
+                replayed = replay_calls(service, recorded, speed=0, max_workers=2)
+
+        assert [item.call.tool for item in replayed] == ["list_prs", "get_pr"]
+        assert all(item.response.success for item in replayed)
+        assert replayed[1].response.result["pull_request"]["head_ref"] == "feature"
+        assert all(item.seconds >= 0 for item in replayed)
+
+    def test_unrecorded_requests_fail_the_call(self):
+        cassette = Cassette(calls=[RecordedCall(0.0, "get_pr", {"repo": "o/r", "pr_number": 1})])
+
+        with patch.object(requests.Session, "request", autospec=True, side_effect=offline):
+            service = GithubToolService(token="other", client_pacing=False)
+            with Player(cassette, speed=0):
+                (replayed,) = replay_calls(service, cassette, speed=0)
+
+        assert not replayed.response.success
+        assert "CassetteMissError" in replayed.response.error
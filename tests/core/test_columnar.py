@@ -0,0 +1,98 @@
+"""Tests for the columnar list encoding."""
+
+import pytest
+
+from chora_github.core.columnar import (
+    decode_columnar,
+    decode_list_response,
+    encode_columnar,
+    encode_list_response,
+)
+from chora_github.core.models import (
+    FileData,
+    ListIssuesRequest,
+    ListIssuesResponse,
+    ListRepoFilesResponse,
+)
+
+
+@pytest.fixture
+def issues_response(multiple_issues) -> ListIssuesResponse:
+    return ListIssuesResponse(issues=multiple_issues, total_count=len(multiple_issues))
+
+
+class TestEncodeColumnar:
+    """Test struct-of-arrays encoding with dictionaries."""
+
+    def test_columns_and_dictionaries(self):
+        rows = [
+            {"number": 1, "labels": ["bug", "p1"], "author": "alice", "assignees": ["bob"]},
+            {"number": 2, "labels": ["bug"], "author": "bob", "assignees": []},
+            {"number": 3, "labels": [], "author": None, "assignees": ["alice"]},
+        ]
+
+        table = encode_columnar(rows)
+
+        assert table.count == 3
+        assert table.columns["number"] == [1, 2, 3]
+        assert table.dictionaries["labels"] == ["bug", "p1"]
+        assert table.columns["labels"] == [[0, 1], [0], []]
+        # author and assignees share the logins dictionary
+        assert table.dictionaries["logins"] == ["alice", "bob"]
+        assert table.columns["author"] == [0, 1, None]
+        assert table.columns["assignees"] == [[1], [], [0]]
+
+    def test_round_trip(self):
+        rows = [{"number": 1, "labels": ["x"], "author": "a"}, {"number": 2, "labels": [], "author": "a"}]
+
+        assert decode_columnar(encode_columnar(rows)) == rows
+
+    def test_empty(self):
+        table = encode_columnar([])
+
+        assert table.count == 0
+        assert decode_columnar(table) == []
+
+
+class TestListResponses:
+    """Test encoding of complete list responses."""
+
+    def test_issues_round_trip(self, issues_response):
+        payload = encode_list_response(issues_response)
+
+        assert payload["format"] == "columnar"
+        assert payload["total_count"] == 5
+        assert payload["issues"]["count"] == 5
+        assert decode_list_response(payload) == issues_response.model_dump()
+
+    def test_decode_from_dict(self, issues_response):
+        payload = encode_list_response(issues_response)
+
+        rows = decode_columnar(payload["issues"])
+
+        assert rows[0]["labels"] == ["bug"]
+        assert rows[4]["labels"] == []
+
+    def test_files_type_is_dictionary_encoded(self):
+        files = [
+            FileData(name="README.md", path="README.md", type="file", size=10),
+            FileData(name="src", path="src", type="dir", size=0),
+            FileData(name="setup.py", path="setup.py", type="file", size=5),
+        ]
+        response = ListRepoFilesResponse(files=files, total_count=3)
+
+        payload = encode_list_response(response)
+
+        assert payload["files"]["dictionaries"]["types"] == ["file", "dir"]
+        assert payload["files"]["columns"]["type"] == [0, 1, 0]
+        assert decode_list_response(payload) == response.model_dump()
+
+    def test_row_payload_passes_through(self, issues_response):
+        payload = issues_response.model_dump()
+
+        assert decode_list_response(payload) is payload
+
+    def test_request_format_validation(self):
+        assert ListIssuesRequest(repo="o/r", format="columnar").format == "columnar"
+        with pytest.raises(ValueError):
+            ListIssuesRequest(repo="o/r", format="csv")
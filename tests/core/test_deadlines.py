@@ -0,0 +1,333 @@
+"""Tests for call deadlines.
+
+Service tests run real PyGithub objects against a slow, endlessly
+paginated issue listing with ``requests`` patched; the fake honours the
+socket timeout it is given, as a hung connection would.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from urllib3 import HTTPResponse
+
+from chora_github.core import deadlines
+from chora_github.core.batch import WriteThrottle
+from chora_github.core.dispatch import ToolDispatcher
+from chora_github.core.exceptions import GithubTimeoutError
+from chora_github.core.models import (
+    CreateIssueRequest,
+    CreateIssuesRequest,
+    ListIssuesRequest,
+    ToolCallRequest,
+)
+from chora_github.core.services import DEFAULT_REQUEST_TIMEOUT, GithubToolService
+from chora_github.core.upstream import DeadlineRetry
+
+
+API = "https://api.github.com"
+REPO = "octocat/Hello-World"
+LISTING = "GET /repos/{owner}/{repo}/issues"
+
+
+def issue(number):
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": "open",
+        "html_url": f"https://github.com/{REPO}/issues/{number}",
+        "url": f"{API}/repos/{REPO}/issues/{number}",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-02T00:00:00Z",
+        "body": "",
+        "user": {"login": "octocat"},
+        "labels": [],
+        "assignees": [],
+    }
+
+
+class SlowGithub:
+    """Answers every request after ``latency`` seconds; issues never run out.
+
+    A POST creates an issue.
+
+    A request whose timeout is shorter than the latency times out, as do
+    all requests when ``hung``.
+    """
+
+    def __init__(self, latency=0.0, hung=False):
+        self.latency = latency
+        self.hung = hung
+        self.requests = []
+
+    def __call__(self, session, method, url, **kwargs):
+        self.requests.append((url, kwargs["timeout"]))
+        if self.hung:
+            raise requests.ReadTimeout("Read timed out.")
+        if kwargs["timeout"] < self.latency:
+            time.sleep(kwargs["timeout"])
+            raise requests.ReadTimeout("Read timed out.")
+        time.sleep(self.latency)
+        parts = urlsplit(url)
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        if method == "POST":
+            response.status_code = 201
+            body = issue(len(self.requests))
+        elif parts.path.endswith("/issues"):
+            page = int(parse_qs(parts.query).get("page", ["1"])[0])
+            body = [issue(2 * page - 1), issue(2 * page)]
+            response.headers["Link"] = f'<{API}/repos/{REPO}/issues?page={page + 1}>; rel="next"'
+        else:
+            body = {"full_name": REPO, "url": f"{API}/repos/{REPO}"}
+        response._content = json.dumps(body).encode()
+        return response
+
+
+@pytest.fixture
+def slow_github():
+    fake = SlowGithub(latency=0.05)
+    with patch.object(requests.Session, "request", autospec=True, side_effect=fake):
+        yield fake
+
+
+@pytest.fixture
+def service(slow_github):
+    return GithubToolService(token="t", client_pacing=False)
+
+
+def listing(limit=100):
+    return ListIssuesRequest(repo=REPO, state="open", limit=limit)
+
+
+# ============================================================================
+# Deadline Scopes
+# ============================================================================
+
+
+class TestDeadlineScopes:
+    """Test opening and nesting deadlines."""
+
+    def test_inner_deadline_can_only_shorten(self):
+        with deadlines.deadline(10, "outer") as outer:
+            with deadlines.deadline(60, "inner") as inner:
+                assert inner is outer
+            with deadlines.deadline(1, "inner") as inner:
+                assert deadlines.current() is inner
+            with deadlines.deadline(None) as inner:
+                assert inner is outer
+            assert deadlines.current() is outer
+        assert deadlines.current() is None
+
+    def test_check_reports_progress(self):
+        with deadlines.deadline(0.01, "list_issues") as scope:
+            scope.record_request()
+            time.sleep(0.02)
+            with pytest.raises(GithubTimeoutError) as exc_info:
+                deadlines.check(LISTING)
+
+        error = exc_info.value
+        assert error.code == "TIMEOUT"
+        assert error.message == "'list_issues' exceeded its 0.01s deadline after 1 GitHub request"
+        assert error.details["upstream_requests"] == 1
+        assert error.details["pending_request"] == LISTING
+        assert error.details["elapsed_seconds"] >= 0.01
+
+    def test_check_with_wait(self):
+        with deadlines.deadline(1):
+            deadlines.check(wait=0.5)
+            with pytest.raises(GithubTimeoutError):
+                deadlines.check(wait=5)
+
+    def test_tool_timeout_from_env(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOOL_TIMEOUT", raising=False)
+        assert deadlines.tool_timeout() == deadlines.DEFAULT_TOOL_TIMEOUT
+        monkeypatch.setenv("GITHUB_TOOL_TIMEOUT", "0")
+        assert deadlines.tool_timeout() is None
+
+
+# ============================================================================
+# Upstream Requests
+# ============================================================================
+
+
+class TestUpstreamDeadline:
+    """Test deadlines applied to the service's GitHub requests."""
+
+    def test_unbounded_requests_use_client_timeout(self, service, slow_github):
+        service.list_issues(listing(limit=2))
+
+        assert [timeout for _, timeout in slow_github.requests] == [DEFAULT_REQUEST_TIMEOUT] * 2
+
+    def test_request_timeout_is_shortened(self, service, slow_github):
+        with deadlines.deadline(5):
+            service.list_issues(listing(limit=2))
+
+        assert all(timeout <= 5 for _, timeout in slow_github.requests)
+
+    def test_pagination_stops_at_deadline(self, service, slow_github):
+        start = time.monotonic()
+        with deadlines.deadline(0.18, "list_issues"), pytest.raises(GithubTimeoutError) as e:
+            list(service.iter_issues(listing()))
+
+        assert time.monotonic() - start < 0.3
+        # Repository and two pages, then the third page times out
+        assert e.value.details["upstream_requests"] == 3
+        assert e.value.details["pending_request"] == f"{LISTING} page 3"
+        assert e.value.details["next_cursor"] == "offset:4"
+        requests_made = len(slow_github.requests)
+        time.sleep(0.1)
+        assert len(slow_github.requests) == requests_made
+
+    def test_no_request_once_expired(self, service, slow_github):
+        with deadlines.deadline(0.001), pytest.raises(GithubTimeoutError):
+            time.sleep(0.01)
+            service.list_issues(listing())
+
+        assert slow_github.requests == []
+
+    def test_hung_request_without_deadline(self, slow_github):
+        slow_github.hung = True
+        service = GithubToolService(token="t", client_pacing=False, timeout=1)
+
+        with pytest.raises(GithubTimeoutError) as e:
+            service.list_issues(listing())
+
+        assert e.value.message == "GitHub did not respond within 1s"
+        assert e.value.details["operation"] == "GET /repos/{owner}/{repo}"
+
+
+# ============================================================================
+# Waits
+# ============================================================================
+
+
+class TestWaits:
+    """Test that retries and write throttling do not outlast the deadline."""
+
+    def test_retry_after_beyond_deadline(self):
+        response = HTTPResponse(status=503, headers={"Retry-After": "60"})
+        retry = DeadlineRetry()
+
+        with deadlines.deadline(1), pytest.raises(GithubTimeoutError):
+            retry.sleep(response)
+
+    def test_no_retry_once_expired(self):
+        retry = DeadlineRetry()
+
+        with deadlines.deadline(0.001), pytest.raises(GithubTimeoutError) as e:
+            time.sleep(0.01)
+            retry.increment("GET", "/repos/o/r/issues?page=2")
+
+        assert e.value.details["pending_request"] == f"{LISTING} page 2"
+
+    def test_write_throttle_pause_beyond_deadline(self):
+        throttle = WriteThrottle()
+        throttle.pause(60)
+
+        with deadlines.deadline(1), pytest.raises(GithubTimeoutError):
+            throttle.acquire()
+
+
+# ============================================================================
+# Dispatcher
+# ============================================================================
+
+
+class TestDispatcherDeadline:
+    """Test that a call's timeout bounds its GitHub requests."""
+
+    def test_call_timeout(self, service):
+        call = ToolCallRequest(
+            tool="list_issues", parameters={"repo": REPO, "limit": 100}, timeout=0.08
+        )
+
+        with ToolDispatcher(service) as dispatcher:
+            response = dispatcher.call(call)
+
+        # The repository is fetched, the first page is not
+        assert response.error_code == "TIMEOUT"
+        assert "'list_issues' exceeded its 0.08s deadline after 1 GitHub request" in response.error
+
+    def test_timed_out_call_stops_in_background(self, service, slow_github):
+        call = ToolCallRequest(tool="list_issues", parameters={"repo": REPO, "limit": 100})
+
+        with ToolDispatcher(service) as dispatcher:
+            response = asyncio.run(dispatcher.call_async(call, timeout=0.12))
+            time.sleep(0.1)
+            requests_made = len(slow_github.requests)
+            time.sleep(0.1)
+
+        assert response.warning.startswith("Partial result:")
+        assert len(slow_github.requests) == requests_made
+
+
+# ============================================================================
+# Partial Results
+# ============================================================================
+
+
+class TestPartialResults:
+    """Test that work completed before the deadline is returned."""
+
+    def test_listing_returns_fetched_pages(self, service):
+        with deadlines.deadline(0.18, "list_issues"):
+            response = service.list_issues(listing())
+
+        assert [issue.number for issue in response.issues] == [1, 2, 3, 4]
+        assert response.total_count == 4
+        assert response.partial.next_cursor == "offset:4"
+        assert "'list_issues' exceeded its 0.18s deadline" in response.partial.reason
+
+    def test_listing_continues_from_cursor(self, service, slow_github):
+        # Match the fake's page size
+        service.client.per_page = 2
+        request = ListIssuesRequest(repo=REPO, state="open", limit=3, cursor="offset:4")
+
+        response = service.list_issues(request)
+
+        assert [issue.number for issue in response.issues] == [5, 6, 7]
+        assert response.partial is None
+        # Pages 1 and 2 are skipped
+        pages = [parse_qs(urlsplit(url).query).get("page") for url, _ in slow_github.requests]
+        assert pages == [None, ["3"], ["4"]]
+
+    def test_complete_listing_is_not_partial(self, service):
+        with deadlines.deadline(5):
+            assert service.list_issues(listing(limit=2)).partial is None
+
+    def test_dispatcher_warns_with_cursor(self, service):
+        call = ToolCallRequest(
+            tool="list_issues", parameters={"repo": REPO, "limit": 100}, timeout=0.18
+        )
+
+        with ToolDispatcher(service) as dispatcher:
+            response = dispatcher.call(call)
+
+        assert response.success is True
+        assert len(response.result["issues"]) == 4
+        assert response.result["partial"]["next_cursor"] == "offset:4"
+        assert response.warning == (
+            "Partial result: 'list_issues' exceeded its 0.18s deadline after 3 GitHub "
+            "requests. Continue with cursor 'offset:4'."
+        )
+
+    def test_batch_reports_items_not_completed(self, service):
+        items = [CreateIssueRequest(repo=REPO, title=f"Issue {n}", body="") for n in range(6)]
+        request = CreateIssuesRequest(items=items, max_concurrency=1)
+
+        with deadlines.deadline(0.18, "create_issues"):
+            response = service.create_issues(request)
+
+        completed = [result.index for result in response.results if result.success]
+        assert completed and response.failed
+        assert response.partial.pending == [
+            result.index for result in response.results if not result.success
+        ]
+        assert min(response.partial.pending) > max(completed)
+        assert response.partial.next_cursor is None
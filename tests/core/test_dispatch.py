@@ -0,0 +1,136 @@
+"""Tests for the tool call dispatcher."""
+
+import threading
+import time
+
+import pytest
+
+from chora_github.core.dispatch import TOOL_ADAPTERS, ToolAdapter, ToolDispatcher
+from chora_github.core.exceptions import GithubRateLimitError
+from chora_github.core.models import GetIssueRequest, ToolCallRequest
+
+
+@pytest.fixture
+def dispatcher(mock_github_service):
+    with ToolDispatcher(mock_github_service, max_concurrency=4, timeout=5) as dispatcher:
+        yield dispatcher
+
+
+def call(tool: str, **parameters) -> ToolCallRequest:
+    return ToolCallRequest(tool=tool, parameters=parameters)
+
+
+class TestToolAdapter:
+    """Test parameter adaptation."""
+
+    def test_owner_and_repo_are_combined(self):
+        adapter = ToolAdapter(GetIssueRequest, "get_issue")
+
+        request = adapter.build_request({"owner": "octocat", "repo": "Hello-World", "issue_number": 1})
+
+        assert request.repo == "octocat/Hello-World"
+
+    def test_every_adapter_targets_a_service_method(self):
+        from chora_github.core.services import GithubToolService
+
+        for adapter in TOOL_ADAPTERS.values():
+            assert callable(getattr(GithubToolService, adapter.method))
+
+
+class TestCall:
+    """Test single tool calls."""
+
+    def test_success(self, dispatcher, mock_github_service):
+        response = dispatcher.call(call("get_issue", repo="octocat/Hello-World", issue_number=1))
+
+        assert response.success is True
+        assert response.result["issue"]["number"] == 1
+        request = mock_github_service.get_issue.call_args.args[0]
+        assert isinstance(request, GetIssueRequest)
+
+    def test_namespaced_tool_name(self, dispatcher):
+        response = dispatcher.call(call("github:list_issues", repo="octocat/Hello-World"))
+
+        assert response.success is True
+
+    def test_unknown_tool(self, dispatcher):
+        response = dispatcher.call(call("delete_repo", repo="octocat/Hello-World"))
+
+        assert response.success is False
+        assert response.error_code == "UNKNOWN_TOOL"
+
+    def test_invalid_parameters(self, dispatcher, mock_github_service):
+        response = dispatcher.call(call("get_issue", repo="octocat/Hello-World", issue_number=0))
+
+        assert response.success is False
+        assert response.error_code == "VALIDATION_ERROR"
+        mock_github_service.get_issue.assert_not_called()
+
+    def test_domain_error_code(self, dispatcher):
+        response = dispatcher.call(call("get_issue", repo="octocat/Hello-World", issue_number=999))
+
+        assert response.success is False
+        assert response.error_code == "NOT_FOUND"
+
+    def test_unexpected_error(self, dispatcher, mock_github_service):
+        mock_github_service.list_issues.side_effect = RuntimeError("boom")
+
+        response = dispatcher.call(call("list_issues", repo="octocat/Hello-World"))
+
+        assert response.success is False
+        assert response.error_code == "UNKNOWN_ERROR"
+        assert "boom" in response.error
+
+
+class TestCallBatch:
+    """Test concurrent batch execution."""
+
+    async def test_results_in_order(self, dispatcher):
+        calls = [
+            call("get_issue", repo="octocat/Hello-World", issue_number=999),
+            call("list_issues", repo="octocat/Hello-World"),
+            call("nope"),
+        ]
+
+        response = await dispatcher.call_batch(calls)
+
+        assert [result.success for result in response.results] == [False, True, False]
+        assert response.succeeded == 1
+        assert response.failed == 2
+
+    async def test_calls_run_concurrently_within_limit(self, mock_github_service):
+        lock = threading.Lock()
+        active = peak = 0
+
+        def slow_get_issue(request):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            raise GithubRateLimitError("limited")
+
+        mock_github_service.get_issue.side_effect = slow_get_issue
+        calls = [call("get_issue", repo="o/r", issue_number=n) for n in range(1, 7)]
+
+        with ToolDispatcher(mock_github_service, max_concurrency=3) as dispatcher:
+            response = await dispatcher.call_batch(calls)
+
+        assert peak == 3
+        assert {result.error_code for result in response.results} == {"RATE_LIMIT_EXCEEDED"}
+
+    async def test_per_call_timeout(self, dispatcher, mock_github_service):
+        mock_github_service.list_issues.side_effect = lambda request: time.sleep(0.5)
+        calls = [
+            ToolCallRequest(tool="list_issues", parameters={"repo": "o/r"}, timeout=0.05),
+            call("get_issue", repo="octocat/Hello-World", issue_number=1),
+        ]
+
+        start = time.perf_counter()
+        response = await dispatcher.call_batch(calls)
+
+        assert time.perf_counter() - start < 0.4
+        assert response.results[0].error_code == "TIMEOUT"
+        assert response.results[1].success is True
@@ -116,6 +116,39 @@ class TestListIssuesTool:
         mock_repo.get_issues.assert_called_once()
         assert response.total_count == 0
 
+    def test_iter_issues_streams_without_limit(self, service, mock_github):
+        """Test iter_issues converts issues as they are consumed."""
+        from chora_github.core.models import StreamIssuesRequest
+
+        consumed = []
+
+        def paginate():
+            for number in range(1, 151):
+                consumed.append(number)
+                yield Mock(_rawData={"number": number, "title": f"Issue {number}"})
+
+        mock_github.return_value.get_repo.return_value.get_issues.return_value = paginate()
+
+        issues = service.iter_issues(StreamIssuesRequest(repo="owner/repo", fields="number"))
+
+        assert next(issues).number == 1
+        assert consumed == [1]
+        assert len(list(issues)) == 149
+
+    def test_iter_issues_maps_errors(self, service, mock_github):
+        """Test iter_issues raises domain errors on first consumption."""
+        from github import UnknownObjectException
+
+        from chora_github.core.exceptions import GithubNotFoundError
+        from chora_github.core.models import StreamIssuesRequest
+
+        mock_github.return_value.get_repo.side_effect = UnknownObjectException(
+            404, "Not Found"
+        )
+
+        with pytest.raises(GithubNotFoundError):
+            next(service.iter_issues(StreamIssuesRequest(repo="nonexistent/repo")))
+
 
 class TestCreateIssueTool:
     """Test create_issue tool implementation."""
@@ -135,6 +168,8 @@ class TestCreateIssueTool:
 
     def test_create_issue_success(self, service, mock_github):
         """Test successful issue creation."""
+        from github.GithubObject import NotSet
+
         from chora_github.core.models import CreateIssueRequest
 
         # Mock
@@ -164,7 +199,7 @@ class TestCreateIssueTool:
         assert response.issue.number == 47
         assert response.issue.title == "Test Issue"
         mock_repo.create_issue.assert_called_once_with(
-            title="Test Issue", body="Test body", labels=None, assignees=None
+            title="Test Issue", body="Test body", labels=NotSet, assignees=NotSet
         )
 
     def test_create_issue_with_labels_and_assignees(self, service, mock_github):
@@ -277,27 +312,34 @@ class TestUpdateIssueTool:
 
         return GithubToolService(token="ghp_test_token")
 
+    @staticmethod
+    def issue_payload(**overrides):
+        """Raw REST issue payload as returned by PATCH /issues/{number}."""
+        payload = {
+            "number": 42,
+            "title": "Test Issue",
+            "state": "open",
+            "html_url": "https://github.com/owner/repo/issues/42",
+            "created_at": "2025-11-13T00:00:00Z",
+            "updated_at": "2025-11-13T00:00:00Z",
+            "body": "Original body",
+            "labels": [{"name": "bug"}],
+            "assignees": [],
+            "user": {"login": "testuser"},
+        }
+        payload.update(overrides)
+        return payload
+
     def test_update_issue_title(self, service, mock_github):
         """Test updating issue title."""
         from chora_github.core.models import UpdateIssueRequest
 
         # Mock
-        mock_repo = Mock()
-        mock_issue = Mock()
-        mock_issue.number = 42
-        mock_issue.title = "Updated Title"
-        mock_issue.state = "open"
-        mock_issue.html_url = "https://github.com/owner/repo/issues/42"
-        mock_issue.created_at = datetime(2025, 11, 13)
-        mock_issue.updated_at = datetime(2025, 11, 13)
-        mock_issue.body = "Original body"
-        mock_issue.labels = []
-        mock_issue.assignees = []
-        mock_issue.user.login = "testuser"
-
-        mock_issue.edit.return_value = None  # edit() modifies in place
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.return_value.get_repo.return_value = mock_repo
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            self.issue_payload(title="Updated Title"),
+        )
 
         # Execute
         request = UpdateIssueRequest(
@@ -305,31 +347,21 @@ class TestUpdateIssueTool:
         )
         response = service.update_issue(request)
 
-        # Verify
+        # Verify: a single PATCH by number, no get_repo/get_issue round trips
         assert response.issue.title == "Updated Title"
-        mock_issue.edit.assert_called_once()
+        assert response.changed is True
+        requester.requestJsonAndCheck.assert_called_once_with(
+            "PATCH", "/repos/owner/repo/issues/42", input={"title": "Updated Title"}
+        )
+        mock_github.return_value.get_repo.assert_not_called()
 
     def test_update_issue_state(self, service, mock_github):
         """Test updating issue state to closed."""
         from chora_github.core.models import IssueState, UpdateIssueRequest
 
         # Mock
-        mock_repo = Mock()
-        mock_issue = Mock()
-        mock_issue.number = 42
-        mock_issue.state = "closed"
-        mock_issue.html_url = "https://github.com/owner/repo/issues/42"
-        mock_issue.created_at = datetime(2025, 11, 13)
-        mock_issue.updated_at = datetime(2025, 11, 13)
-        mock_issue.title = "Test Issue"
-        mock_issue.body = "Original body"
-        mock_issue.labels = []
-        mock_issue.assignees = []
-        mock_issue.user.login = "testuser"
-
-        mock_issue.edit.return_value = None
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.return_value.get_repo.return_value = mock_repo
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = ({}, self.issue_payload(state="closed"))
 
         # Execute
         request = UpdateIssueRequest(
@@ -340,6 +372,87 @@ class TestUpdateIssueTool:
         # Verify
         assert response.issue.state == "closed"
 
+    def test_update_issue_not_found(self, service, mock_github):
+        """Test updating a missing issue."""
+        from github import GithubException
+
+        from chora_github.core.exceptions import GithubNotFoundError
+        from chora_github.core.models import UpdateIssueRequest
+
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.side_effect = GithubException(
+            404, {"message": "Not Found"}, {}
+        )
+
+        with pytest.raises(GithubNotFoundError, match="Issue #42 not found"):
+            service.update_issue(
+                UpdateIssueRequest(repo="owner/repo", issue_number=42, title="x")
+            )
+
+    def test_update_issue_skips_noop_with_cached_copy(self, service, mock_github):
+        """Test that an update matching the cached issue sends no request."""
+        from chora_github.core.models import UpdateIssueRequest
+
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = ({}, self.issue_payload())
+        service.update_issue(
+            UpdateIssueRequest(repo="owner/repo", issue_number=42, title="Test Issue")
+        )
+        requester.requestJsonAndCheck.reset_mock()
+
+        response = service.update_issue(
+            UpdateIssueRequest(
+                repo="Owner/Repo",
+                issue_number=42,
+                title="Test Issue",
+                labels=["bug"],
+                state="open",
+            )
+        )
+
+        assert response.changed is False
+        assert response.issue.title == "Test Issue"
+        requester.requestJsonAndCheck.assert_not_called()
+
+    def test_update_issue_sends_only_changed_fields(self, service, mock_github):
+        """Test that only fields differing from the cached copy are PATCHed."""
+        from chora_github.core.models import UpdateIssueRequest
+
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = ({}, self.issue_payload())
+        service.update_issue(
+            UpdateIssueRequest(repo="owner/repo", issue_number=42, title="Test Issue")
+        )
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            self.issue_payload(body="New body"),
+        )
+
+        response = service.update_issue(
+            UpdateIssueRequest(
+                repo="owner/repo", issue_number=42, title="Test Issue", body="New body"
+            )
+        )
+
+        assert response.changed is True
+        assert requester.requestJsonAndCheck.call_args.kwargs["input"] == {"body": "New body"}
+
+    def test_update_issue_without_fields_fetches_once(self, service, mock_github):
+        """Test that an empty update with no cached copy returns the issue unchanged."""
+        from chora_github.core.models import UpdateIssueRequest
+
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = ({}, self.issue_payload())
+
+        response = service.update_issue(
+            UpdateIssueRequest(repo="owner/repo", issue_number=42)
+        )
+
+        assert response.changed is False
+        requester.requestJsonAndCheck.assert_called_once_with(
+            "GET", "/repos/owner/repo/issues/42"
+        )
+
 
 class TestListPRsTool:
     """Test list_prs tool implementation."""
@@ -530,3 +643,35 @@ class TestListRepoFilesTool:
         assert response.files[0].type == "file"
         assert response.files[1].name == "src"
         assert response.files[1].type == "dir"
+
+    def test_list_repo_files_recursive(self, service, mock_github):
+        """Test recursive listing descends into directories breadth-first."""
+        from chora_github.core.models import ListRepoFilesRequest
+
+        def content(path, type_):
+            item = Mock()
+            item.name = path.rsplit("/", 1)[-1]
+            item.path = path
+            item.type = type_
+            item.size = 0
+            item.sha = "abc123"
+            return item
+
+        tree = {
+            "": [content("src", "dir"), content("README.md", "file")],
+            "src": [content("src/lib", "dir"), content("src/main.py", "file")],
+            "src/lib": [content("src/lib/util.py", "file")],
+        }
+        mock_repo = Mock()
+        mock_repo.get_contents.side_effect = lambda path, ref: tree[path]
+        mock_github.return_value.get_repo.return_value = mock_repo
+
+        response = service.list_repo_files(ListRepoFilesRequest(repo="owner/repo", recursive=True))
+
+        assert [f.path for f in response.files] == [
+            "src",
+            "README.md",
+            "src/lib",
+            "src/main.py",
+            "src/lib/util.py",
+        ]
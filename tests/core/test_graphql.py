@@ -0,0 +1,473 @@
+"""Tests for the GraphQL execution path.
+
+The PyGithub requester is mocked, so these tests verify query variables,
+pagination, node conversion and rate-limit cost tracking without network.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from chora_github.core.exceptions import (
+    GithubNotFoundError,
+    GithubTimeoutError,
+    GithubValidationError,
+)
+from chora_github.core.graphql import (
+    GraphQLCostTracker,
+    GraphQLExecutor,
+    issue_from_node,
+    pr_from_node,
+    split_repo,
+)
+from chora_github.core.models import (
+    GetIssueRequest,
+    GetIssuesRequest,
+    GetPRRequest,
+    GetPRsRequest,
+    ListIssuesRequest,
+    ListPRsRequest,
+    StreamIssuesRequest,
+)
+
+
+def make_issue_node(number: int, **overrides) -> dict:
+    node = {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": "OPEN",
+        "url": f"https://github.com/owner/repo/issues/{number}",
+        "createdAt": "2025-11-01T10:00:00Z",
+        "updatedAt": "2025-11-01T12:00:00Z",
+        "body": "Body",
+        "author": {"login": "octocat"},
+        "labels": {"nodes": [{"name": "bug"}]},
+        "assignees": {"nodes": [{"login": "alice"}]},
+    }
+    node.update(overrides)
+    return node
+
+
+def label_nodes(*names: str) -> dict:
+    return {"nodes": [{"name": name} for name in names]}
+
+
+def make_pr_node(number: int, **overrides) -> dict:
+    node = {
+        "number": number,
+        "title": f"PR {number}",
+        "state": "OPEN",
+        "url": f"https://github.com/owner/repo/pull/{number}",
+        "createdAt": "2025-11-01T10:00:00Z",
+        "updatedAt": None,
+        "body": None,
+        "headRefName": "feature",
+        "baseRefName": "main",
+        "author": None,
+        "mergeable": "MERGEABLE",
+        "merged": False,
+    }
+    node.update(overrides)
+    return node
+
+
+def page(connection: str, nodes: list, has_next: bool = False, cursor: str | None = None, cost: int = 1):
+    return (
+        {},
+        {
+            "data": {
+                "repository": {
+                    connection: {
+                        "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                        "nodes": nodes,
+                    }
+                },
+                "rateLimit": {
+                    "cost": cost,
+                    "remaining": 4990,
+                    "limit": 5000,
+                    "resetAt": "2025-11-01T13:00:00Z",
+                },
+            }
+        },
+    )
+
+
+class TestNodeConversion:
+    """Test GraphQL node to model conversion."""
+
+    def test_issue_from_node(self):
+        issue = issue_from_node(make_issue_node(7))
+
+        assert issue.number == 7
+        assert issue.state == "open"
+        assert issue.labels == ["bug"]
+        assert issue.assignees == ["alice"]
+        assert issue.author == "octocat"
+
+    def test_issue_from_node_ghost_author(self):
+        issue = issue_from_node(make_issue_node(7, author=None))
+        assert issue.author is None
+
+    def test_pr_from_node_mergeable_values(self):
+        assert pr_from_node(make_pr_node(1)).mergeable is True
+        assert pr_from_node(make_pr_node(1, mergeable="CONFLICTING")).mergeable is False
+        assert pr_from_node(make_pr_node(1, mergeable="UNKNOWN")).mergeable is None
+
+    def test_pr_from_node_merged_reports_closed(self):
+        pr = pr_from_node(make_pr_node(3, state="MERGED", merged=True))
+
+        assert pr.state == "closed"
+        assert pr.merged is True
+        assert pr.head_ref == "feature"
+
+    def test_split_repo(self):
+        assert split_repo("owner/repo") == ("owner", "repo")
+        with pytest.raises(GithubValidationError):
+            split_repo("repo")
+
+
+class TestGraphQLExecutor:
+    """Test query execution, pagination and cost tracking."""
+
+    def test_list_issues_single_page(self):
+        requester = Mock()
+        requester.graphql_query.return_value = page("issues", [make_issue_node(1)], cost=1)
+        executor = GraphQLExecutor(requester)
+
+        issues = executor.list_issues(
+            ListIssuesRequest(repo="owner/repo", labels=["bug"], assignee="alice")
+        )
+
+        assert [issue.number for issue in issues] == [1]
+        _, variables = requester.graphql_query.call_args.args
+        assert variables["owner"] == "owner"
+        assert variables["name"] == "repo"
+        assert variables["states"] == ["OPEN"]
+        assert variables["labels"] == ["bug"]
+        assert variables["assignee"] == "alice"
+        assert variables["first"] == 30
+
+    def test_list_issues_paginates_until_limit(self):
+        requester = Mock()
+        requester.graphql_query.side_effect = [
+            page("issues", [make_issue_node(n) for n in range(1, 3)], has_next=True, cursor="c1"),
+            page("issues", [make_issue_node(n) for n in range(3, 5)], has_next=True, cursor="c2"),
+        ]
+        executor = GraphQLExecutor(requester)
+
+        with patch("chora_github.core.graphql.PAGE_SIZE", 2):
+            issues = executor.list_issues(ListIssuesRequest(repo="owner/repo", limit=4))
+
+        assert [issue.number for issue in issues] == [1, 2, 3, 4]
+        assert requester.graphql_query.call_count == 2
+        second_vars = requester.graphql_query.call_args_list[1].args[1]
+        assert second_vars["after"] == "c1"
+
+    def test_list_issues_requires_all_labels(self):
+        requester = Mock()
+        requester.graphql_query.side_effect = [
+            page(
+                "issues",
+                [
+                    make_issue_node(1, labels=label_nodes("bug", "ui")),
+                    make_issue_node(2, labels=label_nodes("bug")),
+                ],
+                has_next=True,
+                cursor="c1",
+            ),
+            page("issues", [make_issue_node(3, labels=label_nodes("ui", "bug", "p1"))]),
+        ]
+        executor = GraphQLExecutor(requester)
+
+        issues = executor.list_issues(
+            ListIssuesRequest(repo="owner/repo", labels=["bug", "ui"], limit=2)
+        )
+
+        # GraphQL matches any label; issue 2 lacks "ui" and is dropped
+        assert [issue.number for issue in issues] == [1, 3]
+        assert requester.graphql_query.call_count == 2
+
+    def test_iter_issues_fetches_pages_on_demand(self):
+        requester = Mock()
+        requester.graphql_query.side_effect = [
+            page("issues", [make_issue_node(1), make_issue_node(2)], has_next=True, cursor="c1"),
+            page("issues", [make_issue_node(3)]),
+        ]
+        executor = GraphQLExecutor(requester)
+
+        with patch("chora_github.core.graphql.PAGE_SIZE", 2):
+            issues = executor.iter_issues(StreamIssuesRequest(repo="owner/repo"))
+            assert next(issues).number == 1
+            assert requester.graphql_query.call_count == 1
+            assert [issue.number for issue in issues] == [2, 3]
+
+        assert requester.graphql_query.call_count == 2
+        assert requester.graphql_query.call_args_list[0].args[1]["first"] == 2
+
+    def test_timeout_carries_cursor_after_last_page(self):
+        requester = Mock()
+        requester.graphql_query.side_effect = [
+            page("issues", [make_issue_node(1), make_issue_node(2)], has_next=True, cursor="c1"),
+            GithubTimeoutError("Call exceeded its 1s deadline after 1 GitHub request"),
+        ]
+        executor = GraphQLExecutor(requester)
+
+        issues = executor.iter_issues(StreamIssuesRequest(repo="owner/repo"))
+        with pytest.raises(GithubTimeoutError) as e:
+            list(issues)
+
+        assert e.value.details["next_cursor"] == "after:c1"
+
+    def test_iter_issues_continues_after_cursor(self):
+        requester = Mock()
+        requester.graphql_query.return_value = page("issues", [make_issue_node(3)])
+        executor = GraphQLExecutor(requester)
+
+        request = StreamIssuesRequest(repo="owner/repo", cursor="after:c1")
+        assert [issue.number for issue in executor.iter_issues(request)] == [3]
+        assert requester.graphql_query.call_args.args[1]["after"] == "c1"
+
+    def test_rest_cursor_rejected(self):
+        executor = GraphQLExecutor(Mock())
+
+        with pytest.raises(GithubValidationError):
+            list(executor.iter_issues(StreamIssuesRequest(repo="owner/repo", cursor="offset:30")))
+
+    def test_list_prs_closed_includes_merged(self):
+        requester = Mock()
+        requester.graphql_query.return_value = page("pullRequests", [make_pr_node(1)])
+        executor = GraphQLExecutor(requester)
+
+        executor.list_prs(ListPRsRequest(repo="owner/repo", state="closed", head="me:feature"))
+
+        variables = requester.graphql_query.call_args.args[1]
+        assert variables["states"] == ["CLOSED", "MERGED"]
+        assert variables["head"] == "feature"
+
+    def test_get_pr(self):
+        requester = Mock()
+        requester.graphql_query.return_value = (
+            {},
+            {"data": {"repository": {"pullRequest": make_pr_node(5)}, "rateLimit": {"cost": 1}}},
+        )
+        executor = GraphQLExecutor(requester)
+
+        pr = executor.get_pr(GetPRRequest(repo="owner/repo", pr_number=5))
+
+        assert pr.number == 5
+        assert pr.mergeable is True
+
+    def test_get_issue_null_node_raises_not_found(self):
+        requester = Mock()
+        requester.graphql_query.return_value = (
+            {},
+            {"data": {"repository": {"issue": None}, "rateLimit": {"cost": 1}}},
+        )
+        executor = GraphQLExecutor(requester)
+
+        with pytest.raises(GithubNotFoundError):
+            executor.get_issue(GetIssueRequest(repo="owner/repo", issue_number=9))
+
+    def test_cost_tracking(self):
+        requester = Mock()
+        requester.graphql_query.return_value = page("issues", [], cost=3)
+        executor = GraphQLExecutor(requester)
+
+        executor.list_issues(ListIssuesRequest(repo="owner/repo"))
+        executor.list_issues(ListIssuesRequest(repo="owner/repo"))
+
+        summary = executor.tracker.summary()
+        assert summary["queries"] == 2
+        assert summary["total_cost"] == 6
+        assert summary["remaining"] == 4990
+        assert summary["operations"]["list_issues"] == {"queries": 2, "cost": 6}
+
+    def test_cost_tracker_defaults_missing_rate_limit(self):
+        tracker = GraphQLCostTracker()
+        entry = tracker.record("get_issue", None)
+
+        assert entry.cost == 1
+        assert tracker.total_cost == 1
+
+
+class TestBulkReads:
+    """Test aliased bulk resolution of issue/PR numbers."""
+
+    def test_get_issues_single_request_with_not_found(self):
+        requester = Mock()
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {"n1": make_issue_node(1), "n2": None, "n3": make_issue_node(3)},
+                    "rateLimit": {"cost": 1},
+                },
+                "errors": [{"type": "NOT_FOUND", "path": ["repository", "n2"]}],
+            },
+        )
+        executor = GraphQLExecutor(requester)
+
+        issues, not_found = executor.get_issues(
+            GetIssuesRequest(repo="owner/repo", numbers=[3, 1, 2, 3])
+        )
+
+        assert [issue.number for issue in issues] == [3, 1]
+        assert not_found == [2]
+        assert requester.requestJsonAndCheck.call_count == 1
+        query = requester.requestJsonAndCheck.call_args.kwargs["input"]["query"]
+        assert query.count("issue(number:") == 3
+        assert "n2: issue(number: 2)" in query
+        assert executor.tracker.last.operation == "get_issues"
+
+    def test_get_prs_other_errors_raise(self):
+        from github import GithubException
+
+        requester = Mock()
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {"data": None, "errors": [{"type": "FORBIDDEN", "message": "nope"}]},
+        )
+        executor = GraphQLExecutor(requester)
+
+        with pytest.raises(GithubException):
+            executor.get_prs(GetPRsRequest(repo="owner/repo", numbers=[1]))
+
+    def test_missing_repository_raises_not_found(self):
+        requester = Mock()
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {"data": {"repository": None}, "errors": [{"type": "NOT_FOUND"}]},
+        )
+        executor = GraphQLExecutor(requester)
+
+        with pytest.raises(GithubNotFoundError):
+            executor.get_prs(GetPRsRequest(repo="owner/repo", numbers=[1]))
+
+    def test_request_validates_numbers(self):
+        with pytest.raises(ValueError):
+            GetIssuesRequest(repo="owner/repo", numbers=[])
+        with pytest.raises(ValueError):
+            GetIssuesRequest(repo="owner/repo", numbers=[0])
+        with pytest.raises(ValueError):
+            GetIssuesRequest(repo="owner/repo", numbers=list(range(1, 102)))
+
+
+class TestServiceGraphQLPath:
+    """Test GithubToolService routing to the GraphQL executor."""
+
+    @pytest.fixture
+    def mock_github(self):
+        with patch("chora_github.core.services.Github") as mock:
+            yield mock
+
+    def test_list_issues_uses_graphql(self, mock_github):
+        from chora_github.core.services import GithubToolService
+
+        requester = mock_github.return_value.requester
+        requester.graphql_query.return_value = page("issues", [make_issue_node(1)])
+        service = GithubToolService(token="ghp_test", use_graphql=True)
+
+        response = service.list_issues(ListIssuesRequest(repo="owner/repo"))
+
+        assert response.total_count == 1
+        mock_github.return_value.get_repo.assert_not_called()
+
+    def test_graphql_not_found_maps_to_domain_error(self, mock_github):
+        from github import UnknownObjectException
+
+        from chora_github.core.services import GithubToolService
+
+        requester = mock_github.return_value.requester
+        requester.graphql_query.side_effect = UnknownObjectException(404, {}, {})
+        service = GithubToolService(token="ghp_test", use_graphql=True)
+
+        with pytest.raises(GithubNotFoundError):
+            service.get_pr(GetPRRequest(repo="owner/repo", pr_number=1))
+
+    def test_get_prs_service(self, mock_github):
+        from chora_github.core.services import GithubToolService
+
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {"data": {"repository": {"n4": make_pr_node(4)}, "rateLimit": {"cost": 1}}},
+        )
+        service = GithubToolService(token="ghp_test")
+
+        response = service.get_prs(GetPRsRequest(repo="owner/repo", numbers=[4]))
+
+        assert response.pull_requests[0].number == 4
+        assert response.not_found == []
+
+    def test_rest_path_is_default(self, mock_github):
+        from chora_github.core.services import GithubToolService
+
+        mock_github.return_value.get_repo.return_value.get_issues.return_value = []
+        service = GithubToolService(token="ghp_test")
+
+        service.list_issues(ListIssuesRequest(repo="owner/repo"))
+
+        mock_github.return_value.requester.graphql_query.assert_not_called()
+
+
+class TestSparseSelection:
+    """Test that sparse fieldsets shrink the GraphQL selection."""
+
+    def test_list_issues_selects_only_requested_fields(self):
+        requester = Mock()
+        node = {"number": 1, "title": "Issue 1"}
+        requester.graphql_query.return_value = page("issues", [node])
+        executor = GraphQLExecutor(requester)
+
+        issues = executor.list_issues(
+            ListIssuesRequest(repo="owner/repo", fields="number,title")
+        )
+
+        query = requester.graphql_query.call_args.args[0]
+        fragment = query[query.index("fragment IssueFields"):]
+        assert "title" in fragment
+        assert "body" not in fragment
+        assert "labels" not in fragment
+        assert issues[0].model_dump() == {"number": 1, "title": "Issue 1"}
+
+    def test_label_filter_selects_labels(self):
+        requester = Mock()
+        node = {"number": 1, "title": "Issue 1", "labels": {"nodes": [{"name": "bug"}]}}
+        requester.graphql_query.return_value = page("issues", [node])
+        executor = GraphQLExecutor(requester)
+
+        issues = executor.list_issues(
+            ListIssuesRequest(repo="owner/repo", labels=["bug"], fields="number,title")
+        )
+
+        query = requester.graphql_query.call_args.args[0]
+        assert "labels" in query[query.index("fragment IssueFields"):]
+        assert issues[0].model_dump() == {"number": 1, "title": "Issue 1"}
+
+    def test_get_prs_sparse(self):
+        requester = Mock()
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {"n4": {"number": 4, "state": "MERGED"}},
+                    "rateLimit": {"cost": 1},
+                }
+            },
+        )
+        executor = GraphQLExecutor(requester)
+
+        prs, _ = executor.get_prs(
+            GetPRsRequest(repo="owner/repo", numbers=[4], fields=["state"])
+        )
+
+        query = requester.requestJsonAndCheck.call_args.kwargs["input"]["query"]
+        assert "headRefName" not in query
+        assert prs[0].model_dump() == {"number": 4, "state": "closed"}
+
+    def test_full_fragment_unchanged_without_fields(self):
+        from chora_github.core.graphql import ISSUE_FIELDS, issue_fragment
+
+        assert issue_fragment() == ISSUE_FIELDS
+        assert "assignees(first: 100) { nodes { login } }" in ISSUE_FIELDS
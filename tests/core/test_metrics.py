@@ -0,0 +1,251 @@
+"""Tests for the metrics registry and upstream request observation."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from github.Requester import HTTPSRequestsConnectionClass, Requester
+
+from chora_github.core import upstream
+from chora_github.core.cache import TTLCache
+from chora_github.core.exceptions import GithubNotFoundError
+from chora_github.core.metrics import (
+    RATE_LIMIT_REMAINING,
+    TOOL_DURATION,
+    UPSTREAM_REQUESTS,
+    MetricsRegistry,
+    add_tool_observer,
+    observe_tool,
+    record_upstream,
+    remove_tool_observer,
+)
+
+
+class TestMetricTypes:
+    """Test counters, gauges, histograms and exposition."""
+
+    def test_counter_and_gauge(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("status",))
+        in_flight = registry.gauge("in_flight", "In flight")
+
+        requests.inc(status=200)
+        requests.inc(2, status=200)
+        in_flight.inc()
+        in_flight.dec()
+
+        assert requests.value(status=200) == 3
+        assert in_flight.value() == 0
+        with pytest.raises(ValueError):
+            requests.inc(-1, status=200)
+        with pytest.raises(ValueError):
+            requests.inc(route="/")
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1))
+
+        for value in (0.05, 0.1, 0.5, 3):
+            latency.observe(value, route="/x")
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{route="/x",le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{route="/x",le="1"} 3' in text
+        assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4' in text
+        assert 'latency_seconds_count{route="/x"} 4' in text
+        assert 'latency_seconds_sum{route="/x"} 3.65' in text
+        assert "# TYPE latency_seconds histogram" in text
+
+    def test_register_is_idempotent(self):
+        registry = MetricsRegistry()
+
+        first = registry.counter("x_total", "X", ("a",))
+
+        assert registry.counter("x_total", "X", ("a",)) is first
+        with pytest.raises(ValueError):
+            registry.gauge("x_total", "X", ("a",))
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("x_total", "X", ("path",)).inc(path='a"b\\c')
+
+        assert 'x_total{path="a\\"b\\\\c"} 1' in registry.render()
+
+    def test_tracked_cache_ratio(self):
+        registry = MetricsRegistry()
+        cache = TTLCache(ttl=60)
+        registry.track_cache("issues", cache)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        text = registry.render()
+
+        assert 'github_cache_hits_total{cache="issues"} 2' in text
+        assert 'github_cache_misses_total{cache="issues"} 1' in text
+        assert 'github_cache_hit_ratio{cache="issues"} 0.6666666666666666' in text
+
+
+class TestObserveTool:
+    """Test service method timing."""
+
+    def test_records_outcome(self):
+        @observe_tool
+        def metrics_probe(fail: bool) -> str:
+            if fail:
+                raise GithubNotFoundError("missing")
+            return "done"
+
+        assert metrics_probe(False) == "done"
+        with pytest.raises(GithubNotFoundError):
+            metrics_probe(True)
+
+        assert TOOL_DURATION.count(tool="metrics_probe", outcome="ok") == 1
+        assert TOOL_DURATION.count(tool="metrics_probe", outcome="NOT_FOUND") == 1
+
+    def test_tool_observers(self):
+        class Service:
+            @observe_tool
+            def observed_probe(self, request: str) -> str:
+                return request
+
+        seen = []
+        observer = lambda tool, request: seen.append((tool, request))  # noqa: E731
+        add_tool_observer(observer)
+        try:
+            Service().observed_probe("first")
+        finally:
+            remove_tool_observer(observer)
+        Service().observed_probe(request="second")
+
+        assert seen == [("observed_probe", "first")]
+
+
+class TestUpstream:
+    """Test upstream request observation."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("/repos/octocat/Hello-World/issues?state=open", "/repos/{owner}/{repo}/issues"),
+            ("/repos/octocat/Hello-World/issues/12", "/repos/{owner}/{repo}/issues/{number}"),
+            ("/repos/o/r/contents/docs/a.md?ref=main", "/repos/{owner}/{repo}/contents/{path}"),
+            ("/graphql", "/graphql"),
+            ("/users/octocat", "/users/{user}"),
+        ],
+    )
+    def test_endpoint_template(self, url, expected):
+        assert upstream.endpoint_template(url) == expected
+
+    def test_token_fingerprint(self):
+        fingerprint = upstream.token_fingerprint("token ghp_secret")
+
+        assert len(fingerprint) == 8
+        assert fingerprint == upstream.token_fingerprint("ghp_secret")
+        assert "secret" not in fingerprint
+        assert upstream.token_fingerprint(None) == ""
+
+    def test_observed_connection_reports_calls(self):
+        calls = []
+        upstream.add_observer(calls.append)
+        try:
+            connection = upstream.ObservedHTTPSConnection("api.github.com")
+            connection.session = Mock()
+            connection.session.get.return_value = Mock(
+                status_code=200, headers={"X-RateLimit-Remaining": "4999"}
+            )
+            connection.request("GET", "/repos/o/r/pulls/3", None, {"Authorization": "token t"})
+
+            response = connection.getresponse()
+        finally:
+            upstream.remove_observer(calls.append)
+
+        assert response.status == 200
+        (call,) = calls
+        assert call.method == "GET"
+        assert call.endpoint == "/repos/{owner}/{repo}/pulls/{number}"
+        assert call.token == upstream.token_fingerprint("t")
+        assert call.headers["x-ratelimit-remaining"] == "4999"
+        assert call.duration >= 0
+
+    def test_shared_connection_keeps_requests_per_thread(self):
+        # PyGithub shares one connection per client between threads
+        connection = upstream.ObservedHTTPSConnection("api.github.com")
+        connection.session = Mock()
+        connection.session.get.side_effect = lambda url, **kwargs: Mock(
+            status_code=200, headers={"X-Url": url}
+        )
+        barrier = threading.Barrier(2)
+        sent = {}
+
+        def call(path: str) -> None:
+            connection.request("GET", path, None, {})
+            barrier.wait()  # both requests are pending before either is sent
+            sent[path] = dict(connection.getresponse().getheaders())["X-Url"]
+
+        threads = [threading.Thread(target=call, args=(f"/repos/o/r/issues/{n}",)) for n in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sent == {
+            f"/repos/o/r/issues/{n}": f"https://api.github.com:443/repos/o/r/issues/{n}"
+            for n in (1, 2)
+        }
+
+    def test_connection_error_is_reported(self):
+        calls = []
+        upstream.add_observer(calls.append)
+        try:
+            connection = upstream.ObservedHTTPSConnection("api.github.com")
+            connection.session = Mock()
+            connection.session.post.side_effect = ConnectionError("reset")
+            connection.request("POST", "/graphql", "{}", {})
+
+            with pytest.raises(ConnectionError):
+                connection.getresponse()
+        finally:
+            upstream.remove_observer(calls.append)
+
+        assert calls[0].status == upstream.ERROR_STATUS
+
+    def test_pygithub_internals_are_present(self):
+        # install() relies on these; a PyGithub release dropping them must
+        # fail here rather than silently stop observing requests
+        assert isinstance(getattr(Requester, upstream._PERSIST_ATTRIBUTE, None), bool)
+        assert callable(Requester.injectConnectionClasses)
+        connection = HTTPSRequestsConnectionClass("api.github.com")
+        assert hasattr(connection, "session")
+
+    def test_install_persists_observed_connections(self):
+        upstream.install()
+
+        requester = Requester(None, "https://api.github.com", 15, "test", 30, True, None, None)
+        assert getattr(Requester, upstream._PERSIST_ATTRIBUTE) is True
+        assert isinstance(
+            requester._Requester__createConnection(), upstream.ObservedHTTPSConnection
+        )
+
+    def test_install_refuses_unsupported_pygithub(self, monkeypatch):
+        monkeypatch.setattr(upstream, "_installed", False)
+        monkeypatch.delattr(Requester, upstream._PERSIST_ATTRIBUTE)
+
+        with pytest.raises(RuntimeError, match="Unsupported PyGithub"):
+            upstream.install()
+
+    def test_record_upstream(self):
+        call = upstream.UpstreamCall(
+            method="GET",
+            endpoint="/metrics-test",
+            status=304,
+            duration=0.01,
+            token="abcd1234",
+            headers={"x-ratelimit-remaining": "42", "x-ratelimit-resource": "core"},
+        )
+
+        record_upstream(call)
+
+        assert UPSTREAM_REQUESTS.value(method="GET", endpoint="/metrics-test", status=304) == 1
+        assert RATE_LIMIT_REMAINING.value(token="abcd1234", resource="core") == 42
@@ -0,0 +1,153 @@
+"""Tests for partial results and listing cursors."""
+
+import pytest
+from pydantic import ValidationError
+
+from chora_github.core.exceptions import GithubTimeoutError, GithubValidationError
+from chora_github.core.models import BatchItemResult, ListIssuesRequest, PartialResult
+from chora_github.core.partial import (
+    after_cursor,
+    batch_partial,
+    collect,
+    offset_cursor,
+    paginate_from,
+    parse_after,
+    parse_offset,
+    partial_warning,
+)
+
+
+class FakePaginatedList:
+    """PaginatedList stand-in: ``total`` numbered items, ``per_page`` a page."""
+
+    def __init__(self, total, per_page):
+        self.items = list(range(total))
+        self.per_page = per_page
+        self.pages = []
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def get_page(self, page):
+        self.pages.append(page)
+        return self.items[page * self.per_page : (page + 1) * self.per_page]
+
+
+def timing_out(items, cursor="offset:2"):
+    yield from items
+    raise GithubTimeoutError("Call exceeded its 1s deadline", details={"next_cursor": cursor})
+
+
+# ============================================================================
+# Cursors
+# ============================================================================
+
+
+class TestCursors:
+    """Test cursor encoding and validation."""
+
+    def test_round_trip(self):
+        assert parse_offset(offset_cursor(60)) == 60
+        assert parse_after(after_cursor("Y3Vyc29y")) == "Y3Vyc29y"
+        assert parse_offset(None) == 0
+        assert parse_after(None) is None
+
+    def test_after_cursor_of_first_page(self):
+        assert parse_after(after_cursor(None)) is None
+
+    def test_cursor_kind_must_match_read_path(self):
+        with pytest.raises(GithubValidationError) as e:
+            parse_offset("after:Y3Vyc29y")
+        assert e.value.details["field"] == "cursor"
+        with pytest.raises(GithubValidationError):
+            parse_after("offset:30")
+
+    def test_request_rejects_malformed_cursor(self):
+        with pytest.raises(ValidationError):
+            ListIssuesRequest(repo="octocat/Hello-World", cursor="30")
+
+
+# ============================================================================
+# Pagination
+# ============================================================================
+
+
+class TestPaginateFrom:
+    """Test resuming a PaginatedList at an offset."""
+
+    def test_offset_zero_iterates(self):
+        paginated = FakePaginatedList(total=5, per_page=2)
+
+        assert list(paginate_from(paginated, 0, 2)) == [0, 1, 2, 3, 4]
+        assert paginated.pages == []
+
+    def test_skips_pages_before_offset(self):
+        paginated = FakePaginatedList(total=7, per_page=2)
+
+        assert list(paginate_from(paginated, 3, 2)) == [3, 4, 5, 6]
+        assert paginated.pages == [1, 2, 3]
+
+    def test_offset_past_end(self):
+        paginated = FakePaginatedList(total=4, per_page=2)
+
+        assert list(paginate_from(paginated, 6, 2)) == []
+
+
+# ============================================================================
+# Collecting
+# ============================================================================
+
+
+class TestCollect:
+    """Test keeping fetched items when a listing times out."""
+
+    def test_complete_listing(self):
+        assert collect(iter([1, 2])) == ([1, 2], None)
+
+    def test_timed_out_listing(self):
+        items, partial = collect(timing_out([1, 2]))
+
+        assert items == [1, 2]
+        assert partial == PartialResult(
+            reason="Call exceeded its 1s deadline", next_cursor="offset:2"
+        )
+
+    def test_nothing_fetched_raises(self):
+        with pytest.raises(GithubTimeoutError):
+            collect(timing_out([]))
+
+
+class TestBatchPartial:
+    """Test partial results of batches."""
+
+    def test_timed_out_items_are_pending(self):
+        results = [
+            BatchItemResult(index=0, success=True),
+            BatchItemResult(index=1, success=False, error="Not found", error_code="NOT_FOUND"),
+            BatchItemResult(index=2, success=False, error="Deadline", error_code="TIMEOUT"),
+        ]
+
+        partial = batch_partial(results)
+
+        assert partial == PartialResult(reason="Deadline", pending=[2])
+
+    def test_no_timeouts(self):
+        assert batch_partial([BatchItemResult(index=0, success=True)]) is None
+
+
+class TestPartialWarning:
+    """Test the warning describing a partial result."""
+
+    def test_listing(self):
+        partial = PartialResult(reason="Call exceeded its 1s deadline", next_cursor="offset:60")
+
+        assert partial_warning(partial) == (
+            "Partial result: Call exceeded its 1s deadline. Continue with cursor 'offset:60'."
+        )
+
+    def test_batch(self):
+        partial = PartialResult(reason="Call exceeded its 1s deadline", pending=[3, 4])
+
+        assert partial_warning(partial) == (
+            "Partial result: Call exceeded its 1s deadline. Items not completed: 3, 4."
+        )
@@ -0,0 +1,177 @@
+"""Tests for raw REST payload conversion."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+from github.Issue import Issue
+from github.PullRequest import PullRequest
+
+from chora_github.core.models import IssueData, PRData
+from chora_github.core.payloads import issue_from_rest, pr_from_rest, raw_payload
+
+
+def issue_payload(**overrides) -> dict:
+    payload = {
+        "url": "https://api.github.com/repos/owner/repo/issues/1",
+        "html_url": "https://github.com/owner/repo/issues/1",
+        "number": 1,
+        "title": "Bug",
+        "state": "open",
+        "body": None,
+        "created_at": "2025-11-01T10:00:00Z",
+        "updated_at": "2025-11-01T12:00:00Z",
+        "user": {"login": "octocat"},
+        "labels": [{"name": "bug"}, {"name": "p1"}],
+        "assignees": [{"login": "alice"}],
+    }
+    payload.update(overrides)
+    return payload
+
+
+def pr_payload(**overrides) -> dict:
+    payload = {
+        "url": "https://api.github.com/repos/owner/repo/pulls/2",
+        "html_url": "https://github.com/owner/repo/pull/2",
+        "number": 2,
+        "title": "Fix",
+        "state": "closed",
+        "body": "Fixes #1",
+        "created_at": "2025-11-01T10:00:00Z",
+        "updated_at": None,
+        "merged_at": "2025-11-02T10:00:00Z",
+        "user": None,
+        "head": {"ref": "fix"},
+        "base": {"ref": "main"},
+    }
+    payload.update(overrides)
+    return payload
+
+
+class TestPayloadConversion:
+    """Test IssueData/PRData construction from REST payloads."""
+
+    def test_issue_from_rest(self):
+        issue = issue_from_rest(issue_payload())
+
+        assert isinstance(issue, IssueData)
+        assert issue.url == "https://github.com/owner/repo/issues/1"
+        assert issue.labels == ["bug", "p1"]
+        assert issue.assignees == ["alice"]
+        assert issue.author == "octocat"
+        assert issue.model_dump()["body"] is None
+
+    def test_issue_from_rest_matches_validated_model(self):
+        fast = issue_from_rest(issue_payload())
+        validated = IssueData(**fast.model_dump())
+
+        assert fast == validated
+
+    def test_pr_from_list_payload_derives_merged(self):
+        pr = pr_from_rest(pr_payload())
+
+        assert isinstance(pr, PRData)
+        assert pr.merged is True
+        assert pr.mergeable is None
+        assert pr.head_ref == "fix"
+        assert pr.author is None
+
+    def test_pr_from_full_payload(self):
+        pr = pr_from_rest(pr_payload(merged=False, mergeable=True, merged_at=None))
+
+        assert pr.merged is False
+        assert pr.mergeable is True
+
+
+class TestRawPayload:
+    """Test reading payloads from PyGithub objects without completing them."""
+
+    def test_reads_payload_without_completion(self):
+        requester = Mock(is_not_lazy=True)
+        pr = PullRequest(requester, {}, pr_payload(), completed=False)
+
+        assert raw_payload(pr)["number"] == 2
+        requester.requestJsonAndCheck.assert_not_called()
+
+    def test_mock_objects_have_no_payload(self):
+        assert raw_payload(Mock()) is None
+
+    def test_service_uses_raw_payload(self):
+        from unittest.mock import patch
+
+        from chora_github.core.services import GithubToolService
+
+        with patch("chora_github.core.services.Github"):
+            service = GithubToolService(token="ghp_test")
+        issue = Issue(Mock(is_not_lazy=True), {}, issue_payload(), completed=False)
+
+        data = service._convert_issue_to_data(issue)
+
+        assert data.created_at == "2025-11-01T10:00:00Z"
+        assert data.labels == ["bug", "p1"]
+
+
+class TestSparseFieldsets:
+    """Test sparse fieldset conversion and serialization."""
+
+    def test_issue_from_rest_with_fields(self):
+        issue = issue_from_rest(issue_payload(), ["number", "title"])
+
+        assert issue.model_dump() == {"number": 1, "title": "Bug"}
+        assert issue.model_dump_json() == '{"number":1,"title":"Bug"}'
+
+    def test_sparse_items_inside_response(self):
+        from chora_github.core.models import ListIssuesResponse
+
+        issue = issue_from_rest(issue_payload(), ["number", "labels"])
+        response = ListIssuesResponse(issues=[issue], total_count=1)
+
+        assert response.model_dump()["issues"] == [{"number": 1, "labels": ["bug", "p1"]}]
+
+    def test_pr_from_rest_with_fields(self):
+        pr = pr_from_rest(pr_payload(), ["number", "merged"])
+
+        assert pr.model_dump() == {"number": 2, "merged": True}
+
+    def test_request_parses_comma_separated_fields(self):
+        from chora_github.core.models import ListIssuesRequest
+
+        request = ListIssuesRequest(repo="owner/repo", fields="labels, title")
+
+        assert request.fields == ["number", "title", "labels"]
+
+    def test_request_rejects_unknown_fields(self):
+        import pytest
+
+        from chora_github.core.models import GetPRRequest
+
+        with pytest.raises(ValueError, match="Unknown pull request fields: labels"):
+            GetPRRequest(repo="owner/repo", pr_number=1, fields=["labels"])
+
+    def test_service_sparse_issues_are_not_cached(self):
+        from unittest.mock import patch
+
+        from chora_github.core.models import GetIssueRequest
+        from chora_github.core.services import GithubToolService
+
+        with patch("chora_github.core.services.Github") as mock_github:
+            service = GithubToolService(token="ghp_test")
+            mock_issue = Mock(
+                number=1,
+                title="Bug",
+                state="open",
+                html_url="https://github.com/owner/repo/issues/1",
+                created_at=datetime(2025, 11, 1, 10, 0),
+                updated_at=None,
+                body=None,
+                user=None,
+            )
+            mock_issue.labels = []
+            mock_issue.assignees = []
+            mock_github.return_value.get_repo.return_value.get_issue.return_value = mock_issue
+
+            response = service.get_issue(
+                GetIssueRequest(repo="owner/repo", issue_number=1, fields="title")
+            )
+
+        assert response.model_dump() == {"issue": {"number": 1, "title": "Bug"}}
+        assert len(service.issue_cache) == 0
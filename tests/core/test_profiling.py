@@ -0,0 +1,114 @@
+"""Tests for slow-call profiling.
+
+Profiles are written to a temporary directory by the ``profiles`` fixture
+(see conftest), which profiles every call regardless of duration.
+"""
+
+import json
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import pytest
+
+from chora_github.core import profiling
+from chora_github.core.metrics import observe_tool
+from chora_github.core.models import GetPRRequest
+
+
+class FakeService:
+    @observe_tool
+    def get_pr(self, request):
+        return sum(range(1000))
+
+
+def busy(n: int = 10_000) -> int:
+    return sum(i * i for i in range(n))
+
+
+def sidecars(directory) -> list[dict]:
+    return [json.loads(path.read_text()) for path in sorted(directory.glob("*.json"))]
+
+
+class TestDisabled:
+    """Test the default (off) state."""
+
+    def test_profiled_yields_none(self, tmp_path):
+        assert profiling.current_config() is None
+        with profiling.profiled("get_pr") as session:
+            busy()
+
+        assert session is None
+        assert profiling.profile_thread() is profiling.profile_thread()
+        assert profiling.summary() == {"enabled": False}
+
+    def test_config_from_env(self, monkeypatch):
+        assert profiling.config_from_env() is None
+        monkeypatch.setenv("GITHUB_PROFILE_DIR", "/tmp/profiles")
+        monkeypatch.setenv("GITHUB_PROFILE_THRESHOLD_MS", "250")
+
+        config = profiling.config_from_env()
+
+        assert config == profiling.ProfilingConfig(directory="/tmp/profiles", threshold_ms=250)
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError, match="sample_rate"):
+            profiling.ProfilingConfig(directory="p", sample_rate=2)
+
+
+class TestProfiles:
+    """Test profiles written for slow calls."""
+
+    def test_profile_and_sidecar(self, profiles):
+        with profiling.profiled("get_pr") as session:
+            session.tag(parameters={"repo": "octocat/Hello-World", "token": "secret", "page": None})
+            busy()
+
+        (path,) = profiles.glob("*.prof")
+        assert "-get_pr-" in path.name
+        assert "busy" in {name for _, _, name in pstats.Stats(str(path)).stats}
+        (sidecar,) = sidecars(profiles)
+        assert sidecar["tool"] == "get_pr"
+        assert sidecar["parameters"] == {"repo": "octocat/Hello-World"}
+        assert sidecar["threads"] == 1
+
+    def test_fast_calls_are_not_written(self, profiles):
+        profiling.current_config().threshold_ms = 60_000
+        with profiling.profiled("get_pr"):
+            busy()
+
+        assert not profiles.exists()
+
+    def test_sampling(self, profiles):
+        profiling.current_config().sample_rate = 0
+        with profiling.profiled("get_pr") as session:
+            busy()
+
+        assert session is None
+
+    def test_max_profiles(self, profiles):
+        profiling.current_config().max_profiles = 2
+        for _ in range(3):
+            with profiling.profiled("get_pr"):
+                busy()
+
+        assert len(list(profiles.glob("*.prof"))) == 2
+        assert profiling.summary()["written"] == 2
+
+    def test_nested_call_is_part_of_outer_profile(self, profiles):
+        with profiling.profiled("outer"), profiling.profiled("inner") as inner:
+            busy()
+
+        assert inner is None
+        assert [sidecar["tool"] for sidecar in sidecars(profiles)] == ["outer"]
+
+    def test_worker_threads_are_merged(self, profiles):
+        service = FakeService()
+        with profiling.profiled("get_prs"), ThreadPoolExecutor(max_workers=2) as pool:
+            request = GetPRRequest(repo="octocat/Hello-World", pr_number=1)
+            # Workers run in a copy of the caller's context, as in the dispatcher
+            futures = [pool.submit(copy_context().run, service.get_pr, request) for _ in range(2)]
+            [future.result() for future in futures]
+
+        (sidecar,) = sidecars(profiles)
+        assert sidecar["threads"] >= 2
@@ -0,0 +1,59 @@
+"""Tests for internal issue records."""
+
+import dataclasses
+from unittest.mock import patch
+
+import pytest
+
+from chora_github.core.models import IssueData
+from chora_github.core.records import IssueRecord
+
+
+class TestIssueRecord:
+    """Test the slotted issue record."""
+
+    def test_round_trip(self, issue):
+        record = IssueRecord.from_model(issue)
+
+        assert record.labels == ("bug", "enhancement")
+        assert record.to_model() == issue
+        assert isinstance(record.to_model(), IssueData)
+
+    def test_to_model_returns_fresh_lists(self, issue):
+        record = IssueRecord.from_model(issue)
+
+        model = record.to_model()
+        model.labels.append("wontfix")
+
+        assert record.labels == ("bug", "enhancement")
+
+    def test_is_slotted_and_frozen(self, issue):
+        record = IssueRecord.from_model(issue)
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.title = "Changed"
+
+    def test_repeated_strings_are_interned(self, sample_issue_data):
+        first = IssueRecord.from_model(IssueData(**sample_issue_data))
+        second = IssueRecord.from_model(
+            IssueData(**{**sample_issue_data, "labels": ["".join(["b", "u", "g"])]})
+        )
+
+        assert second.labels[0] is first.labels[0]
+
+
+class TestServiceCache:
+    """Test that the service caches records rather than models."""
+
+    def test_remembered_issues_are_records(self, issue):
+        with patch("chora_github.core.services.Github"):
+            from chora_github.core.services import GithubToolService
+
+            service = GithubToolService(token="test_token")
+
+        service._remember_issues("Owner/Repo", [issue])
+
+        cached = service._cached_issue("owner/repo", issue.number)
+        assert isinstance(cached, IssueRecord)
+        assert cached.to_model() == issue
@@ -0,0 +1,322 @@
+"""Tests for retrying transient upstream failures.
+
+Service tests run real PyGithub, requests and urllib3 objects, with
+urllib3's connection pool answering from a script of outcomes, so the
+retry policy is exercised exactly as it would be against GitHub. Backoff
+jitter is fixed at 0, so retries do not wait.
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from urllib3 import HTTPResponse
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import ProtocolError
+
+from chora_github.core import upstream
+from chora_github.core.exceptions import GithubError, GithubRateLimitError, GithubServiceError
+from chora_github.core.metrics import UPSTREAM_RETRIES, UPSTREAM_RETRIES_DENIED
+from chora_github.core.models import CreateIssueRequest, GetIssueRequest, UpdateIssueRequest
+from chora_github.core.services import GithubToolService
+from chora_github.core.upstream import RetryBudget, UpstreamRetry, idempotent_writes
+
+
+REPO = "octocat/Hello-World"
+ISSUE = "/repos/{owner}/{repo}/issues/{number}"
+GET_ISSUE = f"GET /repos/{REPO}/issues/1"
+SECONDARY_LIMIT = {"message": "You have exceeded a secondary rate limit."}
+
+
+def issue_payload():
+    return {
+        "number": 1,
+        "title": "Issue 1",
+        "state": "open",
+        "html_url": f"https://github.com/{REPO}/issues/1",
+        "url": f"https://api.github.com/repos/{REPO}/issues/1",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-02T00:00:00Z",
+        "body": "",
+        "user": {"login": "octocat"},
+        "labels": [],
+        "assignees": [],
+    }
+
+
+class FlakyGithub:
+    """Answers requests from per-request scripts of outcomes, then succeeds.
+
+    Scripts are keyed by method (``"POST"``) or method and path
+    (``"GET /repos/o/r/issues/1"``). An outcome is a status code, a
+    ``(status, headers, body)`` tuple or an exception to raise (e.g. a
+    connection reset).
+    """
+
+    def __init__(self):
+        self.scripts = {}
+        self.requests = []
+
+    def fail(self, request, *outcomes):
+        self.scripts[request] = list(outcomes)
+
+    def __call__(self, pool, conn, method, url, body=None, headers=None, **kwargs):
+        path = url.split("?")[0]
+        self.requests.append((method, path))
+        script = self.scripts.get(f"{method} {path}", self.scripts.get(method, []))
+        outcome = script.pop(0) if script else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, response_headers, payload = (
+            outcome if isinstance(outcome, tuple) else (outcome, {}, None)
+        )
+        if payload is None:
+            if status >= 400:
+                payload = {"message": "Server Error"}
+            elif url.startswith(f"/repos/{REPO}/issues"):
+                payload = issue_payload()
+            else:
+                payload = {"full_name": REPO, "url": f"https://api.github.com/repos/{REPO}"}
+        return HTTPResponse(
+            body=io.BytesIO(json.dumps(payload).encode()),
+            headers={"Content-Type": "application/json", **response_headers},
+            status=status,
+            preload_content=False,
+            request_method=method,
+            request_url=url,
+        )
+
+
+@pytest.fixture(autouse=True)
+def budget(monkeypatch):
+    """A full retry budget per test, and no backoff waits."""
+    fresh = RetryBudget()
+    monkeypatch.setattr(upstream, "RETRY_BUDGET", fresh)
+    with patch("chora_github.core.upstream.random") as random:
+        random.random.return_value = 0.0
+        yield fresh
+
+
+@pytest.fixture
+def github():
+    fake = FlakyGithub()
+    with patch.object(HTTPConnectionPool, "_make_request", autospec=True, side_effect=fake):
+        yield fake
+
+
+def make_service(**kwargs):
+    return GithubToolService(token="t", client_pacing=False, **kwargs)
+
+
+def retries(reason, endpoint=ISSUE, method="GET"):
+    return UPSTREAM_RETRIES.value(method=method, endpoint=endpoint, reason=reason)
+
+
+def connection_reset():
+    return ProtocolError("Connection aborted.", ConnectionResetError(104, "reset by peer"))
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+
+class TestReads:
+    """Test that failed reads are resent on their own."""
+
+    def test_bad_gateway_is_retried(self, github):
+        github.fail(GET_ISSUE, 502, 503)
+        before = retries("502"), retries("503")
+
+        response = make_service().get_issue(GetIssueRequest(repo=REPO, issue_number=1))
+
+        assert response.issue.number == 1
+        # Only the failed request is resent, not the repository lookup
+        assert [path for _, path in github.requests] == [f"/repos/{REPO}"] + [
+            f"/repos/{REPO}/issues/1"
+        ] * 3
+        assert (retries("502"), retries("503")) == (before[0] + 1, before[1] + 1)
+
+    def test_connection_reset_is_retried(self, github):
+        github.fail("GET", connection_reset())
+        before = retries("connection", endpoint="/repos/{owner}/{repo}")
+
+        make_service().client.get_repo(REPO)
+
+        assert len(github.requests) == 2
+        assert retries("connection", endpoint="/repos/{owner}/{repo}") == before + 1
+
+    def test_gives_up_with_last_response(self, github):
+        github.fail(GET_ISSUE, *[502] * 10)
+
+        with pytest.raises(GithubError, match="Server Error"):
+            make_service().get_issue(GetIssueRequest(repo=REPO, issue_number=1))
+
+        assert github.requests.count(("GET", f"/repos/{REPO}/issues/1")) == (
+            1 + upstream.DEFAULT_RETRIES
+        )
+
+    def test_client_errors_are_not_retried(self, github):
+        github.fail(GET_ISSUE, 404)
+
+        with pytest.raises(GithubError):
+            make_service().get_issue(GetIssueRequest(repo=REPO, issue_number=1))
+
+        assert len(github.requests) == 2
+
+
+# ============================================================================
+# Writes
+# ============================================================================
+
+
+class TestWrites:
+    """Test that writes are only resent when that is safe."""
+
+    def test_create_is_not_retried(self, github):
+        github.fail("POST", 502)
+
+        with pytest.raises(GithubError):
+            make_service().create_issue(CreateIssueRequest(repo=REPO, title="Bug", body=""))
+
+        assert [method for method, _ in github.requests] == ["GET", "POST"]
+
+    def test_create_connection_reset_raises_service_error(self, github):
+        github.fail("POST", connection_reset())
+
+        with pytest.raises(GithubServiceError) as raised:
+            make_service().create_issue(CreateIssueRequest(repo=REPO, title="Bug", body=""))
+
+        assert raised.value.details["operation"] == "POST /repos/{owner}/{repo}/issues"
+        assert [method for method, _ in github.requests] == ["GET", "POST"]
+
+    def test_update_is_not_retried_by_default(self, github):
+        github.fail("PATCH", 503)
+
+        with pytest.raises(GithubError):
+            make_service().update_issue(UpdateIssueRequest(repo=REPO, issue_number=1, title="A"))
+
+        assert len(github.requests) == 1
+
+    def test_update_retried_when_opted_in(self, github):
+        github.fail("PATCH", 503, connection_reset())
+
+        response = make_service(retry_writes=True).update_issue(
+            UpdateIssueRequest(repo=REPO, issue_number=1, title="A")
+        )
+
+        assert response.issue.number == 1
+        assert [method for method, _ in github.requests] == ["PATCH"] * 3
+
+    def test_rate_limited_create_is_retried(self, github):
+        github.fail("POST", (403, {"Retry-After": "0"}, SECONDARY_LIMIT))
+
+        response = make_service().create_issue(CreateIssueRequest(repo=REPO, title="Bug", body=""))
+
+        assert response.issue.number == 1
+        assert [method for method, _ in github.requests] == ["GET", "POST", "POST"]
+
+    def test_persistent_rate_limit(self, github):
+        github.fail("POST", *[(403, {"Retry-After": "0"}, SECONDARY_LIMIT)] * 10)
+
+        with pytest.raises(GithubRateLimitError):
+            make_service().create_issue(CreateIssueRequest(repo=REPO, title="Bug", body=""))
+
+        assert [method for method, _ in github.requests].count(
+            "POST"
+        ) == 1 + upstream.DEFAULT_RETRIES
+
+
+# ============================================================================
+# Budget
+# ============================================================================
+
+
+class TestRetryBudget:
+    """Test the process-wide retry budget."""
+
+    def test_withdraw_until_spent(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+
+        assert budget.withdraw() and budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+    def test_deposits_are_capped(self):
+        budget = RetryBudget(max_tokens=2)
+        for _ in range(10):
+            budget.deposit()
+
+        assert budget.tokens == 2
+
+    def test_spent_budget_stops_retries(self, github, budget):
+        budget.tokens = 1.0
+        github.fail(GET_ISSUE, 502, 502, 502)
+        before = UPSTREAM_RETRIES_DENIED.value(method="GET", endpoint=ISSUE)
+
+        with pytest.raises(GithubError):
+            make_service().get_issue(GetIssueRequest(repo=REPO, issue_number=1))
+
+        # Repository lookup, the request, and the one retry the budget allowed
+        assert len(github.requests) == 3
+        assert UPSTREAM_RETRIES_DENIED.value(method="GET", endpoint=ISSUE) == before + 1
+
+    def test_denied_connection_retry_raises_service_error(self, github, budget):
+        budget.tokens = 1.0
+        github.fail(GET_ISSUE, connection_reset(), connection_reset(), connection_reset())
+
+        with pytest.raises(GithubServiceError) as raised:
+            make_service().get_issue(GetIssueRequest(repo=REPO, issue_number=1))
+
+        assert raised.value.details["operation"] == f"GET {ISSUE}"
+        assert len(github.requests) == 3
+
+
+# ============================================================================
+# Policy
+# ============================================================================
+
+
+class TestUpstreamRetry:
+    """Test the retry policy on its own."""
+
+    def test_backoff_has_full_jitter(self, budget):
+        retry = UpstreamRetry(backoff_factor=1.0, backoff_max=3.0)
+        for _ in range(3):
+            retry = retry.increment("GET", "/repos/o/r", error=connection_reset())
+
+        with patch("chora_github.core.upstream.random") as random:
+            random.random.return_value = 0.5
+            assert retry.new().get_backoff_time() == 1.5  # half of min(3, 1 * 2**2)
+            random.random.return_value = 1.0
+            assert retry.new().get_backoff_time() == 3.0
+
+    def test_first_retry_waits_up_to_backoff_factor(self):
+        retry = UpstreamRetry(backoff_factor=0.5)
+        retry._jitter = 1.0
+
+        assert retry.get_backoff_time() == 0.0
+        retry = retry.new(history=(*retry.history, None))
+        retry._jitter = 1.0
+        assert retry.get_backoff_time() == 0.5
+
+    def test_honours_retry_after(self):
+        response = HTTPResponse(status=503, headers={"Retry-After": "2"})
+
+        with patch("urllib3.util.retry.time.sleep") as sleep:
+            UpstreamRetry().sleep(response)
+
+        sleep.assert_called_once_with(2)
+
+    def test_methods(self):
+        retry = UpstreamRetry()
+
+        assert retry.is_retry("GET", 502)
+        assert not retry.is_retry("POST", 502)
+        assert not retry.is_retry("GET", 404)
+        assert retry.is_retry("POST", 429)
+        with idempotent_writes():
+            assert retry.is_retry("PATCH", 502)
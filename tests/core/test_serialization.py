@@ -0,0 +1,72 @@
+"""Tests for JSON serialization of responses."""
+
+import json
+from unittest.mock import patch
+
+from chora_github.core import serialization
+from chora_github.core.models import IssueData, ListIssuesResponse
+from chora_github.core.serialization import dumps, dumps_envelope
+
+
+def make_response() -> ListIssuesResponse:
+    issue = IssueData(
+        number=1,
+        title="Bug in été",
+        state="open",
+        url="https://github.com/owner/repo/issues/1",
+        created_at="2025-11-01T10:00:00Z",
+        labels=["bug"],
+    )
+    return ListIssuesResponse(issues=[issue], total_count=1)
+
+
+class TestDumps:
+    """Test compact and pretty serialization."""
+
+    def test_model_is_compact_and_equivalent(self):
+        response = make_response()
+
+        text = dumps(response, pretty=False)
+
+        assert "\n" not in text
+        assert ": " not in text
+        assert json.loads(text) == response.model_dump()
+
+    def test_pretty_output_is_indented(self):
+        text = dumps({"a": 1}, pretty=True)
+
+        assert text == '{\n  "a": 1\n}'
+
+    def test_dict_without_orjson(self):
+        with patch.object(serialization, "orjson", None):
+            assert dumps({"a": [1, 2]}, pretty=False) == '{"a":[1,2]}'
+
+    def test_default_follows_setting(self):
+        with patch.object(serialization, "PRETTY_DEFAULT", True):
+            assert "\n" in dumps({"a": 1})
+
+
+class TestDumpsEnvelope:
+    """Test embedding models in a small envelope."""
+
+    def test_embeds_model(self):
+        response = make_response()
+
+        text = dumps_envelope({"uri": "github://repo/o/r/issues"}, "data", response)
+
+        assert json.loads(text) == {
+            "uri": "github://repo/o/r/issues",
+            "data": response.model_dump(),
+        }
+
+    def test_empty_envelope(self):
+        text = dumps_envelope({}, "data", make_response())
+
+        assert json.loads(text)["data"]["total_count"] == 1
+
+    def test_pretty_setting(self):
+        with patch.object(serialization, "PRETTY_DEFAULT", True):
+            text = dumps_envelope({"uri": "x"}, "data", make_response())
+
+        assert text.startswith('{\n  "uri"')
+        assert json.loads(text)["data"]["issues"][0]["number"] == 1
@@ -0,0 +1,149 @@
+"""Tests for optional tracing spans.
+
+Spans are recorded by the ``tracer`` fixture (an OpenTelemetry tracer
+stand-in, see conftest); service tests run real PyGithub objects against
+canned payloads with ``requests`` patched.
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from chora_github.core import tracing, upstream
+from chora_github.core.models import GetPRRequest
+from chora_github.core.serialization import dumps
+from chora_github.core.services import GithubToolService
+
+
+API = "https://api.github.com"
+TRACEPARENT = "00-" + "1" * 32 + "-" + "2" * 16 + "-01"
+
+ROUTES = {
+    "/repos/octocat/Hello-World": {
+        "full_name": "octocat/Hello-World",
+        "url": f"{API}/repos/octocat/Hello-World",
+    },
+    "/repos/octocat/Hello-World/pulls/1": {
+        "number": 1,
+        "title": "PR 1",
+        "state": "open",
+        "html_url": "https://github.com/octocat/Hello-World/pull/1",
+        "url": f"{API}/repos/octocat/Hello-World/pulls/1",
+        "created_at": "2025-01-01T00:00:00Z",
+        "head": {"ref": "feature"},
+        "base": {"ref": "main"},
+        "user": {"login": "octocat"},
+        "mergeable": True,
+        "merged": False,
+    },
+}
+
+
+def fake_github(session, method, url, **kwargs):
+    path = urlsplit(url).path
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200 if path in ROUTES else 404
+    response._content = json.dumps(ROUTES.get(path, {"message": "Not Found"})).encode()
+    return response
+
+
+@tracing.traced("probe.sync")
+def sync_probe(value: int) -> int:
+    return value * 2
+
+
+@tracing.traced("probe.async")
+async def async_probe(value: int) -> int:
+    return value * 3
+
+
+class TestDisabled:
+    """Test the no-op fallback."""
+
+    def test_span_is_shared_noop(self):
+        assert not tracing.enabled()
+        assert tracing.span("a") is tracing.span("b", {"key": 1})
+        with tracing.span("a") as span:
+            assert span is None
+
+    def test_traced_functions_call_through(self):
+        assert sync_probe(2) == 4
+        assert asyncio.run(async_probe(2)) == 6
+        assert sync_probe.__name__ == "sync_probe"
+
+    def test_no_context_without_tracing(self):
+        assert tracing.extract_context({"traceparent": TRACEPARENT}) is None
+
+
+class TestSpans:
+    """Test spans emitted when tracing is enabled."""
+
+    def test_traced_sync_and_async(self, tracer):
+        sync_probe(1)
+        asyncio.run(async_probe(1))
+
+        assert tracer.names() == ["probe.sync", "probe.async"]
+
+    def test_none_attributes_are_skipped(self, tracer):
+        with tracing.span("outer", {"kept": 1, "dropped": None}) as outer, tracing.span("inner"):
+            pass
+
+        assert outer.attributes == {"kept": 1}
+        assert tracer.names(parent=outer) == ["inner"]
+
+    def test_service_call_layers(self, tracer):
+        with patch.object(requests.Session, "request", autospec=True, side_effect=fake_github):
+            service = GithubToolService(token="t", client_pacing=False)
+            service.get_pr(GetPRRequest(repo="octocat/Hello-World", pr_number=1))
+
+        (operation,) = [span for span in tracer.spans if span.name == "service.get_pr"]
+        assert operation.attributes == {
+            "github.tool": "get_pr",
+            "github.repo": "octocat/Hello-World",
+        }
+        assert tracer.names(parent=operation) == [
+            "GET /repos/{owner}/{repo}",
+            "GET /repos/{owner}/{repo}/pulls/{number}",
+            "convert.pr",
+        ]
+        request = tracer.spans[2]
+        assert request.attributes["http.response.status_code"] == 200
+        assert request.attributes["url.path"] == "/repos/octocat/Hello-World/pulls/1"
+
+    def test_upstream_page(self, tracer):
+        connection = upstream.ObservedHTTPSConnection("api.github.com")
+        connection.session = Mock()
+        connection.session.get.return_value = Mock(status_code=200, headers={})
+        connection.request("GET", "/repos/o/r/issues?state=open&page=3", None, {})
+
+        connection.getresponse()
+
+        (span,) = tracer.spans
+        assert span.name == "GET /repos/{owner}/{repo}/issues"
+        assert span.attributes["github.page"] == 3
+        assert span.attributes["server.address"] == "api.github.com"
+
+    def test_serialization(self, tracer):
+        dumps({"a": 1})
+
+        assert tracer.names() == ["serialize.json"]
+
+
+class TestOpenTelemetry:
+    """Test against the real OpenTelemetry API (no SDK: non-recording spans)."""
+
+    def test_enable_with_global_tracer(self):
+        pytest.importorskip("opentelemetry")
+
+        assert tracing.enable()
+        try:
+            with tracing.span("otel", {"key": "value"}) as span:
+                assert not span.is_recording()
+            assert tracing.extract_context({"traceparent": TRACEPARENT}) is not None
+        finally:
+            tracing.disable()
@@ -0,0 +1,291 @@
+"""Tests for the durable write-behind queue.
+
+The service is mocked and the worker is driven with drain_once() and an
+injected clock, so retries and backoff are tested without sleeping.
+"""
+
+import sqlite3
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from chora_github.core.exceptions import (
+    GithubError,
+    GithubNotFoundError,
+    GithubRateLimitError,
+    GithubTimeoutError,
+)
+from chora_github.core.models import (
+    CreateIssueRequest,
+    CreateIssueResponse,
+    IssueData,
+    UpdateIssueRequest,
+    UpdateIssueResponse,
+    WriteJobStatus,
+)
+from chora_github.core.write_queue import WriteQueue
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_issue(number: int = 1) -> IssueData:
+    return IssueData(
+        number=number,
+        title="Queued",
+        state="open",
+        url=f"https://github.com/owner/repo/issues/{number}",
+        created_at="2025-11-01T10:00:00Z",
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def service():
+    service = Mock()
+    service.create_issue.return_value = CreateIssueResponse(issue=make_issue(7))
+    service.update_issue.return_value = UpdateIssueResponse(issue=make_issue(7))
+    return service
+
+
+@pytest.fixture
+def queue(service, clock):
+    queue = WriteQueue(service, clock=clock, base_delay=2.0)
+    yield queue
+    queue.close()
+
+
+def create_request(title: str = "Queued") -> CreateIssueRequest:
+    return CreateIssueRequest(repo="owner/repo", title=title, body="")
+
+
+def update_request() -> UpdateIssueRequest:
+    return UpdateIssueRequest(repo="owner/repo", issue_number=7, state="closed")
+
+
+class TestEnqueue:
+    """Test acknowledging writes and idempotency keys."""
+
+    def test_enqueue_returns_pending_job(self, queue, service):
+        response = queue.enqueue_create(create_request(), idempotency_key="k1")
+
+        assert response.duplicate is False
+        assert response.job.status == WriteJobStatus.PENDING
+        assert response.job.idempotency_key == "k1"
+        assert response.job.operation == "create_issue"
+        service.create_issue.assert_not_called()
+
+    def test_same_idempotency_key_returns_existing_job(self, queue):
+        first = queue.enqueue_create(create_request(), idempotency_key="k1")
+        second = queue.enqueue_create(create_request("Other"), idempotency_key="k1")
+
+        assert second.duplicate is True
+        assert second.job.job_id == first.job.job_id
+        assert queue.counts() == {"pending": 1}
+
+    def test_jobs_without_key_are_independent(self, queue):
+        queue.enqueue_create(create_request())
+        queue.enqueue_create(create_request())
+
+        assert queue.counts() == {"pending": 2}
+
+    def test_get_unknown_job(self, queue):
+        assert queue.get("missing") is None
+
+
+class TestDrain:
+    """Test background draining, retry and backoff."""
+
+    def test_drain_performs_create(self, queue, service):
+        job_id = queue.enqueue_create(create_request(), idempotency_key="k1").job.job_id
+
+        assert queue.drain_once() == 1
+
+        job = queue.get(job_id)
+        assert job.status == WriteJobStatus.SUCCEEDED
+        assert job.attempts == 1
+        assert job.issue.number == 7
+        assert service.create_issue.call_args.args[0].title == "Queued"
+
+    def test_drain_performs_update(self, queue, service):
+        request = UpdateIssueRequest(repo="owner/repo", issue_number=7, state="closed")
+        job_id = queue.enqueue_update(request).job.job_id
+
+        queue.drain_once()
+
+        assert queue.get(job_id).status == WriteJobStatus.SUCCEEDED
+        assert service.update_issue.call_args.args[0].state == "closed"
+
+    def test_transient_error_is_retried_after_backoff(self, queue, service, clock):
+        service.update_issue.side_effect = [
+            GithubError("GitHub API error: Bad gateway"),
+            UpdateIssueResponse(issue=make_issue(7)),
+        ]
+        job_id = queue.enqueue_update(update_request()).job.job_id
+
+        queue.drain_once()
+        job = queue.get(job_id)
+        assert job.status == WriteJobStatus.PENDING
+        assert job.error == "GitHub API error: Bad gateway"
+
+        # Not due yet
+        assert queue.drain_once() == 0
+        clock.now += 2.0
+        assert queue.drain_once() == 1
+        assert queue.get(job_id).status == WriteJobStatus.SUCCEEDED
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            GithubError("GitHub API error: Bad gateway"),
+            GithubTimeoutError("GitHub did not respond within 15s"),
+            ConnectionResetError("Connection reset by peer"),
+        ],
+    )
+    def test_ambiguous_create_failure_is_not_retried(self, queue, service, clock, error):
+        # GitHub may have created the issue: sending it again could duplicate it
+        service.create_issue.side_effect = error
+        job_id = queue.enqueue_create(create_request()).job.job_id
+
+        queue.drain_once()
+        clock.now += 3600
+        queue.drain_once()
+
+        job = queue.get(job_id)
+        assert job.status == WriteJobStatus.FAILED
+        assert job.error == str(error)
+        assert service.create_issue.call_count == 1
+
+    def test_rate_limit_honours_retry_after(self, queue, service, clock):
+        service.create_issue.side_effect = GithubRateLimitError(
+            "Secondary rate limit", retry_after_seconds=30
+        )
+        queue.enqueue_create(create_request())
+
+        queue.drain_once()
+        clock.now += 29.0
+        assert queue.drain_once() == 0
+        clock.now += 1.0
+        assert queue.drain_once() == 1
+
+    def test_permanent_error_fails_immediately(self, queue, service):
+        service.create_issue.side_effect = GithubNotFoundError("Repository not found")
+        job_id = queue.enqueue_create(create_request()).job.job_id
+
+        queue.drain_once()
+
+        job = queue.get(job_id)
+        assert job.status == WriteJobStatus.FAILED
+        assert job.error_code == "NOT_FOUND"
+
+    def test_fails_after_max_attempts(self, service, clock):
+        service.update_issue.side_effect = GithubError("boom")
+        queue = WriteQueue(service, clock=clock, max_attempts=2, base_delay=1.0)
+        job_id = queue.enqueue_update(update_request()).job.job_id
+
+        queue.drain_once()
+        clock.now += 1.0
+        queue.drain_once()
+
+        assert queue.get(job_id).status == WriteJobStatus.FAILED
+        assert service.update_issue.call_count == 2
+        queue.close()
+
+    def test_backoff_is_exponential_and_capped(self, service):
+        queue = WriteQueue(service, base_delay=2.0, max_delay=10.0)
+
+        assert [queue.backoff(n) for n in (1, 2, 3, 4)] == [2.0, 4.0, 8.0, 10.0]
+        queue.close()
+
+
+class TestDurability:
+    """Test that jobs survive reopening the database."""
+
+    def test_interrupted_jobs_resume_after_restart(self, tmp_path, service, clock):
+        path = str(tmp_path / "queue.db")
+        queue = WriteQueue(service, path=path, clock=clock)
+        job_id = queue.enqueue_update(update_request(), idempotency_key="k1").job.job_id
+        # Simulate a crash while the job was running
+        queue._claim_due(10)
+        queue.close()
+
+        reopened = WriteQueue(service, path=path, clock=clock)
+        assert reopened.get(job_id).status == WriteJobStatus.PENDING
+        assert reopened.enqueue_update(update_request(), idempotency_key="k1").duplicate
+
+        reopened.drain_once()
+        assert reopened.get(job_id).status == WriteJobStatus.SUCCEEDED
+        reopened.close()
+
+    def test_interrupted_create_is_not_resent(self, tmp_path, service, clock):
+        path = str(tmp_path / "queue.db")
+        queue = WriteQueue(service, path=path, clock=clock)
+        job_id = queue.enqueue_create(create_request()).job.job_id
+        queue._claim_due(10)
+        queue.close()
+
+        reopened = WriteQueue(service, path=path, clock=clock)
+        reopened.drain_once()
+
+        job = reopened.get(job_id)
+        assert job.status == WriteJobStatus.FAILED
+        assert job.error_code == "INTERRUPTED"
+        service.create_issue.assert_not_called()
+        reopened.close()
+
+    def test_background_worker_drains(self, service):
+        queue = WriteQueue(service, poll_interval=0.01)
+        queue.start()
+        job_id = queue.enqueue_create(create_request()).job.job_id
+
+        for _ in range(200):
+            if queue.get(job_id).status == WriteJobStatus.SUCCEEDED:
+                break
+            time.sleep(0.01)
+
+        assert queue.get(job_id).status == WriteJobStatus.SUCCEEDED
+        queue.close()
+
+    def test_worker_survives_a_failed_drain(self, service, caplog):
+        queue = WriteQueue(service, poll_interval=0.01)
+        claim_due = queue._claim_due
+        calls = []
+
+        def flaky_claim(limit):
+            calls.append(limit)
+            if len(calls) == 1:
+                raise sqlite3.OperationalError("database is locked")
+            return claim_due(limit)
+
+        queue._claim_due = flaky_claim
+        job_id = queue.enqueue_update(update_request()).job.job_id
+        queue.start()
+
+        for _ in range(200):
+            if queue.get(job_id).status == WriteJobStatus.SUCCEEDED:
+                break
+            time.sleep(0.01)
+
+        assert queue.get(job_id).status == WriteJobStatus.SUCCEEDED
+        assert "Write queue drain failed" in caplog.text
+        queue.close()
+
+    def test_failed_drain_releases_running_jobs(self, queue, service):
+        update_id = queue.enqueue_update(update_request()).job.job_id
+        create_id = queue.enqueue_create(create_request()).job.job_id
+        queue._claim_due(10)  # claimed, then the drain fails
+
+        queue._recover_running()
+
+        assert queue.get(update_id).status == WriteJobStatus.PENDING
+        assert queue.get(create_id).error_code == "INTERRUPTED"
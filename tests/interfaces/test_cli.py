@@ -1,17 +1,26 @@
 """Tests for GitHub CLI Interface (SAP-043)
 
 Tests verify CLI commands, argument parsing, output formatting,
-and error handling.
+and error handling. Commands run against the mocked GithubToolService
+from conftest through a ToolDispatcher passed in the click context.
 
 Generated by: chora-base SAP-047 (Capability Server Template)
 """
 
 import json
-from uuid import uuid4
+import subprocess
+import sys
+from unittest.mock import DEFAULT
 
+import click
 import pytest
 from click.testing import CliRunner
-from github.interfaces.cli import cli
+
+from chora_github import __version__
+from chora_github.core import deadlines
+from chora_github.core.dispatch import ToolDispatcher
+from chora_github.interfaces.cli import cli
+from chora_github.interfaces.cli.commands import parse_parameters
 
 
 # ============================================================================
@@ -25,333 +34,143 @@ def runner():
     return CliRunner()
 
 
-# ============================================================================
-# Test Create Command
-# ============================================================================
-
-
-class TestCreateCommand:
-    """Test create command."""
-
-    def test_create_basic(self, runner):
-        """Test creating entity with basic arguments."""
-        result = runner.invoke(cli, ["create", "Test Entity"])
-
-        assert result.exit_code == 0
-        assert "Test Entity" in result.output
-
-    def test_create_with_description(self, runner):
-        """Test creating entity with description."""
-        result = runner.invoke(
-            cli, ["create", "Test Entity", "--description", "Test description"]
-        )
-
-        assert result.exit_code == 0
-        assert "Test Entity" in result.output
-
-    def test_create_with_metadata(self, runner):
-        """Test creating entity with metadata."""
-        result = runner.invoke(
-            cli,
-            [
-                "create",
-                "Test Entity",
-                "--metadata",
-                "key1=value1",
-                "--metadata",
-                "key2=value2",
-            ],
-        )
+@pytest.fixture
+def invoke(runner, mock_github_service):
+    """Invoke the CLI with a dispatcher over the mocked service."""
 
-        assert result.exit_code == 0
+    def invoke(*args):
+        with ToolDispatcher(mock_github_service) as dispatcher:
+            return runner.invoke(cli, list(args), obj={"dispatcher": dispatcher})
 
-    def test_create_json_output(self, runner):
-        """Test create with JSON output format."""
-        result = runner.invoke(cli, ["--format", "json", "create", "Test Entity"])
+    return invoke
 
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "id" in data
-        assert data["name"] == "Test Entity"
-
-    def test_create_invalid_metadata_format(self, runner):
-        """Test create with invalid metadata format."""
-        result = runner.invoke(
-            cli, ["create", "Test Entity", "--metadata", "invalid-format"]
-        )
 
-        assert result.exit_code == 1
-        assert "Invalid metadata format" in result.output
+REPO = "repo=octocat/Hello-World"
 
 
 # ============================================================================
-# Test List Command
+# Test Startup
 # ============================================================================
 
 
-class TestListCommand:
-    """Test list command."""
-
-    def test_list_empty(self, runner):
-        """Test listing when no entities exist."""
-        result = runner.invoke(cli, ["list"])
-
-        assert result.exit_code == 0
-        assert "No entities found" in result.output or "0" in result.output
-
-    def test_list_with_entities(self, runner):
-        """Test listing with existing entities."""
-        # Create some entities first
-        for i in range(3):
-            runner.invoke(cli, ["create", f"Entity {i}"])
-
-        result = runner.invoke(cli, ["list"])
-
-        assert result.exit_code == 0
-        assert "Entity 0" in result.output or "Entity" in result.output
-
-    def test_list_json_format(self, runner):
-        """Test list with JSON output."""
-        # Create entity
-        runner.invoke(cli, ["create", "Test Entity"])
-
-        result = runner.invoke(cli, ["--format", "json", "list"])
+class TestStartup:
+    """Test that startup only loads what the CLI needs."""
 
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "entities" in data
-        assert "total" in data
-
-    def test_list_with_status_filter(self, runner):
-        """Test list with status filter."""
-        result = runner.invoke(cli, ["list", "--status", "active"])
-
-        assert result.exit_code == 0
+    def test_help_does_not_import_service(self):
+        code = (
+            "import sys\n"
+            "from chora_github.interfaces.cli import cli\n"
+            "cli(['--help'], standalone_mode=False)\n"
+            "print(sorted({'github', 'pydantic', 'fastapi', 'fastmcp'} & set(sys.modules)))"
+        )
 
-    def test_list_with_name_filter(self, runner):
-        """Test list with name filter."""
-        result = runner.invoke(cli, ["list", "--name-contains", "test"])
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
 
-        assert result.exit_code == 0
+        assert "call" in result.stdout
+        assert result.stdout.strip().splitlines()[-1] == "[]"
 
-    def test_list_with_pagination(self, runner):
-        """Test list with pagination."""
-        result = runner.invoke(cli, ["list", "--offset", "0", "--limit", "10"])
+    def test_version(self, runner):
+        result = runner.invoke(cli, ["--version"])
 
         assert result.exit_code == 0
+        assert __version__ in result.output
 
 
 # ============================================================================
-# Test Get Command
+# Test Commands
 # ============================================================================
 
 
-class TestGetCommand:
-    """Test get command."""
-
-    def test_get_existing_entity(self, runner):
-        """Test getting an existing entity."""
-        # Create entity
-        create_result = runner.invoke(
-            cli, ["--format", "json", "create", "Test Entity"]
-        )
-        entity_data = json.loads(create_result.output)
-        entity_id = entity_data["id"]
+class TestToolsCommand:
+    """Test the tools command."""
 
-        # Get entity
-        result = runner.invoke(cli, ["get", entity_id])
+    def test_lists_tools(self, invoke):
+        result = invoke("tools")
 
         assert result.exit_code == 0
-        assert "Test Entity" in result.output
+        assert "list_issues" in result.output
+        assert "issue_number" in result.output
 
-    def test_get_nonexistent_entity(self, runner):
-        """Test getting non-existent entity."""
-        fake_id = str(uuid4())
-        result = runner.invoke(cli, ["get", fake_id])
 
-        assert result.exit_code == 1
-        assert "not found" in result.output.lower()
-
-    def test_get_invalid_uuid(self, runner):
-        """Test get with invalid UUID format."""
-        result = runner.invoke(cli, ["get", "not-a-uuid"])
+class TestCallCommand:
+    """Test the call command."""
 
-        assert result.exit_code == 1
-        assert "Invalid UUID" in result.output
-
-    def test_get_json_format(self, runner):
-        """Test get with JSON output."""
-        # Create entity
-        create_result = runner.invoke(
-            cli, ["--format", "json", "create", "Test Entity"]
-        )
-        entity_data = json.loads(create_result.output)
-        entity_id = entity_data["id"]
-
-        # Get with JSON format
-        result = runner.invoke(cli, ["--format", "json", "get", entity_id])
+    def test_call_with_params(self, invoke, mock_github_service):
+        result = invoke("--format", "json", "call", "get_issue", "-p", REPO, "-p", "issue_number=1")
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert data["id"] == entity_id
-
-
-# ============================================================================
-# Test Update Command
-# ============================================================================
+        assert json.loads(result.output)["issue"]["number"] == 1
+        request = mock_github_service.get_issue.call_args.args[0]
+        assert request.issue_number == 1
 
+    def test_call_with_json(self, invoke):
+        parameters = '{"repo": "octocat/Hello-World", "state": "open"}'
 
-class TestUpdateCommand:
-    """Test update command."""
+        result = invoke("--format", "json", "call", "list_issues", "--json", parameters)
 
-    def test_update_name(self, runner):
-        """Test updating entity name."""
-        # Create entity
-        create_result = runner.invoke(
-            cli, ["--format", "json", "create", "Original Name"]
-        )
-        entity_data = json.loads(create_result.output)
-        entity_id = entity_data["id"]
+        assert result.exit_code == 0
+        assert json.loads(result.output)["total_count"] == 1
 
-        # Update name
-        result = runner.invoke(cli, ["update", entity_id, "--name", "Updated Name"])
+    def test_debug_reports_upstream_requests(self, invoke):
+        result = invoke("--format", "json", "call", "list_issues", "-p", REPO, "--debug")
 
         assert result.exit_code == 0
-        assert "Updated Name" in result.output
+        assert json.loads(result.output)["debug"]["requests"] == 0
 
-    def test_update_description(self, runner):
-        """Test updating entity description."""
-        # Create entity
-        create_result = runner.invoke(
-            cli, ["--format", "json", "create", "Test Entity"]
+    def test_timeout_is_call_deadline(self, invoke, mock_github_service):
+        seen = []
+        mock_github_service.list_issues.side_effect = lambda request: (
+            seen.append(deadlines.current()) or DEFAULT
         )
-        entity_data = json.loads(create_result.output)
-        entity_id = entity_data["id"]
 
-        # Update description
-        result = runner.invoke(
-            cli, ["update", entity_id, "--description", "New description"]
-        )
+        result = invoke("call", "list_issues", "-p", REPO, "--timeout", "2.5")
 
         assert result.exit_code == 0
+        assert seen[0].seconds == 2.5
+        assert seen[0].operation == "list_issues"
 
-    def test_update_no_fields_provided(self, runner):
-        """Test update with no fields fails."""
-        fake_id = str(uuid4())
-        result = runner.invoke(cli, ["update", fake_id])
+    def test_invalid_timeout(self, invoke):
+        result = invoke("call", "list_issues", "-p", REPO, "--timeout", "0")
 
-        assert result.exit_code == 1
-        assert "at least one update field" in result.output.lower()
+        assert result.exit_code == 2
 
+    def test_tool_error(self, invoke):
+        result = invoke("call", "get_issue", "-p", REPO, "-p", "issue_number=999")
 
-# ============================================================================
-# Test Delete Command
-# ============================================================================
-
-
-class TestDeleteCommand:
-    """Test delete command."""
+        assert result.exit_code == 1
+        assert "NOT_FOUND" in result.output
 
-    def test_delete_with_yes_flag(self, runner):
-        """Test delete with --yes flag (no confirmation)."""
-        # Create entity
-        create_result = runner.invoke(
-            cli, ["--format", "json", "create", "Test Entity"]
-        )
-        entity_data = json.loads(create_result.output)
-        entity_id = entity_data["id"]
+    def test_unknown_tool(self, invoke):
+        result = invoke("call", "delete_repo")
 
-        # Delete with --yes
-        result = runner.invoke(cli, ["delete", entity_id, "--yes"])
+        assert result.exit_code == 1
+        assert "UNKNOWN_TOOL" in result.output
 
-        assert result.exit_code == 0
-        assert "deleted successfully" in result.output.lower()
+    def test_missing_token(self, runner, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
 
-    def test_delete_nonexistent_entity(self, runner):
-        """Test deleting non-existent entity."""
-        fake_id = str(uuid4())
-        result = runner.invoke(cli, ["delete", fake_id, "--yes"])
+        result = runner.invoke(cli, ["call", "list_issues", "-p", REPO])
 
         assert result.exit_code == 1
-        assert "not found" in result.output.lower()
+        assert "GITHUB_TOKEN" in result.output
 
 
-# ============================================================================
-# Test Status Command
-# ============================================================================
-
+class TestParseParameters:
+    """Test tool parameter parsing."""
 
-class TestStatusCommand:
-    """Test status command."""
-
-    def test_update_status(self, runner):
-        """Test updating entity status."""
-        # Create entity
-        create_result = runner.invoke(
-            cli, ["--format", "json", "create", "Test Entity"]
+    def test_values_are_json_when_possible(self):
+        parameters = parse_parameters(
+            '{"repo": "o/r"}', ("issue_number=1", "state=open", 'labels=["bug"]')
         )
-        entity_data = json.loads(create_result.output)
-        entity_id = entity_data["id"]
-
-        # Update to active
-        result = runner.invoke(cli, ["status", entity_id, "active"])
-
-        assert result.exit_code == 0
-
-    def test_update_status_invalid_value(self, runner):
-        """Test update with invalid status value."""
-        fake_id = str(uuid4())
-        result = runner.invoke(cli, ["status", fake_id, "invalid-status"])
 
-        # Should fail at argument parsing level
-        assert result.exit_code != 0
+        assert parameters == {"repo": "o/r", "issue_number": 1, "state": "open", "labels": ["bug"]}
 
+    def test_invalid_parameter(self):
+        with pytest.raises(click.BadParameter):
+            parse_parameters(None, ("state",))
 
-# ============================================================================
-# Test Health Command
-# ============================================================================
-
-
-class TestHealthCommand:
-    """Test health command."""
-
-    def test_health_check(self, runner):
-        """Test health check command."""
-        result = runner.invoke(cli, ["health"])
-
-        assert result.exit_code == 0
-        assert "healthy" in result.output.lower() or "status" in result.output.lower()
-
-    def test_health_json_format(self, runner):
-        """Test health check with JSON output."""
-        result = runner.invoke(cli, ["--format", "json", "health"])
-
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert "status" in data
-
-
-# ============================================================================
-# Test Output Formats
-# ============================================================================
-
-
-class TestOutputFormats:
-    """Test different output formats."""
-
-    def test_table_format(self, runner):
-        """Test table output format (default)."""
-        result = runner.invoke(cli, ["health"])
-        assert result.exit_code == 0
-
-    def test_json_format(self, runner):
-        """Test JSON output format."""
-        result = runner.invoke(cli, ["--format", "json", "health"])
-        assert result.exit_code == 0
-        json.loads(result.output)  # Should parse as JSON
-
-    def test_yaml_format(self, runner):
-        """Test YAML output format."""
-        result = runner.invoke(cli, ["--format", "yaml", "health"])
-        assert result.exit_code == 0
-        assert ":" in result.output  # YAML uses colons
+    def test_json_must_be_object(self):
+        with pytest.raises(click.BadParameter):
+            parse_parameters("[1]", ())
@@ -9,8 +9,12 @@ Generated by: chora-base SAP-047 (Capability Server Template)
 Adapted for: GitHub Integration (8 tools, 3 resources)
 """
 
+import asyncio
 import json
 import os
+import subprocess
+import sys
+import threading
 import pytest
 from unittest.mock import patch, Mock
 
@@ -20,6 +24,7 @@ from chora_github.core.exceptions import (
     GithubPermissionError,
     GithubValidationError,
 )
+from chora_github.core.models import GetIssueResponse, IssueData, ListIssuesResponse
 
 
 # ============================================================================
@@ -116,6 +121,34 @@ class TestHelperFunctions:
             assert service is not None
             assert service.token == "ghp_env_token"
 
+    def test_get_service_is_shared_across_calls(self, monkeypatch):
+        """Test tool calls reuse one service per token and configuration."""
+        from chora_github.interfaces.mcp.tools import _get_service, _shared_service
+
+        _shared_service.cache_clear()
+        monkeypatch.delenv("GITHUB_USE_GRAPHQL", raising=False)
+
+        service = _get_service(token="ghp_test_token")
+        assert _get_service(token="ghp_test_token") is service
+        assert _get_service(token="ghp_other_token") is not service
+        monkeypatch.setenv("GITHUB_USE_GRAPHQL", "1")
+        assert _get_service(token="ghp_test_token").use_graphql is True
+        _shared_service.cache_clear()
+
+    def test_tools_run_within_tool_timeout(self):
+        """Test tool calls get a GITHUB_TOOL_TIMEOUT deadline."""
+        from chora_github.core import deadlines
+        from chora_github.interfaces.mcp.tools import _instrumented
+
+        @_instrumented("list_issues")
+        async def probe():
+            return deadlines.current()
+
+        with patch.dict(os.environ, {"GITHUB_TOOL_TIMEOUT": "5"}):
+            scope = asyncio.run(probe())
+        assert scope.seconds == 5
+        assert scope.operation == "list_issues"
+
 
 # ============================================================================
 # Test Data Models (Fixtures)
@@ -239,6 +272,137 @@ class TestMockGithubService:
         assert "Hello World" in response.content
 
 
+# ============================================================================
+# Test Bulk Read Tools
+# ============================================================================
+
+
+class TestBulkReadTools:
+    """Test github:get_issues and github:get_prs tools."""
+
+    async def test_get_issues_returns_found_and_not_found(self, mcp_tools, mock_github_service):
+        result = json.loads(
+            await mcp_tools["github:get_issues"]("octocat", "Hello-World", [1, 999])
+        )
+
+        assert [issue["number"] for issue in result["issues"]] == [1]
+        assert result["not_found"] == [999]
+        request = mock_github_service.get_issues.call_args.args[0]
+        assert request.repo == "octocat/Hello-World"
+        assert request.numbers == [1, 999]
+
+    async def test_get_prs(self, mcp_tools, mock_github_service):
+        result = json.loads(await mcp_tools["github:get_prs"]("octocat", "Hello-World", [1]))
+
+        assert result["pull_requests"][0]["number"] == 1
+        assert result["not_found"] == []
+
+    async def test_tool_span(self, mcp_tools, tracer):
+        await mcp_tools["github:get_prs"]("octocat", "Hello-World", [1])
+
+        (tool,) = [span for span in tracer.spans if span.name.startswith("mcp.tool")]
+        assert tool.name == "mcp.tool get_prs"
+        assert "serialize.json" in tracer.names(parent=tool)
+
+    async def test_tool_profile(self, mcp_tools, profiles):
+        await mcp_tools["github:get_prs"]("octocat", "Hello-World", [1], token="secret")
+
+        (path,) = profiles.glob("*.json")
+        sidecar = json.loads(path.read_text())
+        assert sidecar["tool"] == "get_prs"
+        assert sidecar["parameters"] == {
+            "owner": "octocat",
+            "repo": "Hello-World",
+            "pr_numbers": [1],
+        }
+
+    async def test_fields_are_passed_to_request(self, mcp_tools, mock_github_service):
+        await mcp_tools["github:get_issues"](
+            "octocat", "Hello-World", [1], fields="title,labels"
+        )
+
+        request = mock_github_service.get_issues.call_args.args[0]
+        assert request.fields == ["number", "title", "labels"]
+
+    async def test_unknown_field_returns_error(self, mcp_tools):
+        result = json.loads(
+            await mcp_tools["github:list_prs"]("octocat", "Hello-World", fields="labels")
+        )
+
+        assert result["success"] is False
+
+    async def test_get_issues_rejects_empty_list(self, mcp_tools):
+        result = json.loads(await mcp_tools["github:get_issues"]("octocat", "Hello-World", []))
+
+        assert result["success"] is False
+
+    async def test_tools_pass_owner_repo_slug(self, mcp_tools, mock_github_service):
+        await mcp_tools["github:list_issues"]("octocat", "Hello-World")
+
+        request = mock_github_service.list_issues.call_args.args[0]
+        assert request.repo == "octocat/Hello-World"
+
+    async def test_reads_run_off_the_event_loop_within_deadline(
+        self, mcp_tools, mock_github_service
+    ):
+        from chora_github.core import deadlines
+
+        loop_thread = threading.get_ident()
+        seen = []
+        response = mock_github_service.list_issues.return_value
+        mock_github_service.list_issues.side_effect = lambda request: (
+            seen.append((threading.get_ident(), deadlines.current())) or response
+        )
+
+        await mcp_tools["github:list_issues"]("octocat", "Hello-World")
+
+        ((thread, scope),) = seen
+        assert thread != loop_thread
+        assert scope is not None
+
+
+# ============================================================================
+# Test Batch Write Tools
+# ============================================================================
+
+
+class TestBatchWriteTools:
+    """Test github:create_issues and github:update_issues tools."""
+
+    async def test_create_issues_builds_items(self, mcp_tools, mock_github_service):
+        result = json.loads(
+            await mcp_tools["github:create_issues"](
+                "octocat", "Hello-World", [{"title": "A", "labels": ["bug"]}], max_concurrency=2
+            )
+        )
+
+        assert result["succeeded"] == 1
+        request = mock_github_service.create_issues.call_args.args[0]
+        assert request.max_concurrency == 2
+        assert request.items[0].repo == "octocat/Hello-World"
+        assert request.items[0].body == ""
+        assert request.items[0].labels == ["bug"]
+
+    async def test_batch_runs_off_the_event_loop(self, mcp_tools, mock_github_service):
+        loop_thread = threading.get_ident()
+        threads = []
+        response = mock_github_service.create_issues.return_value
+        mock_github_service.create_issues.side_effect = lambda request: (
+            threads.append(threading.get_ident()) or response
+        )
+
+        await mcp_tools["github:create_issues"]("octocat", "Hello-World", [{"title": "A"}])
+
+        assert threads and threads[0] != loop_thread
+
+    async def test_update_issues_invalid_item_returns_error(self, mcp_tools):
+        result = json.loads(
+            await mcp_tools["github:update_issues"]("octocat", "Hello-World", [{"title": "x"}])
+        )
+
+        assert result["success"] is False
+
+
 # ============================================================================
 # Test Resource Examples
 # ============================================================================
@@ -322,29 +486,216 @@ class TestToolExamples:
 class TestMCPIntegration:
     """Integration tests for MCP server."""
 
-    def test_mcp_server_creation_no_pytest(self):
-        """Test MCP server is NOT created during pytest runs."""
-        # Server should be None when PYTEST_CURRENT_TEST is set
-        with patch.dict(os.environ, {"PYTEST_CURRENT_TEST": "test"}):
-            # Re-import to trigger module-level check
-            import importlib
-            from chora_github.interfaces import mcp as mcp_module
+    def test_server_is_not_created_at_import(self):
+        """Test that importing the package creates no server (and no FastMCP)."""
+        code = (
+            "import sys\n"
+            "import chora_github.interfaces.mcp as m\n"
+            "print(m._server, sorted({'fastmcp', 'github'} & set(sys.modules)))"
+        )
 
-            importlib.reload(mcp_module)
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
 
-            # In test mode, mcp should be None
-            assert mcp_module.mcp is None
+        assert result.stdout.strip() == "None []"
 
-    def test_mcp_server_creation_normal_mode(self):
-        """Test MCP server IS created in normal (non-test) mode."""
-        # Clear PYTEST_CURRENT_TEST to simulate normal mode
-        with patch.dict(os.environ, {}, clear=True):
-            # Re-import to trigger module-level check
-            import importlib
-            from chora_github.interfaces import mcp as mcp_module
+    def test_server_is_created_on_first_access(self, monkeypatch):
+        """Test that ``mcp`` is created once, on first access."""
+        from chora_github.interfaces import mcp as mcp_module
+
+        monkeypatch.setattr(mcp_module, "_server", None)
+
+        server = mcp_module.mcp
+
+        assert server.name == "mcp-server-github"
+        assert mcp_module.mcp is server
+        assert mcp_module.get_server() is server
+
+    def test_startup_does_not_import_pygithub(self):
+        """Test that PyGithub is loaded by the first tool call, not by startup."""
+        code = (
+            "import sys\n"
+            "from chora_github.interfaces.mcp import get_server\n"
+            "get_server()\n"
+            "print('github' in sys.modules)"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+class TestQueuedWriteTools:
+    """Test queued write tools backed by the write queue."""
+
+    @pytest.fixture
+    def write_queue(self, mock_github_service, tmp_path, monkeypatch):
+        from chora_github.interfaces.mcp import tools
+
+        monkeypatch.setenv("GITHUB_WRITE_QUEUE_PATH", str(tmp_path / "queue.db"))
+        monkeypatch.setattr(tools, "_write_queue", None)
+        yield
+        if tools._write_queue is not None:
+            tools._write_queue.close()
+
+    async def test_queue_create_issue_is_idempotent(self, mcp_tools, write_queue):
+        first = json.loads(
+            await mcp_tools["github:queue_create_issue"](
+                "octocat", "Hello-World", "Bug", idempotency_key="k1"
+            )
+        )
+        second = json.loads(
+            await mcp_tools["github:queue_create_issue"](
+                "octocat", "Hello-World", "Bug", idempotency_key="k1"
+            )
+        )
+
+        assert first["job"]["repo"] == "octocat/Hello-World"
+        assert second["duplicate"] is True
+        assert second["job"]["job_id"] == first["job"]["job_id"]
+
+    async def test_get_write_job(self, mcp_tools, write_queue):
+        queued = json.loads(
+            await mcp_tools["github:queue_update_issue"](
+                "octocat", "Hello-World", 1, state="closed"
+            )
+        )
+
+        result = json.loads(
+            await mcp_tools["github:get_write_job"](queued["job"]["job_id"])
+        )
+
+        assert result["job"]["operation"] == "update_issue"
+
+    async def test_get_write_job_unknown(self, mcp_tools, write_queue):
+        result = json.loads(await mcp_tools["github:get_write_job"]("missing"))
+
+        assert result["success"] is False
+        assert result["error"]["type"] == "GithubNotFoundError"
+
+    async def test_queue_disabled_without_path(self, mcp_tools, monkeypatch):
+        from chora_github.interfaces.mcp import tools
+
+        monkeypatch.delenv("GITHUB_WRITE_QUEUE_PATH", raising=False)
+        monkeypatch.setattr(tools, "_write_queue", None)
+
+        result = json.loads(
+            await mcp_tools["github:queue_create_issue"]("octocat", "Hello-World", "Bug")
+        )
+
+        assert result["success"] is False
+        assert "GITHUB_WRITE_QUEUE_PATH" in result["error"]["message"]
+
+
+class TestColumnarFormat:
+    """Test the columnar format option of list tools."""
+
+    async def test_list_issues_columnar(self, mcp_tools, issue):
+        from chora_github.core.columnar import decode_list_response
+
+        result = json.loads(
+            await mcp_tools["github:list_issues"]("octocat", "Hello-World", format="columnar")
+        )
+
+        assert result["format"] == "columnar"
+        assert result["issues"]["columns"]["number"] == [1]
+        assert decode_list_response(result)["issues"] == [issue.model_dump()]
+
+    async def test_list_repo_files_rows_by_default(self, mcp_tools):
+        result = json.loads(
+            await mcp_tools["github:list_repo_files"]("octocat", "Hello-World", ref="main")
+        )
+
+        assert result["files"][0]["name"] == "README.md"
+
+    async def test_ref_is_optional(self, mcp_tools, mock_github_service):
+        await mcp_tools["github:list_repo_files"]("octocat", "Hello-World")
+        await mcp_tools["github:get_file_contents"]("octocat", "Hello-World", "README.md")
+
+        assert mock_github_service.list_repo_files.call_args.args[0].ref == "main"
+        assert mock_github_service.get_file_contents.call_args.args[0].ref == "main"
+
+    async def test_invalid_format_returns_error(self, mcp_tools):
+        result = json.loads(
+            await mcp_tools["github:list_prs"]("octocat", "Hello-World", format="csv")
+        )
+
+        assert result["success"] is False
+
+
+class TestResponseBudget:
+    """Test the max_bytes / max_tokens budget of read tools."""
+
+    @pytest.fixture
+    def long_issue(self, mock_github_service, sample_issue_data):
+        issue = IssueData(**{**sample_issue_data, "body": "x" * 30_000})
+        mock_github_service.list_issues.return_value = ListIssuesResponse(
+            issues=[issue], total_count=1
+        )
+        mock_github_service.get_issue.side_effect = lambda request: GetIssueResponse(issue=issue)
+        return issue
+
+    async def test_list_issues_truncates_bodies(self, mcp_tools, long_issue):
+        raw = await mcp_tools["github:list_issues"]("octocat", "Hello-World", max_bytes=2_000)
+        result = json.loads(raw)
+
+        assert len(raw.encode()) <= 2_000
+        assert result["issues"][0]["body"].endswith("[truncated, 30000 chars]")
+        assert result["budget"]["truncated"][0]["original_length"] == 30_000
+
+    async def test_get_issue_token_budget(self, mcp_tools, long_issue):
+        result = json.loads(
+            await mcp_tools["github:get_issue"]("octocat", "Hello-World", 1, max_tokens=500)
+        )
+
+        assert result["budget"]["max_bytes"] == 2_000
+        assert result["budget"]["truncated"][0]["number"] == 1
+
+    async def test_budget_with_columnar_format(self, mcp_tools, long_issue):
+        result = json.loads(
+            await mcp_tools["github:list_issues"](
+                "octocat", "Hello-World", format="columnar", max_bytes=2_000
+            )
+        )
+
+        assert result["format"] == "columnar"
+        assert result["budget"]["truncated"][0]["number"] == 1
+
+    async def test_no_budget_by_default(self, mcp_tools):
+        result = json.loads(await mcp_tools["github:get_issue"]("octocat", "Hello-World", 1))
+
+        assert "budget" not in result
+
+    async def test_budget_too_small(self, mcp_tools):
+        result = json.loads(
+            await mcp_tools["github:get_pr"]("octocat", "Hello-World", 1, max_bytes=10)
+        )
+
+        assert result["success"] is False
+        assert "too small" in result["error"]["message"]
+
+
+class TestBatchTool:
+    """Test the github:batch tool."""
+
+    async def test_batch(self, mcp_tools):
+        result = json.loads(
+            await mcp_tools["github:batch"](
+                [
+                    {"tool": "get_issue", "parameters": {"repo": "octocat/Hello-World", "issue_number": 1}},
+                    {"tool": "get_issue", "parameters": {"owner": "octocat", "repo": "Hello-World", "issue_number": 999}},
+                ]
+            )
+        )
+
+        assert result["succeeded"] == 1
+        assert result["results"][0]["result"]["issue"]["number"] == 1
+        assert result["results"][1]["error_code"] == "NOT_FOUND"
 
-            importlib.reload(mcp_module)
+    async def test_empty_batch_is_rejected(self, mcp_tools):
+        result = json.loads(await mcp_tools["github:batch"]([]))
 
-            # In normal mode, mcp should be created
-            assert mcp_module.mcp is not None
-            assert mcp_module.mcp.name == "mcp-server-github"
+        assert result["success"] is False
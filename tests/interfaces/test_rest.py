@@ -1,16 +1,26 @@
 """Tests for GitHub REST API Interface (SAP-043)
 
 Tests verify REST API endpoints, request/response handling, error
-responses, and HTTP status codes.
+responses, and HTTP status codes. The app runs against the mocked
+GithubToolService from conftest.
 
 Generated by: chora-base SAP-047 (Capability Server Template)
 """
 
-from uuid import uuid4
+import json
+from unittest.mock import DEFAULT
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
-from github.interfaces.rest import app
+
+from chora_github.core import deadlines
+from chora_github.core.cache import TTLCache
+from chora_github.core.columnar import decode_list_response
+from chora_github.core.exceptions import GithubNotFoundError, GithubRateLimitError
+from chora_github.core.models import ListIssuesResponse, PartialResult
+from chora_github.interfaces.rest import create_app
+from chora_github.interfaces.rest.caching import ResponseCache, etag_matches
 
 
 # ============================================================================
@@ -19,19 +29,15 @@ from github.interfaces.rest import app
 
 
 @pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+def client(mock_github_service):
+    """Create test client (runs the app lifespan)."""
+    mock_github_service.issue_cache = TTLCache(ttl=60)
+    with TestClient(create_app(service=mock_github_service)) as client:
+        yield client
 
 
-@pytest.fixture
-def sample_entity_data():
-    """Sample entity data for testing."""
-    return {
-        "name": "Test Entity",
-        "description": "Test description",
-        "metadata": {"key": "value"},
-    }
+REPO = "/api/v1/github/repos/octocat/Hello-World"
+ADMIN = {"Authorization": "Bearer admin-secret"}
 
 
 # ============================================================================
@@ -48,414 +54,532 @@ class TestRootEndpoints:
 
         assert response.status_code == 200
         data = response.json()
-        assert "name" in data
-        assert "version" in data
-        assert "docs" in data
+        assert data["name"] == "GitHub API"
+        assert data["version"] == "0.1.0"
 
     def test_health_endpoint(self, client):
         """Test health check endpoint."""
         response = client.get("/health")
 
         assert response.status_code == 200
-        data = response.json()
-        assert "status" in data
-        assert data["status"] == "healthy"
-
-    def test_docs_endpoint(self, client):
-        """Test OpenAPI docs are accessible."""
-        response = client.get("/docs")
-        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
 
     def test_openapi_schema(self, client):
-        """Test OpenAPI schema endpoint."""
+        """Test OpenAPI schema lists the tool endpoints."""
         response = client.get("/openapi.json")
 
         assert response.status_code == 200
-        schema = response.json()
-        assert "openapi" in schema
-        assert "paths" in schema
+        paths = response.json()["paths"]
+        assert "/api/v1/github/repos/{owner}/{repo}/issues" in paths
+        assert "/api/v1/call/batch" in paths
 
 
-# ============================================================================
-# Test Create Entity
-# ============================================================================
+class TestMetrics:
+    """Test the Prometheus endpoint."""
 
+    def test_metrics_endpoint(self, client):
+        client.get(f"{REPO}/issues/1")
+        client.get(f"{REPO}/issues/999")
 
-class TestCreateEntity:
-    """Test POST /api/v1/github/entities"""
+        response = client.get("/metrics")
 
-    def test_create_entity(self, client, sample_entity_data):
-        """Test creating a valid entity."""
-        response = client.post("/api/v1/github/entities", json=sample_entity_data)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        route = "/api/v1/github/repos/{owner}/{repo}/issues/{issue_number}"
+        assert f'route="{route}",status="200"' in text
+        assert f'route="{route}",status="404"' in text
+        assert 'github_cache_misses_total{cache="responses"}' in text
+        assert "github_http_requests_in_flight" in text
+
+    def test_request_duration_header(self, client):
+        response = client.get("/health")
 
-        assert response.status_code == 201
-        data = response.json()
-        assert data["success"] is True
-        assert data["entity"]["name"] == sample_entity_data["name"]
-        assert "id" in data["entity"]
+        assert response.headers["X-Request-Duration"].endswith("s")
 
-    def test_create_entity_minimal(self, client):
-        """Test creating entity with only required fields."""
-        response = client.post(
-            "/api/v1/github/entities", json={"name": "Minimal Entity"}
-        )
+    def test_upstream_usage_headers(self, client, mock_github_service, pr):
+        from chora_github.core.models import GetPRResponse
+        from chora_github.core.upstream import UpstreamCall, notify
 
-        assert response.status_code == 201
-        data = response.json()
-        assert data["entity"]["name"] == "Minimal Entity"
+        def get_pr(request):
+            for endpoint, status in (("/repos/{owner}/{repo}", 200), ("/pulls/{number}", 304)):
+                notify(UpstreamCall(method="GET", endpoint=endpoint, status=status, duration=0.01))
+            return GetPRResponse(pull_request=pr)
 
-    def test_create_entity_invalid_name(self, client):
-        """Test creating entity with invalid name."""
-        response = client.post(
-            "/api/v1/github/entities", json={"name": ""}  # Empty name
-        )
+        mock_github_service.get_pr.side_effect = get_pr
 
-        assert response.status_code == 400
-        data = response.json()
-        assert "error" in data
+        response = client.get(f"{REPO}/pulls/1")
+
+        assert response.headers["X-Upstream-Requests"] == "2"
+        assert response.headers["X-Upstream-Not-Modified"] == "1"
+        assert response.headers["X-Upstream-Duration"] == "0.020s"
+        assert client.get("/health").headers["X-Upstream-Requests"] == "0"
+
+    def test_request_span(self, client, tracer):
+        response = client.get(f"{REPO}/issues/1")
+
+        (request,) = [span for span in tracer.spans if span.name.startswith("HTTP")]
+        assert response.status_code == 200
+        assert request.name == "HTTP GET /api/v1/github/repos/{owner}/{repo}/issues/{issue_number}"
+        assert request.attributes["http.response.status_code"] == 200
+        assert "serialize.json" in tracer.names()
+
+
+class TestLifespan:
+    """Test the app-lifetime service."""
+
+    def test_service_is_shared(self, client, mock_github_service):
+        """Test that every request uses the service created at startup."""
+        client.get(f"{REPO}/issues", params={"state": "open"})
+        client.get(f"{REPO}/issues", params={"state": "closed"})
+
+        assert client.app.state.service is mock_github_service
+        assert mock_github_service.list_issues.call_count == 2
 
-    def test_create_entity_missing_name(self, client):
-        """Test creating entity without name."""
-        response = client.post("/api/v1/github/entities", json={})
+    def test_missing_token_fails_startup(self, monkeypatch):
+        """Test that startup fails without GITHUB_TOKEN."""
+        from chora_github.core.exceptions import GithubConfigError
 
-        assert response.status_code == 422  # Validation error
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        with pytest.raises(GithubConfigError), TestClient(create_app()):
+            pass
 
 
 # ============================================================================
-# Test Get Entity
+# Test Issues
 # ============================================================================
 
 
-class TestGetEntity:
-    """Test GET /api/v1/github/entities/{entity_id}"""
+class TestIssues:
+    """Test issue endpoints."""
 
-    def test_get_existing_entity(self, client, sample_entity_data):
-        """Test getting an existing entity."""
-        # Create entity
-        create_response = client.post(
-            "/api/v1/github/entities", json=sample_entity_data
-        )
-        entity_id = create_response.json()["entity"]["id"]
-
-        # Get entity
-        response = client.get(f"/api/v1/github/entities/{entity_id}")
+    def test_list_issues(self, client, mock_github_service):
+        response = client.get(f"{REPO}/issues", params={"state": "all", "labels": "bug, p1"})
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == entity_id
-        assert data["name"] == sample_entity_data["name"]
+        assert response.json()["issues"][0]["number"] == 1
+        request = mock_github_service.list_issues.call_args.args[0]
+        assert request.repo == "octocat/Hello-World"
+        assert request.state == "all"
+        assert request.labels == ["bug", "p1"]
 
-    def test_get_nonexistent_entity(self, client):
-        """Test getting non-existent entity returns 404."""
-        fake_id = str(uuid4())
-        response = client.get(f"/api/v1/github/entities/{fake_id}")
+    def test_list_issues_columnar(self, client):
+        response = client.get(f"{REPO}/issues", params={"format": "columnar"})
 
-        assert response.status_code == 404
         data = response.json()
-        assert "error" in data
-        assert data["error"] == "NOT_FOUND"
+        assert data["format"] == "columnar"
+        assert decode_list_response(data)["issues"][0]["number"] == 1
 
-    def test_get_invalid_uuid(self, client):
-        """Test get with invalid UUID format."""
-        response = client.get("/api/v1/github/entities/not-a-uuid")
+    def test_list_issues_invalid_limit(self, client):
+        response = client.get(f"{REPO}/issues", params={"limit": 500})
 
-        assert response.status_code == 422  # Validation error
+        assert response.status_code == 400
+        assert response.json()["error"] == "VALIDATION_ERROR"
 
+    def test_get_issue(self, client, mock_github_service):
+        response = client.get(f"{REPO}/issues/1", params={"fields": "number,title"})
 
-# ============================================================================
-# Test List Entities
-# ============================================================================
+        assert response.status_code == 200
+        assert response.json()["issue"]["title"] == "Test Issue"
+        assert mock_github_service.get_issue.call_args.args[0].fields == ["number", "title"]
 
+    def test_get_issue_not_found(self, client):
+        response = client.get(f"{REPO}/issues/999")
 
-class TestListEntities:
-    """Test GET /api/v1/github/entities"""
+        assert response.status_code == 404
+        assert response.json()["error"] == "NOT_FOUND"
 
-    def test_list_empty(self, client):
-        """Test listing when no entities exist."""
-        response = client.get("/api/v1/github/entities")
+    def test_create_issue(self, client, mock_github_service):
+        response = client.post(f"{REPO}/issues", json={"title": "New bug", "labels": ["bug"]})
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["entities"] == []
-        assert data["total"] == 0
+        assert response.status_code == 201
+        request = mock_github_service.create_issue.call_args.args[0]
+        assert request.title == "New bug"
+        assert request.body == ""
 
-    def test_list_with_entities(self, client):
-        """Test listing with existing entities."""
-        # Create some entities
-        for i in range(3):
-            client.post("/api/v1/github/entities", json={"name": f"Entity {i}"})
+    def test_create_issue_missing_title(self, client):
+        response = client.post(f"{REPO}/issues", json={})
 
-        response = client.get("/api/v1/github/entities")
+        assert response.status_code == 422
+
+    def test_update_issue(self, client, mock_github_service):
+        response = client.patch(f"{REPO}/issues/1", json={"state": "closed"})
 
         assert response.status_code == 200
-        data = response.json()
-        assert len(data["entities"]) == 3
-        assert data["total"] == 3
-
-    def test_list_with_status_filter(self, client, sample_entity_data):
-        """Test listing with status filter."""
-        # Create entity and update its status
-        create_response = client.post(
-            "/api/v1/github/entities", json=sample_entity_data
+        request = mock_github_service.update_issue.call_args.args[0]
+        assert request.issue_number == 1
+        assert request.state == "closed"
+        assert request.title is None
+
+    def test_rate_limit(self, client, mock_github_service):
+        mock_github_service.list_issues.side_effect = GithubRateLimitError(
+            "GitHub rate limit exceeded", retry_after_seconds=30
         )
-        entity_id = create_response.json()["entity"]["id"]
 
-        client.post(
-            f"/api/v1/github/entities/{entity_id}/status", json={"status": "active"}
-        )
+        response = client.get(f"{REPO}/issues")
 
-        # List active entities
-        response = client.get("/api/v1/github/entities", params={"status": "active"})
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
 
-        assert response.status_code == 200
-        data = response.json()
-        assert all(e["status"] == "active" for e in data["entities"])
-
-    def test_list_with_name_filter(self, client):
-        """Test listing with name filter."""
-        # Create entities
-        client.post("/api/v1/github/entities", json={"name": "Alpha"})
-        client.post("/api/v1/github/entities", json={"name": "Beta"})
-        client.post("/api/v1/github/entities", json={"name": "Alphabet"})
-
-        # Filter by name
-        response = client.get(
-            "/api/v1/github/entities", params={"name_contains": "alpha"}
-        )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 2
+class TestDeadlines:
+    """Test request deadlines (X-Request-Timeout)."""
 
-    def test_list_with_pagination(self, client):
-        """Test pagination."""
-        # Create 10 entities
-        for i in range(10):
-            client.post("/api/v1/github/entities", json={"name": f"Entity {i}"})
+    def test_deadline_from_header(self, client, mock_github_service):
+        def time_out(request):
+            raise deadlines.current().error("GET /repos/{owner}/{repo}/issues page 2")
 
-        # Get first page
-        response = client.get(
-            "/api/v1/github/entities", params={"offset": 0, "limit": 5}
-        )
+        mock_github_service.list_issues.side_effect = time_out
 
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["entities"]) == 5
-        assert data["total"] == 10
+        response = client.get(f"{REPO}/issues", headers={"X-Request-Timeout": "2.5"})
+
+        assert response.status_code == 504
+        error = response.json()
+        assert error["error"] == "TIMEOUT"
+        assert error["details"]["timeout_seconds"] == 2.5
+        assert error["details"]["operation"] == f"GET {REPO}/issues"
+        assert error["details"]["pending_request"] == "GET /repos/{owner}/{repo}/issues page 2"
 
-        # Get second page
-        response = client.get(
-            "/api/v1/github/entities", params={"offset": 5, "limit": 5}
+    def test_no_deadline_by_default(self, client, mock_github_service, monkeypatch):
+        monkeypatch.delenv("GITHUB_REQUEST_TIMEOUT", raising=False)
+        seen = []
+        mock_github_service.get_issue.side_effect = lambda request: (
+            seen.append(deadlines.current()) or DEFAULT
         )
 
+        response = client.get(f"{REPO}/issues/1")
+
         assert response.status_code == 200
-        data = response.json()
-        assert len(data["entities"]) == 5
+        assert seen == [None]
 
+    def test_deadline_covers_stream(self, client, mock_github_service, issue):
+        def time_out_after_first_page(request):
+            yield issue
+            raise deadlines.current().error("GET /repos/{owner}/{repo}/issues page 2")
 
-# ============================================================================
-# Test Update Entity
-# ============================================================================
+        mock_github_service.iter_issues.side_effect = time_out_after_first_page
 
+        response = client.get(f"{REPO}/issues/stream", headers={"X-Request-Timeout": "2"})
 
-class TestUpdateEntity:
-    """Test PUT /api/v1/github/entities/{entity_id}"""
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+        assert lines[0]["number"] == 1
+        assert lines[1]["error"] == "TIMEOUT"
 
-    def test_update_entity(self, client, sample_entity_data):
-        """Test updating an entity."""
-        # Create entity
-        create_response = client.post(
-            "/api/v1/github/entities", json=sample_entity_data
+    def test_partial_listing_is_not_cached(self, client, mock_github_service, issue):
+        mock_github_service.list_issues.return_value = ListIssuesResponse(
+            issues=[issue],
+            total_count=1,
+            partial=PartialResult(reason="Deadline", next_cursor="offset:1"),
         )
-        entity_id = create_response.json()["entity"]["id"]
 
-        # Update entity
-        update_data = {
-            "name": "Updated Name",
-            "description": "Updated description",
-            "metadata": {"updated": True},
-        }
-        response = client.put(f"/api/v1/github/entities/{entity_id}", json=update_data)
+        first = client.get(f"{REPO}/issues", params={"cursor": "offset:30"})
+        second = client.get(f"{REPO}/issues", params={"cursor": "offset:30"})
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["entity"]["name"] == "Updated Name"
-        assert data["entity"]["description"] == "Updated description"
-
-    def test_update_nonexistent_entity(self, client):
-        """Test updating non-existent entity returns 404."""
-        fake_id = str(uuid4())
-        response = client.put(
-            f"/api/v1/github/entities/{fake_id}", json={"name": "Updated"}
-        )
+        assert first.headers["X-Partial-Result"] == "true"
+        assert "ETag" not in first.headers
+        assert first.json()["partial"]["next_cursor"] == "offset:1"
+        assert second.status_code == 200
+        assert mock_github_service.list_issues.call_count == 2
+        assert mock_github_service.list_issues.call_args.args[0].cursor == "offset:30"
 
-        assert response.status_code == 404
+    @pytest.mark.parametrize("value", ["soon", "0", "-1"])
+    def test_invalid_header(self, client, value):
+        response = client.get(f"{REPO}/issues", headers={"X-Request-Timeout": value})
+
+        assert response.status_code == 400
+        assert response.json()["details"]["field"] == "X-Request-Timeout"
 
 
 # ============================================================================
-# Test Partial Update Entity
+# Test Pull Requests and Files
 # ============================================================================
 
 
-class TestPatchEntity:
-    """Test PATCH /api/v1/github/entities/{entity_id}"""
+class TestPullRequests:
+    """Test pull request endpoints."""
 
-    def test_patch_entity_name_only(self, client, sample_entity_data):
-        """Test partially updating only the name."""
-        # Create entity
-        create_response = client.post(
-            "/api/v1/github/entities", json=sample_entity_data
-        )
-        entity_id = create_response.json()["entity"]["id"]
+    def test_list_prs(self, client, mock_github_service):
+        response = client.get(f"{REPO}/pulls", params={"base": "main"})
 
-        # Patch only name
-        response = client.patch(
-            f"/api/v1/github/entities/{entity_id}", json={"name": "Patched Name"}
-        )
+        assert response.status_code == 200
+        assert response.json()["pull_requests"][0]["number"] == 1
+        assert mock_github_service.list_prs.call_args.args[0].base == "main"
+
+    def test_get_pr(self, client):
+        response = client.get(f"{REPO}/pulls/1")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["entity"]["name"] == "Patched Name"
-        assert data["entity"]["description"] == sample_entity_data["description"]
+        assert response.json()["pull_request"]["number"] == 1
+
+
+class TestFiles:
+    """Test file endpoints."""
+
+    def test_get_file_contents_nested_path(self, client, mock_github_service):
+        response = client.get(f"{REPO}/contents/docs/guide/README.md", params={"ref": "dev"})
+
+        assert response.status_code == 200
+        request = mock_github_service.get_file_contents.call_args.args[0]
+        assert request.path == "docs/guide/README.md"
+        assert request.ref == "dev"
+
+    def test_list_repo_files(self, client):
+        response = client.get(f"{REPO}/files")
+
+        assert response.status_code == 200
+        assert response.json()["files"][0]["name"] == "README.md"
 
 
 # ============================================================================
-# Test Delete Entity
+# Test Streaming
 # ============================================================================
 
 
-class TestDeleteEntity:
-    """Test DELETE /api/v1/github/entities/{entity_id}"""
+class TestStreaming:
+    """Test NDJSON streaming listings."""
 
-    def test_delete_entity(self, client, sample_entity_data):
-        """Test deleting an entity."""
-        # Create entity
-        create_response = client.post(
-            "/api/v1/github/entities", json=sample_entity_data
+    @staticmethod
+    def lines(response):
+        return [json.loads(line) for line in response.iter_lines() if line]
+
+    def test_stream_issues(self, client, mock_github_service, issue):
+        mock_github_service.iter_issues.side_effect = lambda request: iter(
+            issue.model_copy(update={"number": n}) for n in range(1, 4)
         )
-        entity_id = create_response.json()["entity"]["id"]
 
-        # Delete entity
-        response = client.delete(f"/api/v1/github/entities/{entity_id}")
+        with client.stream("GET", f"{REPO}/issues/stream", params={"state": "all"}) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            items = self.lines(response)
+
+        assert [item["number"] for item in items] == [1, 2, 3]
+        request = mock_github_service.iter_issues.call_args.args[0]
+        assert request.state == "all"
+        assert request.limit is None
+
+    def test_stream_is_not_cached(self, client, mock_github_service):
+        client.get(f"{REPO}/issues/stream")
+        response = client.get(f"{REPO}/issues/stream")
+
+        assert "ETag" not in response.headers
+        assert mock_github_service.iter_issues.call_count == 2
 
-        assert response.status_code == 204
+    def test_stream_prs_and_files(self, client):
+        prs = self.lines(client.get(f"{REPO}/pulls/stream", params={"limit": 500}))
+        files = self.lines(client.get(f"{REPO}/files/stream", params={"recursive": True}))
 
-        # Verify deleted
-        get_response = client.get(f"/api/v1/github/entities/{entity_id}")
-        assert get_response.status_code == 404
+        assert prs[0]["number"] == 1
+        assert files[0]["name"] == "README.md"
 
-    def test_delete_nonexistent_entity(self, client):
-        """Test deleting non-existent entity returns 404."""
-        fake_id = str(uuid4())
-        response = client.delete(f"/api/v1/github/entities/{fake_id}")
+    def test_stream_error_before_first_item(self, client, mock_github_service):
+        def missing(request):
+            raise GithubNotFoundError("Repository 'octocat/Hello-World' not found")
+            yield
+
+        mock_github_service.iter_issues.side_effect = missing
+
+        response = client.get(f"{REPO}/issues/stream")
 
         assert response.status_code == 404
+        assert response.json()["error"] == "NOT_FOUND"
+
+    def test_stream_error_after_first_item(self, client, mock_github_service, issue):
+        def fails_midway(request):
+            yield issue
+            raise GithubRateLimitError("GitHub rate limit exceeded")
+
+        mock_github_service.iter_issues.side_effect = fails_midway
+
+        items = self.lines(client.get(f"{REPO}/issues/stream"))
+
+        assert items[0]["number"] == 1
+        assert items[1]["error"] == "RATE_LIMIT_EXCEEDED"
 
 
 # ============================================================================
-# Test Update Status
+# Test Tool Calls
 # ============================================================================
 
 
-class TestUpdateStatus:
-    """Test POST /api/v1/github/entities/{entity_id}/status"""
-
-    def test_update_status(self, client, sample_entity_data):
-        """Test updating entity status."""
-        # Create entity
-        create_response = client.post(
-            "/api/v1/github/entities", json=sample_entity_data
-        )
-        entity_id = create_response.json()["entity"]["id"]
+class TestToolCalls:
+    """Test /call and /call/batch."""
 
-        # Update to active
+    def test_call(self, client):
         response = client.post(
-            f"/api/v1/github/entities/{entity_id}/status", json={"status": "active"}
+            "/api/v1/call",
+            json={
+                "tool": "get_issue",
+                "parameters": {"repo": "octocat/Hello-World", "issue_number": 1},
+            },
         )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["entity"]["status"] == "active"
+        assert response.json()["result"]["issue"]["number"] == 1
 
-    def test_update_status_invalid_transition(self, client, sample_entity_data):
-        """Test invalid status transition."""
-        # Create entity, move to completed
-        create_response = client.post(
-            "/api/v1/github/entities", json=sample_entity_data
-        )
-        entity_id = create_response.json()["entity"]["id"]
-
-        client.post(
-            f"/api/v1/github/entities/{entity_id}/status", json={"status": "active"}
-        )
-        client.post(
-            f"/api/v1/github/entities/{entity_id}/status", json={"status": "completed"}
-        )
-
-        # Try to transition from completed (should fail)
+    def test_call_batch(self, client):
         response = client.post(
-            f"/api/v1/github/entities/{entity_id}/status", json={"status": "active"}
+            "/api/v1/call/batch",
+            json={
+                "calls": [
+                    {"tool": "list_issues", "parameters": {"repo": "octocat/Hello-World"}},
+                    {
+                        "tool": "get_pr",
+                        "parameters": {"repo": "octocat/Hello-World", "pr_number": 5},
+                    },
+                ]
+            },
         )
 
-        assert response.status_code == 400
         data = response.json()
-        assert "error" in data
+        assert response.status_code == 200
+        assert data["succeeded"] == 1
+        assert data["results"][1]["error_code"] == "NOT_FOUND"
 
 
 # ============================================================================
-# Test Bulk Operations
+# Test HTTP Caching
 # ============================================================================
 
 
-class TestBulkOperations:
-    """Test bulk operations."""
+def make_request(path: str) -> Request:
+    return Request(
+        {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}
+    )
 
-    def test_bulk_delete(self, client):
-        """Test bulk delete operation."""
-        # Create multiple entities
-        entity_ids = []
-        for i in range(3):
-            response = client.post(
-                "/api/v1/github/entities", json={"name": f"Entity {i}"}
-            )
-            entity_ids.append(response.json()["entity"]["id"])
 
-        # Bulk delete
-        response = client.post("/api/v1/github/entities/bulk/delete", json=entity_ids)
+class TestHTTPCaching:
+    """Test ETag, 304 and Cache-Control handling."""
+
+    def test_caching_headers(self, client):
+        response = client.get(f"{REPO}/issues")
+
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Cache-Control"] == "max-age=60"
+        assert response.headers["Age"] == "0"
+
+    def test_fresh_response_is_served_from_cache(self, client, mock_github_service):
+        first = client.get(f"{REPO}/issues")
+        second = client.get(f"{REPO}/issues")
+
+        assert second.content == first.content
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert mock_github_service.list_issues.call_count == 1
+
+    def test_if_none_match_returns_304(self, client):
+        etag = client.get(f"{REPO}/issues/1").headers["ETag"]
+
+        response = client.get(f"{REPO}/issues/1", headers={"If-None-Match": f'"other", W/{etag}'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_stale_etag_returns_body(self, client):
+        response = client.get(f"{REPO}/issues/1", headers={"If-None-Match": '"stale"'})
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["deleted_count"] == 3
-        assert data["failed_count"] == 0
+        assert response.json()["issue"]["number"] == 1
 
+    def test_write_invalidates_repository(self, client, mock_github_service):
+        client.get(f"{REPO}/issues")
+        client.patch(f"{REPO}/issues/1", json={"state": "closed"})
+        client.get(f"{REPO}/issues")
 
-# ============================================================================
-# Test Error Handling
-# ============================================================================
+        assert mock_github_service.list_issues.call_count == 2
 
+    def test_tool_call_write_invalidates_repository(self, client, mock_github_service):
+        client.get(f"{REPO}/issues")
+        response = client.post(
+            "/api/v1/call",
+            json={
+                "tool": "update_issue",
+                "parameters": {"repo": "Octocat/Hello-World", "issue_number": 1, "state": "closed"},
+            },
+        )
+        client.get(f"{REPO}/issues")
 
-class TestErrorHandling:
-    """Test error response formats."""
+        assert response.json()["success"] is True
+        assert mock_github_service.list_issues.call_count == 2
 
-    def test_validation_error_format(self, client):
-        """Test validation error has correct format."""
-        response = client.post("/api/v1/github/entities", json={"name": ""})  # Invalid
+    def test_tool_call_read_keeps_cache(self, client, mock_github_service):
+        client.get(f"{REPO}/issues")
+        client.post(
+            "/api/v1/call/batch",
+            json={
+                "calls": [
+                    {
+                        "tool": "get_issue",
+                        "parameters": {"repo": "octocat/Hello-World", "issue_number": 1},
+                    }
+                ]
+            },
+        )
+        client.get(f"{REPO}/issues")
 
-        assert response.status_code == 400
-        data = response.json()
-        assert "error" in data
-        assert "message" in data
-        assert "details" in data
+        assert mock_github_service.list_issues.call_count == 1
 
-    def test_not_found_error_format(self, client):
-        """Test not found error has correct format."""
-        fake_id = str(uuid4())
-        response = client.get(f"/api/v1/github/entities/{fake_id}")
+    def test_read_overlapping_write_is_not_served_after_it(self, client, mock_github_service):
+        listing = mock_github_service.list_issues.return_value
+
+        def list_during_write(request):
+            # A write to the repository finishes while the read is running
+            client.app.state.response_cache.invalidate(f"{REPO}/issues/1")
+            return listing
+
+        mock_github_service.list_issues.side_effect = list_during_write
+        client.get(f"{REPO}/issues")
+        mock_github_service.list_issues.side_effect = None
+        client.get(f"{REPO}/issues")
+
+        assert mock_github_service.list_issues.call_count == 2
+
+    def test_generations_are_bounded(self):
+        cache = ResponseCache(max_entries=2)
+        key = cache.key(make_request("/api/v1/github/repos/o/a/issues"))
+        cache.store(key, b"{}")
+
+        for repo in ("a", "b", "c"):
+            cache.invalidate(f"/api/v1/github/repos/o/{repo}/issues")
+
+        assert len(cache._generations) == 2
+        # Repository "a" was forgotten, but its pre-write response stays unreachable
+        assert cache.lookup(cache.key(make_request("/api/v1/github/repos/o/a/issues"))) is None
+
+    def test_errors_are_not_cached(self, client, mock_github_service):
+        client.get(f"{REPO}/issues/999")
+        response = client.get(f"{REPO}/issues/999")
 
         assert response.status_code == 404
-        data = response.json()
-        assert data["error"] == "NOT_FOUND"
-        assert "message" in data
+        assert "ETag" not in response.headers
+        assert mock_github_service.get_issue.call_count == 2
+
+    def test_disabled_cache_still_revalidates(self, mock_github_service):
+        mock_github_service.issue_cache = TTLCache(ttl=0)
+        with TestClient(create_app(service=mock_github_service)) as client:
+            etag = client.get(f"{REPO}/pulls").headers["ETag"]
+            response = client.get(f"{REPO}/pulls", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["Cache-Control"] == "max-age=0"
+        assert mock_github_service.list_prs.call_count == 2
+
+
+class TestEtagMatches:
+    """Test If-None-Match evaluation."""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, False),
+            ('"a"', True),
+            ('W/"a"', True),
+            ('"b", "a"', True),
+            ("*", True),
+            ('"b"', False),
+        ],
+    )
+    def test_etag_matches(self, header, expected):
+        assert etag_matches(header, '"a"') is expected
 
 
 # ============================================================================
@@ -466,10 +590,64 @@ class TestErrorHandling:
 class TestCORS:
     """Test CORS configuration."""
 
-    def test_cors_headers_present(self, client):
-        """Test CORS headers are present in responses."""
-        response = client.get(
-            "/api/v1/github/entities", headers={"Origin": "http://example.com"}
-        )
+    def test_cors_headers(self, client):
+        response = client.get("/health", headers={"Origin": "http://example.com"})
 
-        assert "access-control-allow-origin" in response.headers
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
+
+
+# ============================================================================
+# Test Admin
+# ============================================================================
+
+
+class TestProfilingAdmin:
+    """Test the slow-call profiling admin endpoint."""
+
+    def test_disabled_without_admin_token(self, client, monkeypatch):
+        monkeypatch.delenv("GITHUB_ADMIN_TOKEN", raising=False)
+
+        response = client.get("/api/v1/admin/profiling", headers=ADMIN)
+
+        assert response.status_code == 403
+
+    def test_wrong_admin_token(self, client, monkeypatch):
+        monkeypatch.setenv("GITHUB_ADMIN_TOKEN", "admin-secret")
+
+        response = client.get("/api/v1/admin/profiling", headers={"Authorization": "Bearer x"})
+
+        assert response.status_code == 403
+
+    def test_enable_profiles_requests(self, client, monkeypatch, tmp_path):
+        from chora_github.core import profiling
+
+        monkeypatch.setenv("GITHUB_ADMIN_TOKEN", "admin-secret")
+        monkeypatch.setenv("GITHUB_PROFILE_DIR", str(tmp_path))
+        try:
+            response = client.put(
+                "/api/v1/admin/profiling",
+                json={"enabled": True, "threshold_ms": 0},
+                headers=ADMIN,
+            )
+            assert response.json()["directory"] == str(tmp_path)
+
+            client.get(f"{REPO}/issues/1", headers={"Authorization": "Bearer gh-token"})
+        finally:
+            response = client.put("/api/v1/admin/profiling", json={"enabled": False}, headers=ADMIN)
+            profiling.configure(None)
+
+        assert response.json() == {
+            "enabled": False,
+            "directory": None,
+            "threshold_ms": None,
+            "sample_rate": None,
+            "max_profiles": None,
+            "written": None,
+        }
+        sidecars = [json.loads(path.read_text()) for path in tmp_path.glob("*.json")]
+        (sidecar,) = [item for item in sidecars if item["tool"] == "get_issue"]
+        assert sidecar["parameters"] == {
+            "owner": "octocat",
+            "repo": "Hello-World",
+            "issue_number": "1",
+        }